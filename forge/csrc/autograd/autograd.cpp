@@ -3,6 +3,9 @@
 // SPDX-License-Identifier: Apache-2.0
 #include "autograd/autograd.hpp"
 
+#include <algorithm>
+#include <iterator>
+
 #include "autograd/binding.hpp"
 #include "graph_lib/node_types.hpp"
 #include "graph_lib/utils.hpp"
@@ -416,6 +419,45 @@ void autograd_engine::create_backward_graph(const grad_map &requires_grad_map)
     }
 }
 
+// Loop the updated parameter back to the parameter, and copy the consteval operations of the parameter to the
+// optimizer state which is updated with it (e.g. moments of the parameter).
+void autograd_engine::add_optimizer_loopback(Node *input_node, NodeContext optimizer_output)
+{
+    graph->add_edge(
+        graph->node_by_id(optimizer_output.id),
+        input_node,
+        graphlib::PortId(0),
+        graphlib::PortId(0),
+        graphlib::EdgeType::kDataLoopback);
+
+    for (auto outgoing_edge : graph->user_edges(input_node))
+    {
+        graphlib::NodeId outgoing_node_id = outgoing_edge.consumer_node_id;
+        graphlib::Node *outgoing_node = graph->node_by_id(outgoing_node_id);
+
+        if (outgoing_node->node_type() == NodeType::kInput)
+        {
+            bool is_optimizer_param = outgoing_node->as<graphlib::InputNode>()->is_optimizer_parameter();
+            bool has_dataloopback = false;
+
+            for (auto incoming_edge : graph->operand_edges(outgoing_node))
+            {
+                if (incoming_edge.edge_type == graphlib::EdgeType::kDataLoopback)
+                {
+                    has_dataloopback = true;
+                    break;
+                }
+            }
+
+            if (is_optimizer_param && has_dataloopback &&
+                !outgoing_node->as<graphlib::TaggedNode>()->has_tag("dont_consteval"))
+            {
+                outgoing_node->as<graphlib::InputNode>()->clone_consteval_graph_from(input_node);
+            }
+        }
+    }
+}
+
 void autograd_engine::create_optimizer_graph()
 {
     if (config.optimizer.is_none())
@@ -423,6 +465,13 @@ void autograd_engine::create_optimizer_graph()
         return;
     }
 
+    // In the multi-tensor mode, parameters of the same data format are updated together - the optimizer flattens them
+    // into a single buffer and emits one set of ops for the whole group (see `generate_multi_tensor_op_trace`).
+    bool multi_tensor =
+        py::hasattr(config.optimizer, "multi_tensor") && config.optimizer.attr("multi_tensor").cast<bool>();
+    std::vector<std::pair<DataFormat, std::vector<std::pair<Node *, Node *>>>> multi_tensor_groups;
+    std::unordered_map<Node *, int> parameter_operands;
+
     // for each parameter with requires_grad, we're going to inject an optimizer graph
     std::unordered_set<Node *> visited;
     std::vector<Node *> topo_order =
@@ -453,6 +502,22 @@ void autograd_engine::create_optimizer_graph()
                     const auto &input_to_fwd_node_edge = user_data_edges.at(0);
                     Node *gradient = graph->node_by_id(gradient_edge.consumer_node_id);
 
+                    if (multi_tensor)
+                    {
+                        parameter_operands[input_node] = (int)input_to_fwd_node_edge.consumer_input_port_id;
+                        auto group = std::find_if(
+                            multi_tensor_groups.begin(),
+                            multi_tensor_groups.end(),
+                            [input_node](const auto &entry) { return entry.first == input_node->output_df(); });
+                        if (group == multi_tensor_groups.end())
+                        {
+                            multi_tensor_groups.push_back({input_node->output_df(), {}});
+                            group = std::prev(multi_tensor_groups.end());
+                        }
+                        group->second.push_back({input_node, gradient});
+                        continue;
+                    }
+
                     auto generate_op_trace_fcn = config.optimizer.attr("generate_op_trace");
                     autograd_context context = {
                         .autograd = this,
@@ -464,46 +529,55 @@ void autograd_engine::create_optimizer_graph()
                         generate_op_trace_fcn(context, NodeContext(input_node), NodeContext(gradient))
                             .cast<NodeContext>();
 
-                    graph->add_edge(
-                        graph->node_by_id(optimizer_output.id),
-                        input_node,
-                        graphlib::PortId(0),
-                        graphlib::PortId(0),
-                        graphlib::EdgeType::kDataLoopback);
-
-                    for (auto outgoing_edge : graph->user_edges(input_node))
-                    {
-                        graphlib::NodeId outgoing_node_id = outgoing_edge.consumer_node_id;
-                        graphlib::Node *outgoing_node = graph->node_by_id(outgoing_node_id);
-
-                        if (outgoing_node->node_type() == NodeType::kInput)
-                        {
-                            bool is_optimizer_param =
-                                outgoing_node->as<graphlib::InputNode>()->is_optimizer_parameter();
-                            bool has_dataloopback = false;
-
-                            for (auto incoming_edge : graph->operand_edges(outgoing_node))
-                            {
-                                if (incoming_edge.edge_type == graphlib::EdgeType::kDataLoopback)
-                                {
-                                    has_dataloopback = true;
-                                    break;
-                                }
-                            }
-
-                            if (is_optimizer_param && has_dataloopback &&
-                                !outgoing_node->as<graphlib::TaggedNode>()->has_tag("dont_consteval"))
-                            {
-                                outgoing_node->as<graphlib::InputNode>()->clone_consteval_graph_from(input_node);
-                            }
-                        }
-                    }
+                    add_optimizer_loopback(input_node, optimizer_output);
                 }
 
                 visited.insert(input_node);
             }
         }
     }
+
+    for (const auto &[data_format, group] : multi_tensor_groups)
+    {
+        std::vector<NodeContext> parameters;
+        std::vector<NodeContext> gradients;
+        for (const auto &[parameter, gradient] : group)
+        {
+            parameters.push_back(NodeContext(parameter));
+            gradients.push_back(NodeContext(gradient));
+        }
+
+        // Optimizer ops and state of the group are attributed to its first parameter
+        Node *group_node = group.front().first;
+        log_debug(
+            tt::LogAutograd,
+            "Creating multi-tensor optimizer graph for {} parameters ({}) of data format {}",
+            group.size(),
+            group_node->name(),
+            data_format);
+
+        auto generate_op_trace_fcn = config.optimizer.attr("generate_multi_tensor_op_trace");
+        autograd_context context = {
+            .autograd = this,
+            .current_fwd_op = group_node,
+            .operand = parameter_operands.at(group_node),
+            .epoch_type = graphlib::NodeEpochType::Optimizer,
+        };
+        std::vector<NodeContext> optimizer_outputs =
+            generate_op_trace_fcn(context, parameters, gradients).cast<std::vector<NodeContext>>();
+        TT_ASSERT(optimizer_outputs.size() == group.size(), "Expected an updated tensor for every parameter");
+
+        // Optimizer state of the group is flat, consteval operations of the parameters don't apply to it
+        for (size_t i = 0; i < group.size(); i++)
+        {
+            graph->add_edge(
+                graph->node_by_id(optimizer_outputs[i].id),
+                group[i].first,
+                graphlib::PortId(0),
+                graphlib::PortId(0),
+                graphlib::EdgeType::kDataLoopback);
+        }
+    }
 }
 
 Graph *autograd_engine::run()
@@ -142,6 +142,9 @@ class autograd_engine
     // Combine incoming gradients by adding them, and return the new combined node
     Node *combine_incoming_gradients(Node *node);
 
+    // Loop the updated parameter back to the parameter
+    void add_optimizer_loopback(Node *input_node, NodeContext optimizer_output);
+
     // Create optinstructions, and hook them up accordingly
     void create_optimizer_graph();
 
@@ -233,7 +233,7 @@ PYBIND11_MODULE(_C, m)
         &passes::run_mlir_compiler_to_shared_object,
         py::arg("module"),
         py::arg("mlir_config") = std::nullopt);
-    m.def("split_graph", &passes::split_graph);
+    m.def("split_graph", &passes::split_graph, py::arg("graph"), py::arg("accumulate_gradients") = false);
 
     m.def(
         "extract_unique_op_configuration",
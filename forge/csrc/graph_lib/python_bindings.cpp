@@ -67,6 +67,133 @@ py::object eval_input(
     graphlib::NodeEpochType epoch_type = graphlib::NodeEpochType::Forward);
 py::object eval_input_bw(Node *node, py::object inputs);
 
+// Kinds of nodes created in bulk through create_nodes
+enum class BulkNodeKind
+{
+    Op,
+    ParameterInput,
+    ActivationInput,
+    TargetInput,
+    ConstantInput,
+    Output,
+};
+
+namespace
+{
+graphlib::NodeId create_op_node(
+    Graph *graph,
+    const std::string &name,
+    const graphlib::OpType &op_type,
+    const std::vector<std::uint32_t> &shape,
+    tt::DataFormat data_format,
+    const int subgraph_index,
+    graphlib::TagHints tags)
+{
+    auto node = graph->add_node(graphlib::create_node<graphlib::PyOpNode>(name, op_type), subgraph_index);
+    node->set_shape(Shape::create(shape));
+    node->set_output_df(data_format);
+    node->as<graphlib::TaggedNode>()->tag("original_op_name", name);
+    node->as<graphlib::TaggedNode>()->tag("original_op_type", op_type.name());
+    node->as<graphlib::TaggedNode>()->add_tags(tags);
+    return node->id();
+}
+
+graphlib::NodeId create_input_node(
+    Graph *graph,
+    const std::string &name,
+    graphlib::InputNodeType input_type,
+    const std::vector<std::uint32_t> &shape,
+    bool requires_grad,
+    tt::DataFormat data_format,
+    const int subgraph_index)
+{
+    auto node =
+        graph->add_node(graphlib::create_node<graphlib::InputNode>(name, input_type, requires_grad), subgraph_index);
+    node->set_shape(Shape::create(shape));
+    node->set_output_df(data_format);
+    node->as<graphlib::TaggedNode>()->tag("original_op_name", name);
+    return node->id();
+}
+
+graphlib::NodeId create_scalar_constant_input(
+    Graph *graph, const std::string &name, float constant_value, tt::DataFormat data_format, const int subgraph_index)
+{
+    auto node =
+        graph->add_node(graphlib::create_node<graphlib::ConstantInputNode>(name, constant_value), subgraph_index);
+    node->set_shape(Shape::create({1}));
+    node->set_output_df(data_format);
+    return node->id();
+}
+
+graphlib::NodeId create_tensor_constant_input(
+    Graph *graph,
+    const std::string &name,
+    py::object constant_value,
+    const std::vector<std::uint32_t> &shape,
+    tt::DataFormat data_format,
+    const int subgraph_index)
+{
+    auto node = graph->add_node(
+        graphlib::create_node<graphlib::ConstantInputNode>(
+            name, make_shared_py_object(constant_value), Shape::create(shape)),
+        subgraph_index);
+    node->set_output_df(data_format);
+    return node->id();
+}
+
+graphlib::NodeId create_output(
+    Graph *graph,
+    const std::string &name,
+    const std::vector<std::uint32_t> &shape,
+    tt::DataFormat data_format,
+    bool is_loss_output,
+    const int subgraph_index)
+{
+    auto node = graph->add_node(graphlib::create_node<graphlib::OutputNode>(name), subgraph_index);
+    node->set_shape(Shape::create(shape));
+    node->set_output_df(data_format);
+    if (is_loss_output)
+        node->set_loss_output();
+    return node->id();
+}
+
+void create_data_edge(
+    Graph *graph,
+    const graphlib::NodeId start,
+    int out_port_id,
+    const graphlib::NodeId end,
+    int in_port_id,
+    const std::vector<py::tuple> &operand_broadcast)
+{
+    graphlib::Edge edge(
+        start, (graphlib::PortId)out_port_id, end, (graphlib::PortId)in_port_id, graphlib::EdgeType::kData);
+    graph->add_edge(edge);
+    std::shared_ptr<graphlib::EdgeAttributes> attr = graph->get_edge_attributes(edge);
+
+    for (const py::tuple &broadcast : operand_broadcast)
+    {
+        if (in_port_id == broadcast[0].cast<int>())
+        {
+            int dim = broadcast[1].cast<int>();
+            int size = broadcast[2].cast<int>();
+            attr->set_broadcast_dim(dim, size);
+        }
+    }
+}
+
+graphlib::InputNodeType bulk_node_input_type(BulkNodeKind kind)
+{
+    switch (kind)
+    {
+        case BulkNodeKind::ParameterInput: return graphlib::InputNodeType::Parameter;
+        case BulkNodeKind::ActivationInput: return graphlib::InputNodeType::Activation;
+        case BulkNodeKind::TargetInput: return graphlib::InputNodeType::Target;
+        default: TT_THROW("Not an input node kind");
+    }
+    unreachable();
+}
+}  // namespace
+
 void GraphModule(py::module &m_graph)
 {
     py::enum_<tt::graphlib::NodeType>(m_graph, "NodeType")
@@ -107,6 +234,15 @@ void GraphModule(py::module &m_graph)
         .def(
             "get_node_id", [](const Graph &self, const std::string &name) { return self.get_node_by_name(name)->id(); })
         .def("has_node_with_id", &Graph::has_node_with_id)
+        .def("num_nodes", &Graph::num_nodes)
+        .def(
+            "num_edges",
+            [](const Graph &self)
+            {
+                size_t num_edges = 0;
+                for (auto const &[node_id, operand_edges] : self.operands_map()) num_edges += operand_edges.size();
+                return num_edges;
+            })
         .def("set_training", &Graph::set_training)
         .def("training", &Graph::training)
         .def("set_microbatch", &Graph::set_microbatch)
@@ -374,24 +510,7 @@ void GraphModule(py::module &m_graph)
             })
         .def("from_json", [](json const &j) { return j.get<tt::graphlib::RuntimeTensorTransform>(); });
 
-    m_graph.def(
-        "create_op_node",
-        [](Graph *graph,
-           const std::string &name,
-           const graphlib::OpType &op_type,
-           const std::vector<std::uint32_t> &shape,
-           tt::DataFormat data_format,
-           const int subgraph_index,
-           graphlib::TagHints tags)
-        {
-            auto node = graph->add_node(graphlib::create_node<graphlib::PyOpNode>(name, op_type), subgraph_index);
-            node->set_shape(Shape::create(shape));
-            node->set_output_df(data_format);
-            node->as<graphlib::TaggedNode>()->tag("original_op_name", name);
-            node->as<graphlib::TaggedNode>()->tag("original_op_type", op_type.name());
-            node->as<graphlib::TaggedNode>()->add_tags(tags);
-            return node->id();
-        });
+    m_graph.def("create_op_node", &create_op_node);
     m_graph.def(
         "create_parameter_input",
         [](Graph *graph,
@@ -401,13 +520,14 @@ void GraphModule(py::module &m_graph)
            tt::DataFormat data_format,
            const int subgraph_index)
         {
-            auto node = graph->add_node(
-                graphlib::create_node<graphlib::InputNode>(name, graphlib::InputNodeType::Parameter, requires_grad),
+            return create_input_node(
+                graph,
+                name,
+                graphlib::InputNodeType::Parameter,
+                shape,
+                requires_grad,
+                data_format,
                 subgraph_index);
-            node->set_shape(Shape::create(shape));
-            node->set_output_df(data_format);
-            node->as<graphlib::TaggedNode>()->tag("original_op_name", name);
-            return node->id();
         });
     m_graph.def(
         "create_activation_input",
@@ -418,13 +538,14 @@ void GraphModule(py::module &m_graph)
            tt::DataFormat data_format,
            const int subgraph_index)
         {
-            auto node = graph->add_node(
-                graphlib::create_node<graphlib::InputNode>(name, graphlib::InputNodeType::Activation, requires_grad),
+            return create_input_node(
+                graph,
+                name,
+                graphlib::InputNodeType::Activation,
+                shape,
+                requires_grad,
+                data_format,
                 subgraph_index);
-            node->set_shape(Shape::create(shape));
-            node->set_output_df(data_format);
-            node->as<graphlib::TaggedNode>()->tag("original_op_name", name);
-            return node->id();
         });
     m_graph.def(
         "create_target_input",
@@ -435,59 +556,85 @@ void GraphModule(py::module &m_graph)
            tt::DataFormat data_format,
            const int subgraph_index)
         {
-            auto node = graph->add_node(
-                graphlib::create_node<graphlib::InputNode>(name, graphlib::InputNodeType::Target, requires_grad),
-                subgraph_index);
-            node->set_shape(Shape::create(shape));
-            node->set_output_df(data_format);
-            node->as<graphlib::TaggedNode>()->tag("original_op_name", name);
-            return node->id();
-        });
-    m_graph.def(
-        "create_constant_input",
-        [](Graph *graph,
-           const std::string &name,
-           float constant_value,
-           tt::DataFormat data_format,
-           const int subgraph_index)
-        {
-            auto node = graph->add_node(
-                graphlib::create_node<graphlib::ConstantInputNode>(name, constant_value), subgraph_index);
-            node->set_shape(Shape::create({1}));
-            node->set_output_df(data_format);
-            return node->id();
-        });
-    m_graph.def(
-        "create_constant_input",
-        [](Graph *graph,
-           const std::string &name,
-           py::object constant_value,
-           const std::vector<std::uint32_t> &shape,
-           tt::DataFormat data_format,
-           const int subgraph_index)
-        {
-            auto node = graph->add_node(
-                graphlib::create_node<graphlib::ConstantInputNode>(
-                    name, make_shared_py_object(constant_value), Shape::create(shape)),
-                subgraph_index);
-            node->set_output_df(data_format);
-            return node->id();
+            return create_input_node(
+                graph, name, graphlib::InputNodeType::Target, shape, requires_grad, data_format, subgraph_index);
         });
+    m_graph.def("create_constant_input", &create_scalar_constant_input);
+    m_graph.def("create_constant_input", &create_tensor_constant_input);
+    m_graph.def("create_output", &create_output);
+
+    py::enum_<BulkNodeKind>(m_graph, "BulkNodeKind")
+        .value("Op", BulkNodeKind::Op)
+        .value("ParameterInput", BulkNodeKind::ParameterInput)
+        .value("ActivationInput", BulkNodeKind::ActivationInput)
+        .value("TargetInput", BulkNodeKind::TargetInput)
+        .value("ConstantInput", BulkNodeKind::ConstantInput)
+        .value("Output", BulkNodeKind::Output)
+        .export_values();
+
+    // Bulk versions of the create_* functions, creating a whole batch of nodes/edges in a single call.
+    //
+    // Nodes are described by tuples (kind, name, shape, data_format, subgraph_index, attrs), where attrs are:
+    //   Op: (op_type, tags)
+    //   ParameterInput, ActivationInput, TargetInput: (requires_grad,)
+    //   ConstantInput: (value,) - float for scalar constants, tensor otherwise
+    //   Output: (is_loss_output,)
+    // Ids of the created nodes are returned in the order of the descriptors.
     m_graph.def(
-        "create_output",
-        [](Graph *graph,
-           const std::string &name,
-           const std::vector<std::uint32_t> &shape,
-           tt::DataFormat data_format,
-           bool is_loss_output,
-           const int subgraph_index)
+        "create_nodes",
+        [](Graph *graph, const std::vector<py::tuple> &nodes)
         {
-            auto node = graph->add_node(graphlib::create_node<graphlib::OutputNode>(name), subgraph_index);
-            node->set_shape(Shape::create(shape));
-            node->set_output_df(data_format);
-            if (is_loss_output)
-                node->set_loss_output();
-            return node->id();
+            std::vector<graphlib::NodeId> node_ids;
+            node_ids.reserve(nodes.size());
+            for (const py::tuple &node : nodes)
+            {
+                TT_ASSERT(node.size() == 6, "Node descriptor must have 6 elements");
+                BulkNodeKind kind = node[0].cast<BulkNodeKind>();
+                std::string name = node[1].cast<std::string>();
+                std::vector<std::uint32_t> shape = node[2].cast<std::vector<std::uint32_t>>();
+                tt::DataFormat data_format = node[3].cast<tt::DataFormat>();
+                int subgraph_index = node[4].cast<int>();
+                py::tuple attrs = node[5].cast<py::tuple>();
+
+                switch (kind)
+                {
+                    case BulkNodeKind::Op:
+                        node_ids.push_back(create_op_node(
+                            graph,
+                            name,
+                            attrs[0].cast<graphlib::OpType>(),
+                            shape,
+                            data_format,
+                            subgraph_index,
+                            attrs[1].cast<graphlib::TagHints>()));
+                        break;
+                    case BulkNodeKind::ParameterInput:
+                    case BulkNodeKind::ActivationInput:
+                    case BulkNodeKind::TargetInput:
+                        node_ids.push_back(create_input_node(
+                            graph,
+                            name,
+                            bulk_node_input_type(kind),
+                            shape,
+                            attrs[0].cast<bool>(),
+                            data_format,
+                            subgraph_index));
+                        break;
+                    case BulkNodeKind::ConstantInput:
+                        if (py::isinstance<py::float_>(attrs[0]))
+                            node_ids.push_back(create_scalar_constant_input(
+                                graph, name, attrs[0].cast<float>(), data_format, subgraph_index));
+                        else
+                            node_ids.push_back(create_tensor_constant_input(
+                                graph, name, attrs[0], shape, data_format, subgraph_index));
+                        break;
+                    case BulkNodeKind::Output:
+                        node_ids.push_back(
+                            create_output(graph, name, shape, data_format, attrs[0].cast<bool>(), subgraph_index));
+                        break;
+                }
+            }
+            return node_ids;
         });
 
     m_graph.def("get_constant_input_value", &get_constant_input_value);
@@ -500,28 +647,23 @@ void GraphModule(py::module &m_graph)
             return node->shape().as_vector();
         });
 
+    m_graph.def("create_data_edge", &create_data_edge);
+
+    // Edges are described by tuples (start, out_port_id, end, in_port_id, operand_broadcast), see create_data_edge
     m_graph.def(
-        "create_data_edge",
-        [](Graph *graph,
-           const graphlib::NodeId start,
-           int out_port_id,
-           const graphlib::NodeId end,
-           int in_port_id,
-           std::vector<py::tuple> operand_broadcast)
+        "create_data_edges",
+        [](Graph *graph, const std::vector<py::tuple> &edges)
         {
-            graphlib::Edge edge(
-                start, (graphlib::PortId)out_port_id, end, (graphlib::PortId)in_port_id, graphlib::EdgeType::kData);
-            graph->add_edge(edge);
-            std::shared_ptr<graphlib::EdgeAttributes> attr = graph->get_edge_attributes(edge);
-
-            for (const py::tuple &broadcast : operand_broadcast)
+            for (const py::tuple &edge : edges)
             {
-                if (in_port_id == broadcast[0].cast<int>())
-                {
-                    int dim = broadcast[1].cast<int>();
-                    int size = broadcast[2].cast<int>();
-                    attr->set_broadcast_dim(dim, size);
-                }
+                TT_ASSERT(edge.size() == 5, "Edge descriptor must have 5 elements");
+                create_data_edge(
+                    graph,
+                    edge[0].cast<graphlib::NodeId>(),
+                    edge[1].cast<int>(),
+                    edge[2].cast<graphlib::NodeId>(),
+                    edge[3].cast<int>(),
+                    edge[4].cast<std::vector<py::tuple>>());
             }
         });
 
@@ -312,16 +312,24 @@ const std::string &Op::as_string() const { return new_to_old_op_type_mapper[type
  * Default implementation for ops that are not cpp implemented yet. We will invoke old python code to evaluate them. *
  * ------------------------------------------------------------------------------------------------------------------*/
 
+// Python module dispatching to the old python implementation, see forge/op/eval/forge/__init__.py. Imported once, and
+// intentionally never released, so that it isn't destroyed after the interpreter is finalized.
+static py::module_ &forge_eval_module()
+{
+    static py::module_ *module = new py::module_(py::module_::import("forge.op.eval.forge"));
+    return *module;
+}
+
 at::Tensor Op::base_eval(const graphlib::OpType &old_op_type, const std::vector<at::Tensor> &tensors) const
 {
-    py::function eval = py::module_::import("forge.op.eval.forge").attr("get_f_forge_eval")(&old_op_type);
+    py::function eval = forge_eval_module().attr("get_f_forge_eval")(&old_op_type);
     return eval(&tensors).cast<at::Tensor>();
 }
 
 std::tuple<graphlib::Shape, std::vector<graphlib::DimBroadcast>> Op::base_shape(
     const graphlib::OpType &old_op_type, const std::vector<std::vector<std::uint32_t>> &inputs) const
 {
-    py::function shape = py::module_::import("forge.op.eval.forge").attr("get_f_forge_shape")(&old_op_type);
+    py::function shape = forge_eval_module().attr("get_f_forge_shape")(&old_op_type);
     py::tuple result = shape(&inputs);
     if (result.size() != 2)
         throw std::runtime_error("Expected a tuple of shape and broadcast.");
@@ -339,7 +347,7 @@ tt::graphlib::NodeContext Op::base_backward(
     const tt::graphlib::NodeContext &output,
     const tt::graphlib::NodeContext &gradient) const
 {
-    py::function backward = py::module_::import("forge.op.eval.forge").attr("get_f_forge_backward")(&old_op_type);
+    py::function backward = forge_eval_module().attr("get_f_forge_backward")(&old_op_type);
     return backward(&context, operand, &inputs, &output, &gradient).cast<tt::graphlib::NodeContext>();
 }
 
@@ -349,15 +357,14 @@ void Op::base_decompose(
     DecomposingContext &dc,
     const std::vector<tt::graphlib::NodeContext> &inputs) const
 {
-    py::function decompose = py::module_::import("forge.op.eval.forge").attr(dispatch)(&old_op_type);
+    py::function decompose = forge_eval_module().attr(dispatch)(&old_op_type);
     decompose(&dc, &inputs);
 }
 
 long Op::base_initial_flops_estimate(
     const graphlib::OpType &old_op_type, const std::vector<std::vector<std::uint32_t>> &inputs) const
 {
-    py::function initial_flops_estimate =
-        py::module_::import("forge.op.eval.forge").attr("get_f_forge_initial_flops_estimate")(&old_op_type);
+    py::function initial_flops_estimate = forge_eval_module().attr("get_f_forge_initial_flops_estimate")(&old_op_type);
     py::object ret = initial_flops_estimate(&inputs);
 
     return ret.is_none() ? 0 : ret.cast<long>();
@@ -166,8 +166,39 @@ std::unique_ptr<Graph> extract_forward_graph(const Graph *graph, const std::vect
     return fwd_graph;
 }
 
+// Makes the gradient output accumulate into a persistent buffer, i.e. `grad_out = grad + accumulated`, where
+// `accumulated` is a new backward graph input aliased to the gradient output. The runtime keeps the buffer in the
+// tensor pool, and replaces it with the gradient output after each backward pass. See
+// `OutputNode::is_aliased_tensor()`.
+//
+// Returns the id of the accumulator input node.
+graphlib::NodeId add_gradient_accumulator(
+    Graph *bwd_graph, const graphlib::QueueNode *queue_node, graphlib::Node *gradient, graphlib::Node *grad_out)
+{
+    auto accumulator_node = graphlib::create_node<graphlib::InputNode>(
+        queue_node->name() + "_accumulated", graphlib::InputNodeType::Accumulator, false);
+    accumulator_node->set_shape(queue_node->shape());
+    accumulator_node->set_output_df(queue_node->output_df());
+    accumulator_node->set_epoch_type(graphlib::NodeEpochType::Backward);
+    auto accumulator = bwd_graph->add_node(std::move(accumulator_node), 0 /*subgraph_id=*/);
+
+    auto add_node =
+        graphlib::create_node<graphlib::PyOpNode>(queue_node->name() + "_accumulate", graphlib::OpType("add"));
+    add_node->set_shape(queue_node->shape());
+    add_node->set_output_df(queue_node->output_df());
+    add_node->set_epoch_type(graphlib::NodeEpochType::Backward);
+    auto add = bwd_graph->add_node(std::move(add_node), 0 /*subgraph_id=*/);
+
+    bwd_graph->add_edge(gradient, add, 0, 0, graphlib::EdgeType::kData);
+    bwd_graph->add_edge(accumulator, add, 0, 1, graphlib::EdgeType::kData);
+    bwd_graph->add_edge(add, grad_out, 0, 0, graphlib::EdgeType::kData);
+
+    grad_out->as<graphlib::OutputNode>()->set_alias(accumulator->as<graphlib::InputNode>());
+    return accumulator->id();
+}
+
 std::unique_ptr<Graph> extract_backward_graph(
-    const Graph *graph, const Graph *fwd_graph, const std::vector<graphlib::Node *> &topo)
+    const Graph *graph, const Graph *fwd_graph, const std::vector<graphlib::Node *> &topo, bool accumulate_gradients)
 {
     auto bwd_graph = std::make_unique<Graph>(tt::graphlib::IRLevel::IR_TT_FORGE, "backward");
     bwd_graph->set_training(graph->training());
@@ -207,6 +238,7 @@ std::unique_ptr<Graph> extract_backward_graph(
         }
     }
 
+    std::vector<graphlib::NodeId> bwd_accumulator_inputs;
     for (auto node : topo)
     {
         if (!node->is_backward())
@@ -241,7 +273,15 @@ std::unique_ptr<Graph> extract_backward_graph(
                 operand->name());
 
             auto cloned_operand = bwd_graph->get_node_by_name(operand->name());
-            bwd_graph->add_edge(cloned_operand, grad_out, 0, 0, graphlib::EdgeType::kData);
+            if (accumulate_gradients)
+            {
+                bwd_accumulator_inputs.push_back(
+                    add_gradient_accumulator(bwd_graph.get(), queue_node, cloned_operand, grad_out));
+            }
+            else
+            {
+                bwd_graph->add_edge(cloned_operand, grad_out, 0, 0, graphlib::EdgeType::kData);
+            }
 
             continue;
         }
@@ -292,6 +332,7 @@ std::unique_ptr<Graph> extract_backward_graph(
     // 1. Inputs that are exclusive to the backward graph
     // 2. Intermediate outputs from the forward graph
     // 3. Inputs from the forward graph that have users in the backward graph
+    // 4. Gradient accumulators (if gradients are accumulated)
     std::vector<graphlib::NodeId> bwd_module_inputs;
     for (auto input : graph->ordered_module_inputs())
     {
@@ -320,6 +361,8 @@ std::unique_ptr<Graph> extract_backward_graph(
         }
     }
 
+    bwd_module_inputs.insert(bwd_module_inputs.end(), bwd_accumulator_inputs.begin(), bwd_accumulator_inputs.end());
+
     bwd_graph->register_module_inputs(bwd_module_inputs);
 
     std::vector<graphlib::NodeId> bwd_module_outputs;
@@ -457,7 +500,7 @@ std::unique_ptr<Graph> extract_optimizer_graph(
 }
 
 // Splits the graph into multiple graphs which will be lowered to MLIR as different functions.
-ForgeGraphModule split_graph(graphlib::Graph *graph)
+ForgeGraphModule split_graph(graphlib::Graph *graph, bool accumulate_gradients)
 {
     auto topo = graphlib::topological_sort(*graph);
 
@@ -473,7 +516,7 @@ ForgeGraphModule split_graph(graphlib::Graph *graph)
         return module;
     }
 
-    auto bwd_graph = extract_backward_graph(graph, module.get_graph(GraphType::Forward), topo);
+    auto bwd_graph = extract_backward_graph(graph, module.get_graph(GraphType::Forward), topo, accumulate_gradients);
     reportify::dump_graph(graph->name(), "backward_graph", bwd_graph.get());
     module.set_graph(GraphType::Backward, bwd_graph.release());
 
@@ -14,6 +14,9 @@ namespace tt::passes
 {
 // Split the graph into multiple graphs which will lower to different MLIR programs,
 // i.e. forward, backward, etc.
-ForgeGraphModule split_graph(tt::graphlib::Graph* graph);
+//
+// If `accumulate_gradients` is set, the backward graph adds the parameter gradients into persistent accumulators,
+// instead of returning the gradients of the current pass.
+ForgeGraphModule split_graph(tt::graphlib::Graph* graph, bool accumulate_gradients = false);
 
 }  // namespace tt::passes
@@ -22,10 +22,12 @@ void RuntimeModule(py::module &m_runtime)
         .def("store", &runtime::Binary::store)
         .def("as_json", &runtime::Binary::asJson);
     m_runtime.def("run_program", &tt::run_program);
+    m_runtime.def("load_binary_from_file", &tt::load_binary_from_file);
 
     py::class_<Tensor>(m_runtime, "Tensor")
         .def(py::init<torch::Tensor &>())
         .def("to_torch", &Tensor::to_torch)
+        .def("to_torch_into", &Tensor::to_torch_into, py::arg("out"))
         .def("update_host_data", &Tensor::update_host_data)
         .def("detach_from_device", &Tensor::detach_from_device);
     py::class_<TensorPool>(m_runtime, "TensorPool")
@@ -34,7 +36,8 @@ void RuntimeModule(py::module &m_runtime)
         .def(
             "insert",
             [](TensorPool &self, const std::string &name, torch::Tensor &tensor) { self.insert(name, tensor); })
-        .def("update_tensor", &TensorPool::update_tensor);
+        .def("update_tensor", &TensorPool::update_tensor)
+        .def("replace_tensor", &TensorPool::replace_tensor);
 
     py::enum_<ProgramType>(m_runtime, "ProgramType")
         .value("Forward", ProgramType::Forward)
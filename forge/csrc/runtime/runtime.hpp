@@ -12,6 +12,9 @@
 namespace tt
 {
 
+// Loads the flatbuffer binary from the file (e.g. one previously stored via Binary::store).
+runtime::Binary load_binary_from_file(std::string const& filename);
+
 // Helper function to load the binary from the file and run a program - might be useful for testing/debugging.
 std::vector<tt::Tensor> run_program_from_file(
     std::string const& filename, int program_idx, std::vector<torch::Tensor> const& inputs);
@@ -62,12 +62,16 @@ void ModelState::run_program(ProgramType program_type, std::vector<tt::Tensor> a
     // NOTE: there is an ordering requirement for the activation inputs and the persistent inputs, i.e.
     // in the input list (`inputs` vector here), the activation inputs come first. Unfortunately, there isn't any
     // mechanism which enforces this, yet. It's an informal contract between the compiler and the runtime.
+    //
+    // The layout index is the position of the input in the program's input list, so it is advanced for every input,
+    // including the ones already on device (e.g. outputs of a previous run passed back as inputs).
     size_t input_idx = 0;
     for (auto tensor : act_inputs)
     {
+        size_t curr_input_id = input_idx++;
         if (!tensor.on_device())
         {
-            auto layout = tt::runtime::getLayout(binary, pg_id, input_idx++);
+            auto layout = tt::runtime::getLayout(binary, pg_id, curr_input_id);
             tensor.to_device(device_id, layout);
         }
 
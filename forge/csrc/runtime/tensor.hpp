@@ -123,6 +123,28 @@ class TensorImpl : public std::enable_shared_from_this<TensorImpl>
         return torch_tensor;
     }
 
+    // Copies the tensor into the given host tensor, without allocating a new host tensor.
+    // When the data type and layout of `out` match the tensor, the data is copied from the device directly into `out`,
+    // otherwise it goes through the host storage and is converted to the data type of `out`.
+    void to_torch_into(torch::Tensor& out)
+    {
+        bool layout_matches = out.scalar_type() == dt_to_torch_scalar_type(desc.dataType) &&
+                              out.sizes().vec() == as_vec_int64(desc.shape) &&
+                              out.strides().vec() == as_vec_int64(desc.stride);
+        if (host_storage.has_value() || !layout_matches)
+        {
+            out.copy_(to_torch());
+            return;
+        }
+
+        TT_ASSERT(rt_tensor.has_value(), "We expect the tensor to be on device");
+        constexpr bool untilize_tensor = true;
+        auto sharded_tensor = tt::runtime::toHost(rt_tensor.value(), untilize_tensor);
+        TT_ASSERT(sharded_tensor.size() == 1, "We don't expect sharded tensors, i.e. we expect only one shard");
+
+        tt::runtime::memcpy(out.data_ptr(), sharded_tensor[0]);
+    }
+
     // Creates a device tensor from the host tensor.
     // Note: the host tensor is not modified and lives on.
     void to_device(const size_t device_id, runtime::Layout& layout)
@@ -210,6 +232,9 @@ class Tensor
     // If the tensor is on device, it will first be copied to the host.
     torch::Tensor to_torch() const { return impl->to_torch(); }
 
+    // Copies this tensor into the given host tensor, see `TensorImpl::to_torch_into`.
+    void to_torch_into(torch::Tensor& out) const { impl->to_torch_into(out); }
+
     void to_device(const size_t device_id, runtime::Layout& layout) { impl->to_device(device_id, layout); }
 
     void update_host_data() { impl->update_host_data(); }
@@ -252,6 +277,14 @@ class TensorPool
         tensor_name_to_value.at(name).get_runtime_tensor() = tensor.get_runtime_tensor();
     }
 
+    // Replaces the tensor under the given name with a different tensor (which doesn't have to be on device).
+    // Unlike `update_tensor`, the change is not visible through copies of the old tensor (e.g. in program states).
+    void replace_tensor(const std::string& name, tt::Tensor& tensor)
+    {
+        TT_ASSERT(tensor_name_to_value.find(name) != tensor_name_to_value.end(), "Tensor {} not found", name);
+        tensor_name_to_value.at(name) = tensor;
+    }
+
    private:
     std::unordered_map<std::string, Tensor> tensor_name_to_value;
 
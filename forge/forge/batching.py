@@ -0,0 +1,300 @@
+# SPDX-FileCopyrightText: © 2025 Tenstorrent AI ULC
+
+# SPDX-License-Identifier: Apache-2.0
+"""
+Dynamic batching of single-sample inference requests.
+
+The model is compiled for a fixed batch size. `BatchScheduler` collects single-sample requests until the batch is
+full, or until the oldest request in the batch has waited for the latency deadline, pads a partial batch up to the
+compiled batch size, runs the model once per batch and scatters the outputs back to the requests:
+
+    compiled_model = forge.compile(model, sample_inputs=[torch.rand(8, 3, 224, 224)])
+    scheduler = BatchScheduler(compiled_model, max_batch_size=8, max_latency_ms=5)
+    future = scheduler.submit(torch.rand(1, 3, 224, 224))
+    output = future.result()[0]  # [1, 1000]
+
+`BatchingHTTPServer` exposes the scheduler over HTTP, see its docstring for the request format.
+"""
+
+import json
+import queue
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import torch
+from loguru import logger
+
+# Percentiles of the request latency reported in the metrics
+LATENCY_PERCENTILES = [50, 90, 99]
+
+# Number of most recent requests over which the latency percentiles are computed
+LATENCY_WINDOW = 10000
+
+
+@dataclass
+class BatchRequest:
+    inputs: Sequence[torch.Tensor]
+    future: Future
+    # Time of submission, from `time.perf_counter`
+    submit_time: float
+
+
+class BatchingMetrics:
+    """
+    Metrics of the batch scheduler - number of served requests and batches, batch fill ratio and request latency
+    percentiles (time from submission until the result is available).
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.num_requests = 0
+        self.num_batches = 0
+        # Sum of the batch sizes before padding
+        self.num_batched_samples = 0
+        self.latencies = deque(maxlen=LATENCY_WINDOW)
+
+    def record_batch(self, batch_size: int, latencies: List[float]):
+        with self.lock:
+            self.num_batches += 1
+            self.num_requests += len(latencies)
+            self.num_batched_samples += batch_size
+            self.latencies.extend(latencies)
+
+    def to_dict(self, max_batch_size: int) -> Dict[str, float]:
+        with self.lock:
+            latencies = np.array(self.latencies, dtype=np.float64) * 1e3
+            metrics = {
+                "requests": self.num_requests,
+                "batches": self.num_batches,
+                "batch_fill_ratio": (
+                    self.num_batched_samples / (self.num_batches * max_batch_size) if self.num_batches else 0.0
+                ),
+            }
+        for percentile in LATENCY_PERCENTILES:
+            metrics[f"latency_p{percentile}_ms"] = (
+                float(np.percentile(latencies, percentile)) if len(latencies) else 0.0
+            )
+        return metrics
+
+
+class BatchScheduler:
+    """
+    Groups single-sample requests into batches, and runs them on the model.
+
+    Parameters
+    ----------
+    model: Callable
+        Called with the batched inputs, returns the list of batched outputs, e.g. `CompiledModel`. Batch is the first
+        dimension of all inputs and outputs.
+    max_batch_size: int
+        Batch size for which the model is compiled.
+    max_latency_ms: float
+        Maximum time the first request of a batch waits for the batch to fill up.
+    pad_partial_batches: bool
+        Pad partial batches to `max_batch_size` with zeros, required if the model is compiled for a fixed batch size.
+    """
+
+    def __init__(
+        self,
+        model: Callable[..., List[torch.Tensor]],
+        max_batch_size: int,
+        max_latency_ms: float = 5.0,
+        pad_partial_batches: bool = True,
+    ):
+        assert max_batch_size > 0, "Batch size has to be positive"
+
+        self.model = model
+        self.max_batch_size = max_batch_size
+        self.max_latency = max_latency_ms / 1e3
+        self.pad_partial_batches = pad_partial_batches
+
+        # Shapes and dtypes of the inputs of a single sample, set by the first request
+        self.sample_signature: Optional[List[Tuple[torch.Size, torch.dtype]]] = None
+        self.requests: queue.Queue = queue.Queue()
+        self.metrics = BatchingMetrics()
+        self.closed = False
+        self.submit_lock = threading.Lock()
+
+        self.worker = threading.Thread(target=self._run, name="forge_batch_scheduler", daemon=True)
+        self.worker.start()
+
+    def submit(self, *inputs: torch.Tensor) -> Future:
+        """
+        Submits a single-sample request, returns the future of the list of its outputs. Batch dimension of the inputs
+        (and of the outputs) has to be 1.
+        """
+        signature = [(t.shape, t.dtype) for t in inputs]
+        with self.submit_lock:
+            if self.closed:
+                raise RuntimeError("Cannot submit to a scheduler which has been shut down")
+
+            if self.sample_signature is None:
+                for t in inputs:
+                    if t.dim() == 0 or t.shape[0] != 1:
+                        raise ValueError(f"Expected inputs with batch size 1, got shape {list(t.shape)}")
+                self.sample_signature = signature
+            elif signature != self.sample_signature:
+                raise ValueError(f"Request inputs {signature} don't match the model inputs {self.sample_signature}")
+
+            future = Future()
+            self.requests.put(BatchRequest(inputs, future, time.perf_counter()))
+        return future
+
+    def queue_depth(self) -> int:
+        """
+        Returns the number of requests waiting to be batched.
+        """
+        return self.requests.qsize()
+
+    def get_metrics(self) -> Dict[str, float]:
+        metrics = self.metrics.to_dict(self.max_batch_size)
+        metrics["queue_depth"] = self.queue_depth()
+        return metrics
+
+    def _collect_batch(self) -> Optional[List[BatchRequest]]:
+        first = self.requests.get()
+        if first is None:
+            return None
+
+        batch = [first]
+        deadline = first.submit_time + self.max_latency
+        while len(batch) < self.max_batch_size:
+            timeout = deadline - time.perf_counter()
+            try:
+                request = self.requests.get(timeout=timeout) if timeout > 0 else self.requests.get_nowait()
+            except queue.Empty:
+                break
+            if request is None:
+                # Serve the collected requests before shutting down
+                self.requests.put(None)
+                break
+            batch.append(request)
+        return batch
+
+    def _run_batch(self, batch: List[BatchRequest]):
+        # Requests cancelled while waiting in the queue are dropped
+        batch = [request for request in batch if request.future.set_running_or_notify_cancel()]
+        if not batch:
+            return
+
+        try:
+            batched_inputs = []
+            for input_idx in range(len(batch[0].inputs)):
+                samples = [request.inputs[input_idx] for request in batch]
+                if self.pad_partial_batches and len(batch) < self.max_batch_size:
+                    padding = torch.zeros_like(samples[0]).expand(
+                        self.max_batch_size - len(batch), *samples[0].shape[1:]
+                    )
+                    samples.append(padding)
+                batched_inputs.append(torch.cat(samples, dim=0))
+
+            outputs = self.model(*batched_inputs)
+        except BaseException as e:
+            logger.debug(f"Batch of {len(batch)} requests failed: {e}")
+            for request in batch:
+                request.future.set_exception(e)
+            return
+
+        # Scatter the outputs back, outputs of the padding samples are dropped. Samples are copied out of the batch,
+        # since the model can reuse its output buffers (see `CompiledModel.enable_persistent_buffers`)
+        for sample_idx, request in enumerate(batch):
+            request.future.set_result([output[sample_idx : sample_idx + 1].clone() for output in outputs])
+
+        finished = time.perf_counter()
+        self.metrics.record_batch(len(batch), [finished - request.submit_time for request in batch])
+
+    def _run(self):
+        while True:
+            batch = self._collect_batch()
+            if batch is None:
+                return
+            self._run_batch(batch)
+
+    def shutdown(self, wait: bool = True):
+        """
+        Stops accepting new requests. Requests already submitted are served.
+        """
+        with self.submit_lock:
+            if not self.closed:
+                self.closed = True
+                self.requests.put(None)
+
+        if wait:
+            self.worker.join()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.shutdown()
+
+
+class BatchingHTTPServer(ThreadingHTTPServer):
+    """
+    HTTP front end of the batch scheduler.
+
+    POST /infer - runs a single sample. Request body is `{"inputs": [input_0, input_1, ...]}`, where every input is a
+    nested list holding one sample (without the batch dimension). Response body is `{"outputs": [...]}` in the same
+    format.
+
+    GET /metrics - returns the scheduler metrics.
+
+        server = BatchingHTTPServer(scheduler, ("localhost", 8000))
+        server.serve_forever()
+    """
+
+    daemon_threads = True
+
+    def __init__(self, scheduler: BatchScheduler, server_address: Tuple[str, int]):
+        self.scheduler = scheduler
+        super().__init__(server_address, BatchingRequestHandler)
+
+
+class BatchingRequestHandler(BaseHTTPRequestHandler):
+    server: BatchingHTTPServer
+
+    def _send_json(self, status: int, body: Dict):
+        payload = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def do_GET(self):
+        if self.path != "/metrics":
+            self._send_json(404, {"error": f"Unknown path {self.path}"})
+            return
+        self._send_json(200, self.server.scheduler.get_metrics())
+
+    def do_POST(self):
+        if self.path != "/infer":
+            self._send_json(404, {"error": f"Unknown path {self.path}"})
+            return
+
+        try:
+            request = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))))
+            scheduler = self.server.scheduler
+            dtypes = [dtype for _, dtype in scheduler.sample_signature] if scheduler.sample_signature else []
+            inputs = [
+                torch.tensor(value, dtype=dtypes[idx] if idx < len(dtypes) else None).unsqueeze(0)
+                for idx, value in enumerate(request["inputs"])
+            ]
+            outputs = scheduler.submit(*inputs).result()
+        except (ValueError, KeyError, TypeError) as e:
+            self._send_json(400, {"error": str(e)})
+            return
+        except Exception as e:
+            self._send_json(500, {"error": str(e)})
+            return
+
+        self._send_json(200, {"outputs": [output.squeeze(0).tolist() for output in outputs]})
+
+    def log_message(self, format, *args):
+        logger.trace(f"{self.address_string()} - {format % args}")
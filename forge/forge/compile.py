@@ -9,7 +9,14 @@ import torch
 from loguru import logger
 
 import forge
-from forge.compiled_graph_state import CompiledGraphState, CompiledModel, CompileResults
+from forge.compiled_graph_state import (
+    CompiledGraphState,
+    CompiledModel,
+    CompileResults,
+    get_optimizer_parameter_key,
+)
+from forge.compile_cache import get_compile_cache, is_compile_cache_enabled
+from forge.compile_profiler import compile_phase, profile_compile, write_compile_profile
 from forge.config import (
     CompilerConfig,
     CompileDepth,
@@ -30,11 +37,11 @@ import forge._C.graph as pygraph
 from forge._C.graph import Graph
 from forge._C.runtime import Binary
 import forge.ci as ci
-from forge.module import Module, ForgeModule, wrap_module, AnyModule
+from forge.module import Module, ForgeModule, wrap_module, AnyModule, get_any_module_types
 from forge.parameter import Parameter
 from forge.forgeglobal import state_changed, clear_state_changed
 import forge.query as query
-from forge.tensor import Tensor, to_pt_tensors, AnyTensor
+from forge.tensor import Tensor, to_pt_tensors, AnyTensor, evaluate_lazy_values
 from forge.verify import DeprecatedVerifyConfig, do_verify, _generate_random_losses, _run_pytorch_backward
 from forge.forge_property_utils import (
     ExecutionStage,
@@ -154,6 +161,9 @@ def calculate_grads(outputs: Tuple[Tensor, ...], intermediate_golden_tensors: Di
     Verify graph vs. pytorch golden
     """
 
+    # Lazily traced outputs are evaluated together, see `evaluate_lazy_values`
+    evaluate_lazy_values(list(outputs))
+
     # retain intermediate gradients for verification
     for t in intermediate_golden_tensors.values():
         if t.requires_grad == True:
@@ -217,7 +227,7 @@ def compile_main(
     CompiledModel - Callable object that can be used to run the compiled module on device.
 
     """
-    assert isinstance(module, AnyModule), f"Forge only supports: {AnyModule}."
+    assert isinstance(module, get_any_module_types()), f"Forge only supports: {AnyModule}."
 
     if module_name is None:
         module_name = module.__class__.__name__
@@ -238,6 +248,22 @@ def compile_main(
     record_compiler_config(compiler_cfg)
     record_execution(ExecutionStage.FAILED_TVM_RELAY_IRMODULE_GENERATION)
 
+    # Only inference compiles of framework modules are cached for now; training programs are linked with the
+    # optimizer and the attached modules, which can't be restored from the cache.
+    cache_key = None
+    if (
+        is_compile_cache_enabled()
+        and not training
+        and attach_to is None
+        and compiler_cfg.compile_depth == CompileDepth.FULL
+    ):
+        compile_cache = get_compile_cache()
+        cache_key = compile_cache.get_key(modules[0], sample_inputs, compiler_cfg, training)
+        if cache_key is not None:
+            compiled_module = compile_cache.load(cache_key, modules[0])
+            if compiled_module is not None:
+                return compiled_module
+
     compile_context: CompileContext = CompileContext(
         modules=modules,
         graph_name=module_name,
@@ -251,13 +277,20 @@ def compile_main(
         attach_to=attach_to,
     )
 
-    return forge_compile_from_context(compile_context)
+    compiled_module = forge_compile_from_context(compile_context)
+
+    if cache_key is not None and isinstance(compiled_module, CompiledModel):
+        compile_cache.store(cache_key, compiled_module)
+
+    return compiled_module
 
 
 def forge_compile_from_context(context: CompileContext) -> CompiledModel:
     """
     Run front-end compile passes and generate a Forge netlist, with a given compile context.
 
+    If compile profiling is enabled, the profile is attached to the result as `compile_profile`.
+
     Parameters
     ----------
     context: CompileContext
@@ -267,6 +300,35 @@ def forge_compile_from_context(context: CompileContext) -> CompiledModel:
     -------
     CompileResults
 
+    """
+    compiler_cfg = context.compiler_cfg
+    profiling_enabled = (
+        compiler_cfg.enable_compile_profiler or compiler_cfg.compile_profile_path or compiler_cfg.compile_trace_path
+    )
+
+    with profile_compile(context.graph_name, enabled=bool(profiling_enabled)) as profiler:
+        compile_result = run_compile_stages(context)
+
+    if profiler is not None:
+        compile_result.compile_profile = profiler.profile
+        write_compile_profile(profiler.profile, compiler_cfg.compile_profile_path, compiler_cfg.compile_trace_path)
+
+    return compile_result
+
+
+def run_compile_stages(context: CompileContext) -> CompiledModel:
+    """
+    Runs compile stages from the current stage of the context up to the compile depth.
+
+    Parameters
+    ----------
+    context: CompileContext
+        Contains all needed info to run compile passes.
+
+    Returns
+    -------
+    CompiledModel, or CompileResults if the compilation is stopped early
+
     """
 
     # Map stages to functions which execute them.
@@ -293,7 +355,10 @@ def forge_compile_from_context(context: CompileContext) -> CompiledModel:
         compiler_cfg = context.compiler_cfg
 
         # Execute the current stage.
-        next_stage = stage_to_func[current_stage](context)
+        with compile_phase(current_stage.name.lower(), category="compile_stage") as phase:
+            next_stage = stage_to_func[current_stage](context)
+        if phase is not None:
+            phase.set_graph(context.graph)
 
         # Check if we need to stop compilation or perform verifications in the current stage.
         should_early_stop_compilation = check_for_compilation_early_stop(compiler_cfg.compile_depth, current_stage)
@@ -334,15 +399,6 @@ def forge_compile_from_context(context: CompileContext) -> CompiledModel:
 
         context.stage = next_stage
 
-    compile_results = generate_compile_results(
-        verify_cfg,
-        context.initial_graph_copy,
-        context.outputs,
-        context.intermediate_tensors,
-        final_graph=context.final_graph,
-        pass_specific_output_kwargs=context.output_kwargs,
-    )
-
     assert context.forge_module is not None
     fwd_compiled_graph_state = CompiledGraphState.from_compiled_graph(
         context.modules[0], context.forge_module.get_graph(GraphType.Forward)
@@ -374,15 +430,15 @@ def forge_compile_from_context(context: CompileContext) -> CompiledModel:
             graph_opt_params = context.graph.get_optimizer_parameter_nodes()
 
             # Now convert the names of the optimizer parameters to the names of the parameters in the compiled graph.
-            module_param_names = [param.get_name() for param in module_params]
+            module_param_names = set(param.get_name() for param in module_params)
+            for param_name, _ in opt_params:
+                assert param_name in module_param_names, f"Parameter {param_name} not found in module parameters"
+
             converted_opt_params = {}
             for opt_param_node in graph_opt_params:
-                for opt_param in opt_params:
-                    param_name, opt_param_name = opt_param
-                    assert param_name in module_param_names, f"Parameter {param_name} not found in module parameters"
-
-                    if param_name in opt_param_node.name and opt_param_name in opt_param_node.name:
-                        converted_opt_params[opt_param_node.name] = opt_params[opt_param]
+                opt_param = get_optimizer_parameter_key(opt_param_node.name)
+                if opt_param in opt_params:
+                    converted_opt_params[opt_param_node.name] = opt_params[opt_param]
 
             opt_compiled_graph_state = CompiledGraphState.from_compiled_graph(
                 context.modules[0], context.forge_module.get_graph(GraphType.Optimizer), converted_opt_params
@@ -940,7 +996,9 @@ def split_graph(context: CompileContext) -> CompileDepth:
     record_execution(ExecutionStage.FAILED_FORGE_GRAPH_SPLIT)
 
     assert context.graph is not None
-    context.forge_module = forge._C.split_graph(context.graph)
+    context.forge_module = forge._C.split_graph(
+        context.graph, accumulate_gradients=context.compiler_cfg.enable_gradient_accumulation
+    )
 
     return CompileDepth.RUN_MLIR_COMPILER
 
@@ -1061,15 +1119,8 @@ def generate_graph(
     from collections import deque
     import inspect
 
-    from forge._C.graph import (
-        create_output,
-        create_parameter_input,
-        create_data_edge,
-        create_activation_input,
-        create_constant_input,
-        create_op_node,
-        create_target_input,
-    )
+    from forge._C.graph import OpType, add_partial_datacopy_edge
+    from forge.graph_builder import GraphBuilder
 
     inputs = context.inputs
     graph_name = context.graph_name
@@ -1092,7 +1143,7 @@ def generate_graph(
         if compiler_cfg.compile_subgraphs:
             outputs = inputs[idx]
 
-        start_tracing()
+        start_tracing(shape_only=compiler_cfg.enable_shape_only_tracing)
         outputs = module.forward(*outputs)
         stop_tracing()
         if isinstance(outputs, Tensor):
@@ -1112,6 +1163,9 @@ def generate_graph(
     if trace_only:
         return graph, all_subgraph_outputs, {}, inputs, target_tensors
 
+    # Nodes are created in bulk through the builder, and are referred to by builder handles until flushed
+    builder = GraphBuilder(graph)
+
     visited_tensors = {}
     pending_tensors = deque()
     intermediate = {}
@@ -1136,44 +1190,47 @@ def generate_graph(
             input_names_known = False
     inputs, _, _ = flatten_inputs(inputs)
 
+    # Tensors compare and hash by identity, index of the first occurrence of each input
+    input_indices: Dict[Tensor, int] = {}
+    for index, input in enumerate(inputs):
+        input_indices.setdefault(input, index)
+    target_tensor_set = set(target_tensors)
+
     for out in all_subgraph_outputs:
         module = output_to_module_map[out]
         assert module is not None
         module_name = module.get_name()
+        subgraph_idx = output_to_subgraph_index.get(out, 0)
 
         if out.src_op is None:
 
             # No source op. It could be a pass-through, so let's compare to inputs
-            found = False
-            for input in inputs:
-                if input == out:
-                    # Found a passthrough
-                    outq = create_output(
-                        graph,
-                        module_name + f".output_passthrough_{len(passthroughs)}",
-                        out.shape.get_pytorch_shape(),
-                        out.data_format,
-                        module.is_loss,
-                        output_to_subgraph_index.get(out, 0),
-                    )
-                    passthroughs.add(input)
-                    found = True
-                    break
-
-            if not found:
+            if out not in input_indices:
                 raise RuntimeError("Untraced output tensor encountered")
 
+            # Found a passthrough
+            outq = builder.add_output(
+                module_name + f".output_passthrough_{len(passthroughs)}",
+                out.shape.get_pytorch_shape(),
+                out.data_format,
+                module.is_loss,
+                subgraph_idx,
+            )
+            passthroughs.add(out)
+
         else:
-            outq = create_output(
-                graph,
+            outq = builder.add_output(
                 module_name + ".output_" + out.src_op.name,
                 out.shape.get_pytorch_shape(),
                 out.data_format,
                 module.is_loss,
-                output_to_subgraph_index.get(out, 0),
+                subgraph_idx,
             )
         module_output_tensor_to_node[out] = outq
-        pending_tensors.append((out, outq, 0, [], output_to_subgraph_index.get(out, 0)))
+        pending_tensors.append((out, outq, 0, [], subgraph_idx))
+
+    # Ids of the output nodes are used in the names of passthrough nops
+    builder.flush()
 
     recorded_parameters = {}
 
@@ -1183,7 +1240,7 @@ def generate_graph(
 
         if tensor in visited_tensors:
             # Already created the note - let's add the edge and move on
-            create_data_edge(graph, visited_tensors[tensor], 0, output, port_index, operand_broadcast)
+            builder.add_data_edge(visited_tensors[tensor], 0, output, port_index, operand_broadcast)
             continue
 
         if isinstance(tensor, int):
@@ -1195,36 +1252,35 @@ def generate_graph(
             if tensor.get_name() is not None:
                 name = tensor.get_name()
             else:
-                name = "parameter_" + graph.get_node_name(output)
+                name = "parameter_" + builder.get_node_name(output)
 
             if name in recorded_parameters:
                 # Multiple subgraphs might use the same parameter. If it is used in the same subgraph,
                 # we should have already found it in the visited_tensors dictionary. Putting an assert here
                 # to catch fallouts.
                 assert (
-                    graph.get_subgraph_id_for_node(recorded_parameters[name]) != subgraph_idx
+                    builder.get_subgraph_idx(recorded_parameters[name]) != subgraph_idx
                 ), "Trying to add parameter with name: {} that is used in the same subgraph".format(name)
-                create_data_edge(graph, recorded_parameters[name], 0, output, port_index, operand_broadcast)
+                builder.add_data_edge(recorded_parameters[name], 0, output, port_index, operand_broadcast)
                 continue
 
-            inq = create_parameter_input(
-                graph, name, tensor.shape.get_pytorch_shape(), tensor.requires_grad, tensor.data_format, subgraph_idx
+            inq = builder.add_parameter_input(
+                name, tensor.shape.get_pytorch_shape(), tensor.requires_grad, tensor.data_format, subgraph_idx
             )
-            create_data_edge(graph, inq, 0, output, port_index, operand_broadcast)
+            builder.add_data_edge(inq, 0, output, port_index, operand_broadcast)
             visited_tensors[tensor] = inq
             recorded_parameters[name] = inq
             continue
 
         if tensor.src_op is None:
             input_name = (
-                input_node_names[inputs.index(tensor)]
-                if input_names_known and tensor in inputs
-                else "input_" + str(port_index) + "_" + graph.get_node_name(output)
+                input_node_names[input_indices[tensor]]
+                if input_names_known and tensor in input_indices
+                else "input_" + str(port_index) + "_" + builder.get_node_name(output)
             )
             if tensor in passthroughs:
                 # passthrough input->output, add a nop
-                inq = create_activation_input(
-                    graph,
+                inq = builder.add_activation_input(
                     input_name,
                     tensor.shape.get_pytorch_shape(),
                     tensor.requires_grad,
@@ -1232,9 +1288,8 @@ def generate_graph(
                     subgraph_idx,
                 )
 
-                nop = create_op_node(
-                    graph,
-                    f"_passthrough_nop_{output}",
+                nop = builder.add_op_node(
+                    f"_passthrough_nop_{builder.get_node_id(output)}",
                     OpType("nop"),
                     tensor.shape.get_pytorch_shape(),
                     tensor.data_format,
@@ -1242,99 +1297,81 @@ def generate_graph(
                     {},
                 )
 
-                create_data_edge(graph, inq, 0, nop, 0, operand_broadcast)
-                create_data_edge(graph, nop, 0, output, 0, operand_broadcast)
+                builder.add_data_edge(inq, 0, nop, 0, operand_broadcast)
+                builder.add_data_edge(nop, 0, output, 0, operand_broadcast)
                 visited_tensors[tensor] = inq
                 module_input_tensor_to_node[tensor] = inq
                 continue
 
-            elif tensor in target_tensors:
+            elif tensor in target_tensor_set:
                 # Target input
-                inq = create_target_input(
-                    graph,
+                inq = builder.add_target_input(
                     input_name,
                     tensor.shape.get_pytorch_shape(),
                     tensor.requires_grad,
                     tensor.data_format,
                     subgraph_idx,
                 )
-                create_data_edge(graph, inq, 0, output, port_index, operand_broadcast)
+                builder.add_data_edge(inq, 0, output, port_index, operand_broadcast)
                 visited_tensors[tensor] = inq
                 module_target_tensor_to_node[tensor] = inq
                 continue
 
             elif tensor.is_constant():
                 # Target input
-                inq = create_constant_input(
-                    graph,
+                inq = builder.add_constant_input(
                     input_name,
                     tensor.value(),
                     tensor.shape.get_pytorch_shape(),
                     tensor.data_format,
                     subgraph_idx,
                 )
-                create_data_edge(graph, inq, 0, output, port_index, operand_broadcast)
+                builder.add_data_edge(inq, 0, output, port_index, operand_broadcast)
                 visited_tensors[tensor] = inq
                 module_target_tensor_to_node[tensor] = inq
                 continue
 
             else:
                 # input tensor
-                input_creator = (
-                    create_activation_input
-                    if input_name not in compiler_cfg.loopback_outputs
-                    else create_parameter_input
-                )
+                is_loopback = input_name in compiler_cfg.loopback_outputs
+                input_creator = builder.add_activation_input if not is_loopback else builder.add_parameter_input
 
-                if input_name in compiler_cfg.loopback_outputs:
+                if is_loopback:
                     module.add_parameter(input_name, Parameter(tensor.value(), requires_grad=True, name=input_name))
 
                 inq = input_creator(
-                    graph,
                     input_name,
                     tensor.shape.get_pytorch_shape(),
                     tensor.requires_grad,
                     tensor.data_format,
                     subgraph_idx,
                 )
-                create_data_edge(graph, inq, 0, output, port_index, operand_broadcast)
+                builder.add_data_edge(inq, 0, output, port_index, operand_broadcast)
                 visited_tensors[tensor] = inq
-                if input_name not in compiler_cfg.loopback_outputs:
+                if not is_loopback:
                     module_input_tensor_to_node[tensor] = inq
-                elif input_name in compiler_cfg.loopback_outputs:
+                else:
                     module_loopback_tensor_to_node[tensor] = inq
                     recorded_parameters[input_name] = inq
                 continue
 
         elif tensor.src_op.op_type == "constant":
             constant_value = tensor.src_op.named_attrs["c"]
-            constant = create_constant_input(
-                graph,
-                "constant_" + str(port_index) + "_" + graph.get_node_name(output),
+            constant = builder.add_scalar_constant_input(
+                "constant_" + str(port_index) + "_" + builder.get_node_name(output),
                 constant_value,
                 tensor.data_format,
                 subgraph_idx,
             )
 
-            create_data_edge(graph, constant, 0, output, port_index, operand_broadcast)
+            builder.add_data_edge(constant, 0, output, port_index, operand_broadcast)
             visited_tensors[tensor] = constant
             continue
 
-        """
-        print("ttdevice.py, create_op_node")
-        print(f"graph type: {type(graph)}")
-        print(f"src_op name: {tensor.src_op.name}")
-        print(f"src_op op_type: {tensor.src_op.op_type}")
-        print(f"src_op attrs: {tensor.src_op.attrs}")
-        print(f"shape: {tensor.shape.get_pytorch_shape()}")
-        print(f"data format: {tensor.data_format}")
-        """
-
         tags = {}
         if tensor.src_layer is not None:
             tags["layer"] = tensor.src_layer
-        op = create_op_node(
-            graph,
+        op = builder.add_op_node(
             tensor.src_op.name,
             tensor.src_op.cpp_op_type,
             tensor.shape.get_pytorch_shape(),
@@ -1345,44 +1382,44 @@ def generate_graph(
 
         visited_tensors[tensor] = op
         if return_intermediate and tensor.has_value():
-            intermediate[op] = tensor.value()
+            intermediate[op] = tensor
 
-        create_data_edge(graph, op, 0, output, port_index, operand_broadcast)
+        builder.add_data_edge(op, 0, output, port_index, operand_broadcast)
 
         for i, t in enumerate(tensor.src_op.operands):
             pending_tensors.append((t, op, i, tensor.src_op.operand_broadcast, subgraph_idx))
 
+    builder.flush()
+    node_id = builder.get_node_id
+
     # Register input/output order of the module to the graph now that the nodes are created
     module_inputs = [
-        module_input_tensor_to_node[input_tensor]
+        node_id(module_input_tensor_to_node[input_tensor])
         for input_tensor in inputs
         if input_tensor in module_input_tensor_to_node
     ]
     module_outputs = [
-        module_output_tensor_to_node[output_tensor]
+        node_id(module_output_tensor_to_node[output_tensor])
         for output_tensor in all_subgraph_outputs
         if output_tensor in module_output_tensor_to_node
     ]
-    module_targets = [module_target_tensor_to_node[target_tensor] for target_tensor in target_tensors]
+    module_targets = [node_id(module_target_tensor_to_node[target_tensor]) for target_tensor in target_tensors]
     out_requires_grad = [
         output_tensor.requires_grad
         for output_tensor in all_subgraph_outputs
         if output_tensor in module_output_tensor_to_node
     ]
 
-    # Remove unused inputs from list of module inputs
+    # Remove unused and loopback inputs from list of module inputs
     inputs = [
         input_tensor
         for input_tensor in inputs
-        if input_tensor in module_input_tensor_to_node or input_tensor in module_output_tensor_to_node
+        if (input_tensor in module_input_tensor_to_node or input_tensor in module_output_tensor_to_node)
+        and input_tensor not in module_loopback_tensor_to_node
     ]
 
-    # Remove loopback inputs from list of module inputs
-    inputs = [input_tensor for input_tensor in inputs if input_tensor not in module_loopback_tensor_to_node]
-
     if len(compiler_cfg.loopback_outputs):
-        output_to_remove = []
-        out_requires_grad_to_remove = []
+        removed_output_indices = set()
         for input_name, output_indices in compiler_cfg.loopback_outputs.items():
             if isinstance(output_indices, int):
                 output_indices = [output_indices]
@@ -1390,16 +1427,23 @@ def generate_graph(
                 input_id = graph.get_node_id(input_name)
                 output_id = module_outputs[output_index]
                 add_partial_datacopy_edge(graph, output_id, 0, input_id, 0)
-                output_to_remove.append(module_outputs[output_index])
-                out_requires_grad_to_remove.append(out_requires_grad[output_index])
-        [module_outputs.remove(value) for value in output_to_remove]
-        [out_requires_grad.remove(value) for value in out_requires_grad_to_remove]
+                removed_output_indices.add(output_index)
+        module_outputs = [output for index, output in enumerate(module_outputs) if index not in removed_output_indices]
+        out_requires_grad = [
+            requires_grad
+            for index, requires_grad in enumerate(out_requires_grad)
+            if index not in removed_output_indices
+        ]
 
     graph.register_module_inputs(module_inputs)
     graph.register_module_targets(module_targets)
     graph.register_module_outputs(module_outputs)
 
     if return_intermediate:
+        # Lazily traced intermediates are evaluated in a single pass with the outputs, so that each op is evaluated
+        # only once and the intermediates are part of the outputs' autograd graph
+        evaluate_lazy_values([*outputs, *intermediate.values()])
+        intermediate = {node_id(op): tensor.value() for op, tensor in intermediate.items()}
         return graph, outputs, intermediate, inputs, target_tensors
 
     return graph, outputs, {}, inputs, target_tensors
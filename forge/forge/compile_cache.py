@@ -0,0 +1,263 @@
+# SPDX-FileCopyrightText: © 2025 Tenstorrent AI ULC
+
+# SPDX-License-Identifier: Apache-2.0
+"""
+Persistent cache of compiled models.
+
+Entries are keyed on the model fingerprint (type, sources and weights structure), the sample inputs signature, the
+compiler configuration and the compiler version. Each entry holds the compiled flatbuffer binary and the serialized
+compiled graph states, which is everything needed to construct a `CompiledModel` without running any compile stage.
+
+Weight values are not part of the key; post-consteval parameters are recomputed from the current module weights
+when an entry is loaded.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+from dataclasses import dataclass
+from typing import List, Optional
+
+import torch
+from loguru import logger
+
+import forge
+from forge.compiled_graph_state import CompiledGraphState, CompiledModel
+from forge.config import CompilerConfig
+from forge.module import Module, PyTorchModule, TFModule, OnnxModule, JaxModule
+
+COMPILE_CACHE_DEFAULT_DIR = "generated_modules/compile_cache"
+
+# Size limit of the compile cache in MB, least recently used entries are evicted above it
+COMPILE_CACHE_DEFAULT_SIZE_LIMIT_MB = 20 * 1024
+
+COMPILE_CACHE_BINARY_FILE = "binary.ttnn"
+COMPILE_CACHE_STATE_FILE = "state.pt"
+COMPILE_CACHE_META_FILE = "meta.json"
+
+# Bump when the layout of the cache entries changes
+COMPILE_CACHE_VERSION = 1
+
+
+def is_compile_cache_enabled() -> bool:
+    return bool(int(os.environ.get("FORGE_ENABLE_COMPILE_CACHE", "0")))
+
+
+def get_compiler_version() -> str:
+    """
+    Returns identifier of the compiler build - package version and the identity of the compiled extension.
+    """
+    from importlib.metadata import version, PackageNotFoundError
+
+    try:
+        package_version = version("tt_forge_fe")
+    except PackageNotFoundError:
+        package_version = "unknown"
+
+    extension_stat = os.stat(forge._C.__file__)
+    return f"{package_version}_{extension_stat.st_size}_{extension_stat.st_mtime_ns}_{COMPILE_CACHE_VERSION}"
+
+
+def get_framework_name(module: Module) -> Optional[str]:
+    """
+    Returns framework name of the wrapped module, or None if the module can't be cached.
+    """
+    if isinstance(module, PyTorchModule):
+        return "pytorch"
+    if isinstance(module, TFModule):
+        return "tensorflow"
+    if isinstance(module, OnnxModule):
+        return "onnx"
+    if isinstance(module, JaxModule):
+        return "jax"
+    return None
+
+
+@dataclass
+class CompileCacheStats:
+    hits: int = 0
+    misses: int = 0
+    stores: int = 0
+    evictions: int = 0
+
+
+class CompileCache:
+    """
+    On-disk cache of compiled models, see module docstring.
+
+    Each entry is a directory named by the cache key. Recency of use is tracked through the modification time of the
+    entry's meta file, which is touched on every hit, and used for LRU eviction once the cache grows above the limit.
+    """
+
+    def __init__(self, cache_dir: str = COMPILE_CACHE_DEFAULT_DIR, size_limit: Optional[int] = None):
+        self.cache_dir = cache_dir
+        self.size_limit = (
+            int(os.environ.get("FORGE_COMPILE_CACHE_SIZE_LIMIT_MB", COMPILE_CACHE_DEFAULT_SIZE_LIMIT_MB)) * 1024 * 1024
+            if size_limit is None
+            else size_limit
+        )
+        self.stats = CompileCacheStats()
+
+    def get_key(
+        self,
+        module: Module,
+        sample_inputs: List[torch.Tensor],
+        compiler_cfg: CompilerConfig,
+        training: bool,
+    ) -> Optional[str]:
+        """
+        Returns the cache key for compiling the given module, or None if the compilation can't be cached.
+        """
+        from forge.tvm_calls.forge_compile import get_module_signature, get_tensor_signature
+
+        framework = get_framework_name(module)
+        if framework is None:
+            return None
+
+        # Profiling options don't affect the compiled model
+        compiler_cfg_dict = compiler_cfg.to_dict(encode_json=False)
+        for profiling_field in ["enable_compile_profiler", "compile_profile_path", "compile_trace_path"]:
+            compiler_cfg_dict.pop(profiling_field, None)
+
+        fingerprint = {
+            "compiler_version": get_compiler_version(),
+            "framework": framework,
+            "name": module.get_name(),
+            "module": get_module_signature(framework, module.module),
+            "inputs": get_tensor_signature(list(sample_inputs)),
+            "training": training,
+            "compiler_cfg": compiler_cfg_dict,
+        }
+        # Sets are sorted for a stable key, other values which aren't JSON serializable are represented by their string
+        serialized = json.dumps(
+            fingerprint, sort_keys=True, default=lambda x: sorted(x) if isinstance(x, (set, frozenset)) else str(x)
+        )
+        return hashlib.sha256(serialized.encode("utf-8")).hexdigest()
+
+    def get_entry_path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, key)
+
+    def load(self, key: str, module: Module) -> Optional[CompiledModel]:
+        """
+        Returns the compiled model stored under the key, or None on cache miss.
+        """
+        from forge._C.runtime import load_binary_from_file
+
+        entry_path = self.get_entry_path(key)
+        meta_path = os.path.join(entry_path, COMPILE_CACHE_META_FILE)
+        if not os.path.exists(meta_path):
+            self.stats.misses += 1
+            return None
+
+        compiled_binary = load_binary_from_file(os.path.join(entry_path, COMPILE_CACHE_BINARY_FILE))
+        serialized_states = torch.load(os.path.join(entry_path, COMPILE_CACHE_STATE_FILE), weights_only=False)
+
+        fwd_compiled_graph_state = CompiledGraphState.from_serialized(module, serialized_states["forward"])
+
+        # Mark entry as recently used for LRU eviction
+        os.utime(meta_path)
+        self.stats.hits += 1
+        logger.info(f"Loaded compiled model {module.get_name()} from compile cache {entry_path}")
+
+        return CompiledModel(
+            None,
+            fwd_compiled_graph_state,
+            None,
+            None,
+            compiled_binary,
+            module,
+        )
+
+    def store(self, key: str, compiled_model: CompiledModel):
+        """
+        Stores the compiled model under the key, and evicts least recently used entries if over the size limit.
+        """
+        entry_path = self.get_entry_path(key)
+        # Write into a temporary directory first, so that an interrupted store never leaves a partial entry behind
+        tmp_entry_path = entry_path + ".tmp"
+        shutil.rmtree(tmp_entry_path, ignore_errors=True)
+        os.makedirs(tmp_entry_path)
+
+        compiled_model.compiled_binary.store(os.path.join(tmp_entry_path, COMPILE_CACHE_BINARY_FILE))
+        torch.save(
+            {"forward": compiled_model.fwd_compiled_graph_state.serialize()},
+            os.path.join(tmp_entry_path, COMPILE_CACHE_STATE_FILE),
+        )
+        with open(os.path.join(tmp_entry_path, COMPILE_CACHE_META_FILE), "w") as f:
+            json.dump({"name": compiled_model.framework_module.get_name(), "version": COMPILE_CACHE_VERSION}, f)
+
+        shutil.rmtree(entry_path, ignore_errors=True)
+        os.replace(tmp_entry_path, entry_path)
+        self.stats.stores += 1
+        logger.info(f"Stored compiled model {compiled_model.framework_module.get_name()} to compile cache {entry_path}")
+
+        self.evict()
+
+    def get_entries(self) -> List[tuple]:
+        """
+        Returns list of (entry path, size in bytes, last use time) ordered from the least to the most recently used.
+        """
+        if not os.path.isdir(self.cache_dir):
+            return []
+
+        entries = []
+        for key in os.listdir(self.cache_dir):
+            entry_path = self.get_entry_path(key)
+            meta_path = os.path.join(entry_path, COMPILE_CACHE_META_FILE)
+            if key.endswith(".tmp") or not os.path.exists(meta_path):
+                continue
+            size = sum(entry.stat().st_size for entry in os.scandir(entry_path) if entry.is_file())
+            entries.append((entry_path, size, os.path.getmtime(meta_path)))
+
+        return sorted(entries, key=lambda entry: entry[2])
+
+    def evict(self) -> List[str]:
+        """
+        Evicts least recently used entries until the cache size is within the limit.
+        """
+        if self.size_limit <= 0:
+            return []
+
+        entries = self.get_entries()
+        cache_size = sum(entry[1] for entry in entries)
+
+        evicted = []
+        for entry_path, size, _ in entries:
+            if cache_size <= self.size_limit:
+                break
+            shutil.rmtree(entry_path, ignore_errors=True)
+            cache_size -= size
+            evicted.append(entry_path)
+            self.stats.evictions += 1
+            logger.info(f"Evicted compile cache entry {entry_path}")
+
+        return evicted
+
+    def invalidate(self, key: Optional[str] = None) -> int:
+        """
+        Removes the entry for the given key, or all entries if no key is given. Returns number of removed entries.
+        """
+        entries = [entry_path for entry_path, _, _ in self.get_entries()]
+        if key is not None:
+            entries = [entry_path for entry_path in entries if entry_path == self.get_entry_path(key)]
+
+        for entry_path in entries:
+            shutil.rmtree(entry_path, ignore_errors=True)
+
+        return len(entries)
+
+
+_compile_cache: Optional[CompileCache] = None
+
+
+def get_compile_cache() -> CompileCache:
+    global _compile_cache
+    cache_dir = os.environ.get("FORGE_COMPILE_CACHE_DIR", COMPILE_CACHE_DEFAULT_DIR)
+    if _compile_cache is None or _compile_cache.cache_dir != cache_dir:
+        _compile_cache = CompileCache(cache_dir)
+    return _compile_cache
+
+
+def get_compile_cache_stats() -> CompileCacheStats:
+    return get_compile_cache().stats
@@ -0,0 +1,219 @@
+# SPDX-FileCopyrightText: © 2025 Tenstorrent AI ULC
+
+# SPDX-License-Identifier: Apache-2.0
+"""
+Compile profiler - records wall time, CPU time, peak RSS growth and graph size for each compile stage, and for
+the nested TVM phases (tracing, frontend conversion, pattern callbacks, partitioning, codegen, module import).
+
+Profiling is enabled through `CompilerConfig.enable_compile_profiler` (or `FORGE_COMPILE_PROFILE=1`). The resulting
+`CompileProfile` is attached to the compiled model as `compile_profile`, and can be written out as JSON report or
+Chrome trace (chrome://tracing, Perfetto).
+"""
+
+import json
+import os
+import resource
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field, asdict
+from typing import Dict, List, Optional
+
+from loguru import logger
+
+
+def get_peak_rss() -> int:
+    """
+    Returns peak resident set size of the process in bytes.
+    """
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is reported in bytes on macOS, and in kilobytes on Linux
+    return peak_rss if sys.platform == "darwin" else peak_rss * 1024
+
+
+@dataclass
+class CompilePhase:
+    name: str
+    # "compile_stage" for CompileDepth stages, "tvm" for TVM phases, "tvm_pattern_callback" for pattern callbacks
+    category: str
+    # Start time relative to the start of the profile
+    start_ns: int = 0
+    wall_time_ns: int = 0
+    cpu_time_ns: int = 0
+    # Growth of the process peak RSS while the phase was running
+    peak_rss_delta: int = 0
+    # Nesting level, 0 for top level phases
+    depth: int = 0
+    thread_id: int = 0
+    num_nodes: Optional[int] = None
+    num_edges: Optional[int] = None
+
+    def set_graph(self, graph):
+        if graph is None:
+            return
+        self.num_nodes = graph.num_nodes()
+        self.num_edges = graph.num_edges()
+
+
+@dataclass
+class CompileProfile:
+    graph_name: str
+    phases: List[CompilePhase] = field(default_factory=list)
+    wall_time_ns: int = 0
+    cpu_time_ns: int = 0
+    peak_rss: int = 0
+
+    def get_phases(self, category: Optional[str] = None) -> List[CompilePhase]:
+        return [phase for phase in self.phases if category is None or phase.category == category]
+
+    def get_total_time_by_name(self, category: Optional[str] = None) -> Dict[str, int]:
+        """
+        Returns accumulated wall time (ns) per phase name, e.g. for pattern callbacks which run multiple times.
+        """
+        totals = {}
+        for phase in self.get_phases(category):
+            totals[phase.name] = totals.get(phase.name, 0) + phase.wall_time_ns
+        return totals
+
+    def to_dict(self) -> Dict:
+        return asdict(self)
+
+    def to_chrome_trace(self) -> Dict:
+        """
+        Returns profile in the Chrome trace event format.
+        """
+        pid = os.getpid()
+        events = []
+        for phase in self.phases:
+            args = {
+                "cpu_time_ms": phase.cpu_time_ns / 1e6,
+                "peak_rss_delta_mb": phase.peak_rss_delta / (1024 * 1024),
+            }
+            if phase.num_nodes is not None:
+                args["num_nodes"] = phase.num_nodes
+                args["num_edges"] = phase.num_edges
+            events.append(
+                {
+                    "name": phase.name,
+                    "cat": phase.category,
+                    "ph": "X",
+                    "ts": phase.start_ns / 1e3,
+                    "dur": phase.wall_time_ns / 1e3,
+                    "pid": pid,
+                    "tid": phase.thread_id,
+                    "args": args,
+                }
+            )
+        return {"traceEvents": events, "displayTimeUnit": "ms", "otherData": {"graph_name": self.graph_name}}
+
+    def dump_json(self, path: str):
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with open(path, "w") as f:
+            json.dump(self.to_dict(), f, indent=2)
+
+    def dump_chrome_trace(self, path: str):
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with open(path, "w") as f:
+            json.dump(self.to_chrome_trace(), f)
+
+    def summary(self) -> str:
+        lines = [
+            f"Compile profile for {self.graph_name}: wall {self.wall_time_ns / 1e6:.1f} ms, "
+            f"cpu {self.cpu_time_ns / 1e6:.1f} ms, peak rss {self.peak_rss / (1024 * 1024):.1f} MB"
+        ]
+        for phase in self.phases:
+            if phase.category == "tvm_pattern_callback":
+                continue
+            graph_size = f", {phase.num_nodes} nodes, {phase.num_edges} edges" if phase.num_nodes is not None else ""
+            lines.append(
+                f"{'  ' * (phase.depth + 1)}{phase.name}: wall {phase.wall_time_ns / 1e6:.1f} ms, "
+                f"cpu {phase.cpu_time_ns / 1e6:.1f} ms, peak rss +{phase.peak_rss_delta / (1024 * 1024):.1f} MB"
+                f"{graph_size}"
+            )
+        return "\n".join(lines)
+
+
+class CompileProfiler:
+    """
+    Collects compile phases into a `CompileProfile`.
+
+    Phases are recorded through `compile_phase`, which is a no-op unless a profiler is active, so that the
+    instrumented code (compile stages, TVM frontend) doesn't have to thread the profiler through.
+    """
+
+    def __init__(self, graph_name: str):
+        self.profile = CompileProfile(graph_name)
+        self.start_ns = time.perf_counter_ns()
+        self.start_cpu_ns = time.process_time_ns()
+        self.depth = 0
+
+    @contextmanager
+    def phase(self, name: str, category: str):
+        record = CompilePhase(name, category, depth=self.depth, thread_id=threading.get_ident())
+        # Phases are appended on start, so that the list is ordered by the start time
+        self.profile.phases.append(record)
+
+        self.depth += 1
+        start_peak_rss = get_peak_rss()
+        start_cpu_ns = time.process_time_ns()
+        start_ns = time.perf_counter_ns()
+        try:
+            yield record
+        finally:
+            record.start_ns = start_ns - self.start_ns
+            record.wall_time_ns = time.perf_counter_ns() - start_ns
+            record.cpu_time_ns = time.process_time_ns() - start_cpu_ns
+            record.peak_rss_delta = get_peak_rss() - start_peak_rss
+            self.depth -= 1
+
+    def finish(self) -> CompileProfile:
+        self.profile.wall_time_ns = time.perf_counter_ns() - self.start_ns
+        self.profile.cpu_time_ns = time.process_time_ns() - self.start_cpu_ns
+        self.profile.peak_rss = get_peak_rss()
+        return self.profile
+
+
+_active_profiler: Optional[CompileProfiler] = None
+
+
+@contextmanager
+def profile_compile(graph_name: str, enabled: bool = True):
+    """
+    Activates compile profiler for the duration of the context, yields the profiler (None if not enabled).
+    """
+    global _active_profiler
+    if not enabled:
+        yield None
+        return
+
+    previous_profiler = _active_profiler
+    _active_profiler = CompileProfiler(graph_name)
+    try:
+        yield _active_profiler
+    finally:
+        _active_profiler.finish()
+        _active_profiler = previous_profiler
+
+
+@contextmanager
+def compile_phase(name: str, category: str = "tvm"):
+    """
+    Records a phase in the active compile profiler, yields the phase record (None if profiling is not active).
+    """
+    if _active_profiler is None:
+        yield None
+        return
+
+    with _active_profiler.phase(name, category) as record:
+        yield record
+
+
+def write_compile_profile(profile: CompileProfile, profile_path: str = "", trace_path: str = ""):
+    logger.info(profile.summary())
+    if profile_path:
+        profile.dump_json(profile_path)
+        logger.info("Compile profile written to {}", profile_path)
+    if trace_path:
+        profile.dump_chrome_trace(trace_path)
+        logger.info("Compile trace written to {}", trace_path)
@@ -2,16 +2,19 @@
 
 # SPDX-License-Identifier: Apache-2.0
 
+import re
+import threading
+from concurrent.futures import Future
 from enum import IntEnum
 from dataclasses import dataclass, field
 from dataclasses_json import dataclass_json
 from loguru import logger
 import torch
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Sequence, Set, Tuple, Union
 
 
 from forge._C import ForgeGraphModule
-from forge._C.graph import Graph
+from forge._C.graph import Graph, get_constant_input_value
 import forge._C.graph as pygraph
 from forge._C.runtime import (
     Binary,
@@ -22,8 +25,20 @@ from forge._C.runtime import (
     ProgramType,
 )
 from forge._C import run_mlir_compiler_to_cpp, run_mlir_compiler_to_shared_object
-from forge.tensor import Tensor, get_post_const_eval_tensors, to_pt_tensors, cast_unsupported_torch_dtype, AnyTensor
+from forge.tensor import (
+    Tensor,
+    get_post_const_eval_tensors,
+    get_constant_inputs,
+    const_eval_tensor,
+    to_pt_tensors,
+    cast_unsupported_torch_dtype,
+    pytorch_dtype_to_forge_dataformat,
+    forge_dataformat_to_pytorch_dtype,
+    AnyTensor,
+)
 from forge.module import Module, PyTorchModule, AnyModule
+from forge.compile_profiler import CompileProfile
+from forge.execution_pipeline import ExecutionPipeline
 
 
 class CompileResults:
@@ -42,11 +57,60 @@ class CompileResults:
 
     pass_specific_output_kwargs: Dict[str, Any] = {}
 
+    # Set if compile profiling is enabled
+    compile_profile: Optional[CompileProfile] = None
+
+
+# Gradient of parameter `p` is the backward graph output `grad_acc_<p>_grad_accumulator` (see autograd and split_graph)
+GRADIENT_OUTPUT_PREFIX = "grad_acc_"
+GRADIENT_OUTPUT_SUFFIX = "_grad_accumulator"
+
+# Optimizer parameter `o` of parameter `p` is the optimizer graph input `input_opt_<p>_<index>.<o>` (see autograd)
+OPTIMIZER_PARAMETER_PATTERN = re.compile(r"^input_opt_(?P<parameter>.+)_\d+\.(?P<optimizer_parameter>[^.]+)$")
+
+
+def get_gradient_parameter_name(output_name: str) -> Optional[str]:
+    """
+    Returns the name of the parameter whose gradient is the backward graph output, None for other outputs.
+    """
+    if output_name.startswith(GRADIENT_OUTPUT_PREFIX) and output_name.endswith(GRADIENT_OUTPUT_SUFFIX):
+        return output_name[len(GRADIENT_OUTPUT_PREFIX) : -len(GRADIENT_OUTPUT_SUFFIX)]
+    return None
+
+
+def get_optimizer_parameter_key(node_name: str) -> Optional[Tuple[str, str]]:
+    """
+    Returns the (parameter name, optimizer parameter name) pair of the optimizer graph input, None for other inputs.
+    """
+    match = OPTIMIZER_PARAMETER_PATTERN.match(node_name)
+    if match is None:
+        return None
+    return match.group("parameter"), match.group("optimizer_parameter")
+
+
+def get_parameter_gradient_outputs(
+    ordered_output_names: List[str],
+    gradient_parameter_names: Dict[str, str],
+    module_parameter_names: Optional[Set[str]] = None,
+) -> List[Tuple[str, int]]:
+    """
+    Returns the (parameter name, backward output index) pairs of the parameter gradients. If `module_parameter_names`
+    is given, gradients of parameters which are not in the framework module (e.g. created by the compiler) are skipped.
+    """
+    parameter_gradient_outputs = []
+    for idx, output_name in enumerate(ordered_output_names):
+        name = gradient_parameter_names.get(output_name)
+        if name is None or (module_parameter_names is not None and name not in module_parameter_names):
+            continue
+        parameter_gradient_outputs.append((name, idx))
+    return parameter_gradient_outputs
+
 
 @dataclass_json
 @dataclass()
 class CompiledGraphState:
-    graph: Graph
+    # Compiled graph, not available when the state is loaded from the compile cache
+    graph: Optional[Graph]
     ordered_input_names: List[str]
     ordered_input_gradient_names: List[str]
     ordered_output_names: List[str]
@@ -67,6 +131,16 @@ class CompiledGraphState:
 
     has_cache_buffers: bool = False
 
+    graph_name: str = ""
+    training: bool = False
+
+    # Initial (zero) values of the gradient accumulators, which are inputs of the backward graph compiled with gradient
+    # accumulation - ordered as the graph inputs
+    gradient_accumulators: Dict[str, torch.Tensor] = field(default_factory=dict)
+
+    # Names of the parameters whose gradients are the graph outputs, by output name (backward graph only)
+    gradient_parameter_names: Dict[str, str] = field(default_factory=dict)
+
     @staticmethod
     def from_compiled_graph(
         module: Module, graph: Graph, optimizer_params: Optional[Dict[str, Tensor]] = None
@@ -78,10 +152,29 @@ class CompiledGraphState:
         ordered_intermediate_names = graph.get_ordered_intermediate_names()
         ordered_output_nodes = graph.get_ordered_output_nodes()
         aliased_outputs: Dict[str, str] = {}
+        accumulator_outputs: Dict[str, pygraph.OutputNode] = {}
         for node in ordered_output_nodes:
             assert isinstance(node, pygraph.OutputNode)
             if node.is_aliased:
                 aliased_outputs[node.name] = node.alias
+                # Parameters are aliased by the optimizer graph, graph inputs by the gradient accumulators
+                if node.alias in ordered_input_names:
+                    accumulator_outputs[node.alias] = node
+
+        gradient_parameter_names: Dict[str, str] = {}
+        for name in ordered_output_names:
+            parameter_name = get_gradient_parameter_name(name)
+            if parameter_name is not None:
+                gradient_parameter_names[name] = parameter_name
+
+        gradient_accumulators: Dict[str, torch.Tensor] = {
+            name: torch.zeros(
+                accumulator_outputs[name].shape.as_list(),
+                dtype=forge_dataformat_to_pytorch_dtype(accumulator_outputs[name].output_df),
+            )
+            for name in ordered_input_names
+            if name in accumulator_outputs
+        }
 
         ordered_constant_node_names = [constant_node.name for constant_node in graph.get_constant_nodes()]
         ordered_parameter_node_names = [parameter_node.name for parameter_node in graph.get_parameter_nodes()]
@@ -108,19 +201,19 @@ class CompiledGraphState:
             for name, opt_param in optimizer_params.items():
                 constant_to_tensor[name] = opt_param.value()
 
-        post_const_eval_constants: Dict[str, torch.Tensor] = get_post_const_eval_tensors(
+        # Constants and parameters are const-evaluated together, so that they can share intermediate results
+        post_const_eval_tensors: Dict[str, torch.Tensor] = get_post_const_eval_tensors(
             graph,
             constant_to_tensor,
             consteval_trace,
-            ordered_constant_node_names,
-        )
-
-        post_const_eval_parameters: Dict[str, torch.Tensor] = get_post_const_eval_tensors(
-            graph,
-            constant_to_tensor,
-            consteval_trace,
-            ordered_parameter_node_names,
+            ordered_constant_node_names + ordered_parameter_node_names,
         )
+        post_const_eval_constants: Dict[str, torch.Tensor] = {
+            name: post_const_eval_tensors[name] for name in ordered_constant_node_names
+        }
+        post_const_eval_parameters: Dict[str, torch.Tensor] = {
+            name: post_const_eval_tensors[name] for name in ordered_parameter_node_names
+        }
 
         return CompiledGraphState(
             graph=graph,
@@ -137,6 +230,92 @@ class CompiledGraphState:
             post_const_eval_constants=post_const_eval_constants,
             post_const_eval_parameters=post_const_eval_parameters,
             has_cache_buffers=has_cache_buffers,
+            graph_name=graph.get_name(),
+            training=graph.training(),
+            gradient_accumulators=gradient_accumulators,
+            gradient_parameter_names=gradient_parameter_names,
+        )
+
+    def serialize(self) -> Dict[str, Any]:
+        """
+        Returns the state in a form which can be stored with `torch.save` and restored via `from_serialized`.
+
+        Post-consteval parameters are not stored - only the graph constants which feed their consteval traces, so
+        that the parameters can be recomputed from the (possibly updated) module weights on load.
+        """
+        assert self.graph is not None, "Graph is needed to serialize compiled graph state"
+
+        constant_nodes = {node.name: node for node in self.graph.get_constant_nodes(recurse=True)}
+        parameter_consteval_constants: Dict[str, torch.Tensor] = {}
+        for name in self.ordered_parameter_node_names:
+            consteval_graph = self.consteval_trace.get(name, None)
+            input_names = [name]
+            if consteval_graph is not None:
+                input_names = [
+                    node_name
+                    for node_name in consteval_graph["topological_sorted_nodes"]
+                    if consteval_graph["nodes"][node_name]["opcode"] == "Input"
+                ]
+            for input_name in input_names:
+                if input_name in constant_nodes:
+                    parameter_consteval_constants[input_name] = get_constant_input_value(constant_nodes[input_name])
+
+        return {
+            "graph_name": self.graph_name,
+            "training": self.training,
+            "ordered_input_names": self.ordered_input_names,
+            "ordered_input_gradient_names": self.ordered_input_gradient_names,
+            "ordered_output_names": self.ordered_output_names,
+            "ordered_external_output_names": self.ordered_external_output_names,
+            "ordered_target_names": self.ordered_target_names,
+            "ordered_constant_node_names": self.ordered_constant_node_names,
+            "ordered_parameter_node_names": self.ordered_parameter_node_names,
+            "ordered_intermediate_names": self.ordered_intermediate_names,
+            "aliased_outputs": self.aliased_outputs,
+            "consteval_trace": self.consteval_trace,
+            "has_cache_buffers": self.has_cache_buffers,
+            "post_const_eval_constants": self.post_const_eval_constants,
+            "parameter_consteval_constants": parameter_consteval_constants,
+        }
+
+    @staticmethod
+    def from_serialized(module: Module, serialized: Dict[str, Any]) -> "CompiledGraphState":
+        """
+        Restores the state stored via `serialize`. Post-consteval parameters are recomputed from the module weights.
+        """
+        constant_to_tensor: Dict[str, torch.Tensor] = dict(serialized["parameter_consteval_constants"])
+        for p in module.get_parameters():
+            value = p.value()
+            if value == None:
+                raise ValueError(f"Parameter {p.get_name()} has no value")
+            constant_to_tensor[p.get_name()] = value
+
+        # All consteval inputs are either module weights or stored constants, so no graph constant nodes are needed
+        consteval_trace = serialized["consteval_trace"]
+        post_const_eval_parameters: Dict[str, torch.Tensor] = {
+            name: const_eval_tensor(
+                get_constant_inputs({}, constant_to_tensor, consteval_trace, name), consteval_trace, name
+            )
+            for name in serialized["ordered_parameter_node_names"]
+        }
+
+        return CompiledGraphState(
+            graph=None,
+            ordered_input_names=serialized["ordered_input_names"],
+            ordered_input_gradient_names=serialized["ordered_input_gradient_names"],
+            ordered_output_names=serialized["ordered_output_names"],
+            aliased_outputs=serialized["aliased_outputs"],
+            ordered_external_output_names=serialized["ordered_external_output_names"],
+            ordered_target_names=serialized["ordered_target_names"],
+            ordered_constant_node_names=serialized["ordered_constant_node_names"],
+            ordered_parameter_node_names=serialized["ordered_parameter_node_names"],
+            ordered_intermediate_names=serialized["ordered_intermediate_names"],
+            consteval_trace=consteval_trace,
+            post_const_eval_constants=serialized["post_const_eval_constants"],
+            post_const_eval_parameters=post_const_eval_parameters,
+            has_cache_buffers=serialized["has_cache_buffers"],
+            graph_name=serialized["graph_name"],
+            training=serialized["training"],
         )
 
     def get_tensor(self, name_to_tensor: dict[str, torch.Tensor], name: str) -> torch.Tensor:
@@ -156,6 +335,59 @@ class CompiledGraphState:
         return [self.get_parameter_tensor(name) for name in self.ordered_parameter_node_names]
 
 
+def get_supported_torch_dtype(dtype: torch.dtype) -> torch.dtype:
+    """
+    Returns the dtype to which `cast_unsupported_torch_dtype` casts tensors of the given dtype.
+    """
+    return forge_dataformat_to_pytorch_dtype(pytorch_dtype_to_forge_dataformat(dtype)) or dtype
+
+
+class StagingBuffers:
+    """
+    Host buffers of the model inputs and outputs, reused across calls with the same input signature (shapes and
+    dtypes), instead of allocating and wrapping new host tensors on every call.
+
+    Inputs are copied (and cast to the dtypes supported by the device) into the input buffers, which are wrapped in
+    runtime tensors once. Outputs are read back from the device directly into the output buffers, so the returned
+    output tensors are overwritten by the next call.
+    """
+
+    def __init__(self):
+        self.input_signature: Optional[List[tuple]] = None
+        self.inputs: List[torch.Tensor] = []
+        self.runtime_inputs: List[CTensor] = []
+        self.outputs: Optional[List[torch.Tensor]] = None
+
+    def stage_inputs(self, inputs: List[torch.Tensor]) -> List[CTensor]:
+        signature = [(tuple(t.shape), t.dtype) for t in inputs]
+        if signature != self.input_signature:
+            if self.input_signature is not None:
+                logger.debug("Input signature changed, reallocating staging buffers")
+            self.input_signature = signature
+            self.inputs = [
+                torch.empty(t.shape, dtype=get_supported_torch_dtype(t.dtype), memory_format=torch.contiguous_format)
+                for t in inputs
+            ]
+            self.runtime_inputs = [CTensor(t) for t in self.inputs]
+            self.outputs = None
+
+        for buffer, runtime_input, t in zip(self.inputs, self.runtime_inputs, inputs):
+            # Device copy of the previous call's data is dropped, the buffer is pushed to the device again on run
+            runtime_input.detach_from_device()
+            buffer.copy_(t)
+
+        return self.runtime_inputs
+
+    def read_outputs(self, outputs: List[CTensor]) -> List[torch.Tensor]:
+        if self.outputs is None:
+            # Output buffers are allocated by the first readback, with the dtype and layout of the device outputs
+            self.outputs = [output.to_torch() for output in outputs]
+        else:
+            for output, buffer in zip(outputs, self.outputs):
+                output.to_torch_into(buffer)
+        return self.outputs
+
+
 class ProgramId(IntEnum):
     FORWARD = 0
     BACKWARD = 1
@@ -189,9 +421,9 @@ class CompiledModel:
     framework_module: AnyModule
 
     # Forge graph module, currently used for exporting the model to a cpp file.
-    # Needed by the lower to MLIR logic.
+    # Needed by the lower to MLIR logic. Not available when the model is loaded from the compile cache.
     # Issue(#1350): current state of `CompiledModel` is a bit messy, we should clean it up.
-    forge_graph_module: ForgeGraphModule
+    forge_graph_module: Optional[ForgeGraphModule]
 
     # Gradients to be passed into the backward pass.
     # Used when CompiledModel.backward() is part of a chain of backward passes.
@@ -200,9 +432,15 @@ class CompiledModel:
 
     attached_module: Optional["CompiledModel"]
 
+    # Pipeline running the requests submitted through `submit`, created by `start_pipeline` or on the first submit.
+    execution_pipeline: Optional[ExecutionPipeline]
+
+    # Reused input/output host buffers, set by `enable_persistent_buffers`.
+    staging_buffers: Optional[StagingBuffers]
+
     def __init__(
         self,
-        forge_graph_module: ForgeGraphModule,
+        forge_graph_module: Optional[ForgeGraphModule],
         fwd_compiled_graph_state: CompiledGraphState,
         bwd_compiled_graph_state: Optional[CompiledGraphState],
         opt_compiled_graph_state: Optional[CompiledGraphState],
@@ -221,6 +459,8 @@ class CompiledModel:
         self.bwd_compiled_graph_state = bwd_compiled_graph_state
         if self.bwd_compiled_graph_state is not None:
             self.create_program_state(ProgramType.Backward, self.bwd_compiled_graph_state)
+            for name, accumulator in self.bwd_compiled_graph_state.gradient_accumulators.items():
+                self.tensor_pool.insert(name, accumulator)
 
         self.opt_compiled_graph_state = opt_compiled_graph_state
         if self.opt_compiled_graph_state is not None:
@@ -230,11 +470,28 @@ class CompiledModel:
         self.inputs = []
         self.framework_module = framework_module
         self.intermediates = []
+        # (parameter name, backward output index) of every gradient of a framework module parameter
+        self.parameter_gradient_outputs: List[Tuple[str, int]] = []
         if self.bwd_compiled_graph_state is not None:
             self.gradient_inputs = [None] * len(self.bwd_compiled_graph_state.ordered_input_gradient_names)
+            module_parameter_names = None
+            if isinstance(self.framework_module, PyTorchModule):
+                module_parameter_names = {name for name, _ in self.framework_module.module.named_parameters()}
+            self.parameter_gradient_outputs = get_parameter_gradient_outputs(
+                self.bwd_compiled_graph_state.ordered_output_names,
+                self.bwd_compiled_graph_state.gradient_parameter_names,
+                module_parameter_names,
+            )
         self.outputs = {}
         self.attached_module = attached_module
         self.gradient_outputs = []
+        # Set by the compiler if compile profiling is enabled
+        self.compile_profile: Optional[CompileProfile] = None
+
+        # Programs are executed both from `__call__` and from the execution pipeline, one at a time
+        self.device_lock = threading.Lock()
+        self.execution_pipeline = None
+        self.staging_buffers = None
 
     def create_persistent_inputs(self, tensor_pool: TensorPool, compiled_graph_state: CompiledGraphState):
         persistent_inputs = []
@@ -272,7 +529,58 @@ class CompiledModel:
         assert len(self.gradient_inputs) > grad_id, "More gradients than expected."
         self.gradient_inputs[grad_id] = CTensor(grad)
 
-    def __call__(self, *inputs: AnyTensor) -> List[torch.Tensor]:
+    def stage_inputs(self, *inputs: AnyTensor) -> List[CTensor]:
+        """
+        Converts the inputs to runtime tensors, casting them to dtypes supported by the device.
+        """
+        torch_inputs = [*to_pt_tensors(inputs)]
+        assert all([isinstance(t, torch.Tensor) for t in torch_inputs]), "All inputs should be torch tensors by now."
+
+        if self.staging_buffers is not None:
+            return self.staging_buffers.stage_inputs(torch_inputs)
+
+        # After tensors are transformed to pt tensors, we have to cast them to dtypes that are actually supported by our hardware.
+        torch_inputs = [cast_unsupported_torch_dtype(input_tensor) for input_tensor in torch_inputs]
+
+        return [CTensor(t) for t in torch_inputs]
+
+    def execute_forward(self, inputs: List[CTensor]) -> List[CTensor]:
+        """
+        Runs the forward program on the staged inputs, returns all of the program outputs (external outputs and
+        intermediates).
+        """
+        with self.device_lock:
+            self.runtime_model_state.run_program(ProgramType.Forward, inputs)
+            return self.runtime_model_state.get_outputs(ProgramType.Forward)
+
+    def read_outputs(self, all_outputs: List[CTensor]) -> List[torch.Tensor]:
+        """
+        Reads back the external outputs of the forward program as torch tensors.
+        """
+        return [
+            all_outputs[idx].to_torch()
+            for idx, output_name in enumerate(self.fwd_compiled_graph_state.ordered_output_names)
+            if output_name in self.fwd_compiled_graph_state.ordered_external_output_names
+        ]
+
+    def enable_persistent_buffers(self, enable: bool = True) -> None:
+        """
+        Opt-in mode for repeated inference calls with fixed input shapes - input and output host buffers are allocated
+        on the first call and reused by the following ones (see `StagingBuffers`).
+
+        NOTE: outputs returned in this mode are the output buffers themselves, and are overwritten by the next call.
+        Clone them, or pass `out=` to the call, to keep them.
+
+        Parameters
+        ----------
+        enable: bool
+            Enables the persistent buffers if True, disables (and frees) them otherwise.
+        """
+        assert not self.training(), "Persistent buffers are supported only for inference."
+        assert self.execution_pipeline is None, "Persistent buffers can't be used while the pipeline is running."
+        self.staging_buffers = StagingBuffers() if enable else None
+
+    def __call__(self, *inputs: AnyTensor, out: Optional[List[torch.Tensor]] = None) -> List[torch.Tensor]:
         """
         Run inference on the compiled model.
 
@@ -281,16 +589,16 @@ class CompiledModel:
         inputs: [Tensor, ...]
             Input tensors
 
+        out: [torch.Tensor, ...], optional
+            Tensors into which the outputs are written. Outputs are copied from the device directly into the tensors
+            whose dtype and layout match the device outputs, otherwise they are converted.
+
         Returns
         -------
         List[Tensor]
             Output tensors
         """
-        torch_inputs = [*to_pt_tensors(inputs)]
-        # After tensors are transformed to pt tensors, we have to cast them to dtypes that are actually supported by our hardware.
-        torch_inputs = [cast_unsupported_torch_dtype(input_tensor) for input_tensor in torch_inputs]
-
-        assert all([isinstance(t, torch.Tensor) for t in torch_inputs]), "All inputs should be torch tensors by now."
+        staged_inputs = self.stage_inputs(*inputs)
 
         if self.training() and isinstance(self.framework_module, PyTorchModule):
             for name, param in self.framework_module.module.named_parameters():
@@ -309,25 +617,33 @@ class CompiledModel:
                 self.remove_weights_from_device()
 
         logger.info(
-            f"Running model {self.framework_module.get_name()} {self.fwd_compiled_graph_state.graph.get_name()} on device..."
+            f"Running model {self.framework_module.get_name()} {self.fwd_compiled_graph_state.graph_name} on device..."
         )
 
-        self.inputs = [CTensor(t) for t in torch_inputs]
-        self.runtime_model_state.run_program(ProgramType.Forward, self.inputs)
-
-        all_outputs = self.runtime_model_state.get_outputs(ProgramType.Forward)
+        self.inputs = staged_inputs
+        all_outputs = self.execute_forward(self.inputs)
 
         self.intermediates = []
 
-        # The model_outputs will contain outputs that we need to return to the user, i.e. external outputs.
-        model_outputs = []
+        # The external_outputs will contain outputs that we need to return to the user.
+        external_outputs = []
         for idx, output_name in enumerate(self.fwd_compiled_graph_state.ordered_output_names):
             output = all_outputs[idx]
             if output_name in self.fwd_compiled_graph_state.ordered_intermediate_names:
                 self.intermediates.append(output)
             if output_name in self.fwd_compiled_graph_state.ordered_external_output_names:
                 self.outputs[output_name] = output
-                model_outputs.append(output.to_torch())
+                external_outputs.append(output)
+
+        if out is not None:
+            assert len(out) == len(external_outputs), f"Expected {len(external_outputs)} output tensors, got {len(out)}"
+            for output, out_tensor in zip(external_outputs, out):
+                output.to_torch_into(out_tensor)
+            model_outputs = list(out)
+        elif self.staging_buffers is not None:
+            model_outputs = list(self.staging_buffers.read_outputs(external_outputs))
+        else:
+            model_outputs = [output.to_torch() for output in external_outputs]
 
         if self.training():
             # For executing loss and its backward graph on CPU, we need to tell torch to compute gradients.
@@ -339,6 +655,100 @@ class CompiledModel:
 
         return model_outputs
 
+    def run_with_device_outputs(
+        self, *inputs: Union[AnyTensor, CTensor], device_outputs: Sequence[int] = ()
+    ) -> List[Union[torch.Tensor, CTensor]]:
+        """
+        Run inference, keeping the selected outputs on the device.
+
+        Outputs selected by `device_outputs` are returned as runtime tensors, which aren't read back to the host. They
+        can be passed as inputs to the following runs (of this or another compiled model sharing the device), and are
+        used by the runtime without a round trip through the host - e.g. KV cache in autoregressive generation.
+
+        Parameters
+        ----------
+        inputs: [Tensor | runtime Tensor, ...]
+            Input tensors, runtime tensors returned by a previous run are passed through as they are
+
+        device_outputs: [int, ...]
+            Indices of the outputs which are kept on the device
+
+        Returns
+        -------
+        List[torch.Tensor | runtime Tensor]
+            Output tensors, runtime tensors at the `device_outputs` indices
+        """
+        assert not self.training(), "Device resident outputs are supported only for inference."
+
+        host_inputs = iter(self.stage_inputs(*[t for t in inputs if not isinstance(t, CTensor)]))
+        staged_inputs = [t if isinstance(t, CTensor) else next(host_inputs) for t in inputs]
+
+        all_outputs = self.execute_forward(staged_inputs)
+        external_outputs = [
+            all_outputs[idx]
+            for idx, output_name in enumerate(self.fwd_compiled_graph_state.ordered_output_names)
+            if output_name in self.fwd_compiled_graph_state.ordered_external_output_names
+        ]
+
+        device_outputs = set(device_outputs)
+        return [output if idx in device_outputs else output.to_torch() for idx, output in enumerate(external_outputs)]
+
+    def start_pipeline(self, max_in_flight: int = 4) -> ExecutionPipeline:
+        """
+        Starts the pipeline running the requests submitted through `submit`. Input staging, program execution and
+        output readback of the requests run on separate worker threads, so they overlap between consecutive requests.
+
+        Parameters
+        ----------
+        max_in_flight: int
+            Maximum number of submitted requests which haven't completed yet, `submit` blocks when it is reached.
+
+        Returns
+        -------
+        ExecutionPipeline
+            The started pipeline
+        """
+        assert not self.training(), "Pipelined execution is supported only for inference."
+        assert self.execution_pipeline is None, "Pipeline is already running, call `shutdown_pipeline` first."
+        # Requests in flight would share the buffers
+        assert self.staging_buffers is None, "Pipelined execution can't be used with persistent buffers."
+
+        self.execution_pipeline = ExecutionPipeline(
+            self.stage_inputs,
+            self.execute_forward,
+            self.read_outputs,
+            max_in_flight=max_in_flight,
+            name=self.fwd_compiled_graph_state.graph_name,
+        )
+        return self.execution_pipeline
+
+    def submit(self, *inputs: AnyTensor) -> Future:
+        """
+        Submits an inference request to the execution pipeline, starting it with the default settings if it isn't
+        running. Requests are executed in the order in which they are submitted.
+
+        Parameters
+        ----------
+        inputs: [Tensor, ...]
+            Input tensors
+
+        Returns
+        -------
+        Future[List[torch.Tensor]]
+            Future of the output tensors
+        """
+        if self.execution_pipeline is None:
+            self.start_pipeline()
+        return self.execution_pipeline.submit(*inputs)
+
+    def shutdown_pipeline(self) -> None:
+        """
+        Completes the submitted requests and stops the execution pipeline.
+        """
+        if self.execution_pipeline is not None:
+            self.execution_pipeline.shutdown()
+            self.execution_pipeline = None
+
     def forward(self, *inputs: AnyTensor) -> List[torch.Tensor]:
         return self(*inputs)
 
@@ -360,39 +770,39 @@ class CompiledModel:
         ]
 
         logger.info(
-            f"Running backward pass on model {self.framework_module.get_name()} {self.bwd_compiled_graph_state.graph.get_name()} on device..."
+            f"Running backward pass on model {self.framework_module.get_name()} {self.bwd_compiled_graph_state.graph_name} on device..."
         )
 
-        bwd_inputs = [*self.gradient_inputs, *self.intermediates, *inputs]
+        # Gradient accumulators (if any) are the last inputs of the backward program
+        accumulators = [
+            self.tensor_pool.get_tensor(name) for name in self.bwd_compiled_graph_state.gradient_accumulators
+        ]
+        bwd_inputs = [*self.gradient_inputs, *self.intermediates, *inputs, *accumulators]
         assert all([isinstance(t, CTensor) for t in bwd_inputs]), "All inputs should be CTensors by now."
 
         self.runtime_model_state.run_program(ProgramType.Backward, bwd_inputs)
         grads = self.runtime_model_state.get_outputs(ProgramType.Backward)
 
-        if self.optimizer_on_device():
+        if self.accumulates_gradients():
+            # Accumulated gradients stay on device - they replace the accumulators, and are read back or consumed by the
+            # optimizer only after the last micro-batch
+            for idx, output_name in enumerate(self.bwd_compiled_graph_state.ordered_output_names):
+                accumulator_name = self.bwd_compiled_graph_state.aliased_outputs.get(output_name, None)
+                if accumulator_name in self.bwd_compiled_graph_state.gradient_accumulators:
+                    self.tensor_pool.update_tensor(accumulator_name, grads[idx])
+            self.gradient_outputs = grads
+        elif self.optimizer_on_device():
             if self.gradient_outputs is None or len(self.gradient_outputs) == 0:
                 self.gradient_outputs = grads
             else:
-                # TODO (Issue #1530): Handle gradient accumulation
                 assert len(self.gradient_outputs) == len(grads), "Number of gradients does not match number of outputs"
-                assert False, "Gradient accumulation for grads on device not implemented yet"
+                assert False, (
+                    "Gradients of the previous backward pass haven't been consumed by the optimizer step, compile with "
+                    "`enable_gradient_accumulation` to accumulate gradients on device"
+                )
         else:
             self.gradient_outputs = grads
-            # Accumulate gradients in the PyTorch module
-            if isinstance(self.framework_module, PyTorchModule):
-                for name, param in self.framework_module.module.named_parameters():
-                    for idx, grad_output_name in enumerate(self.bwd_compiled_graph_state.ordered_output_names):
-                        if name in grad_output_name:
-                            grad_tensor = grads[idx].to_torch()
-                            if param.shape != grad_tensor.shape:
-                                # Our gradients have additional dimensions which PyTorch not expects (e.g. [1, 1, N, M] -> [N, M])
-                                assert (torch.squeeze(grad_tensor)).shape == param.shape
-                                grad_tensor = torch.squeeze(grad_tensor)
-
-                            if param.grad is not None:
-                                param.grad += grad_tensor
-                            else:
-                                param.grad = grad_tensor
+            self.set_host_gradients(grads, accumulate=True)
 
         # Pass on the calculated gradients to the attached module
         if self.attached_module is not None:
@@ -408,14 +818,63 @@ class CompiledModel:
 
         return self.gradient_outputs
 
+    def set_host_gradients(self, grads: List[CTensor], accumulate: bool) -> None:
+        """
+        Reads the gradients back into the `.grad` of the PyTorch module parameters - adding them to the existing
+        gradients if `accumulate` is set, replacing them otherwise.
+        """
+        if not isinstance(self.framework_module, PyTorchModule):
+            return
+
+        parameters = dict(self.framework_module.module.named_parameters())
+        for name, idx in self.parameter_gradient_outputs:
+            param = parameters[name]
+            grad_tensor = grads[idx].to_torch()
+            if param.shape != grad_tensor.shape:
+                # Our gradients have additional dimensions which PyTorch not expects (e.g. [1, 1, N, M] -> [N, M])
+                assert (torch.squeeze(grad_tensor)).shape == param.shape
+                grad_tensor = torch.squeeze(grad_tensor)
+
+            if accumulate and param.grad is not None:
+                param.grad += grad_tensor
+            else:
+                param.grad = grad_tensor
+
+    def accumulates_gradients(self) -> bool:
+        return (
+            self.bwd_compiled_graph_state is not None and len(self.bwd_compiled_graph_state.gradient_accumulators) > 0
+        )
+
+    def update_host_gradients(self) -> None:
+        """
+        Reads the gradients accumulated on device into the `.grad` of the PyTorch module parameters (replacing them),
+        for the optimizer running on the host.
+        """
+        assert self.accumulates_gradients(), "Model not compiled with gradient accumulation."
+        assert len(self.gradient_outputs) > 0, "No gradients accumulated since the last `zero_grad`."
+        self.set_host_gradients(self.gradient_outputs, accumulate=False)
+
+    def zero_grad(self) -> None:
+        """
+        Zeroes the gradients accumulated on device. Accumulators are replaced by fresh zero host tensors, pushed to the
+        device by the next backward pass.
+
+        NOTE: After a backward pass the accumulators are device-only tensors, whose host copies may be the `.grad` of
+        the module parameters (see `update_host_gradients`) - so they are replaced rather than zeroed in place.
+        """
+        assert self.accumulates_gradients(), "Model not compiled with gradient accumulation."
+        for name, initial_value in self.bwd_compiled_graph_state.gradient_accumulators.items():
+            self.tensor_pool.replace_tensor(name, CTensor(torch.zeros_like(initial_value)))
+        self.gradient_outputs = []
+
     def training(self) -> bool:
-        return self.fwd_compiled_graph_state.graph.training()
+        return self.fwd_compiled_graph_state.training
 
     def optimizer_on_device(self) -> bool:
         return self.opt_compiled_graph_state is not None
 
     def step(self) -> None:
-        assert self.fwd_compiled_graph_state.graph.training(), "Model not compiled for training."
+        assert self.training(), "Model not compiled for training."
         assert self.opt_compiled_graph_state is not None, "Optimizer graph should be present for training."
         assert self.bwd_compiled_graph_state is not None, "Backward graph should be present for training."
 
@@ -424,33 +883,28 @@ class CompiledModel:
         ]
 
         logger.info(
-            f"Running optimizer step on model {self.framework_module.get_name()} {self.opt_compiled_graph_state.graph.get_name()} on device..."
+            f"Running optimizer step on model {self.framework_module.get_name()} {self.opt_compiled_graph_state.graph_name} on device..."
         )
 
         self.runtime_model_state.run_program(ProgramType.Optimizer, inputs)
         out_params = self.runtime_model_state.get_outputs(ProgramType.Optimizer)
 
-        update_param: Dict[str, CTensor] = {}
-        for idx, param in enumerate(self.opt_compiled_graph_state.ordered_output_names):
-            update_param[param] = out_params[idx]
-
-        for weight_update_name in self.opt_compiled_graph_state.aliased_outputs:
-            weight_name = self.opt_compiled_graph_state.aliased_outputs[weight_update_name]
-            # self.opt_compiled_graph_state.get_parameter_tensor(weight_name).data = update_param[weight_update_name].data
-            self.tensor_pool.update_tensor(
-                weight_name, update_param[weight_update_name]
-            )  # get_tensor(weight_name).set_tensor_data(update_param[weight_update_name])
-
-            # Sanity check - assert that the parameter tensors in framework module are the same as the ones in our runtime.
-            assert isinstance(
-                self.framework_module, PyTorchModule
-            ), "For now only PyTorchModule is supported in training"
-            for torch_name, val in self.framework_module.module.named_parameters():
-                if torch_name == weight_name:
-                    assert self.opt_compiled_graph_state.get_parameter_tensor(
-                        weight_name
-                    ) is self.fwd_compiled_graph_state.get_parameter_tensor(weight_name)
-                    assert self.fwd_compiled_graph_state.get_parameter_tensor(weight_name) is val
+        # Sanity check - parameter tensors of the framework module have to be the same as the ones in our runtime.
+        assert isinstance(self.framework_module, PyTorchModule), "For now only PyTorchModule is supported in training"
+        parameters = dict(self.framework_module.module.named_parameters())
+
+        for idx, weight_update_name in enumerate(self.opt_compiled_graph_state.ordered_output_names):
+            weight_name = self.opt_compiled_graph_state.aliased_outputs.get(weight_update_name, None)
+            if weight_name is None:
+                continue
+
+            self.tensor_pool.update_tensor(weight_name, out_params[idx])
+
+            if weight_name in parameters:
+                assert self.opt_compiled_graph_state.get_parameter_tensor(
+                    weight_name
+                ) is self.fwd_compiled_graph_state.get_parameter_tensor(weight_name)
+                assert self.fwd_compiled_graph_state.get_parameter_tensor(weight_name) is parameters[weight_name]
 
         self.gradient_outputs = []
 
@@ -478,6 +932,8 @@ class CompiledModel:
             Path to the file where the model c++ code will be exported.
         """
 
+        assert self.forge_graph_module is not None, "Export is not supported for models loaded from the compile cache."
+
         logger.info(f"Exporting model {self.framework_module.get_name()} to cpp file...")
         cpp_code = run_mlir_compiler_to_cpp(self.forge_graph_module)
 
@@ -503,6 +959,8 @@ class CompiledModel:
             Path to the file where the model shared object code will be exported.
         """
 
+        assert self.forge_graph_module is not None, "Export is not supported for models loaded from the compile cache."
+
         logger.info(f"Exporting model {self.framework_module.get_name()} to shared object file...")
         path_to_so = run_mlir_compiler_to_shared_object(self.forge_graph_module)
 
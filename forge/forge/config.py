@@ -53,6 +53,8 @@ class CompilerConfig:
     enable_training: bool = False
     # enable training recompute during autograd
     enable_recompute: bool = False
+    # accumulate parameter gradients on device across backward passes, until `CompiledModel.zero_grad`
+    enable_gradient_accumulation: bool = False
     # invokes pattern_matcher to compact isomorphic subgraphs
     match_subgraph_patterns: Optional[int] = None
     # enable optimization passes (soon to be removed, only until mlir creates proper optimization passes for resnet)
@@ -96,6 +98,9 @@ class CompilerConfig:
     compile_tvm_to_python: bool = True
     # Whether to keep generated python code, or load and delete
     retain_tvm_python_files: bool = False
+    # Trace forge modules with shapes and dtypes only; op outputs are evaluated on CPU only when their values
+    # are needed (verification, intermediates, golden gradients)
+    enable_shape_only_tracing: bool = False
     # Defines store path of serilized TVM graphs.
     tvm_graph_store_path: str = ""
     # Defines load path of serilized TVM graphs.
@@ -138,6 +143,13 @@ class CompilerConfig:
 
     mlir_config: Optional[MLIRConfig] = field(default=None, metadata=optional_as_json(MLIRConfig))
 
+    # Profile compile stages and TVM phases (wall/CPU time, peak RSS, graph size), see forge/compile_profiler.py
+    enable_compile_profiler: bool = False
+    # If set, compile profile is written to this path as a JSON report
+    compile_profile_path: str = ""
+    # If set, compile profile is written to this path in the Chrome trace format
+    compile_trace_path: str = ""
+
     # TODO: add reportify dir
 
     def apply_env_config_overrides(self):
@@ -172,6 +184,18 @@ class CompilerConfig:
                 int(os.environ["FORGE_EXPORT_TVM_UNIQUE_OPS_CONFIG_DETAILS"])
             )
 
+        if "FORGE_SHAPE_ONLY_TRACING" in os.environ:
+            self.enable_shape_only_tracing = bool(int(os.environ["FORGE_SHAPE_ONLY_TRACING"]))
+
+        if "FORGE_COMPILE_PROFILE" in os.environ:
+            self.enable_compile_profiler = bool(int(os.environ["FORGE_COMPILE_PROFILE"]))
+
+        if "FORGE_COMPILE_PROFILE_PATH" in os.environ:
+            self.compile_profile_path = os.environ["FORGE_COMPILE_PROFILE_PATH"]
+
+        if "FORGE_COMPILE_TRACE_PATH" in os.environ:
+            self.compile_trace_path = os.environ["FORGE_COMPILE_TRACE_PATH"]
+
     def __post_init__(self):
         self.apply_env_config_overrides()
 
@@ -0,0 +1,138 @@
+# SPDX-FileCopyrightText: © 2025 Tenstorrent AI ULC
+
+# SPDX-License-Identifier: Apache-2.0
+"""
+Pipelined execution of requests on a compiled model.
+
+Every request goes through three stages - input staging (host side conversion of the inputs), program execution (on
+device) and output readback (conversion of the outputs to torch tensors). Each stage runs on its own worker thread,
+so staging of request N+1 and readback of request N-1 overlap with the execution of request N. Requests are executed
+in the order in which they are submitted.
+
+    pipeline = ExecutionPipeline(stage_inputs, execute, read_outputs, max_in_flight=4)
+    futures = [pipeline.submit(*inputs) for inputs in requests]
+    results = [future.result() for future in futures]
+    pipeline.shutdown()
+"""
+
+import queue
+import threading
+from concurrent.futures import Future
+from typing import Any, Callable, List, Optional
+
+from loguru import logger
+
+# Marks the end of the request stream in the stage queues
+_SHUTDOWN = object()
+
+
+class ExecutionPipeline:
+    """
+    Runs submitted requests through the input staging, execution and output readback stages, each on a dedicated
+    worker thread.
+
+    At most `max_in_flight` requests are in the pipeline at a time - `submit` blocks until one of the requests in
+    flight completes, which bounds the host memory held by the staged inputs and outputs.
+
+    Parameters
+    ----------
+    stage_inputs: Callable
+        Called with the submitted inputs, returns the staged inputs.
+    execute: Callable
+        Called with the staged inputs, returns the raw outputs.
+    read_outputs: Callable
+        Called with the raw outputs, returns the result of the request.
+    max_in_flight: int
+        Maximum number of requests submitted, but not yet completed.
+    name: str
+        Prefix of the worker thread names.
+    """
+
+    def __init__(
+        self,
+        stage_inputs: Callable[..., Any],
+        execute: Callable[[Any], Any],
+        read_outputs: Callable[[Any], Any],
+        max_in_flight: int = 4,
+        name: str = "forge",
+    ):
+        assert max_in_flight > 0, "At least one request has to be allowed in flight"
+
+        self.max_in_flight = max_in_flight
+        self.in_flight = threading.BoundedSemaphore(max_in_flight)
+        self.stages = [lambda inputs: stage_inputs(*inputs), execute, read_outputs]
+        self.queues: List[queue.Queue] = [queue.Queue() for _ in self.stages]
+        self.closed = False
+        self.submit_lock = threading.Lock()
+
+        self.workers = []
+        for stage_idx, stage_name in enumerate(["stage_inputs", "execute", "read_outputs"]):
+            worker = threading.Thread(
+                target=self._run_stage, args=(stage_idx,), name=f"{name}_{stage_name}", daemon=True
+            )
+            worker.start()
+            self.workers.append(worker)
+
+    def submit(self, *inputs: Any) -> Future:
+        """
+        Submits a request, returns the future of its result. Blocks while `max_in_flight` requests are in flight.
+        """
+        self.in_flight.acquire()
+        future = Future()
+        # Slot is freed once the request completes - with the result, an exception or by cancellation
+        future.add_done_callback(lambda _: self.in_flight.release())
+
+        with self.submit_lock:
+            if self.closed:
+                future.set_exception(RuntimeError("Cannot submit to a pipeline which has been shut down"))
+                return future
+            self.queues[0].put((future, inputs))
+        return future
+
+    def _run_stage(self, stage_idx: int):
+        stage = self.stages[stage_idx]
+        input_queue = self.queues[stage_idx]
+        output_queue: Optional[queue.Queue] = self.queues[stage_idx + 1] if stage_idx + 1 < len(self.queues) else None
+
+        while True:
+            item = input_queue.get()
+            if item is _SHUTDOWN:
+                if output_queue is not None:
+                    output_queue.put(_SHUTDOWN)
+                return
+
+            future, value = item
+            # Requests cancelled before they started are dropped
+            if stage_idx == 0 and not future.set_running_or_notify_cancel():
+                continue
+
+            try:
+                value = stage(value)
+            except BaseException as e:
+                logger.debug(f"Request failed in pipeline stage {stage_idx}: {e}")
+                future.set_exception(e)
+                continue
+
+            if output_queue is not None:
+                output_queue.put((future, value))
+            else:
+                future.set_result(value)
+
+    def shutdown(self, wait: bool = True):
+        """
+        Stops accepting new requests. Requests already submitted are completed.
+        """
+        with self.submit_lock:
+            if not self.closed:
+                self.closed = True
+                self.queues[0].put(_SHUTDOWN)
+
+        if wait:
+            for worker in self.workers:
+                worker.join()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.shutdown()
@@ -29,6 +29,9 @@ g_state_changed = True
 # Are we actively tracing a graph, allows forwarding through forge modules without creating ops with unique names
 g_tracing = False
 
+# Is the active trace shape-only, i.e. op outputs are evaluated lazily, see ForgeOp.get_tensor
+g_shape_only_tracing = False
+
 # ID used to uniquefy nodes when no names are provided
 g_unique_node_id = -1
 
@@ -108,20 +111,29 @@ def tracing() -> bool:
     return g_tracing
 
 
-def start_tracing():
+def shape_only_tracing() -> bool:
+    """
+    Has a shape-only graph trace started, and op outputs should be evaluated only when their values are needed
+    """
+    return g_tracing and g_shape_only_tracing
+
+
+def start_tracing(shape_only: bool = False):
     """
     Indicate that a graph trace has started, and unique op names should be generated
     """
-    global g_tracing
+    global g_tracing, g_shape_only_tracing
     g_tracing = True
+    g_shape_only_tracing = shape_only
 
 
 def stop_tracing():
     """
     Indicate that a graph trace has ended, forge graph can be forwarded without generating unique names
     """
-    global g_tracing
+    global g_tracing, g_shape_only_tracing
     g_tracing = False
+    g_shape_only_tracing = False
 
 
 def get_unique_node_id():
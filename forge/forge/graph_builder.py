@@ -0,0 +1,119 @@
+# SPDX-FileCopyrightText: © 2025 Tenstorrent AI ULC
+
+# SPDX-License-Identifier: Apache-2.0
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from forge._C import DataFormat
+from forge._C.graph import BulkNodeKind, Graph, OpType, create_data_edges, create_nodes
+
+
+class GraphBuilder:
+    """
+    Builds a graph in batches - nodes and data edges are collected on the python side, and are created in the graph
+    with a single call per batch on `flush`, instead of a pybind call per node/edge.
+
+    The add_* methods return a handle of the node, which is used to refer to the node in edges (flushed or not). Id of
+    the node in the graph is available through `get_node_id` once the node has been flushed. Nodes are created in the
+    graph in the order in which they were added.
+    """
+
+    def __init__(self, graph: Graph):
+        self.graph = graph
+        # Name and subgraph index of each node, indexed by handle
+        self.node_names: List[str] = []
+        self.node_subgraphs: List[int] = []
+        # Graph ids of flushed nodes, indexed by handle
+        self.node_ids: List[int] = []
+        self.pending_nodes: List[Tuple] = []
+        self.pending_edges: List[Tuple] = []
+
+    def _add_node(
+        self,
+        kind: BulkNodeKind,
+        name: str,
+        shape: Sequence[int],
+        data_format: DataFormat,
+        subgraph_idx: int,
+        attrs: Tuple,
+    ) -> int:
+        handle = len(self.node_names)
+        self.node_names.append(name)
+        self.node_subgraphs.append(subgraph_idx)
+        self.pending_nodes.append((kind, name, shape, data_format, subgraph_idx, attrs))
+        return handle
+
+    def add_op_node(
+        self,
+        name: str,
+        op_type: OpType,
+        shape: Sequence[int],
+        data_format: DataFormat,
+        subgraph_idx: int,
+        tags: Dict[str, Any],
+    ) -> int:
+        return self._add_node(BulkNodeKind.Op, name, shape, data_format, subgraph_idx, (op_type, tags))
+
+    def add_parameter_input(
+        self, name: str, shape: Sequence[int], requires_grad: bool, data_format: DataFormat, subgraph_idx: int
+    ) -> int:
+        return self._add_node(BulkNodeKind.ParameterInput, name, shape, data_format, subgraph_idx, (requires_grad,))
+
+    def add_activation_input(
+        self, name: str, shape: Sequence[int], requires_grad: bool, data_format: DataFormat, subgraph_idx: int
+    ) -> int:
+        return self._add_node(BulkNodeKind.ActivationInput, name, shape, data_format, subgraph_idx, (requires_grad,))
+
+    def add_target_input(
+        self, name: str, shape: Sequence[int], requires_grad: bool, data_format: DataFormat, subgraph_idx: int
+    ) -> int:
+        return self._add_node(BulkNodeKind.TargetInput, name, shape, data_format, subgraph_idx, (requires_grad,))
+
+    def add_constant_input(
+        self, name: str, value: Any, shape: Sequence[int], data_format: DataFormat, subgraph_idx: int
+    ) -> int:
+        return self._add_node(BulkNodeKind.ConstantInput, name, shape, data_format, subgraph_idx, (value,))
+
+    def add_scalar_constant_input(self, name: str, value: float, data_format: DataFormat, subgraph_idx: int) -> int:
+        # Scalar constants are told apart from tensor constants by the value type
+        return self._add_node(BulkNodeKind.ConstantInput, name, (1,), data_format, subgraph_idx, (float(value),))
+
+    def add_output(
+        self, name: str, shape: Sequence[int], data_format: DataFormat, is_loss: bool, subgraph_idx: int
+    ) -> int:
+        return self._add_node(BulkNodeKind.Output, name, shape, data_format, subgraph_idx, (is_loss,))
+
+    def add_data_edge(
+        self, start: int, out_port_id: int, end: int, in_port_id: int, operand_broadcast: Optional[List[Tuple]] = None
+    ):
+        if operand_broadcast is None:
+            operand_broadcast = []
+        self.pending_edges.append((start, out_port_id, end, in_port_id, operand_broadcast))
+
+    def get_node_name(self, handle: int) -> str:
+        return self.node_names[handle]
+
+    def get_subgraph_idx(self, handle: int) -> int:
+        return self.node_subgraphs[handle]
+
+    def get_node_id(self, handle: int) -> int:
+        assert handle < len(self.node_ids), f"Node {self.node_names[handle]} hasn't been flushed to the graph yet"
+        return self.node_ids[handle]
+
+    def flush(self):
+        """
+        Creates the pending nodes and edges in the graph.
+        """
+        if self.pending_nodes:
+            self.node_ids += create_nodes(self.graph, self.pending_nodes)
+            self.pending_nodes = []
+
+        if self.pending_edges:
+            node_ids = self.node_ids
+            create_data_edges(
+                self.graph,
+                [
+                    (node_ids[start], out_port_id, node_ids[end], in_port_id, operand_broadcast)
+                    for start, out_port_id, end, in_port_id, operand_broadcast in self.pending_edges
+                ],
+            )
+            self.pending_edges = []
@@ -0,0 +1,61 @@
+# SPDX-FileCopyrightText: © 2025 Tenstorrent AI ULC
+
+# SPDX-License-Identifier: Apache-2.0
+"""
+Lazy imports of the optional frontend frameworks (TensorFlow, JAX, Paddle, ONNX, ...).
+
+Importing a framework costs seconds and hundreds of MB of memory, so `import forge` doesn't import any of them. Modules
+use `lazy_import` instead, which returns a proxy that imports the framework on the first attribute access:
+
+    tf = lazy_import("tensorflow")
+
+    def to_tf(t):
+        return tf.convert_to_tensor(t)  # tensorflow is imported here
+
+Type checks should go through `is_imported` first - an object can only be an instance of a framework type if the
+framework has already been imported (by the user, or by forge), so there is no need to import it just to find out
+that the object is something else.
+"""
+
+import importlib
+import sys
+import types
+
+
+class LazyModule(types.ModuleType):
+    """
+    Module proxy, imports the module on the first attribute access.
+    """
+
+    def __init__(self, name: str):
+        super().__init__(name)
+        self._lazy_module = None
+
+    def _load(self) -> types.ModuleType:
+        if self._lazy_module is None:
+            self._lazy_module = importlib.import_module(self.__name__)
+        return self._lazy_module
+
+    def __getattr__(self, name: str):
+        return getattr(self._load(), name)
+
+    def __dir__(self):
+        return dir(self._load())
+
+    def __repr__(self):
+        state = "imported" if is_imported(self) else "not imported"
+        return f"<lazy module '{self.__name__}' ({state})>"
+
+
+def lazy_import(name: str) -> LazyModule:
+    """
+    Returns proxy of the module with the given name, the module is imported on first use.
+    """
+    return LazyModule(name)
+
+
+def is_imported(module: LazyModule) -> bool:
+    """
+    Returns True if the module has already been imported, either through the proxy or directly by the user.
+    """
+    return module._lazy_module is not None or module.__name__ in sys.modules
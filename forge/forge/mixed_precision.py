@@ -0,0 +1,262 @@
+# SPDX-FileCopyrightText: © 2025 Tenstorrent AI ULC
+
+# SPDX-License-Identifier: Apache-2.0
+"""
+Mixed precision training with fp32 master weights and dynamic loss scaling.
+
+`MixedPrecisionTrainer` keeps an fp32 master copy of the trainable parameters, and casts the module to the compute
+dtype (e.g. bfloat16) in which the forward and backward programs are compiled. The optimizer runs on the host over the
+master parameters - the gradients read back from the device are unscaled into fp32, and the updated master weights are
+cast back into the module parameters, which the device shares with the module:
+
+    trainer = MixedPrecisionTrainer(model, lambda params: torch.optim.SGD(params, lr=0.001))
+    trainer.compile(sample_inputs=[torch.rand(32, 784)])
+    for data, target in train_loader:
+        loss = loss_fn(trainer(data)[0], target)
+        trainer.backward(loss)
+        trainer.step()  # False if the step was skipped due to a gradient overflow
+
+The loss is scaled before the backward pass so that small gradients don't underflow in the compute dtype.
+`DynamicLossScaler` lowers the scale and skips the optimizer step when the gradients overflow, and raises it again
+after a number of steps without an overflow.
+"""
+
+import dataclasses
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence
+
+import torch
+from loguru import logger
+
+import forge
+from forge.config import CompilerConfig
+from forge.tensor import pytorch_dtype_to_forge_dataformat
+
+
+class DynamicLossScaler:
+    """
+    Dynamic loss scale - the scale is multiplied by `backoff_factor` on every step with overflowing (inf/nan)
+    gradients, and by `growth_factor` after `growth_interval` consecutive steps without an overflow.
+
+    Parameters
+    ----------
+    init_scale: float
+        Initial loss scale
+
+    growth_factor: float
+        Factor by which the scale is raised after `growth_interval` steps without an overflow
+
+    backoff_factor: float
+        Factor by which the scale is lowered on an overflow
+
+    growth_interval: int
+        Number of consecutive steps without an overflow after which the scale is raised
+
+    min_scale: float
+        Lower bound of the scale
+    """
+
+    def __init__(
+        self,
+        init_scale: float = 2.0**16,
+        growth_factor: float = 2.0,
+        backoff_factor: float = 0.5,
+        growth_interval: int = 2000,
+        min_scale: float = 1.0,
+    ):
+        assert growth_factor > 1.0, "Growth factor has to be greater than 1"
+        assert 0.0 < backoff_factor < 1.0, "Backoff factor has to be between 0 and 1"
+        assert growth_interval > 0, "Growth interval has to be positive"
+
+        self.growth_factor = growth_factor
+        self.backoff_factor = backoff_factor
+        self.growth_interval = growth_interval
+        self.min_scale = min_scale
+
+        self.scale = init_scale
+        # Number of consecutive steps without an overflow
+        self.growth_tracker = 0
+        self.num_steps = 0
+        self.num_skipped_steps = 0
+
+    def scale_loss(self, loss: torch.Tensor) -> torch.Tensor:
+        return loss * self.scale
+
+    def unscale(self, grad: torch.Tensor) -> torch.Tensor:
+        """
+        Returns the gradient of the scaled loss divided by the scale, in fp32.
+        """
+        return grad.float() / self.scale
+
+    @staticmethod
+    def has_overflow(grads: Iterable[torch.Tensor]) -> bool:
+        return any(not torch.isfinite(grad).all() for grad in grads)
+
+    def update(self, overflow: bool) -> None:
+        """
+        Updates the scale after a step, `overflow` being whether the step had overflowing gradients (and was skipped).
+        """
+        self.num_steps += 1
+        if overflow:
+            self.num_skipped_steps += 1
+            self.growth_tracker = 0
+            self.scale = max(self.scale * self.backoff_factor, self.min_scale)
+            logger.debug(f"Gradient overflow, skipping step - lowering loss scale to {self.scale}")
+            return
+
+        self.growth_tracker += 1
+        if self.growth_tracker == self.growth_interval:
+            self.growth_tracker = 0
+            self.scale *= self.growth_factor
+
+    def state_dict(self) -> Dict[str, Any]:
+        return {
+            "scale": self.scale,
+            "growth_tracker": self.growth_tracker,
+            "num_steps": self.num_steps,
+            "num_skipped_steps": self.num_skipped_steps,
+        }
+
+    def load_state_dict(self, state_dict: Dict[str, Any]) -> None:
+        self.scale = state_dict["scale"]
+        self.growth_tracker = state_dict["growth_tracker"]
+        self.num_steps = state_dict["num_steps"]
+        self.num_skipped_steps = state_dict["num_skipped_steps"]
+
+
+class MixedPrecisionTrainer:
+    """
+    Trains a PyTorch module compiled in the compute dtype, with fp32 master weights optimized on the host.
+
+    Parameters
+    ----------
+    module: torch.nn.Module
+        Module to train, in fp32 - it is cast to `compute_dtype` in place
+
+    optimizer_fn: Callable[[List[torch.nn.Parameter]], torch.optim.Optimizer]
+        Creates the host optimizer over the given fp32 master parameters
+
+    compute_dtype: torch.dtype
+        Data type of the forward and backward programs
+
+    loss_scaler: DynamicLossScaler, optional
+        Loss scaler, dynamic loss scaling with the default settings if not provided
+    """
+
+    def __init__(
+        self,
+        module: torch.nn.Module,
+        optimizer_fn: Callable[[List[torch.nn.Parameter]], torch.optim.Optimizer],
+        compute_dtype: torch.dtype = torch.bfloat16,
+        loss_scaler: Optional[DynamicLossScaler] = None,
+    ):
+        self.module = module
+        self.compute_dtype = compute_dtype
+        self.loss_scaler = loss_scaler if loss_scaler is not None else DynamicLossScaler()
+
+        # Masters are created before the cast, so that they keep the full precision of the initial weights
+        self.parameters = [param for param in module.parameters() if param.requires_grad]
+        self.master_parameters = [torch.nn.Parameter(param.detach().float().clone()) for param in self.parameters]
+        self.optimizer = optimizer_fn(self.master_parameters)
+
+        # Casting keeps the parameter objects (only their data is replaced), which the compiled model shares
+        module.to(compute_dtype)
+
+        self.compiled_model = None
+
+    @property
+    def loss_scale(self) -> float:
+        return self.loss_scaler.scale
+
+    def compile(self, sample_inputs: Sequence[torch.Tensor], compile_fn: Callable = forge.compile, **kwargs):
+        """
+        Compiles the module for training in the compute dtype. Floating point sample inputs are cast to the compute
+        dtype, and the default data format of the compiler config is set to it, unless already overridden - the
+        passed compiler config is not modified.
+
+        The optimizer runs on the host over the master parameters, so a device optimizer can't be passed.
+        """
+        assert "optimizer" not in kwargs, (
+            "Device optimizer is not supported in mixed precision training - the optimizer runs on the host over the "
+            "fp32 master parameters, pass it through `optimizer_fn`."
+        )
+
+        compiler_cfg = kwargs.pop("compiler_cfg", None) or CompilerConfig()
+        if compiler_cfg.default_df_override is None:
+            compiler_cfg = dataclasses.replace(
+                compiler_cfg, default_df_override=pytorch_dtype_to_forge_dataformat(self.compute_dtype)
+            )
+
+        self.compiled_model = compile_fn(
+            self.module,
+            sample_inputs=self.cast_inputs(sample_inputs),
+            training=True,
+            compiler_cfg=compiler_cfg,
+            **kwargs,
+        )
+        return self.compiled_model
+
+    def cast_inputs(self, inputs: Sequence[torch.Tensor]) -> List[torch.Tensor]:
+        return [
+            input.to(self.compute_dtype) if isinstance(input, torch.Tensor) and input.is_floating_point() else input
+            for input in inputs
+        ]
+
+    def __call__(self, *inputs: torch.Tensor) -> List[torch.Tensor]:
+        """
+        Runs the forward pass, returns the outputs in fp32 - the loss is computed in fp32 on the host.
+        """
+        assert self.compiled_model is not None, "Module not compiled, call `compile` first."
+        outputs = self.compiled_model(*self.cast_inputs(inputs))
+        return [output.float() for output in outputs]
+
+    def backward(self, loss: torch.Tensor) -> None:
+        """
+        Runs the backward pass of the scaled loss on the host, and of the model on device.
+        """
+        self.loss_scaler.scale_loss(loss).backward()
+        self.compiled_model.backward()
+
+    def step(self) -> bool:
+        """
+        Unscales the gradients into the master parameters and runs the optimizer step over them, unless the gradients
+        overflowed. Updated master weights are cast back into the module parameters. Returns whether the step was
+        taken.
+        """
+        accumulates_gradients = self.compiled_model.accumulates_gradients()
+        if accumulates_gradients:
+            self.compiled_model.update_host_gradients()
+
+        for param, master in zip(self.parameters, self.master_parameters):
+            master.grad = self.loss_scaler.unscale(param.grad) if param.grad is not None else None
+            param.grad = None
+        if accumulates_gradients:
+            self.compiled_model.zero_grad()
+
+        overflow = self.loss_scaler.has_overflow(
+            master.grad for master in self.master_parameters if master.grad is not None
+        )
+        if not overflow:
+            self.optimizer.step()
+            with torch.no_grad():
+                for param, master in zip(self.parameters, self.master_parameters):
+                    # In place, the device copy of the parameter is refreshed from it on the next forward pass
+                    param.copy_(master)
+
+        self.optimizer.zero_grad()
+        self.loss_scaler.update(overflow)
+        return not overflow
+
+    def state_dict(self) -> Dict[str, Any]:
+        return {
+            "master_parameters": [master.detach().clone() for master in self.master_parameters],
+            "optimizer": self.optimizer.state_dict(),
+            "loss_scaler": self.loss_scaler.state_dict(),
+        }
+
+    def load_state_dict(self, state_dict: Dict[str, Any]) -> None:
+        with torch.no_grad():
+            for param, master, saved in zip(self.parameters, self.master_parameters, state_dict["master_parameters"]):
+                master.copy_(saved)
+                param.copy_(saved)
+        self.optimizer.load_state_dict(state_dict["optimizer"])
+        self.loss_scaler.load_state_dict(state_dict["loss_scaler"])
@@ -2,22 +2,16 @@
 
 # SPDX-License-Identifier: Apache-2.0
 from abc import ABC, abstractmethod
-from typing import Optional, Tuple, List, Dict, TypeAlias
+from typing import Optional, Tuple, List, Dict, TypeAlias, Union
 from collections import OrderedDict
 import itertools
 
-import flax
-import jax.numpy as jnp
 import numpy as np
-import onnx
-from onnx import numpy_helper
-import paddle
 import torch
-import tensorflow as tf
 from loguru import logger
-from transformers import FlaxPreTrainedModel
 
 import forge
+from .lazy_import import lazy_import, is_imported
 from .forgeglobal import lazy_trace_data
 from .tensor import (
     SomeTensor,
@@ -34,6 +28,15 @@ from .parameter import Parameter
 
 from forge.tvm_utils import map_pt_dtype_to_tf, flatten_structured_output
 
+# Frontend frameworks are imported on first use, see forge.lazy_import
+tf = lazy_import("tensorflow")
+paddle = lazy_import("paddle")
+onnx = lazy_import("onnx")
+numpy_helper = lazy_import("onnx.numpy_helper")
+flax = lazy_import("flax")
+jnp = lazy_import("jax.numpy")
+transformers = lazy_import("transformers")
+
 
 class Module(ABC):
     """
@@ -220,7 +223,7 @@ class PaddleModule(Module):
     A wrapper around a Paddle module.
     """
 
-    def __init__(self, name: str, module: paddle.nn.Layer):
+    def __init__(self, name: str, module: "paddle.nn.Layer"):
         super().__init__(name)
         self.module = module
 
@@ -258,7 +261,7 @@ class TFModule(Module):
     A wrapper around a TF module. Currently, TF modules can only run on a CPU device.
     """
 
-    def __init__(self, name: str, module: tf.keras.Model):
+    def __init__(self, name: str, module: "tf.keras.Model"):
         """
         Create TF module wrapper.
 
@@ -275,7 +278,7 @@ class TFModule(Module):
 
         self.module = module
 
-    def forward(self, *args, **kwargs) -> Tuple[tf.Tensor]:
+    def forward(self, *args, **kwargs) -> Tuple["tf.Tensor"]:
         """
         Run TF module forward, converting pytorch tensors as necessary
 
@@ -303,7 +306,7 @@ class TFModule(Module):
         outputs = to_pt_tensors(outputs)
         return outputs
 
-    def cpu_eval_forward(self, *args, **kwargs) -> Tuple[tf.Tensor]:
+    def cpu_eval_forward(self, *args, **kwargs) -> Tuple["tf.Tensor"]:
 
         args = to_tf_tensors(args, force_float32=True)
         outputs = self.call(*args, **kwargs)
@@ -311,7 +314,7 @@ class TFModule(Module):
         outputs = to_pt_tensors(outputs)
         return outputs
 
-    def call(self, *args, **kwargs) -> Tuple[tf.Tensor]:
+    def call(self, *args, **kwargs) -> Tuple["tf.Tensor"]:
         """
         Run TF module forward, with pre-loaded inputs in input queues
 
@@ -331,7 +334,7 @@ class TFModule(Module):
         outputs = self.module(*args, **kwargs)
         return outputs
 
-    def backward(self, *args) -> Tuple[tf.Tensor]:
+    def backward(self, *args) -> Tuple["tf.Tensor"]:
         """
         Run TF module backward, with pre-loaded inputs in input queues
 
@@ -362,7 +365,7 @@ class OnnxModule(Module):
     A wrapper around a Onnx module.
     """
 
-    def __init__(self, name: str, module: onnx.onnx_ml_pb2.ModelProto, onnx_path: Optional[str] = None):
+    def __init__(self, name: str, module: "onnx.onnx_ml_pb2.ModelProto", onnx_path: Optional[str] = None):
         """
         Create Onnx module wrapper.
 
@@ -988,31 +991,65 @@ def wrap_module(module, name: str) -> Module:
     Module
         Wrapped module
     """
+    # Module can only be an instance of a framework type if the framework has already been imported
     if isinstance(module, torch.nn.Module):
         return PyTorchModule(name, module)
-    elif isinstance(module, tf.keras.Model):
+    elif is_imported(tf) and isinstance(module, tf.keras.Model):
         return TFModule(name, module)
     elif isinstance(module, ForgeModule):
         return module
-    elif isinstance(module, paddle.nn.Layer):
+    elif is_imported(paddle) and isinstance(module, paddle.nn.Layer):
         return PaddleModule(name, module)
-    elif isinstance(module, onnx.onnx_ml_pb2.ModelProto):
+    elif is_imported(onnx) and isinstance(module, onnx.onnx_ml_pb2.ModelProto):
         return OnnxModule(name, module)
     elif isinstance(module, forge.module.OnnxModule):
         return module
-    elif isinstance(module, (flax.linen.Module, FlaxPreTrainedModel)):
+    elif is_jax_module(module):
         return JaxModule(name, module)
     else:
         raise RuntimeError("Unsupported module type: " + str(type(module)))
 
 
-FrameworkModule: TypeAlias = (
-    torch.nn.Module
-    | tf.keras.Model
-    | paddle.nn.Layer
-    | onnx.onnx_ml_pb2.ModelProto
-    | OnnxModule
-    | flax.linen.Module
-    | FlaxPreTrainedModel
-)
-AnyModule: TypeAlias = FrameworkModule | ForgeModule
+def is_jax_module(module) -> bool:
+    if not is_imported(flax):
+        return False
+    if isinstance(module, flax.linen.Module):
+        return True
+    return is_imported(transformers) and isinstance(module, transformers.FlaxPreTrainedModel)
+
+
+FrameworkModule: TypeAlias = Union[
+    torch.nn.Module,
+    "tf.keras.Model",
+    "paddle.nn.Layer",
+    "onnx.onnx_ml_pb2.ModelProto",
+    OnnxModule,
+    "flax.linen.Module",
+    "transformers.FlaxPreTrainedModel",
+]
+AnyModule: TypeAlias = Union[FrameworkModule, ForgeModule]
+
+
+def get_framework_module_types() -> Tuple[type, ...]:
+    """
+    Returns module types of the frameworks which have been imported, for isinstance checks against `FrameworkModule`.
+    """
+    types = [torch.nn.Module, OnnxModule]
+    if is_imported(tf):
+        types.append(tf.keras.Model)
+    if is_imported(paddle):
+        types.append(paddle.nn.Layer)
+    if is_imported(onnx):
+        types.append(onnx.onnx_ml_pb2.ModelProto)
+    if is_imported(flax):
+        types.append(flax.linen.Module)
+        if is_imported(transformers):
+            types.append(transformers.FlaxPreTrainedModel)
+    return tuple(types)
+
+
+def get_any_module_types() -> Tuple[type, ...]:
+    """
+    Returns types for isinstance checks against `AnyModule`.
+    """
+    return get_framework_module_types() + (ForgeModule,)
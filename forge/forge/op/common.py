@@ -2,14 +2,16 @@
 
 # SPDX-License-Identifier: Apache-2.0
 
-from typing import Tuple, Union
+from typing import Optional, Tuple, Union
 
-from ..tensor import Tensor
+import torch
+
+from ..tensor import Tensor, TensorFromTrace
 from ..parameter import Parameter
 from forge._C import DataFormat
 from forge._C.graph import OpType
 import forge
-from forge.forgeglobal import get_unique_node_id, tracing
+from forge.forgeglobal import get_unique_node_id, tracing, shape_only_tracing
 from forge.tensor import pytorch_dtype_to_forge_dataformat
 from loguru import logger
 
@@ -56,9 +58,14 @@ class ForgeOp:
         shapes = [o.shape.get_pytorch_shape() for o in self.operands]
         shape, self.operand_broadcast = self.cpp_op_type.shape(shapes)
 
+        # In shape-only tracing, output dtype is taken from evaluation on meta tensors and the value itself is
+        # evaluated lazily, only if needed (e.g. for verification)
+        ref_output = self.eval_meta() if shape_only_tracing() else None
+
         # get reference output value
-        values = [o.value() if isinstance(o, (Tensor, Parameter)) else o for o in self.operands]
-        ref_output = self.cpp_op_type.eval(values)
+        if ref_output is None:
+            values = [o.value() if isinstance(o, (Tensor, Parameter)) else o for o in self.operands]
+            ref_output = self.cpp_op_type.eval(values)
 
         if out_df is not None:  # User provided output dataformat
             data_format = out_df
@@ -69,6 +76,35 @@ class ForgeOp:
 
         result = Tensor.create_from_trace(src_op=self, shape=shape, data_format=data_format)
         result.requires_grad = any([o.requires_grad for o in self.operands])
-        result.set_value(ref_output)
+        if ref_output.is_meta:
+            result.set_lazy_value(ref_output.dtype)
+        else:
+            result.set_value(ref_output)
 
         return result
+
+    def eval_meta(self) -> Optional[torch.Tensor]:
+        """
+        Evaluate op on meta tensors, which carry only shapes and dtypes of the operands.
+        Returns None if the op can't be evaluated on meta tensors.
+        """
+        meta_values = []
+        for o in self.operands:
+            if not isinstance(o, (Tensor, Parameter)):
+                meta_values.append(o)
+                continue
+            if not o.has_value():
+                return None
+            dtype = o.pt_data_format if isinstance(o, TensorFromTrace) else o.value().dtype
+            meta_values.append(torch.empty(o.shape.get_pytorch_shape(), dtype=dtype, device="meta"))
+
+        try:
+            ref_output = self.cpp_op_type.eval(meta_values)
+        except Exception as e:
+            logger.trace("Op {} can't be evaluated on meta tensors: {}", self.name, e)
+            return None
+
+        if not isinstance(ref_output, torch.Tensor) or not ref_output.is_meta:
+            return None
+
+        return ref_output
@@ -9,7 +9,6 @@ from typing import List, Tuple
 from math import prod
 
 import torch
-import tensorflow as tf
 import numpy as np
 
 from collections import defaultdict
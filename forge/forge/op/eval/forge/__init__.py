@@ -2,8 +2,11 @@
 
 # SPDX-License-Identifier: Apache-2.0
 import importlib
+import os
 from types import ModuleType
 from functools import lru_cache
+
+from forge._C.graph import OpType
 from .exp import Exp
 from .cosine import Cosine
 from .ethernet_datacopy import EthernetDatacopy
@@ -201,69 +204,117 @@ def empty_function(*inputs):
     pass
 
 
+# Number of (op, attributes) combinations with cached dispatch
+OP_DISPATCH_CACHE_SIZE = int(os.environ.get("FORGE_OP_DISPATCH_CACHE_SIZE", "16384"))
+
+
+class OpDispatch:
+    """
+    Prebuilt callables implementing an op with a given set of attributes.
+    """
+
+    __slots__ = (
+        "eval",
+        "shape",
+        "backward",
+        "decompose",
+        "decompose_post_autograd",
+        "decompose_post_optimize",
+        "initial_flops_estimate",
+    )
+
+    def __init__(self, op_name, attr, named_attrs):
+        module_or_class = _get_module_or_class(op_name)
+        if isinstance(module_or_class, ModuleType):
+            # Old-style op, module functions take op name and attributes as the leading arguments
+            def get_function(name, required=False):
+                if not hasattr(module_or_class, name):
+                    return _get_missing_function(module_or_class, name) if required else empty_function
+                function = getattr(module_or_class, name)
+                # Functions get a copy of the attributes, some of them modify the list in place
+                return lambda *inputs: function(op_name, list(attr), *inputs)
+
+        else:
+            # New-style op, instance wraps an owned copy of the op type, since the dispatch outlives the node
+            instance = module_or_class(OpType(op_name, attr, named_attrs))
+
+            def get_function(name, required=False):
+                return getattr(instance, name)
+
+        self.eval = get_function("eval", required=True)
+        self.shape = get_function("shape", required=True)
+        self.backward = get_function("backward", required=True)
+        self.decompose = get_function("decompose")
+        self.decompose_post_autograd = get_function("decompose_post_autograd")
+        self.decompose_post_optimize = get_function("decompose_post_optimize")
+        self.initial_flops_estimate = get_function("initial_flops_estimate")
+
+
+def _get_missing_function(module, name):
+    def missing_function(*inputs):
+        # Raises the same error as calling the function would
+        return getattr(module, name)(*inputs)
+
+    return missing_function
+
+
+def _to_hashable(value):
+    if isinstance(value, (list, tuple)):
+        return tuple(_to_hashable(item) for item in value)
+    # Type is part of the key, so that e.g. True and 1 don't share the dispatch
+    return (type(value), value)
+
+
+# (op name, attributes) -> OpDispatch, in insertion order for eviction
+_op_dispatch_cache = {}
+
+
+def get_op_dispatch(op_type) -> OpDispatch:
+    """
+    Returns dispatch of the op type, shared by all of the nodes (and passes) with the same op and attributes.
+    """
+    op_name = op_type.op
+    attr = op_type.attr
+    named_attrs = op_type.named_attrs
+    key = (op_name, _to_hashable(attr), _to_hashable(sorted(named_attrs.items())))
+
+    dispatch = _op_dispatch_cache.get(key)
+    if dispatch is None:
+        if len(_op_dispatch_cache) >= OP_DISPATCH_CACHE_SIZE:
+            # Evict the oldest entry
+            del _op_dispatch_cache[next(iter(_op_dispatch_cache))]
+        dispatch = OpDispatch(op_name, attr, named_attrs)
+        _op_dispatch_cache[key] = dispatch
+    return dispatch
+
+
+def clear_op_dispatch_cache():
+    _op_dispatch_cache.clear()
+
+
 def get_f_forge_backward(op_type):
-    module_or_class = _get_module_or_class(op_type.op)
-    if isinstance(module_or_class, ModuleType):
-        return lambda *inputs: module_or_class.backward(op_type.op, op_type.attr, *inputs)
-    else:
-        return module_or_class(op_type).backward
+    return get_op_dispatch(op_type).backward
 
 
 def get_f_forge_shape(op_type):
-    module_or_class = _get_module_or_class(op_type.op)
-    if isinstance(module_or_class, ModuleType):
-        return lambda *inputs: module_or_class.shape(op_type.op, op_type.attr, *inputs)
-    else:
-        return module_or_class(op_type).shape
+    return get_op_dispatch(op_type).shape
 
 
 def get_f_forge_eval(op_type):
-    module_or_class = _get_module_or_class(op_type.op)
-    if isinstance(module_or_class, ModuleType):
-        return lambda *inputs: module_or_class.eval(op_type.op, op_type.attr, *inputs)
-    else:
-        return module_or_class(op_type).eval
+    return get_op_dispatch(op_type).eval
 
 
 def get_f_forge_decompose(op_type):
-    module_or_class = _get_module_or_class(op_type.op)
-    if isinstance(module_or_class, ModuleType):
-        if hasattr(module_or_class, "decompose"):
-            return lambda *inputs: module_or_class.decompose(op_type.op, op_type.attr, *inputs)
-        else:
-            return empty_function
-    else:
-        return module_or_class(op_type).decompose
+    return get_op_dispatch(op_type).decompose
 
 
 def get_f_forge_decompose_post_autograd(op_type):
-    module_or_class = _get_module_or_class(op_type.op)
-    if isinstance(module_or_class, ModuleType):
-        if hasattr(module_or_class, "decompose_post_autograd"):
-            return lambda *inputs: module_or_class.decompose_post_autograd(op_type.op, op_type.attr, *inputs)
-        else:
-            return empty_function
-    else:
-        return module_or_class(op_type).decompose_post_autograd
+    return get_op_dispatch(op_type).decompose_post_autograd
 
 
 def get_f_forge_decompose_post_optimize(op_type):
-    module_or_class = _get_module_or_class(op_type.op)
-    if isinstance(module_or_class, ModuleType):
-        if hasattr(module_or_class, "decompose_post_optimize"):
-            return lambda *inputs: module_or_class.decompose_post_optimize(op_type.op, op_type.attr, *inputs)
-        else:
-            return empty_function
-    else:
-        return module_or_class(op_type).decompose_post_optimize
+    return get_op_dispatch(op_type).decompose_post_optimize
 
 
 def get_f_forge_initial_flops_estimate(op_type):
-    module_or_class = _get_module_or_class(op_type.op)
-    if isinstance(module_or_class, ModuleType):
-        if hasattr(module_or_class, "initial_flops_estimate"):
-            return lambda *inputs: module_or_class.initial_flops_estimate(op_type.op, op_type.attr, *inputs)
-        else:
-            return empty_function
-    else:
-        return module_or_class(op_type).initial_flops_estimate
+    return get_op_dispatch(op_type).initial_flops_estimate
@@ -1,6 +1,8 @@
 # SPDX-FileCopyrightText: (c) 2025 Tenstorrent AI ULC
 #
 # SPDX-License-Identifier: Apache-2.0
+import torch
+
 from ..common import to_torch_operands
 from ..interface import PyOp
 
@@ -42,10 +44,13 @@ class UpdateCache(PyOp):
             batch_offset + B_in <= B_cache
         ), f"batch_offset ({batch_offset}) + input batch size ({B_in}) exceeds cache batch size ({B_cache})"
 
-        for b in range(B_in):
-            idx = update_index[b].item()
-            assert 0 <= idx < S_cache, f"Invalid update index {idx} at batch {b}"
-            cache[b + batch_offset, :, idx : idx + S_in, :] = input[b]
+        # Every sequence is written at its own position (ragged decode), with a single scatter over the batch
+        update_index = update_index.to(torch.int64)
+        assert bool(
+            ((update_index >= 0) & (update_index < S_cache)).all()
+        ), f"Invalid update indices {update_index.tolist()} for cache sequence length {S_cache}"
+        scatter_index = update_index.reshape(B_in, 1, 1, 1).expand(B_in, H_in, S_in, D_in)
+        cache[batch_offset : batch_offset + B_in].scatter_(2, scatter_index, input.to(cache.dtype))
 
         return cache
 
@@ -97,9 +102,8 @@ class FillCache(PyOp):
             batch_offset + B_in <= B_cache
         ), f"batch_offset ({batch_offset}) + input batch size ({B_in}) exceeds cache batch size ({B_cache})"
 
-        for b in range(B_in):
-            assert S_in <= S_cache, f"Fill would write past the end of cache: S_in {S_in} > S_cache {S_cache}"
-            cache[b + batch_offset, :, 0:S_in, :] = input[b]
+        assert S_in <= S_cache, f"Fill would write past the end of cache: S_in {S_in} > S_cache {S_cache}"
+        cache[batch_offset : batch_offset + B_in, :, 0:S_in, :] = input
 
         return cache
 
@@ -30,296 +30,640 @@ from .nop import Nop
 from .buffer import Buffer
 
 
+def _select_with_zero_padding(x, dim, indices):
+    """
+    Selects the given indices of x along dim, indices equal to x.shape[dim] select a slice of zeros.
+    """
+    size = x.shape[dim]
+    if bool((indices >= size).any()):
+        zero_shape = list(x.shape)
+        zero_shape[dim] = 1
+        x = torch.cat([x, torch.zeros(zero_shape, dtype=x.dtype)], dim=dim)
+    return torch.index_select(x, dim, indices)
+
+
+def _eval_select(attr, ops, t_ops):
+    assert len(attr) == 4, "Select should have 4 attributes"
+    dim, begin, length, stride = attr
+    x = t_ops[0]
+    size = x.shape[dim]
+
+    # Indices of selected slices, `length` consecutive indices from every `stride`, starting at `begin`
+    offsets = torch.arange(0, size - begin, stride)
+    indices = (offsets.unsqueeze(1) + torch.arange(begin, begin + length).unsqueeze(0)).flatten()
+    if stride == size:
+        return torch.index_select(x, dim, indices)
+    # Indices past the end of the input select zero padding
+    return _select_with_zero_padding(x, dim, torch.clamp(indices, max=size))
+
+
+def _eval_gather(attr, ops, t_ops):
+    assert len(attr) == 5, "Gather should have 5 attributes"
+    dim, begin, length, stride, orig_size = attr
+    x = t_ops[0]
+    if dim > 0:
+        dim -= 4
+    while len(x.shape) <= abs(dim):
+        x = x.unsqueeze(0)
+
+    # Inverse of select - slices of the input are scattered to `length` consecutive positions from every `stride`,
+    # starting at `begin`, the rest of the positions are zero
+    positions = torch.arange(orig_size)
+    gathered = (positions >= begin) & (torch.remainder(positions - begin, stride) < length)
+    indices = torch.where(gathered, torch.cumsum(gathered, dim=0) - 1, x.shape[dim])
+    return _select_with_zero_padding(x, dim, indices)
+
+
+def _eval_index(attr, ops, t_ops):
+    assert len(attr) == 4, "Index should have 4 attributes"
+    dim, start, stop, stride = attr
+    if dim >= 0:
+        dim -= len(ops[0].shape)
+
+    if dim == -5:
+        return t_ops[0][..., start:stop:stride, :, :, :, :]
+    elif dim == -4:
+        return t_ops[0][..., start:stop:stride, :, :, :]
+    elif dim == -3:
+        return t_ops[0][..., start:stop:stride, :, :]
+    elif dim == -2:
+        return t_ops[0][..., start:stop:stride, :]
+    elif dim == -1:
+        return t_ops[0][..., start:stop:stride]
+    else:
+        raise NotImplementedError(f"Dim={dim}")
+
+
+def _eval_adv_index(attr, ops, t_ops):
+    assert len(attr) == 1, "AdvIndex should have 1 attributes"
+    assert len(t_ops[1].shape) == 1 or len(t_ops[1].shape) == 2, "indices should be 1D or 2D"
+    dim = attr[0]
+    indices = t_ops[1].type(torch.LongTensor)
+    if len(indices.shape) == 2:
+        # Indices are 2D, we need to reshape them to 1D
+        indices = indices.reshape(-1)
+
+    ret = torch.index_select(t_ops[0], dim, indices)
+
+    return ret
+
+
+def _eval_broadcast(attr, ops, t_ops):
+    assert len(attr) <= 3, "Broadcast should have two attributes - dim and size"
+    explicit_bcast = len(attr) == 3 and bool(attr[2])
+
+    tensor = t_ops[0]
+    dim = attr[0]
+    size = attr[1]
+    while len(tensor.shape) <= ((-dim - 1) if dim < 0 else dim):
+        tensor = tensor.unsqueeze(0)
+    target_shape = list(tensor.shape)
+    assert dim < len(target_shape), f"Trying to broadcast on dim that doesn't exist: {dim} on {target_shape}"
+    target_shape[dim] = size
+    return torch.broadcast_to(tensor, target_shape)
+
+
+def _eval_repeat(attr, ops, t_ops):
+    sizes = attr
+    return t_ops[0].repeat(*sizes)
+
+
+def _eval_repeat_interleave(attr, ops, t_ops):
+    assert len(attr) == 2, "repeat_interleave should have two attributes - repeats and dim"
+    repeats = attr[0]
+    dim = attr[1]
+    return t_ops[0].repeat_interleave(repeats=repeats, dim=dim)
+
+
+def _eval_conv2d_depthwise_weights(attr, ops, t_ops):
+    weights = t_ops[0]
+    assert len(weights.shape) == 4, "Weights should have rank 4"
+
+    w, z, cin, cout = weights.shape
+
+    assert cin == 1, "Depthwise weights should always have cin == 1"
+
+    # [1, 9, 1, 65] -> [1, 9, 1, 96]
+    weights = torch.nn.functional.pad(weights, (0, align_up_tile(cout) - cout))
+    # [1, 9, 1, 96] -> [1, 9, 32, 96]
+    weights = torch.nn.functional.pad(weights, (0, 0, 0, align_up_tile(cin) - cin))
+
+    # Diagonally embed weights
+    weights_diag = torch.zeros_like(weights, requires_grad=False)
+
+    cnt_kernels = z
+    ct = weights.shape[-1] // TILE_DIM
+    for idx_kernel in range(cnt_kernels):
+        for idx_ct in range(ct):
+            weights_diag[:, idx_kernel, :, idx_ct * TILE_DIM : (idx_ct + 1) * TILE_DIM] = torch.diag_embed(
+                weights[:, idx_kernel, 0, idx_ct * TILE_DIM : (idx_ct + 1) * TILE_DIM]
+            )
+
+    # [1, 9, 32, 96] -> [1, 1, 9 * 32, 96]
+    weights_diag = weights_diag.reshape(w, 1, -1, weights.shape[-1])
+
+    return weights_diag
+
+
+def _eval_conv2d_depthwise_weights_bw(attr, ops, t_ops):
+    assert False, "not implemented yet"
+
+
+def _eval_conv2d_grouped_weights(attr, ops, t_ops):
+    weights = t_ops[0]
+    w = weights.shape[0]
+    z = weights.shape[1]
+    cin = weights.shape[2]
+    cout = weights.shape[3]
+    output_group = cout // attr[0]
+
+    weights = torch.nn.functional.pad(weights, (0, align_up_tile(cout) - cout))
+    weights = weights.reshape(w, z, -1, weights.shape[-1])
+
+    weights_sections = torch.split(weights, output_group, dim=-1)
+    new_weights = torch.zeros(w, z, align_up_tile(attr[0] * cin), align_up_tile(cout))
+    for i, section in enumerate(weights_sections):
+        new_weights[
+            :,
+            :,
+            i * section.shape[-2] : (i + 1) * section.shape[-2],
+            i * section.shape[-1] : (i + 1) * section.shape[-1],
+        ] = section
+
+    weights = new_weights.unsqueeze(-3)
+
+    if len(attr) == 4:
+        weights = weights.transpose(2, 3)
+        weights = weights.reshape(w, z, TILE_DIM, -1)
+    elif len(attr) == 5:
+        weights = weights.transpose(1, 2)
+        weights = weights.transpose(2, 3)
+        weights = weights.reshape(w, 1, align_up_tile(attr[0] * cin), -1)
+    return weights
+
+
+def _eval_conv2d_grouped_weights_bw(attr, ops, t_ops):
+    weights = t_ops[0]
+    groups = attr[0]
+    w = 1
+    z = attr[1]
+    cin = attr[2]
+    cout = attr[3]
+    output_group = cout // groups
+
+    if len(attr) == 4:
+        assert weights.shape[0] == w
+        assert weights.shape[1] == z
+        assert weights.shape[2] == TILE_DIM
+        weights = weights.transpose(2, 3)
+        weights = weights.reshape(w, z, -1, TILE_DIM, TILE_DIM)
+    elif len(attr) == 5:
+        weights = weights.reshape(w, 1, align_up_tile(groups * cin), -1)
+        weights = weights.transpose(2, 3)
+        weights = weights.transpose(1, 2)
+        weights = weights.reshape(w, z, align_up_tile(groups * cin), align_up_tile(cout))
+
+    sections = []
+    for i in range(groups):
+        section = weights[:, :, i * cin : (i + 1) * cin, i * output_group : (i + 1) * output_group]
+        sections.append(section)
+
+    new_weights = torch.concat(sections, dim=-1)
+
+    weights = new_weights.reshape(w, z, cin, -1)[:, :, :, :cout]
+    return weights
+
+
+def _eval_conv2d_prestride_act(attr, ops, t_ops):
+    assert len(attr) == 6, "conv2d_prestride_act should have 6 attributes"
+    stride_height, stride_width, kernel_height, kernel_width, original_y, original_x = attr
+
+    act = t_ops[0]
+
+    act = torch.nn.functional.pad(
+        act,
+        (0, align_up(original_x, stride_width) - original_x, 0, align_up(original_y, stride_height) - original_y),
+    )
+
+    prestrided_activations = []
+    for y in range(stride_height):
+        for x in range(stride_width):
+            prestrided_activations.append(act[:, :, y::stride_height, x::stride_width])
+
+    prestrided_activations = torch.cat(prestrided_activations, dim=-3)
+
+    w, z, r, c = prestrided_activations.shape
+    prestrided_activations = prestrided_activations.view(w, 1, z, r * c)
+    # prestrided_activations = prestrided_activations.transpose(-1, -2)
+
+    return prestrided_activations
+
+
+def _eval_conv2d_prestride_weights(attr, ops, t_ops):
+    assert len(attr) == 8, "conv2d_prestride_weights should have 8 attributes"
+    y, x = attr[0], attr[1]
+    stride_height, stride_width = attr[2], attr[3]
+    padding = [attr[4], attr[5], attr[6], attr[7]]
+
+    weights = t_ops[0]
+    assert len(weights.shape) == 4, "weights should have 4 dims"
+
+    ps_weights, _ = calculate_conv2d_prestride_weights_and_padding(weights, y, x, stride_width, padding)
+    return ps_weights
+
+
+def _eval_pad_tile(attr, ops, t_ops):
+    assert len(attr) == 2
+    dim, original_length = attr
+    act = t_ops[0]
+    if dim >= 0:
+        dim -= len(act.shape)
+    assert dim == -2 or dim == -1
+    padding = align_up_tile(act.shape[dim]) - act.shape[dim]
+    if dim == -2:
+        act = torch.nn.functional.pad(act, (0, 0, 0, padding))
+    if dim == -1:
+        act = torch.nn.functional.pad(act, (0, padding))
+    return act
+
+
+def _eval_narrow(attr, ops, t_ops):
+    assert len(attr) == 4
+    dim, start, length, original_length = attr
+    act = t_ops[0]
+    return act.narrow(dim, start, length)
+
+
+def _eval_pixel_shuffle(attr, ops, t_ops):
+    assert len(ops) == 1, "Pixel shuffle should have one operand."
+    assert len(attr) == 1, "Pixel shuffle should have one attribute."
+    return torch.nn.functional.pixel_shuffle(ops[0], attr[0])
+
+
+def _eval_forge_pad(attr, ops, t_ops):
+    assert (
+        len(attr) == 3
+    ), "Forge pad should have three attributes. The paddings for R and C dimensions and the value to pad with."
+    r_tiles, c_tiles, value = attr
+    operand = t_ops[0]
+    shape = operand.shape
+    # Padding is always given in tiles, so we need to recompute the padding in the original dimension
+    new_r_size_tile, new_c_size_tile = 0, 0
+    new_r_size, new_c_size = 0, 0
+    if r_tiles > 0:
+        new_r_size_tile = align_up_tile(shape[-2]) - shape[-2]
+        new_r_size = r_tiles * TILE_DIM
+    if c_tiles > 0:
+        new_c_size_tile = align_up_tile(shape[-1]) - shape[-1]
+        new_c_size = c_tiles * TILE_DIM
+    result = torch.nn.functional.pad(operand, [0, new_c_size_tile, 0, new_r_size_tile], value=0)
+    result = torch.nn.functional.pad(result, [0, new_c_size, 0, new_r_size], value=value)
+    return result
+
+
+def _eval_forge_unpad(attr, ops, t_ops):
+    assert len(attr) == 4, "Forge unpad should have four attributes. The paddings and the original shape."
+    r_tiles, c_tiles, orig_r, orig_c = attr
+    operand = t_ops[0]
+    if r_tiles > 0:
+        assert operand.shape[-2] == align_up_tile(orig_r) + r_tiles * TILE_DIM
+    if c_tiles > 0:
+        assert operand.shape[-1] == align_up_tile(orig_c) + c_tiles * TILE_DIM
+    result = torch.index_select(operand, -2, torch.arange(orig_r))
+    result = torch.index_select(result, -1, torch.arange(orig_c))
+    return result
+
+
+_eval_fns = {
+    "select": _eval_select,
+    "gather": _eval_gather,
+    "index": _eval_index,
+    "adv_index": _eval_adv_index,
+    "broadcast": _eval_broadcast,
+    "repeat": _eval_repeat,
+    "repeat_interleave": _eval_repeat_interleave,
+    "conv2d_depthwise_weights": _eval_conv2d_depthwise_weights,
+    "conv2d_depthwise_weights_bw": _eval_conv2d_depthwise_weights_bw,
+    "conv2d_grouped_weights": _eval_conv2d_grouped_weights,
+    "conv2d_grouped_weights_bw": _eval_conv2d_grouped_weights_bw,
+    "conv2d_prestride_act": _eval_conv2d_prestride_act,
+    "conv2d_prestride_weights": _eval_conv2d_prestride_weights,
+    "pad_tile": _eval_pad_tile,
+    "narrow": _eval_narrow,
+    "pixel_shuffle": _eval_pixel_shuffle,
+    "forge_pad": _eval_forge_pad,
+    "forge_unpad": _eval_forge_unpad,
+}
+
+
 def eval(type, attr, ops):
     assert len(ops) == 1 or (
         type == "adv_index" and len(ops) == 2
     ), f"Tensor manipulation ops should have one input {len(ops)} {attr}"
     t_ops = to_torch_operands(*ops)
-    dtype = ops[0].dtype
 
-    if type == "select":
-        assert len(attr) == 4, "Select should have 4 attributes"
-        dim, begin, length, stride = attr
-        zero_shape = list(t_ops[0].shape)
-        zero_shape[dim] = 1
-        zero_slice = torch.zeros(zero_shape, dtype=dtype).squeeze(dim)
-        result = []
-        for offset in range(0, t_ops[0].shape[dim] - begin, stride):
-            for i in range(begin, begin + length):
-                if offset + i < t_ops[0].shape[dim] or stride == t_ops[0].shape[dim]:
-                    result.append(t_ops[0].select(dim, offset + i))
-                else:
-                    result.append(zero_slice)
-        return torch.stack(result, dim=dim)
-
-    if type == "gather":
-        assert len(attr) == 5, "Gather should have 5 attributes"
-        dim, begin, length, stride, orig_size = attr
-        x = t_ops[0]
-        result = []
-        zero_shape = list(x.shape)
-        if dim > 0:
-            dim -= 4
-        while len(zero_shape) <= abs(dim):
-            zero_shape = [1] + zero_shape
-            x = x.unsqueeze(0)
-        zero_shape[dim] = 1
-        zero_slice = torch.zeros(zero_shape, dtype=dtype).squeeze(dim)
-        offset = 0
-        for i in range(0, orig_size):
-            range_i = (i - begin) % stride
-            if i >= begin and range_i < length:
-                result.append(x.select(dim, offset))
-                offset += 1
-            else:
-                result.append(zero_slice)
-        return torch.stack(result, dim=dim)
-
-    if type == "index":
-        assert len(attr) == 4, "Index should have 4 attributes"
-        dim, start, stop, stride = attr
-        if dim >= 0:
-            dim -= len(ops[0].shape)
-
-        if dim == -5:
-            return t_ops[0][..., start:stop:stride, :, :, :, :]
-        elif dim == -4:
-            return t_ops[0][..., start:stop:stride, :, :, :]
-        elif dim == -3:
-            return t_ops[0][..., start:stop:stride, :, :]
-        elif dim == -2:
-            return t_ops[0][..., start:stop:stride, :]
-        elif dim == -1:
-            return t_ops[0][..., start:stop:stride]
-        else:
-            raise NotImplementedError(f"Dim={dim}")
-
-    if type == "adv_index":
-        assert len(attr) == 1, "AdvIndex should have 1 attributes"
-        assert len(t_ops[1].shape) == 1 or len(t_ops[1].shape) == 2, "indices should be 1D or 2D"
-        dim = attr[0]
-        indices = t_ops[1].type(torch.LongTensor)
-        if len(indices.shape) == 2:
-            # Indices are 2D, we need to reshape them to 1D
-            indices = indices.reshape(-1)
-
-        ret = torch.index_select(t_ops[0], dim, indices)
-
-        return ret
-
-    if type == "broadcast":
-        assert len(attr) <= 3, "Broadcast should have two attributes - dim and size"
-        explicit_bcast = len(attr) == 3 and bool(attr[2])
-
-        tensor = t_ops[0]
-        dim = attr[0]
-        size = attr[1]
-        while len(tensor.shape) <= ((-dim - 1) if dim < 0 else dim):
-            tensor = tensor.unsqueeze(0)
-        target_shape = list(tensor.shape)
-        assert dim < len(target_shape), f"Trying to broadcast on dim that doesn't exist: {dim} on {target_shape}"
-        target_shape[dim] = size
-        return torch.broadcast_to(tensor, target_shape)
-
-    if type == "repeat":
-        sizes = attr
-        return t_ops[0].repeat(*sizes)
-
-    if type == "repeat_interleave":
-        assert len(attr) == 2, "repeat_interleave should have two attributes - repeats and dim"
-        repeats = attr[0]
-        dim = attr[1]
-        return t_ops[0].repeat_interleave(repeats=repeats, dim=dim)
-
-    if type == "conv2d_depthwise_weights":
-        weights = t_ops[0]
-        assert len(weights.shape) == 4, "Weights should have rank 4"
-
-        w, z, cin, cout = weights.shape
-
-        assert cin == 1, "Depthwise weights should always have cin == 1"
-
-        # [1, 9, 1, 65] -> [1, 9, 1, 96]
-        weights = torch.nn.functional.pad(weights, (0, align_up_tile(cout) - cout))
-        # [1, 9, 1, 96] -> [1, 9, 32, 96]
-        weights = torch.nn.functional.pad(weights, (0, 0, 0, align_up_tile(cin) - cin))
-
-        # Diagonally embed weights
-        weights_diag = torch.zeros_like(weights, requires_grad=False)
-
-        cnt_kernels = z
-        ct = weights.shape[-1] // TILE_DIM
-        for idx_kernel in range(cnt_kernels):
-            for idx_ct in range(ct):
-                weights_diag[:, idx_kernel, :, idx_ct * TILE_DIM : (idx_ct + 1) * TILE_DIM] = torch.diag_embed(
-                    weights[:, idx_kernel, 0, idx_ct * TILE_DIM : (idx_ct + 1) * TILE_DIM]
-                )
-
-        # [1, 9, 32, 96] -> [1, 1, 9 * 32, 96]
-        weights_diag = weights_diag.reshape(w, 1, -1, weights.shape[-1])
-
-        return weights_diag
-
-    if type == "conv2d_depthwise_weights_bw":
-        assert False, "not implemented yet"
-
-    if type == "conv2d_grouped_weights":
-        weights = t_ops[0]
-        w = weights.shape[0]
-        z = weights.shape[1]
-        cin = weights.shape[2]
-        cout = weights.shape[3]
-        output_group = cout // attr[0]
-
-        weights = torch.nn.functional.pad(weights, (0, align_up_tile(cout) - cout))
-        weights = weights.reshape(w, z, -1, weights.shape[-1])
-
-        weights_sections = torch.split(weights, output_group, dim=-1)
-        new_weights = torch.zeros(w, z, align_up_tile(attr[0] * cin), align_up_tile(cout))
-        for i, section in enumerate(weights_sections):
-            new_weights[
-                :,
-                :,
-                i * section.shape[-2] : (i + 1) * section.shape[-2],
-                i * section.shape[-1] : (i + 1) * section.shape[-1],
-            ] = section
-
-        weights = new_weights.unsqueeze(-3)
-
-        if len(attr) == 4:
-            weights = weights.transpose(2, 3)
-            weights = weights.reshape(w, z, TILE_DIM, -1)
-        elif len(attr) == 5:
-            weights = weights.transpose(1, 2)
-            weights = weights.transpose(2, 3)
-            weights = weights.reshape(w, 1, align_up_tile(attr[0] * cin), -1)
-        return weights
-
-    if type == "conv2d_grouped_weights_bw":
-        weights = t_ops[0]
-        groups = attr[0]
-        w = 1
-        z = attr[1]
-        cin = attr[2]
-        cout = attr[3]
-        output_group = cout // groups
-
-        if len(attr) == 4:
-            assert weights.shape[0] == w
-            assert weights.shape[1] == z
-            assert weights.shape[2] == TILE_DIM
-            weights = weights.transpose(2, 3)
-            weights = weights.reshape(w, z, -1, TILE_DIM, TILE_DIM)
-        elif len(attr) == 5:
-            weights = weights.reshape(w, 1, align_up_tile(groups * cin), -1)
-            weights = weights.transpose(2, 3)
-            weights = weights.transpose(1, 2)
-            weights = weights.reshape(w, z, align_up_tile(groups * cin), align_up_tile(cout))
-
-        sections = []
-        for i in range(groups):
-            section = weights[:, :, i * cin : (i + 1) * cin, i * output_group : (i + 1) * output_group]
-            sections.append(section)
-
-        new_weights = torch.concat(sections, dim=-1)
-
-        weights = new_weights.reshape(w, z, cin, -1)[:, :, :, :cout]
-        return weights
-
-    if type == "conv2d_prestride_act":
-        assert len(attr) == 6, "conv2d_prestride_act should have 6 attributes"
-        stride_height, stride_width, kernel_height, kernel_width, original_y, original_x = attr
-
-        act = t_ops[0]
-
-        act = torch.nn.functional.pad(
-            act,
-            (0, align_up(original_x, stride_width) - original_x, 0, align_up(original_y, stride_height) - original_y),
-        )
+    assert type in _eval_fns, f"{type} not defined in tensor manipulations"
+    return _eval_fns[type](attr, ops, t_ops)
+
+
+def _shape_index(attr, ops):
+    assert len(attr) == 4, "Index should have 4 attributes"
+    dim, start, stop, stride = attr
+    shape = list(ops[0])
+
+    if start < 0:
+        start = shape[dim] + start
+
+    shape[dim] = round_up_div(stop - start, stride)
+    return tuple(shape), []
+
+
+def _shape_adv_index(attr, ops):
+    assert len(attr) == 1, "AdvIndex should have 1 attributes"
+    assert len(ops[1]) == 1 or len(ops[1]) == 2, "indices should be 1D or 2D"
+    dim = attr[0]
+    shape = list(ops[0])
+    shape[dim] = ops[1][-1]
+    return shape, []
+
+
+def _shape_select(attr, ops):
+    assert len(attr) == 4, "Select should have 4 attributes"
+    dim, begin, length, stride = attr
+    shape = list(ops[0])
+    shape[dim] = length * round_up_div(shape[dim] - begin, stride)
+    return tuple(shape), []
+
+
+def _shape_gather(attr, ops):
+    assert len(attr) == 5, "Gather should have 5 attributes"
+    dim, begin, length, stride, orig_size = attr
+    orig_shape = list(ops[0])
+    if dim > 0:
+        dim -= 4
+    while len(orig_shape) <= abs(dim):
+        orig_shape = [1] + orig_shape
+    orig_shape[dim] = orig_size
+    return tuple(orig_shape), []
+
+
+def _shape_hslice(attr, ops):
+    assert len(attr) == 1, "HSlice should have one attribute, the slice size"
+    slice_size = attr[0]
+    shape = list(ops[0])
+    assert shape[-1] % slice_size == 0
+    while len(shape) < 4:
+        shape = [1] + shape
+    shape[-1] //= slice_size
+    shape[-3] *= slice_size
+    return tuple(shape), []
+
+
+def _shape_hstack(attr, ops):
+    assert len(ops[0]) >= 3, "HStack should at least have 3 dims"
+    assert len(attr) == 1, "hstack should have one attribute, equal to number of stacks of Z dim to create"
+    slice_size = attr[0]
+    assert (
+        ops[0][-3] % slice_size == 0
+    ), f"HStack requires Z: {ops[0][-3]} to be a multiple of slice_size: {slice_size},"
+    shape = list(ops[0])
+    shape[-1] *= slice_size
+    shape[-3] //= slice_size
+    return tuple(shape), []
+
+
+def _shape_vslice(attr, ops):
+    assert len(attr) == 1, "VSlice should have one attribute, the slice size"
+    slice_size = attr[0]
+    shape = list(ops[0])
+    assert len(shape) >= 2, "VSlice should at least have 2 dims"
+    assert shape[-2] % slice_size == 0
+    while len(shape) < 3:
+        shape = [1] + shape
+    shape[-2] //= slice_size
+    shape[-3] *= slice_size
+    return tuple(shape), []
+
+
+def _shape_vstack(attr, ops):
+    assert len(ops[0]) >= 3, "VStack should at least have 3 dims"
+    assert len(attr) == 1, "vstack should have one attribute, equal to number of stacks of Z dim to create"
+    slice_size = attr[0]
+    assert ops[0][-3] % slice_size == 0, f"VStack requires Z to be a multiple of slice_size"
+    shape = list(ops[0])
+    shape[-2] *= slice_size
+    shape[-3] //= slice_size
+    return tuple(shape), []
+
+
+def _shape_broadcast(attr, ops):
+    assert len(attr) <= 3, "Broadcast should have two attributes - dim and size"
+    dim = attr[0]
+    size = attr[1]
+    target_shape = list(ops[0])
+
+    if dim < 0:
+        while abs(dim) > len(target_shape):
+            target_shape = [1] + target_shape
+    else:
+        while dim >= len(target_shape):
+            target_shape = [1] + target_shape
 
-        prestrided_activations = []
-        for y in range(stride_height):
-            for x in range(stride_width):
-                prestrided_activations.append(act[:, :, y::stride_height, x::stride_width])
-
-        prestrided_activations = torch.cat(prestrided_activations, dim=-3)
-
-        w, z, r, c = prestrided_activations.shape
-        prestrided_activations = prestrided_activations.view(w, 1, z, r * c)
-        # prestrided_activations = prestrided_activations.transpose(-1, -2)
-
-        return prestrided_activations
-
-    if type == "conv2d_prestride_weights":
-        assert len(attr) == 8, "conv2d_prestride_weights should have 8 attributes"
-        y, x = attr[0], attr[1]
-        stride_height, stride_width = attr[2], attr[3]
-        padding = [attr[4], attr[5], attr[6], attr[7]]
-
-        weights = t_ops[0]
-        assert len(weights.shape) == 4, "weights should have 4 dims"
-
-        ps_weights, _ = calculate_conv2d_prestride_weights_and_padding(weights, y, x, stride_width, padding)
-        return ps_weights
-
-    if type == "pad_tile":
-        assert len(attr) == 2
-        dim, original_length = attr
-        act = t_ops[0]
-        if dim >= 0:
-            dim -= len(act.shape)
-        assert dim == -2 or dim == -1
-        padding = align_up_tile(act.shape[dim]) - act.shape[dim]
-        if dim == -2:
-            act = torch.nn.functional.pad(act, (0, 0, 0, padding))
-        if dim == -1:
-            act = torch.nn.functional.pad(act, (0, padding))
-        return act
-
-    if type == "narrow":
-        assert len(attr) == 4
-        dim, start, length, original_length = attr
-        act = t_ops[0]
-        return act.narrow(dim, start, length)
-
-    if type == "pixel_shuffle":
-        assert len(ops) == 1, "Pixel shuffle should have one operand."
-        assert len(attr) == 1, "Pixel shuffle should have one attribute."
-        return torch.nn.functional.pixel_shuffle(ops[0], attr[0])
-
-    if type == "forge_pad":
-        assert (
-            len(attr) == 3
-        ), "Forge pad should have three attributes. The paddings for R and C dimensions and the value to pad with."
-        r_tiles, c_tiles, value = attr
-        operand = t_ops[0]
-        shape = operand.shape
-        # Padding is always given in tiles, so we need to recompute the padding in the original dimension
-        new_r_size_tile, new_c_size_tile = 0, 0
-        new_r_size, new_c_size = 0, 0
-        if r_tiles > 0:
-            new_r_size_tile = align_up_tile(shape[-2]) - shape[-2]
-            new_r_size = r_tiles * TILE_DIM
-        if c_tiles > 0:
-            new_c_size_tile = align_up_tile(shape[-1]) - shape[-1]
-            new_c_size = c_tiles * TILE_DIM
-        result = torch.nn.functional.pad(operand, [0, new_c_size_tile, 0, new_r_size_tile], value=0)
-        result = torch.nn.functional.pad(result, [0, new_c_size, 0, new_r_size], value=value)
-        return result
-
-    if type == "forge_unpad":
-        assert len(attr) == 4, "Forge unpad should have four attributes. The paddings and the original shape."
-        r_tiles, c_tiles, orig_r, orig_c = attr
-        operand = t_ops[0]
-        if r_tiles > 0:
-            assert operand.shape[-2] == align_up_tile(orig_r) + r_tiles * TILE_DIM
-        if c_tiles > 0:
-            assert operand.shape[-1] == align_up_tile(orig_c) + c_tiles * TILE_DIM
-        result = torch.index_select(operand, -2, torch.arange(orig_r))
-        result = torch.index_select(result, -1, torch.arange(orig_c))
-        return result
-
-    assert False, f"{type} not defined in tensor manipulations"
+    target_shape[dim] = size
+    return tuple(target_shape), []
+
+
+def _shape_repeat(attr, ops):
+    sizes = attr
+    if len(ops[0]) < len(sizes):
+        # Scenario: When the input is a 1D tensor and needs to be repeated in 2D,
+        # `ttir.repeat` does not currently support this directly,
+        # so we are calculating the new shape by expanding the dimensions
+        # to match repeat attr dimensions and calculate the output shape
+        shape = (1,) * (len(sizes) - len(ops[0])) + tuple(ops[0])
+    else:
+        shape = ops[0]
+    return tuple(dim * size for dim, size in zip(list(shape), sizes)), []
+
+
+def _shape_repeat_interleave(attr, ops):
+    assert len(attr) <= 3, "repeat_interleave should have two attributes - repeats and dim"
+    repeats = attr[0]
+    dim = attr[1]
+
+    if dim < 0:
+        dim += len(ops[0])
+    target_shape = list(ops[0])
+    target_shape[dim] *= repeats
+    return tuple(target_shape), []
+
+
+def _shape_conv2d_depthwise_weights(attr, ops):
+    shape = list(ops[0])
+
+    w, k, _, cout = shape
+    shape = [w, 1, k * TILE_DIM, align_up_tile(cout)]
+
+    return tuple(shape), []
+
+
+def _shape_conv2d_depthwise_weights_bw(attr, ops):
+    assert False, "not yet implemented"
+
+
+def _shape_conv2d_grouped_weights(attr, ops):
+    shape = list(ops[0])
+    if len(attr) == 4:
+        shape[2] = TILE_DIM
+    elif len(attr) == 5:
+        _, k, cin, cout = shape
+        shape[1] = 1
+        shape[2] = align_up_tile(attr[0] * cin)
+        shape[3] = k * align_up_tile(cout)
+    return tuple(shape), []
+
+
+def _shape_conv2d_grouped_weights_bw(attr, ops):
+    shape = list(ops[0])
+    if len(attr) == 4:
+        assert shape[2] == TILE_DIM
+        shape[2] = 1
+    elif len(attr) == 5:
+        w, k, cin, cout, _ = attr
+        shape[1] = k
+        shape[2] = cin
+        shape[3] = cout
+    return tuple(shape), []
+
+
+def _shape_conv2d_prestride_act(attr, ops):
+    assert len(attr) == 6, "conv2d_prestride_act should have 6 attributes"
+    stride_height, stride_width, kernel_height, kernel_width, original_y, original_x = attr
+
+    shape = list(ops[0])
+    assert len(shape) == 4
+
+    shape[-2] = (shape[-2] + stride_height - 1) // stride_height
+    shape[-1] = (shape[-1] + stride_width - 1) // stride_width
+
+    shape[-3] *= stride_height * stride_width
+
+    # reshape (no transpose in Prestride transform in BE tilize)
+    reshape_shape = [
+        shape[0],
+        1,
+        shape[1],
+        shape[2] * shape[3],
+    ]
+
+    return tuple(reshape_shape), []
+
+
+def _shape_conv2d_prestride_weights(attr, ops):
+    assert len(attr) == 8, "conv2d_prestride_weights should have 8 attributes"
+    y, x = attr[0], attr[1]
+    stride_height, stride_width = attr[2], attr[3]
+    padding = [attr[4], attr[5], attr[6], attr[7]]
+
+    shape = list(ops[0])
+    assert len(shape) == 4
+    shape, _ = calculate_conv2d_prestride_weights_and_padding(shape, y, x, stride_width, padding)
+    return tuple(shape), []
+
+
+def _shape_pad_tile(attr, ops):
+    assert len(attr) == 2
+    dim, original_length = attr
+    if dim >= 0:
+        dim -= len(ops[0])
+    if not (dim == -2 or dim == -1):
+        x = 2
+    assert dim == -2 or dim == -1
+    shape = list(ops[0])
+    shape[dim] = align_up_tile(shape[dim])
+    return tuple(shape), []
+
+
+def _shape_narrow(attr, ops):
+    assert len(attr) == 4
+    dim, start, length, original_length = attr
+    shape = list(ops[0])
+    shape[dim] = length
+    return tuple(shape), []
+
+
+def _shape_pixel_shuffle(attr, ops):
+    assert len(ops) == 1, "Pixel shuffle should have one operand."
+    assert len(attr) == 1, "Pixel shuffle should have one attribute."
+
+    orig_shape = ops[0]
+    assert len(orig_shape) >= 3, "Pixel shuffle should be at least 3D."
+
+    upscale_factor = attr[0]
+    assert (
+        orig_shape[-3] % (upscale_factor**2) == 0
+    ), f"Op shape at dim -3 ({orig_shape[-3]}) should be divisible by upscale_factor*upscale_factor ({upscale_factor**2})."
+
+    output_shape = (
+        *orig_shape[:-3],
+        orig_shape[-3] // upscale_factor**2,
+        orig_shape[-2] * upscale_factor,
+        orig_shape[-1] * upscale_factor,
+    )
+    return output_shape, []
+
+
+def _shape_forge_pad(attr, ops):
+    assert (
+        len(attr) == 3
+    ), "Forge pad should have three attributes. The paddings for R and C dimensions and the value to pad with."
+    r_tiles, c_tiles, value = attr
+    shape = list(ops[0])
+    # Padding is always given in tiles, so we need to recompute the padding in the original dimension
+    if r_tiles > 0:
+        shape[-2] = (align_up_tile(shape[-2]) // TILE_DIM + r_tiles) * TILE_DIM
+    if c_tiles > 0:
+        shape[-1] = (align_up_tile(shape[-1]) // TILE_DIM + c_tiles) * TILE_DIM
+    return tuple(shape), []
+
+
+def _shape_forge_unpad(attr, ops):
+    assert len(attr) == 4, "Forge unpad should have four attributes. The paddings and the original shape."
+    r_tiles, c_tiles, orig_r, orig_c = attr
+    if r_tiles > 0:
+        assert ops[0][-2] == align_up_tile(orig_r) + r_tiles * TILE_DIM
+    if c_tiles > 0:
+        assert ops[0][-1] == align_up_tile(orig_c) + c_tiles * TILE_DIM
+    shape = list(ops[0])
+    shape[-2] = orig_r
+    shape[-1] = orig_c
+    return tuple(shape), []
+
+
+_shape_fns = {
+    "index": _shape_index,
+    "adv_index": _shape_adv_index,
+    "select": _shape_select,
+    "gather": _shape_gather,
+    "hslice": _shape_hslice,
+    "hstack": _shape_hstack,
+    "vslice": _shape_vslice,
+    "vstack": _shape_vstack,
+    "broadcast": _shape_broadcast,
+    "repeat": _shape_repeat,
+    "repeat_interleave": _shape_repeat_interleave,
+    "conv2d_depthwise_weights": _shape_conv2d_depthwise_weights,
+    "conv2d_depthwise_weights_bw": _shape_conv2d_depthwise_weights_bw,
+    "conv2d_grouped_weights": _shape_conv2d_grouped_weights,
+    "conv2d_grouped_weights_bw": _shape_conv2d_grouped_weights_bw,
+    "conv2d_prestride_act": _shape_conv2d_prestride_act,
+    "conv2d_prestride_weights": _shape_conv2d_prestride_weights,
+    "pad_tile": _shape_pad_tile,
+    "narrow": _shape_narrow,
+    "pixel_shuffle": _shape_pixel_shuffle,
+    "forge_pad": _shape_forge_pad,
+    "forge_unpad": _shape_forge_unpad,
+}
 
 
 def shape(type, attr, ops):
@@ -327,403 +671,173 @@ def shape(type, attr, ops):
         type == "adv_index" and len(ops) == 2
     ), f"Tensor manipulation ops should have one input, has {len(ops)} input instead"
 
-    if type == "index":
-        assert len(attr) == 4, "Index should have 4 attributes"
-        dim, start, stop, stride = attr
-        shape = list(ops[0])
+    assert type in _shape_fns, f"{type} not defined in tensor manipulations"
+    return _shape_fns[type](attr, ops)
 
-        if start < 0:
-            start = shape[dim] + start
 
-        shape[dim] = round_up_div(stop - start, stride)
-        return tuple(shape), []
+def _backward_conv2d_depthwise_weights(attr, ac, operand, inputs, output, grad):
+    return ac.op("conv2d_depthwise_weights_bw", (grad,), attributes=attr)
 
-    if type == "adv_index":
-        assert len(attr) == 1, "AdvIndex should have 1 attributes"
-        assert len(ops[1]) == 1 or len(ops[1]) == 2, "indices should be 1D or 2D"
-        dim = attr[0]
-        shape = list(ops[0])
-        shape[dim] = ops[1][-1]
-        return shape, []
 
-    if type == "select":
-        assert len(attr) == 4, "Select should have 4 attributes"
-        dim, begin, length, stride = attr
-        shape = list(ops[0])
-        shape[dim] = length * round_up_div(shape[dim] - begin, stride)
-        return tuple(shape), []
-
-    if type == "gather":
-        assert len(attr) == 5, "Gather should have 5 attributes"
-        dim, begin, length, stride, orig_size = attr
-        orig_shape = list(ops[0])
-        if dim > 0:
-            dim -= 4
-        while len(orig_shape) <= abs(dim):
-            orig_shape = [1] + orig_shape
-        orig_shape[dim] = orig_size
-        return tuple(orig_shape), []
-
-    if type == "hslice":
-        assert len(attr) == 1, "HSlice should have one attribute, the slice size"
-        slice_size = attr[0]
-        shape = list(ops[0])
-        assert shape[-1] % slice_size == 0
-        while len(shape) < 4:
-            shape = [1] + shape
-        shape[-1] //= slice_size
-        shape[-3] *= slice_size
-        return tuple(shape), []
-
-    if type == "hstack":
-        assert len(ops[0]) >= 3, "HStack should at least have 3 dims"
-        assert len(attr) == 1, "hstack should have one attribute, equal to number of stacks of Z dim to create"
-        slice_size = attr[0]
-        assert (
-            ops[0][-3] % slice_size == 0
-        ), f"HStack requires Z: {ops[0][-3]} to be a multiple of slice_size: {slice_size},"
-        shape = list(ops[0])
-        shape[-1] *= slice_size
-        shape[-3] //= slice_size
-        return tuple(shape), []
-
-    if type == "vslice":
-        assert len(attr) == 1, "VSlice should have one attribute, the slice size"
-        slice_size = attr[0]
-        shape = list(ops[0])
-        assert len(shape) >= 2, "VSlice should at least have 2 dims"
-        assert shape[-2] % slice_size == 0
-        while len(shape) < 3:
-            shape = [1] + shape
-        shape[-2] //= slice_size
-        shape[-3] *= slice_size
-        return tuple(shape), []
-
-    if type == "vstack":
-        assert len(ops[0]) >= 3, "VStack should at least have 3 dims"
-        assert len(attr) == 1, "vstack should have one attribute, equal to number of stacks of Z dim to create"
-        slice_size = attr[0]
-        assert ops[0][-3] % slice_size == 0, f"VStack requires Z to be a multiple of slice_size"
-        shape = list(ops[0])
-        shape[-2] *= slice_size
-        shape[-3] //= slice_size
-        return tuple(shape), []
-
-    if type == "broadcast":
-        assert len(attr) <= 3, "Broadcast should have two attributes - dim and size"
-        dim = attr[0]
-        size = attr[1]
-        target_shape = list(ops[0])
-
-        if dim < 0:
-            while abs(dim) > len(target_shape):
-                target_shape = [1] + target_shape
-        else:
-            while dim >= len(target_shape):
-                target_shape = [1] + target_shape
-
-        target_shape[dim] = size
-        return tuple(target_shape), []
-
-    if type == "repeat":
-        sizes = attr
-        if len(ops[0]) < len(sizes):
-            # Scenario: When the input is a 1D tensor and needs to be repeated in 2D,
-            # `ttir.repeat` does not currently support this directly,
-            # so we are calculating the new shape by expanding the dimensions
-            # to match repeat attr dimensions and calculate the output shape
-            shape = (1,) * (len(sizes) - len(ops[0])) + tuple(ops[0])
-        else:
-            shape = ops[0]
-        return tuple(dim * size for dim, size in zip(list(shape), sizes)), []
-
-    if type == "repeat_interleave":
-        assert len(attr) <= 3, "repeat_interleave should have two attributes - repeats and dim"
-        repeats = attr[0]
-        dim = attr[1]
-
-        if dim < 0:
-            dim += len(ops[0])
-        target_shape = list(ops[0])
-        target_shape[dim] *= repeats
-        return tuple(target_shape), []
-
-    if type == "conv2d_depthwise_weights":
-        shape = list(ops[0])
-
-        w, k, _, cout = shape
-        shape = [w, 1, k * TILE_DIM, align_up_tile(cout)]
-
-        return tuple(shape), []
-
-    if type == "conv2d_depthwise_weights_bw":
-        assert False, "not yet implemented"
-
-    if type == "conv2d_grouped_weights":
-        shape = list(ops[0])
-        if len(attr) == 4:
-            shape[2] = TILE_DIM
-        elif len(attr) == 5:
-            _, k, cin, cout = shape
-            shape[1] = 1
-            shape[2] = align_up_tile(attr[0] * cin)
-            shape[3] = k * align_up_tile(cout)
-        return tuple(shape), []
-
-    if type == "conv2d_grouped_weights_bw":
-        shape = list(ops[0])
-        if len(attr) == 4:
-            assert shape[2] == TILE_DIM
-            shape[2] = 1
-        elif len(attr) == 5:
-            w, k, cin, cout, _ = attr
-            shape[1] = k
-            shape[2] = cin
-            shape[3] = cout
-        return tuple(shape), []
-
-    if type == "conv2d_prestride_act":
-        assert len(attr) == 6, "conv2d_prestride_act should have 6 attributes"
-        stride_height, stride_width, kernel_height, kernel_width, original_y, original_x = attr
-
-        shape = list(ops[0])
-        assert len(shape) == 4
-
-        shape[-2] = (shape[-2] + stride_height - 1) // stride_height
-        shape[-1] = (shape[-1] + stride_width - 1) // stride_width
-
-        shape[-3] *= stride_height * stride_width
-
-        # reshape (no transpose in Prestride transform in BE tilize)
-        reshape_shape = [
-            shape[0],
-            1,
-            shape[1],
-            shape[2] * shape[3],
-        ]
-
-        return tuple(reshape_shape), []
-
-    if type == "conv2d_prestride_weights":
-        assert len(attr) == 8, "conv2d_prestride_weights should have 8 attributes"
-        y, x = attr[0], attr[1]
-        stride_height, stride_width = attr[2], attr[3]
-        padding = [attr[4], attr[5], attr[6], attr[7]]
-
-        shape = list(ops[0])
-        assert len(shape) == 4
-        shape, _ = calculate_conv2d_prestride_weights_and_padding(shape, y, x, stride_width, padding)
-        return tuple(shape), []
-
-    if type == "pad_tile":
-        assert len(attr) == 2
-        dim, original_length = attr
-        if dim >= 0:
-            dim -= len(ops[0])
-        if not (dim == -2 or dim == -1):
-            x = 2
-        assert dim == -2 or dim == -1
-        shape = list(ops[0])
-        shape[dim] = align_up_tile(shape[dim])
-        return tuple(shape), []
-
-    if type == "narrow":
-        assert len(attr) == 4
-        dim, start, length, original_length = attr
-        shape = list(ops[0])
-        shape[dim] = length
-        return tuple(shape), []
-
-    if type == "pixel_shuffle":
-        assert len(ops) == 1, "Pixel shuffle should have one operand."
-        assert len(attr) == 1, "Pixel shuffle should have one attribute."
-
-        orig_shape = ops[0]
-        assert len(orig_shape) >= 3, "Pixel shuffle should be at least 3D."
-
-        upscale_factor = attr[0]
-        assert (
-            orig_shape[-3] % (upscale_factor**2) == 0
-        ), f"Op shape at dim -3 ({orig_shape[-3]}) should be divisible by upscale_factor*upscale_factor ({upscale_factor**2})."
-
-        output_shape = (
-            *orig_shape[:-3],
-            orig_shape[-3] // upscale_factor**2,
-            orig_shape[-2] * upscale_factor,
-            orig_shape[-1] * upscale_factor,
-        )
-        return output_shape, []
-
-    if type == "forge_pad":
-        assert (
-            len(attr) == 3
-        ), "Forge pad should have three attributes. The paddings for R and C dimensions and the value to pad with."
-        r_tiles, c_tiles, value = attr
-        shape = list(ops[0])
-        # Padding is always given in tiles, so we need to recompute the padding in the original dimension
-        if r_tiles > 0:
-            shape[-2] = (align_up_tile(shape[-2]) // TILE_DIM + r_tiles) * TILE_DIM
-        if c_tiles > 0:
-            shape[-1] = (align_up_tile(shape[-1]) // TILE_DIM + c_tiles) * TILE_DIM
-        return tuple(shape), []
-
-    if type == "forge_unpad":
-        assert len(attr) == 4, "Forge unpad should have four attributes. The paddings and the original shape."
-        r_tiles, c_tiles, orig_r, orig_c = attr
-        if r_tiles > 0:
-            assert ops[0][-2] == align_up_tile(orig_r) + r_tiles * TILE_DIM
-        if c_tiles > 0:
-            assert ops[0][-1] == align_up_tile(orig_c) + c_tiles * TILE_DIM
-        shape = list(ops[0])
-        shape[-2] = orig_r
-        shape[-1] = orig_c
-        return tuple(shape), []
-
-    assert False, f"{type} not defined in tensor manipulations"
+def _backward_conv2d_grouped_weights(attr, ac, operand, inputs, output, grad):
+    return ac.op("conv2d_grouped_weights_bw", (grad,), attributes=attr)
 
 
-def backward(type, attr, ac, operand, inputs, output, grad):
+def _backward_select(attr, ac, operand, inputs, output, grad):
+    assert len(attr) == 4
+    dim, begin, length, stride = attr
+    orig_size = inputs[0].shape[dim]
+    current_size = grad.shape[dim]
+    # return ac.op("gather", (grad,), attributes=(dim, begin, length, stride, orig_size))
 
-    assert operand == 0, "Invalid operand index"
+    # temporarily replace gather op (not HW supported) with select + concat
+    grad_return = None
+    grad_offset = 0
 
-    if type == "conv2d_depthwise_weights":
-        return ac.op("conv2d_depthwise_weights_bw", (grad,), attributes=attr)
-
-    elif type == "conv2d_grouped_weights":
-        return ac.op("conv2d_grouped_weights_bw", (grad,), attributes=attr)
-
-    elif type == "select":
-        assert len(attr) == 4
-        dim, begin, length, stride = attr
-        orig_size = inputs[0].shape[dim]
-        current_size = grad.shape[dim]
-        # return ac.op("gather", (grad,), attributes=(dim, begin, length, stride, orig_size))
-
-        # temporarily replace gather op (not HW supported) with select + concat
-        grad_return = None
-        grad_offset = 0
-
-        for offset in range(0, orig_size, stride):
-            # zero padding of front
-            if begin > 0:
-                zero_pre_pad_shape = inputs[0].shape.as_list()
-                zero_pre_pad_shape[dim] = min(begin, orig_size - offset)
-                if grad_return is None:
-                    grad_return = ac.tensor(torch.zeros(zero_pre_pad_shape))
-                else:
-                    zero_slice = ac.tensor(torch.zeros(zero_pre_pad_shape))
-                    grad_return = ac.op_with_named_attrs("concatenate", (grad_return, zero_slice), {"dim": dim})
-            if offset + begin >= orig_size:
-                break
-
-            # pass the gradient for selected part
-            grad_slice = ac.op(
-                "select",
-                (grad,),
-                (dim, grad_offset, length, current_size),
-                named_attrs={"dim": dim, "begin": grad_offset, "length": length, "stride": current_size},
-            )
+    for offset in range(0, orig_size, stride):
+        # zero padding of front
+        if begin > 0:
+            zero_pre_pad_shape = inputs[0].shape.as_list()
+            zero_pre_pad_shape[dim] = min(begin, orig_size - offset)
             if grad_return is None:
-                grad_return = grad_slice
+                grad_return = ac.tensor(torch.zeros(zero_pre_pad_shape))
             else:
-                grad_return = ac.op_with_named_attrs("concatenate", (grad_return, grad_slice), {"dim": dim})
-            grad_offset += length
-            if offset + begin + length >= orig_size:
-                break
-
-            # zero padding of back
-            zero_padding_length = stride - length - begin
-            if zero_padding_length > 0:
-                zero_post_pad_shape = inputs[0].shape.as_list()
-                zero_post_pad_shape[dim] = zero_padding_length
-                zero_slice = ac.tensor(torch.zeros(zero_post_pad_shape))
+                zero_slice = ac.tensor(torch.zeros(zero_pre_pad_shape))
                 grad_return = ac.op_with_named_attrs("concatenate", (grad_return, zero_slice), {"dim": dim})
-        return grad_return
+        if offset + begin >= orig_size:
+            break
 
-    elif type == "pad_tile":
-        assert len(attr) == 2
-        dim, original_length = attr
-        return ac.op(
-            "narrow",
+        # pass the gradient for selected part
+        grad_slice = ac.op(
+            "select",
             (grad,),
-            attributes=(dim, 0, inputs[0].shape[dim], original_length),
+            (dim, grad_offset, length, current_size),
+            named_attrs={"dim": dim, "begin": grad_offset, "length": length, "stride": current_size},
         )
-
-    elif type == "narrow":
-        assert len(attr) == 4
-        dim, start, length, original_length = attr
-        if dim >= 0:
-            dim -= len(inputs[0].shape)
-        if dim in [-1, -2] and align_up_tile(length) == align_up_tile(inputs[0].shape[dim]):
-            if dim == -1:
-                return ac.op("pad", (grad,), (start, original_length - length - start, 0, False))
-            elif dim == -2:
-                return ac.op("pad", (grad,), (0, 0, start, original_length - length - start, 0, False))
-            raise ArgumentError("Only dim == 2 and dim == 3 are supported.")
-        else:
-            raise NotImplementedError("Unimplemented narrow in forge")
-
-    elif type == "broadcast":
-        assert len(attr) == 3
-        if attr[0] < 0:
-            attr[0] += inputs[0].shape.len()
-        delta = 4 - inputs[0].shape.len()
-        attr[0] += delta
-        assert attr[0] >= 0 and attr[0] <= 3, f"Invalid broadcast dim after lowering: {attr[0]}"
-
-        if attr[0] == 2 or attr[0] == 3:
-            ret = ac.op("reduce_sum", (grad,), (attr[0],), {"keep_dim": True})
+        if grad_return is None:
+            grad_return = grad_slice
         else:
-            ret = ac.op_with_named_attrs(
-                "transpose",
-                [
-                    grad,
-                ],
-                {"dim0": attr[0], "dim1": -2},
-            )
-            ret = ac.op("reduce_sum", (ret,), (-2,), {"keep_dim": True})
-            ret = ac.op_with_named_attrs(
-                "transpose",
-                [
-                    ret,
-                ],
-                {"dim0": attr[0], "dim1": -2},
-            )
-        return ret
+            grad_return = ac.op_with_named_attrs("concatenate", (grad_return, grad_slice), {"dim": dim})
+        grad_offset += length
+        if offset + begin + length >= orig_size:
+            break
+
+        # zero padding of back
+        zero_padding_length = stride - length - begin
+        if zero_padding_length > 0:
+            zero_post_pad_shape = inputs[0].shape.as_list()
+            zero_post_pad_shape[dim] = zero_padding_length
+            zero_slice = ac.tensor(torch.zeros(zero_post_pad_shape))
+            grad_return = ac.op_with_named_attrs("concatenate", (grad_return, zero_slice), {"dim": dim})
+    return grad_return
+
+
+def _backward_pad_tile(attr, ac, operand, inputs, output, grad):
+    assert len(attr) == 2
+    dim, original_length = attr
+    return ac.op(
+        "narrow",
+        (grad,),
+        attributes=(dim, 0, inputs[0].shape[dim], original_length),
+    )
+
+
+def _backward_narrow(attr, ac, operand, inputs, output, grad):
+    assert len(attr) == 4
+    dim, start, length, original_length = attr
+    if dim >= 0:
+        dim -= len(inputs[0].shape)
+    if dim in [-1, -2] and align_up_tile(length) == align_up_tile(inputs[0].shape[dim]):
+        if dim == -1:
+            return ac.op("pad", (grad,), (start, original_length - length - start, 0, False))
+        elif dim == -2:
+            return ac.op("pad", (grad,), (0, 0, start, original_length - length - start, 0, False))
+        raise ArgumentError("Only dim == 2 and dim == 3 are supported.")
+    else:
+        raise NotImplementedError("Unimplemented narrow in forge")
 
-    elif type == "repeat_interleave":
-        assert len(attr) == 2, "repeat_interleave should have two attributes - repeats and dim"
-        repeats = attr[0]
-        dim = attr[1]
-        shape = inputs[0].shape.as_list()
-        if dim < 0:
-            dim += len(shape)
 
-        shape.insert(dim, repeats)
+def _backward_broadcast(attr, ac, operand, inputs, output, grad):
+    assert len(attr) == 3
+    if attr[0] < 0:
+        attr[0] += inputs[0].shape.len()
+    delta = 4 - inputs[0].shape.len()
+    attr[0] += delta
+    assert attr[0] >= 0 and attr[0] <= 3, f"Invalid broadcast dim after lowering: {attr[0]}"
 
-        ret = ac.op_with_named_attrs("reshape", (grad,), {"shape": shape})
-        ret = ac.op("reduce_sum", (ret,), (dim, True), {"dim_arg": [dim], "keep_dim": True})
-        ret = ac.op_with_named_attrs("squeeze", (ret,), {"dim": dim})
-        return ret
+    if attr[0] == 2 or attr[0] == 3:
+        ret = ac.op("reduce_sum", (grad,), (attr[0],), {"keep_dim": True})
+    else:
+        ret = ac.op_with_named_attrs(
+            "transpose",
+            [
+                grad,
+            ],
+            {"dim0": attr[0], "dim1": -2},
+        )
+        ret = ac.op("reduce_sum", (ret,), (-2,), {"keep_dim": True})
+        ret = ac.op_with_named_attrs(
+            "transpose",
+            [
+                ret,
+            ],
+            {"dim0": attr[0], "dim1": -2},
+        )
+    return ret
+
+
+def _backward_repeat_interleave(attr, ac, operand, inputs, output, grad):
+    assert len(attr) == 2, "repeat_interleave should have two attributes - repeats and dim"
+    repeats = attr[0]
+    dim = attr[1]
+    shape = inputs[0].shape.as_list()
+    if dim < 0:
+        dim += len(shape)
+
+    shape.insert(dim, repeats)
+
+    ret = ac.op_with_named_attrs("reshape", (grad,), {"shape": shape})
+    ret = ac.op("reduce_sum", (ret,), (dim, True), {"dim_arg": [dim], "keep_dim": True})
+    ret = ac.op_with_named_attrs("squeeze", (ret,), {"dim": dim})
+    return ret
+
+
+def _backward_index(attr, ac, operand, inputs, output, grad):
+    assert len(attr) == 4
+    dim, start, stop, stride = attr
+
+    if stride != 1:
+        raise NotImplementedError("Only stride == 1 is supported for index op backward")
+    shape = inputs[0].shape.as_list()
 
-    elif type == "index":
-        assert len(attr) == 4
-        dim, start, stop, stride = attr
+    if dim >= 0:
+        dim -= len(shape)
+
+    left = start
+    right = shape[dim] - stop
+    value = 0.0
+
+    return Pad.decompose_constant_mode(ac, grad, value, left, right, 0, 0, dim, 0)
 
-        if stride != 1:
-            raise NotImplementedError("Only stride == 1 is supported for index op backward")
-        shape = inputs[0].shape.as_list()
 
-        if dim >= 0:
-            dim -= len(shape)
+_backward_fns = {
+    "conv2d_depthwise_weights": _backward_conv2d_depthwise_weights,
+    "conv2d_grouped_weights": _backward_conv2d_grouped_weights,
+    "select": _backward_select,
+    "pad_tile": _backward_pad_tile,
+    "narrow": _backward_narrow,
+    "broadcast": _backward_broadcast,
+    "repeat_interleave": _backward_repeat_interleave,
+    "index": _backward_index,
+}
 
-        left = start
-        right = shape[dim] - stop
-        value = 0.0
 
-        return Pad.decompose_constant_mode(ac, grad, value, left, right, 0, 0, dim, 0)
+def backward(type, attr, ac, operand, inputs, output, grad):
+    assert operand == 0, "Invalid operand index"
 
-    raise NotImplementedError(f"{type}")
+    if type not in _backward_fns:
+        raise NotImplementedError(f"{type}")
+    return _backward_fns[type](attr, ac, operand, inputs, output, grad)
 
 
 def unsqueeze_input_for_reshape_decomp(dc, inp):
@@ -747,118 +861,134 @@ def squeeze_output_for_reshape_decomp(dc, output, orig_out_shape):
     return output
 
 
-def decompose(type, attr, dc, inputs):
-    if type == "adv_index":
-        dim = attr[0]
-        in0_shape = inputs[0].shape.as_list()
-        indices_shape = inputs[1].shape.as_list()
-
-        assert len(indices_shape) == 2 or len(indices_shape) == 1, "indices tensor should be 1D or 2D"
-
-        # Idea is to reshape the input tensor to [in0_shape[dim], -1] and then apply the embedding operation
-        # The embedding operation will select the appropriate indices from the reshaped tensor
-        # and then we will reshape the output back to the original shape.
-        #
-        # For example:
-        # If the input tensor is of shape [N, C, H, W] and we want to index along dim = 2 with indices shape [X],
-        # we will first reshape it: [N, C, H, W] -> [N, H, C, W] and [N, H, C, W] -> [H, N, C, W] (permuted)
-        # and then reshape it to [H, N * C * W] (flattening the last 3 dimensions)
-        # and then apply the embedding operation to select the appropriate indices [H, N * C * W] -> [X, N * C * W].
-        # Next, we will reshape the output back to the 4D shape [X, N * C * W] -> [X, N, C, W]
-        # and finally, we will transpose the output back to the original order.
-        # [X, N, C, W] -> [N, X, C, W] and [N, X, C, W] -> [N, C, X, W]
-
-        # Step 1: Move the indexed dimension to the front using a sequence of transposes
-        if dim != 0:
-            current = inputs[0]
-            for i in range(dim, 0, -1):
-                current = dc.op_with_named_attrs("transpose", [current], {"dim0": i, "dim1": i - 1})
-            permuted = current
-        else:
-            # No need to transpose if dim is already 0
-            permuted = inputs[0]
+def _decompose_adv_index(attr, dc, inputs):
+    dim = attr[0]
+    in0_shape = inputs[0].shape.as_list()
+    indices_shape = inputs[1].shape.as_list()
 
-        # Step 2: Reshape to [in0_shape[dim], -1]
-        # Calculate product of all dimensions except the first (after transposition)
+    assert len(indices_shape) == 2 or len(indices_shape) == 1, "indices tensor should be 1D or 2D"
 
-        if len(in0_shape) != 2:
-            # Calculate permuted shape, by popping the element at indexed dim and inserting it at the begging
-            permuted_shape = in0_shape.copy()  # copy is needed to avoid modifying the original shape
-            indexed_dim_shape = permuted_shape.pop(dim)
-            permuted_shape = [indexed_dim_shape, *permuted_shape]
+    # Idea is to reshape the input tensor to [in0_shape[dim], -1] and then apply the embedding operation
+    # The embedding operation will select the appropriate indices from the reshaped tensor
+    # and then we will reshape the output back to the original shape.
+    #
+    # For example:
+    # If the input tensor is of shape [N, C, H, W] and we want to index along dim = 2 with indices shape [X],
+    # we will first reshape it: [N, C, H, W] -> [N, H, C, W] and [N, H, C, W] -> [H, N, C, W] (permuted)
+    # and then reshape it to [H, N * C * W] (flattening the last 3 dimensions)
+    # and then apply the embedding operation to select the appropriate indices [H, N * C * W] -> [X, N * C * W].
+    # Next, we will reshape the output back to the 4D shape [X, N * C * W] -> [X, N, C, W]
+    # and finally, we will transpose the output back to the original order.
+    # [X, N, C, W] -> [N, X, C, W] and [N, X, C, W] -> [N, C, X, W]
+
+    # Step 1: Move the indexed dimension to the front using a sequence of transposes
+    if dim != 0:
+        current = inputs[0]
+        for i in range(dim, 0, -1):
+            current = dc.op_with_named_attrs("transpose", [current], {"dim0": i, "dim1": i - 1})
+        permuted = current
+    else:
+        # No need to transpose if dim is already 0
+        permuted = inputs[0]
 
-            rest_dims_product = math.prod(permuted_shape[1:])
+    # Step 2: Reshape to [in0_shape[dim], -1]
+    # Calculate product of all dimensions except the first (after transposition)
 
-            reshape_dims = [in0_shape[dim], rest_dims_product]
-            reshaped = dc.op_with_named_attrs("reshape", [permuted], {"shape": reshape_dims})
-        else:
-            reshaped = permuted
+    if len(in0_shape) != 2:
+        # Calculate permuted shape, by popping the element at indexed dim and inserting it at the begging
+        permuted_shape = in0_shape.copy()  # copy is needed to avoid modifying the original shape
+        indexed_dim_shape = permuted_shape.pop(dim)
+        permuted_shape = [indexed_dim_shape, *permuted_shape]
 
-        # Step 3: Apply embedding operation
-        # embedding op expects indices tensor as first argument and embedding_table as second argument
-        selected = dc.op("embedding", (inputs[1], reshaped))
+        rest_dims_product = math.prod(permuted_shape[1:])
 
-        # Step 4: Reshape back to appropriate dimensions
-        # The new shape replaces the indexed dimension with the indices shape
-        if len(in0_shape) != 2:
-            output_shape = indices_shape + permuted_shape[1:]
+        reshape_dims = [in0_shape[dim], rest_dims_product]
+        reshaped = dc.op_with_named_attrs("reshape", [permuted], {"shape": reshape_dims})
+    else:
+        reshaped = permuted
 
-            reshaped_output = dc.op_with_named_attrs("reshape", [selected], {"shape": output_shape})
-        else:
-            reshaped_output = selected
-
-        # Step 5: Restore original dimension order if necessary using transposes
-        if dim != 0:
-            # Move dimension 0 to position 'dim' using transposes
-            current = reshaped_output
-            for i in range(0, dim):
-                current = dc.op_with_named_attrs("transpose", [current], {"dim0": i, "dim1": i + 1})
-            result = current
-        else:
-            # No need to transpose if dim is already 0
-            result = reshaped_output
+    # Step 3: Apply embedding operation
+    # embedding op expects indices tensor as first argument and embedding_table as second argument
+    selected = dc.op("embedding", (inputs[1], reshaped))
 
-        dc.fuse(result)
-        return
+    # Step 4: Reshape back to appropriate dimensions
+    # The new shape replaces the indexed dimension with the indices shape
+    if len(in0_shape) != 2:
+        output_shape = indices_shape + permuted_shape[1:]
+
+        reshaped_output = dc.op_with_named_attrs("reshape", [selected], {"shape": output_shape})
+    else:
+        reshaped_output = selected
+
+    # Step 5: Restore original dimension order if necessary using transposes
+    if dim != 0:
+        # Move dimension 0 to position 'dim' using transposes
+        current = reshaped_output
+        for i in range(0, dim):
+            current = dc.op_with_named_attrs("transpose", [current], {"dim0": i, "dim1": i + 1})
+        result = current
+    else:
+        # No need to transpose if dim is already 0
+        result = reshaped_output
+
+    dc.fuse(result)
+    return
 
-    if type == "broadcast":
-        if attr[1] == 1:
-            dc.fuse(dc.op(Nop.create(), [inputs[0]]))
 
-    if type == "pixel_shuffle":
-        result = inputs[0]  # Shape: (N, C*r*r, H, W)
-        N, C_r2, H, W = result.shape
-        r = attr[0]
-        C = C_r2 // (r * r)
+def _decompose_broadcast(attr, dc, inputs):
+    if attr[1] == 1:
+        dc.fuse(dc.op(Nop.create(), [inputs[0]]))
 
-        # Step 1: Reshape to (N, C, r, r, H, W)
-        reshape_dims = (N, C, r, r, H, W)
-        x = dc.op_with_named_attrs("reshape", [result], {"shape": reshape_dims})
 
-        # Step 2: Transpose sequence on x
-        x = dc.op_with_named_attrs("transpose", [x], {"dim0": 2, "dim1": 4})  # [0,1,4,3,2,5]
-        x = dc.op_with_named_attrs("transpose", [x], {"dim0": 3, "dim1": 4})  # [0,1,4,2,3,5]
-        x = dc.op_with_named_attrs("transpose", [x], {"dim0": 4, "dim1": 5})  # [0,1,4,2,5,3]
+def _decompose_pixel_shuffle(attr, dc, inputs):
+    result = inputs[0]  # Shape: (N, C*r*r, H, W)
+    N, C_r2, H, W = result.shape
+    r = attr[0]
+    C = C_r2 // (r * r)
 
-        # Step 3: Final reshape to (N, C, H * r, W * r)
-        reshape_dims = (N, C, H * r, W * r)
-        x = dc.op_with_named_attrs("reshape", [x], {"shape": reshape_dims})
+    # Step 1: Reshape to (N, C, r, r, H, W)
+    reshape_dims = (N, C, r, r, H, W)
+    x = dc.op_with_named_attrs("reshape", [result], {"shape": reshape_dims})
 
-        dc.fuse(x)
+    # Step 2: Transpose sequence on x
+    x = dc.op_with_named_attrs("transpose", [x], {"dim0": 2, "dim1": 4})  # [0,1,4,3,2,5]
+    x = dc.op_with_named_attrs("transpose", [x], {"dim0": 3, "dim1": 4})  # [0,1,4,2,3,5]
+    x = dc.op_with_named_attrs("transpose", [x], {"dim0": 4, "dim1": 5})  # [0,1,4,2,5,3]
 
-    if type == "repeat":
-        input_shape = inputs[0].shape.as_list()
-        target_shape = attr
-        result = inputs[0]
+    # Step 3: Final reshape to (N, C, H * r, W * r)
+    reshape_dims = (N, C, H * r, W * r)
+    x = dc.op_with_named_attrs("reshape", [x], {"shape": reshape_dims})
 
-        if len(input_shape) < len(target_shape):
-            # Scenario: When the input is a 1D tensor and needs to be repeated in 2D,
-            # `ttir.repeat` does not currently support this directly.
-            # To handle this, we first reshape the input to ensure both the input and the repeats have the same dimensions
-            new_shape = (1,) * (len(target_shape) - len(input_shape)) + tuple(input_shape)
-            result = dc.op_with_named_attrs("reshape", [result], {"shape": new_shape})
-            result = dc.op_with_named_attrs("repeat", [result], {"repeats": target_shape}, target_shape)
-            dc.fuse(result)
+    dc.fuse(x)
+
+
+def _decompose_repeat(attr, dc, inputs):
+    input_shape = inputs[0].shape.as_list()
+    target_shape = attr
+    result = inputs[0]
+
+    if len(input_shape) < len(target_shape):
+        # Scenario: When the input is a 1D tensor and needs to be repeated in 2D,
+        # `ttir.repeat` does not currently support this directly.
+        # To handle this, we first reshape the input to ensure both the input and the repeats have the same dimensions
+        new_shape = (1,) * (len(target_shape) - len(input_shape)) + tuple(input_shape)
+        result = dc.op_with_named_attrs("reshape", [result], {"shape": new_shape})
+        result = dc.op_with_named_attrs("repeat", [result], {"repeats": target_shape}, target_shape)
+        dc.fuse(result)
+
+
+_decompose_fns = {
+    "adv_index": _decompose_adv_index,
+    "broadcast": _decompose_broadcast,
+    "pixel_shuffle": _decompose_pixel_shuffle,
+    "repeat": _decompose_repeat,
+}
+
+
+def decompose(type, attr, dc, inputs):
+    decompose_fn = _decompose_fns.get(type)
+    if decompose_fn is not None:
+        decompose_fn(attr, dc, inputs)
 
 
 def create_row_picker_matrix(col_indices, lhs_num_cols, lhs_num_channels=None, lhs_batch_size=None):
@@ -1155,79 +1285,16 @@ def decompose_non_tile_dim_aligned_vslice(inputs, dc, orig_shape, attr):
     return result
 
 
-def decompose_post_optimize(type, attr, dc, inputs):
-    # TODO: remove once backend support is available
-    if type == "select":
-        decompose_select(attr, dc, inputs)
-
-    elif type == "hslice":
-        input_shape = inputs[0].shape.as_list()
-        post_dim = input_shape[-1] // attr[0]
-        result = inputs[0]
-        if post_dim % TILE_DIM != 0:
-            if input_shape[-2] % TILE_DIM != 0:
-                result = dc.op(
-                    "pad_tile",
-                    [
-                        result,
-                    ],
-                    (-2, input_shape[-2]),
-                )
-            cols = []
-            pad_post_dim = align_up_tile(post_dim)
-            pad_input_dim = pad_post_dim * attr[0]
-            for i in range(attr[0]):
-                cols.extend(torch.arange(i * pad_post_dim, i * pad_post_dim + post_dim).tolist())
-            spm = torch.sparse_coo_tensor(
-                [cols, torch.arange(input_shape[-1]).tolist()],
-                torch.ones(input_shape[-1]),
-                (pad_input_dim, input_shape[-1]),
-                dtype=torch.float32,
-            )
+def _decompose_post_optimize_select(attr, dc, inputs):
+    decompose_select(attr, dc, inputs)
 
-            while len(result.shape) < 3:
-                result = dc.op_with_named_attrs(
-                    "unsqueeze",
-                    [
-                        result,
-                    ],
-                    {"dim": 0},
-                )
 
-            spm = torch.stack([spm] * result.shape[-3], -3).unsqueeze(0)
-            result = dc.op_with_named_attrs(
-                "transpose",
-                [
-                    result,
-                ],
-                {"dim0": -2, "dim1": -1},
-            )
-            result = picker_matmul(True, dc, spm, result)
-            result = dc.op_with_named_attrs("transpose", [result], {"dim0": -2, "dim1": -1})
-            result = dc.op(
-                "hslice",
-                [
-                    result,
-                ],
-                attr,
-            )
-            result = dc.op(
-                "narrow",
-                [
-                    result,
-                ],
-                (-1, 0, post_dim, result.shape[-1]),
-            )
-            if input_shape[-2] % TILE_DIM != 0:
-                result = dc.op(
-                    "narrow",
-                    [
-                        result,
-                    ],
-                    (-2, 0, input_shape[-2], result.shape[-2]),
-                )
-            dc.fuse(result)
-        elif input_shape[-2] % TILE_DIM != 0:
+def _decompose_post_optimize_hslice(attr, dc, inputs):
+    input_shape = inputs[0].shape.as_list()
+    post_dim = input_shape[-1] // attr[0]
+    result = inputs[0]
+    if post_dim % TILE_DIM != 0:
+        if input_shape[-2] % TILE_DIM != 0:
             result = dc.op(
                 "pad_tile",
                 [
@@ -1235,13 +1302,52 @@ def decompose_post_optimize(type, attr, dc, inputs):
                 ],
                 (-2, input_shape[-2]),
             )
-            result = dc.op(
-                "hslice",
+        cols = []
+        pad_post_dim = align_up_tile(post_dim)
+        pad_input_dim = pad_post_dim * attr[0]
+        for i in range(attr[0]):
+            cols.extend(torch.arange(i * pad_post_dim, i * pad_post_dim + post_dim).tolist())
+        spm = torch.sparse_coo_tensor(
+            [cols, torch.arange(input_shape[-1]).tolist()],
+            torch.ones(input_shape[-1]),
+            (pad_input_dim, input_shape[-1]),
+            dtype=torch.float32,
+        )
+
+        while len(result.shape) < 3:
+            result = dc.op_with_named_attrs(
+                "unsqueeze",
                 [
                     result,
                 ],
-                attr,
+                {"dim": 0},
             )
+
+        spm = torch.stack([spm] * result.shape[-3], -3).unsqueeze(0)
+        result = dc.op_with_named_attrs(
+            "transpose",
+            [
+                result,
+            ],
+            {"dim0": -2, "dim1": -1},
+        )
+        result = picker_matmul(True, dc, spm, result)
+        result = dc.op_with_named_attrs("transpose", [result], {"dim0": -2, "dim1": -1})
+        result = dc.op(
+            "hslice",
+            [
+                result,
+            ],
+            attr,
+        )
+        result = dc.op(
+            "narrow",
+            [
+                result,
+            ],
+            (-1, 0, post_dim, result.shape[-1]),
+        )
+        if input_shape[-2] % TILE_DIM != 0:
             result = dc.op(
                 "narrow",
                 [
@@ -1249,60 +1355,37 @@ def decompose_post_optimize(type, attr, dc, inputs):
                 ],
                 (-2, 0, input_shape[-2], result.shape[-2]),
             )
-            dc.fuse(result)
+        dc.fuse(result)
+    elif input_shape[-2] % TILE_DIM != 0:
+        result = dc.op(
+            "pad_tile",
+            [
+                result,
+            ],
+            (-2, input_shape[-2]),
+        )
+        result = dc.op(
+            "hslice",
+            [
+                result,
+            ],
+            attr,
+        )
+        result = dc.op(
+            "narrow",
+            [
+                result,
+            ],
+            (-2, 0, input_shape[-2], result.shape[-2]),
+        )
+        dc.fuse(result)
 
-    elif type == "hstack":
-        input_shape = inputs[0].shape.as_list()
-        result = inputs[0]
-        if input_shape[-1] % TILE_DIM != 0:
-            if input_shape[-2] % TILE_DIM != 0:
-                result = dc.op(
-                    "pad_tile",
-                    [
-                        result,
-                    ],
-                    (-2, input_shape[-2]),
-                )
-            output_dim = input_shape[-1] * attr[0]
-            pad_output_dim = align_up_tile(input_shape[-1]) * attr[0]
-            result = dc.op(
-                "pad_tile",
-                [
-                    result,
-                ],
-                (-1, input_shape[-1]),
-            )
-            result = dc.op(
-                "hstack",
-                [
-                    result,
-                ],
-                attr,
-            )
-            rows = []
-            pad_input_dim = align_up_tile(input_shape[-1])
-            for i in range(attr[0]):
-                rows.extend(torch.arange(i * pad_input_dim, i * pad_input_dim + input_shape[-1]).tolist())
-            spm = torch.sparse_coo_tensor(
-                [torch.arange(output_dim).tolist(), rows],
-                torch.ones(output_dim),
-                (output_dim, pad_output_dim),
-                dtype=torch.float32,
-            )
-            spm = torch.stack([spm] * result.shape[-3], -3).unsqueeze(0)
-            result = dc.op_with_named_attrs("transpose", [result], {"dim0": -2, "dim1": -1})
-            result = picker_matmul(True, dc, spm, result)
-            result = dc.op_with_named_attrs("transpose", [result], {"dim0": -2, "dim1": -1})
-            if input_shape[-2] % TILE_DIM != 0:
-                result = dc.op(
-                    "narrow",
-                    [
-                        result,
-                    ],
-                    (-2, 0, input_shape[-2], result.shape[-2]),
-                )
-            dc.fuse(result)
-        elif input_shape[-2] % TILE_DIM != 0:
+
+def _decompose_post_optimize_hstack(attr, dc, inputs):
+    input_shape = inputs[0].shape.as_list()
+    result = inputs[0]
+    if input_shape[-1] % TILE_DIM != 0:
+        if input_shape[-2] % TILE_DIM != 0:
             result = dc.op(
                 "pad_tile",
                 [
@@ -1310,13 +1393,37 @@ def decompose_post_optimize(type, attr, dc, inputs):
                 ],
                 (-2, input_shape[-2]),
             )
-            result = dc.op(
-                "hstack",
-                [
-                    result,
-                ],
-                attr,
-            )
+        output_dim = input_shape[-1] * attr[0]
+        pad_output_dim = align_up_tile(input_shape[-1]) * attr[0]
+        result = dc.op(
+            "pad_tile",
+            [
+                result,
+            ],
+            (-1, input_shape[-1]),
+        )
+        result = dc.op(
+            "hstack",
+            [
+                result,
+            ],
+            attr,
+        )
+        rows = []
+        pad_input_dim = align_up_tile(input_shape[-1])
+        for i in range(attr[0]):
+            rows.extend(torch.arange(i * pad_input_dim, i * pad_input_dim + input_shape[-1]).tolist())
+        spm = torch.sparse_coo_tensor(
+            [torch.arange(output_dim).tolist(), rows],
+            torch.ones(output_dim),
+            (output_dim, pad_output_dim),
+            dtype=torch.float32,
+        )
+        spm = torch.stack([spm] * result.shape[-3], -3).unsqueeze(0)
+        result = dc.op_with_named_attrs("transpose", [result], {"dim0": -2, "dim1": -1})
+        result = picker_matmul(True, dc, spm, result)
+        result = dc.op_with_named_attrs("transpose", [result], {"dim0": -2, "dim1": -1})
+        if input_shape[-2] % TILE_DIM != 0:
             result = dc.op(
                 "narrow",
                 [
@@ -1324,62 +1431,38 @@ def decompose_post_optimize(type, attr, dc, inputs):
                 ],
                 (-2, 0, input_shape[-2], result.shape[-2]),
             )
-            dc.fuse(result)
-
-    elif type == "vslice":
-        input_shape = inputs[0].shape.as_list()
-        post_dim = input_shape[-2] // attr[0]
-        result = inputs[0]
-        if post_dim % TILE_DIM != 0:
-            if input_shape[-1] % TILE_DIM != 0:
-                result = dc.op(
-                    "pad_tile",
-                    [
-                        result,
-                    ],
-                    (-1, input_shape[-1]),
-                )
-            cols = []
-            pad_post_dim = align_up_tile(post_dim)
-            pad_input_dim = pad_post_dim * attr[0]
-            for i in range(attr[0]):
-                cols.extend(torch.arange(i * pad_post_dim, i * pad_post_dim + post_dim).tolist())
-            spm = (
-                torch.sparse_coo_tensor(
-                    [cols, torch.arange(input_shape[-2]).tolist()],
-                    torch.ones(input_shape[-2]),
-                    (pad_input_dim, input_shape[-2]),
-                    dtype=torch.float32,
-                )
-                .unsqueeze(0)
-                .unsqueeze(0)
-            )
-            spm = torch.cat([spm] * result.shape[-3], -3)
-            result = picker_matmul(True, dc, spm, result)
-            result = dc.op(
-                "vslice",
-                [
-                    result,
-                ],
-                attr,
-            )
-            result = dc.op(
-                "narrow",
-                [
-                    result,
-                ],
-                (-2, 0, post_dim, result.shape[-2]),
-            )
-            if input_shape[-1] % TILE_DIM != 0:
-                result = dc.op(
-                    "narrow",
-                    [
-                        result,
-                    ],
-                    (-1, 0, input_shape[-1], result.shape[-1]),
-                )
-            dc.fuse(result)
-        elif input_shape[-1] % TILE_DIM != 0:
+        dc.fuse(result)
+    elif input_shape[-2] % TILE_DIM != 0:
+        result = dc.op(
+            "pad_tile",
+            [
+                result,
+            ],
+            (-2, input_shape[-2]),
+        )
+        result = dc.op(
+            "hstack",
+            [
+                result,
+            ],
+            attr,
+        )
+        result = dc.op(
+            "narrow",
+            [
+                result,
+            ],
+            (-2, 0, input_shape[-2], result.shape[-2]),
+        )
+        dc.fuse(result)
+
+
+def _decompose_post_optimize_vslice(attr, dc, inputs):
+    input_shape = inputs[0].shape.as_list()
+    post_dim = input_shape[-2] // attr[0]
+    result = inputs[0]
+    if post_dim % TILE_DIM != 0:
+        if input_shape[-1] % TILE_DIM != 0:
             result = dc.op(
                 "pad_tile",
                 [
@@ -1387,13 +1470,38 @@ def decompose_post_optimize(type, attr, dc, inputs):
                 ],
                 (-1, input_shape[-1]),
             )
-            result = dc.op(
-                "vslice",
-                [
-                    result,
-                ],
-                attr,
+        cols = []
+        pad_post_dim = align_up_tile(post_dim)
+        pad_input_dim = pad_post_dim * attr[0]
+        for i in range(attr[0]):
+            cols.extend(torch.arange(i * pad_post_dim, i * pad_post_dim + post_dim).tolist())
+        spm = (
+            torch.sparse_coo_tensor(
+                [cols, torch.arange(input_shape[-2]).tolist()],
+                torch.ones(input_shape[-2]),
+                (pad_input_dim, input_shape[-2]),
+                dtype=torch.float32,
             )
+            .unsqueeze(0)
+            .unsqueeze(0)
+        )
+        spm = torch.cat([spm] * result.shape[-3], -3)
+        result = picker_matmul(True, dc, spm, result)
+        result = dc.op(
+            "vslice",
+            [
+                result,
+            ],
+            attr,
+        )
+        result = dc.op(
+            "narrow",
+            [
+                result,
+            ],
+            (-2, 0, post_dim, result.shape[-2]),
+        )
+        if input_shape[-1] % TILE_DIM != 0:
             result = dc.op(
                 "narrow",
                 [
@@ -1401,63 +1509,37 @@ def decompose_post_optimize(type, attr, dc, inputs):
                 ],
                 (-1, 0, input_shape[-1], result.shape[-1]),
             )
-            dc.fuse(result)
+        dc.fuse(result)
+    elif input_shape[-1] % TILE_DIM != 0:
+        result = dc.op(
+            "pad_tile",
+            [
+                result,
+            ],
+            (-1, input_shape[-1]),
+        )
+        result = dc.op(
+            "vslice",
+            [
+                result,
+            ],
+            attr,
+        )
+        result = dc.op(
+            "narrow",
+            [
+                result,
+            ],
+            (-1, 0, input_shape[-1], result.shape[-1]),
+        )
+        dc.fuse(result)
 
-    elif type == "vstack":
-        input_shape = inputs[0].shape.as_list()
-        result = inputs[0]
-        if input_shape[-2] % TILE_DIM != 0:
-            if input_shape[-1] % TILE_DIM != 0:
-                result = dc.op(
-                    "pad_tile",
-                    [
-                        result,
-                    ],
-                    (-1, input_shape[-1]),
-                )
-            output_dim = input_shape[-2] * attr[0]
-            pad_output_dim = align_up_tile(input_shape[-2]) * attr[0]
-            result = dc.op(
-                "pad_tile",
-                [
-                    result,
-                ],
-                (-2, input_shape[-2]),
-            )
-            result = dc.op(
-                "vstack",
-                [
-                    result,
-                ],
-                attr,
-            )
-            rows = []
-            pad_input_dim = align_up_tile(input_shape[-2])
-            for i in range(attr[0]):
-                rows.extend(torch.arange(i * pad_input_dim, i * pad_input_dim + input_shape[-2]).tolist())
-            spm = (
-                torch.sparse_coo_tensor(
-                    [torch.arange(output_dim).tolist(), rows],
-                    torch.ones(output_dim),
-                    (output_dim, pad_output_dim),
-                    dtype=torch.float32,
-                )
-                .coalesce()
-                .unsqueeze(0)
-                .unsqueeze(0)
-            )
-            spm = torch.cat([spm] * result.shape[-3], -3)
-            result = picker_matmul(True, dc, spm, result)
-            if input_shape[-1] % TILE_DIM != 0:
-                result = dc.op(
-                    "narrow",
-                    [
-                        result,
-                    ],
-                    (-1, 0, input_shape[-1], result.shape[-1]),
-                )
-            dc.fuse(result)
-        elif input_shape[-1] % TILE_DIM != 0:
+
+def _decompose_post_optimize_vstack(attr, dc, inputs):
+    input_shape = inputs[0].shape.as_list()
+    result = inputs[0]
+    if input_shape[-2] % TILE_DIM != 0:
+        if input_shape[-1] % TILE_DIM != 0:
             result = dc.op(
                 "pad_tile",
                 [
@@ -1465,13 +1547,40 @@ def decompose_post_optimize(type, attr, dc, inputs):
                 ],
                 (-1, input_shape[-1]),
             )
-            result = dc.op(
-                "vstack",
-                [
-                    result,
-                ],
-                attr,
+        output_dim = input_shape[-2] * attr[0]
+        pad_output_dim = align_up_tile(input_shape[-2]) * attr[0]
+        result = dc.op(
+            "pad_tile",
+            [
+                result,
+            ],
+            (-2, input_shape[-2]),
+        )
+        result = dc.op(
+            "vstack",
+            [
+                result,
+            ],
+            attr,
+        )
+        rows = []
+        pad_input_dim = align_up_tile(input_shape[-2])
+        for i in range(attr[0]):
+            rows.extend(torch.arange(i * pad_input_dim, i * pad_input_dim + input_shape[-2]).tolist())
+        spm = (
+            torch.sparse_coo_tensor(
+                [torch.arange(output_dim).tolist(), rows],
+                torch.ones(output_dim),
+                (output_dim, pad_output_dim),
+                dtype=torch.float32,
             )
+            .coalesce()
+            .unsqueeze(0)
+            .unsqueeze(0)
+        )
+        spm = torch.cat([spm] * result.shape[-3], -3)
+        result = picker_matmul(True, dc, spm, result)
+        if input_shape[-1] % TILE_DIM != 0:
             result = dc.op(
                 "narrow",
                 [
@@ -1479,6 +1588,43 @@ def decompose_post_optimize(type, attr, dc, inputs):
                 ],
                 (-1, 0, input_shape[-1], result.shape[-1]),
             )
-            dc.fuse(result)
+        dc.fuse(result)
+    elif input_shape[-1] % TILE_DIM != 0:
+        result = dc.op(
+            "pad_tile",
+            [
+                result,
+            ],
+            (-1, input_shape[-1]),
+        )
+        result = dc.op(
+            "vstack",
+            [
+                result,
+            ],
+            attr,
+        )
+        result = dc.op(
+            "narrow",
+            [
+                result,
+            ],
+            (-1, 0, input_shape[-1], result.shape[-1]),
+        )
+        dc.fuse(result)
 
-    return
+
+_decompose_post_optimize_fns = {
+    "select": _decompose_post_optimize_select,
+    "hslice": _decompose_post_optimize_hslice,
+    "hstack": _decompose_post_optimize_hstack,
+    "vslice": _decompose_post_optimize_vslice,
+    "vstack": _decompose_post_optimize_vstack,
+}
+
+
+def decompose_post_optimize(type, attr, dc, inputs):
+    # TODO: remove once backend support is available
+    decompose_fn = _decompose_post_optimize_fns.get(type)
+    if decompose_fn is not None:
+        decompose_fn(attr, dc, inputs)
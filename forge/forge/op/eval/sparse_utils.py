@@ -1,6 +1,7 @@
 # SPDX-FileCopyrightText: © 2024 Tenstorrent AI ULC
 
 # SPDX-License-Identifier: Apache-2.0
+import functools
 import math
 import numpy as np
 import os
@@ -11,6 +12,64 @@ from forge.utils import align_up_tile, align_up, round_up_div, clamp
 from ...forgeglobal import TILE_DIM
 from forge._C import DataFormat, compress_sparse_tensor_and_strip_info, SparseCOO, SparseFORGE, MathFidelity
 
+# Number of picker matrices kept per builder, 0 disables caching
+SPARSE_PICKER_CACHE_SIZE = int(os.environ.get("FORGE_SPARSE_PICKER_CACHE_SIZE", "128"))
+
+
+def _to_hashable(arg):
+    if isinstance(arg, (list, tuple, torch.Size)):
+        return tuple(_to_hashable(a) for a in arg)
+    return arg
+
+
+def _type_signature(arg):
+    # Types of the (nested) values, so that e.g. pickers for 2 and 2.0 are cached separately
+    if isinstance(arg, tuple):
+        return tuple(_type_signature(a) for a in arg)
+    return type(arg)
+
+
+def _is_cacheable(arg):
+    # Tensors hash by identity, so they can't be used as cache keys
+    if isinstance(arg, tuple):
+        return all(_is_cacheable(a) for a in arg)
+    if isinstance(arg, torch.Tensor):
+        return False
+    try:
+        hash(arg)
+    except TypeError:
+        return False
+    return True
+
+
+def sparse_picker_cache(builder):
+    """
+    Caches picker matrices built from shapes and attributes. The same pickers are requested repeatedly during
+    compilation (e.g. for every conv/resize with the same shapes), so they are built only once. Cached tensor is
+    cloned on return, so callers can freely modify it.
+    """
+    if SPARSE_PICKER_CACHE_SIZE <= 0:
+        builder.cache_info = lambda: None
+        builder.cache_clear = lambda: None
+        return builder
+
+    @functools.lru_cache(maxsize=SPARSE_PICKER_CACHE_SIZE, typed=True)
+    def cached_builder(type_signature, *args, **kwargs):
+        return builder(*args, **kwargs)
+
+    @functools.wraps(builder)
+    def wrapper(*args, **kwargs):
+        hashable_args = tuple(_to_hashable(a) for a in args)
+        hashable_kwargs = {k: _to_hashable(v) for k, v in kwargs.items()}
+        key = (hashable_args, tuple(hashable_kwargs.items()))
+        if not _is_cacheable(key):
+            return builder(*args, **kwargs)
+        return cached_builder(_type_signature(key), *hashable_args, **hashable_kwargs).clone()
+
+    wrapper.cache_info = cached_builder.cache_info
+    wrapper.cache_clear = cached_builder.cache_clear
+    return wrapper
+
 
 def conv2d_padding_to_canonical(padding, kernel_size):
     # current implementation is without dilation
@@ -292,6 +351,7 @@ def create_conv2d_picker_matrix(y, x, y_shift, x_shift, stride, tile_align=False
     return dident
 
 
+@sparse_picker_cache
 def create_conv2d_sparse_picker_matrix(
     y,
     x,
@@ -344,18 +404,16 @@ def create_conv2d_sparse_picker_matrix(
         sparse_r = out_y * out_x
         sparse_c = y * x
     return torch.sparse_coo_tensor(
-        [rows.tolist(), cols.tolist()],
+        torch.stack([rows, cols]),
         torch.ones(cols.shape[0]),
         (sparse_r, sparse_c),
         dtype=torch.float32,
     ).coalesce()
 
 
+@sparse_picker_cache
 def create_dilate2d_sparse_picker_matrix(y, x, dilation, tile_align=False):
-    rows = torch.arange(y * x).view(y, x)
-    rows *= dilation
-    for i in range(y):
-        rows[i] += i * x * dilation
+    rows = torch.arange(y * x).view(y, x) * dilation + (torch.arange(y) * x * dilation).unsqueeze(-1)
     rows = rows.view(y * x)
     cols = torch.arange(y * x)
     sparse_r = (y * dilation) * (x * dilation)
@@ -364,13 +422,14 @@ def create_dilate2d_sparse_picker_matrix(y, x, dilation, tile_align=False):
         sparse_r = align_up_tile(sparse_r)
         sparse_c = align_up_tile(sparse_c)
     return torch.sparse_coo_tensor(
-        [rows.tolist(), cols.tolist()],
+        torch.stack([rows, cols]),
         torch.ones(cols.shape[0]),
         (sparse_r, sparse_c),
         dtype=torch.float32,
     )
 
 
+@sparse_picker_cache
 def create_avg_pool2d_count_include_pad_False_picker_matrix(y, x, k_y, k_x, stride, padding, tile_align=False):
     """
     When avg_pool2d has its parameter `count_include_pad` set to False, we will treat it as True and then try to fix it
@@ -398,7 +457,7 @@ def create_avg_pool2d_count_include_pad_False_picker_matrix(y, x, k_y, k_x, stri
 
     # Transform into sparse picker
     picker = picker.reshape(-1)
-    rows_cols = torch.arange(picker.shape[0]).tolist()
+    rows_cols = torch.arange(picker.shape[0])
 
     if tile_align:
         picker_dim = align_up_tile(picker.shape[0])
@@ -406,13 +465,14 @@ def create_avg_pool2d_count_include_pad_False_picker_matrix(y, x, k_y, k_x, stri
         picker_dim = picker.shape[0]
 
     return torch.sparse_coo_tensor(
-        indices=[rows_cols, rows_cols],
+        indices=torch.stack([rows_cols, rows_cols]),
         values=picker,
         size=(picker_dim, picker_dim),
         dtype=torch.float32,
     ).coalesce()
 
 
+@sparse_picker_cache
 def create_index_sparse_picker_matrix(r, start, stop, stride, tile_align=False):
     length = stop - start
     rows = torch.arange(r).narrow(0, start, length) - start
@@ -425,74 +485,76 @@ def create_index_sparse_picker_matrix(r, start, stop, stride, tile_align=False):
         sparse_r = align_up_tile(sparse_r)
         sparse_c = align_up_tile(sparse_c)
     return torch.sparse_coo_tensor(
-        [rows.tolist(), cols.tolist()],
+        torch.stack([rows, cols]),
         torch.ones(cols.shape[0]),
         (sparse_r, sparse_c),
         dtype=torch.float32,
     )
 
 
+@sparse_picker_cache
 def create_reshape_flatten_sparse_picker_matrix(orig_r, new_r, tile_dim=TILE_DIM):
     cols = torch.arange(new_r // tile_dim)
     rows = cols * tile_dim
     return torch.sparse_coo_tensor(
-        [rows.tolist(), cols.tolist()],
+        torch.stack([rows, cols]),
         torch.ones(cols.shape[0]),
         (new_r, orig_r),
         dtype=torch.float32,
     )
 
 
+@sparse_picker_cache
 def create_reshape_flatten_sparse_picker_matrix_narrower(orig_r, new_r, org_length, tile_dim=TILE_DIM):
     cols = torch.arange(orig_r)
-    rows = torch.tensor([])
-    for i in range(0, new_r, tile_dim):
-        rows = torch.cat([rows, (torch.arange(org_length) + i)])
+    rows = (torch.arange(org_length).unsqueeze(0) + torch.arange(0, new_r, tile_dim).unsqueeze(-1)).reshape(-1)
     return torch.sparse_coo_tensor(
-        [rows.tolist(), cols.tolist()],
+        torch.stack([rows, cols]),
         torch.ones(cols.shape[0]),
         (new_r, orig_r),
         dtype=torch.float32,
     )
 
 
+@sparse_picker_cache
 def create_flattened_padding_removal_sparse_picker_matrix(
     r, start, stop, length, align_up_rows=False, align_up_cols=False
 ):
     num_pads = r // length
-    cols = []
-    [cols.extend((torch.arange(start, stop) + (length * pad)).tolist()) for pad in range(num_pads)]
-    cols = torch.tensor(cols)
+    cols = (torch.arange(start, stop).unsqueeze(0) + (torch.arange(num_pads) * length).unsqueeze(-1)).reshape(-1)
     rows = torch.arange(num_pads * stop)
     num_rows = num_pads * stop if not align_up_rows else align_up_tile(num_pads * stop)
     return torch.sparse_coo_tensor(
-        [rows.tolist(), cols.tolist()],
+        torch.stack([rows, cols]),
         torch.ones(cols.shape[0]),
         (num_rows, r if not align_up_cols else align_up_tile(r)),
         dtype=torch.float32,
     )
 
 
+@sparse_picker_cache
 def create_padding_shift_sparse_picker_matrix(length, slices, padded_length):
-    rows = torch.arange(0, length).tolist()
-    cols = []
-    for i in range(slices):
-        lo = i * align_up_tile(length // slices)
-        hi = lo + length // slices
-        col = torch.arange(lo, hi)
-        cols = cols + col.tolist()
+    rows = torch.arange(0, length)
+    slice_length = length // slices
+    cols = (
+        torch.arange(slice_length).unsqueeze(0) + (torch.arange(slices) * align_up_tile(slice_length)).unsqueeze(-1)
+    ).reshape(-1)
 
     return torch.sparse_coo_tensor(
-        [rows, cols], torch.ones(len(cols)), (padded_length, align_up_tile(cols[-1] + 1)), dtype=torch.float32
+        torch.stack([rows, cols]),
+        torch.ones(cols.shape[0]),
+        (padded_length, align_up_tile(cols[-1].item() + 1)),
+        dtype=torch.float32,
     )
 
 
+@sparse_picker_cache
 def create_real_row_sparse_picker_matrix(orig_x, padded_y):
     cols = torch.arange(orig_x)
     rows = cols * TILE_DIM
     # Resulted row dim is TILE_DIM * (orig_shape[-1]), orig_shape[-1] doesnt need to be tile aligned
     spm = torch.sparse_coo_tensor(
-        [rows.tolist(), cols.tolist()],
+        torch.stack([rows, cols]),
         torch.ones(cols.shape[0]),
         (orig_x * TILE_DIM, padded_y),
         dtype=torch.float32,
@@ -500,50 +562,34 @@ def create_real_row_sparse_picker_matrix(orig_x, padded_y):
     return spm
 
 
+@sparse_picker_cache
 def create_repeat_sparse_picker_matrix(orig_x, repeat):
-    cols = torch.arange(orig_x).tolist() * repeat
-    rows = torch.arange(orig_x * repeat).tolist()
+    cols = torch.arange(orig_x).repeat(repeat)
+    rows = torch.arange(orig_x * repeat)
 
     spm = torch.sparse_coo_tensor(
-        [rows, cols],
-        torch.ones(len(rows)),
+        torch.stack([rows, cols]),
+        torch.ones(rows.shape[0]),
         (align_up_tile(orig_x * repeat), align_up_tile(orig_x)),
         dtype=torch.float32,
     )
     return spm
 
 
+@sparse_picker_cache
 def create_sparse_interleave_picker_matrix(length, orig_x, orig_z):
-    def create_rows(orig_x, orig_z):
-        rows = []
-        curr_row = 0
-        for i in range(orig_x):
-            rows.append(torch.arange(curr_row, curr_row + orig_z).tolist())
-            curr_row += align_up_tile(orig_z)
-        return rows
-
-    def create_cols(length, orig_x):
-        cols = []
-        for i in range(orig_x):
-            curr_cols = []
-            for j in range(length // align_up_tile(orig_x)):
-                vals = [i + j * align_up_tile(orig_x)]
-                curr_cols += vals
-
-            cols.append(curr_cols)
-        return cols
-
-    rows = create_rows(orig_x, orig_z)
-    cols = create_cols(length, orig_x)
-    matrix = torch.sparse_coo_tensor(
-        [rows[0], cols[0]], torch.ones(len(cols[0])), (align_up_tile(rows[-1][-1] + 1), length), dtype=torch.float32
-    )
-    for i in range(1, orig_x):
-        matrix += torch.sparse_coo_tensor(
-            [rows[i], cols[i]], torch.ones(len(cols[i])), (align_up_tile(rows[-1][-1] + 1), length), dtype=torch.float32
-        )
+    # Row block i picks columns i, i + align_up_tile(orig_x), i + 2 * align_up_tile(orig_x), ...
+    rows = torch.arange(orig_z).unsqueeze(0) + (torch.arange(orig_x) * align_up_tile(orig_z)).unsqueeze(-1)
+    cols = torch.arange(length // align_up_tile(orig_x)).unsqueeze(0) * align_up_tile(orig_x) + torch.arange(
+        orig_x
+    ).unsqueeze(-1)
 
-    return matrix
+    return torch.sparse_coo_tensor(
+        torch.stack([rows.reshape(-1), cols.reshape(-1)]),
+        torch.ones(cols.numel()),
+        (align_up_tile(rows[-1][-1].item() + 1), length),
+        dtype=torch.float32,
+    )
 
 
 def transpose_sparse_picker_matrix(sparse):
@@ -563,7 +609,7 @@ def transpose_sparse_picker_matrix(sparse):
         rows, cols = s.indices()
         transposed.append(
             torch.sparse_coo_tensor(
-                [cols.tolist(), rows.tolist()],
+                torch.stack([cols, rows]),
                 s.values(),
                 (sparse_c, sparse_r),
                 dtype=s.dtype,
@@ -599,17 +645,12 @@ def get_sparse_picker_matrix_max_span(sparse: torch.Tensor):
     sparse = sparse.select(dim=0, index=0)  # removes batch dim
     for z in range(zdim):
         z_slice = sparse.select(dim=0, index=z)  # Now 2d
-        rows, cols = z_slice.coalesce().indices().tolist()
-
-        non_zero_tiles = {(rows[i] // TILE_DIM, cols[i] // TILE_DIM) for i in range(len(rows))}
 
-        d = dict()
-        for k, v in non_zero_tiles:
-            if k not in d:
-                d[k] = 0
-            d[k] += 1
+        # Count non-zero tiles in each row of tiles
+        non_zero_tiles = torch.unique(torch.div(z_slice.coalesce().indices(), TILE_DIM, rounding_mode="floor"), dim=1)
+        _, num_tiles_in_row = torch.unique(non_zero_tiles[0], return_counts=True)
 
-        max_span = max(max_span, max(d.values()))
+        max_span = max(max_span, num_tiles_in_row.max().item())
 
     return max_span
 
@@ -631,6 +672,7 @@ def up_idx_to_orig_idx_align_corners(up_idx, original_size, upsample_size):
     return torch.tensor(x_ori_list)
 
 
+@sparse_picker_cache
 def create_nearest_neighbor_upsample_picker_matrix(
     scale_factor,
     shape,
@@ -643,12 +685,8 @@ def create_nearest_neighbor_upsample_picker_matrix(
             raise RuntimeError("Resize3d is not supported in channel-last format yet")
 
         rows = torch.arange(shape[-3] * scale_factor[0] * shape[-2] * scale_factor[1])
-        cols = []
-        for i in range(shape[-3]):
-            col = torch.arange(shape[-2]).repeat_interleave(scale_factor[0]).repeat(scale_factor[1]) + i * (shape[-2])
-            cols.append(col)
-
-        cols = torch.concat(cols)
+        col = torch.arange(shape[-2]).repeat_interleave(scale_factor[0]).repeat(scale_factor[1])
+        cols = (col.unsqueeze(0) + (torch.arange(shape[-3]) * shape[-2]).unsqueeze(-1)).reshape(-1)
 
         sparse_r = rows.shape[0]
         sparse_c = shape[-2] * shape[-3]
@@ -656,25 +694,18 @@ def create_nearest_neighbor_upsample_picker_matrix(
             sparse_r = align_up_tile(sparse_r)
             sparse_c = align_up_tile(sparse_c)
 
-        return torch.sparse_coo_tensor([rows.tolist(), cols.tolist()], torch.ones(cols.shape[0]), (sparse_r, sparse_c))
+        return torch.sparse_coo_tensor(torch.stack([rows, cols]), torch.ones(cols.shape[0]), (sparse_r, sparse_c))
     else:
         if for_din:
             rows = torch.arange(shape[-3] * scale_factor[2] * shape[-4])
-            # cols = torch.arange(shape[-3]).repeat_interleave(scale_factor)
-            cols = []
-            for i in range(shape[-4]):
-                col = torch.arange(shape[-3]).repeat_interleave(scale_factor[2]) + i * shape[-3]
-                cols.append(col)
-            cols = torch.concat(cols)
+            col = torch.arange(shape[-3]).repeat_interleave(scale_factor[2])
+            cols = (col.unsqueeze(0) + (torch.arange(shape[-4]) * shape[-3]).unsqueeze(-1)).reshape(-1)
             sparse_r = rows.shape[0]
             sparse_c = shape[-3] * shape[-4]
         else:
             rows = torch.arange(shape[-2] * scale_factor[0] * shape[-1] * scale_factor[1])
-            cols = []
-            for i in range(shape[-2]):
-                col = torch.arange(shape[-1]).repeat_interleave(scale_factor[0]).repeat(scale_factor[1]) + i * shape[-1]
-                cols.append(col)
-            cols = torch.concat(cols)
+            col = torch.arange(shape[-1]).repeat_interleave(scale_factor[0]).repeat(scale_factor[1])
+            cols = (col.unsqueeze(0) + (torch.arange(shape[-2]) * shape[-1]).unsqueeze(-1)).reshape(-1)
             sparse_r = rows.shape[0]
             sparse_c = shape[-1] * shape[-2]
 
@@ -682,9 +713,10 @@ def create_nearest_neighbor_upsample_picker_matrix(
             sparse_r = align_up_tile(sparse_r)
             sparse_c = align_up_tile(sparse_c)
 
-        return torch.sparse_coo_tensor([rows.tolist(), cols.tolist()], torch.ones(cols.shape[0]), (sparse_r, sparse_c))
+        return torch.sparse_coo_tensor(torch.stack([rows, cols]), torch.ones(cols.shape[0]), (sparse_r, sparse_c))
 
 
+@sparse_picker_cache
 def create_nearest_neighbor_downsample_picker_matrix(
     scale_factor,
     shape,
@@ -694,14 +726,8 @@ def create_nearest_neighbor_downsample_picker_matrix(
     if channel_last:
         rows = torch.arange((shape[-3] // scale_factor) * (shape[-2] // scale_factor))
         rows = scale_factor * (rows // scale_factor)
-        cols = []
-        for i in range(shape[-3]):
-            col = torch.arange(shape[-2]).repeat_interleave(scale_factor).repeat(scale_factor) + i * align_up_tile(
-                shape[-2]
-            )
-            cols.append(col)
-
-        cols = torch.concat(cols)
+        col = torch.arange(shape[-2]).repeat_interleave(scale_factor).repeat(scale_factor)
+        cols = (col.unsqueeze(0) + (torch.arange(shape[-3]) * align_up_tile(shape[-2])).unsqueeze(-1)).reshape(-1)
 
         sparse_r = rows.shape[0]
         sparse_c = align_up_tile(shape[-2]) * shape[-3]
@@ -709,7 +735,7 @@ def create_nearest_neighbor_downsample_picker_matrix(
             sparse_r = align_up_tile(sparse_r)
             sparse_c = align_up_tile(sparse_c)
 
-        return torch.sparse_coo_tensor([rows.tolist(), cols.tolist()], torch.ones(cols.shape[0]), (sparse_r, sparse_c))
+        return torch.sparse_coo_tensor(torch.stack([rows, cols]), torch.ones(cols.shape[0]), (sparse_r, sparse_c))
     else:
         cols = torch.arange(shape[-2] // scale_factor) * scale_factor
         rows = cols // scale_factor
@@ -719,9 +745,26 @@ def create_nearest_neighbor_downsample_picker_matrix(
             sparse_r = align_up_tile(sparse_r)
             sparse_c = align_up_tile(sparse_c)
 
-        return torch.sparse_coo_tensor([rows.tolist(), cols.tolist()], torch.ones(cols.shape[0]), (sparse_r, sparse_c))
+        return torch.sparse_coo_tensor(torch.stack([rows, cols]), torch.ones(cols.shape[0]), (sparse_r, sparse_c))
 
 
+def get_bilinear_upsample_contributions(upsample_idx_adjusted, size):
+    """
+    Returns (upsampled index, original index, weight) triplets of all non-zero contributions of the original
+    indices to the upsampled ones. Each upsampled index gets contributions from (at most) two neighbouring
+    original indices, floor(idx) and floor(idx) + 1.
+    """
+    lower_idx = torch.floor(upsample_idx_adjusted).long()
+    upsample_idx = torch.arange(upsample_idx_adjusted.shape[0]).repeat(2)
+    orig_idx = torch.cat([lower_idx, lower_idx + 1])
+
+    # Contribution of the original index is 1 - distance to the upsampled one, clipped to [0, 1]
+    weights = 1 - torch.abs(upsample_idx_adjusted.repeat(2) - orig_idx)
+    mask = (weights > 0) & (orig_idx < size)
+    return upsample_idx[mask], orig_idx[mask], weights[mask]
+
+
+@sparse_picker_cache
 def create_bilinear_upsample_picker_matrix(
     scale_factor,
     shape,
@@ -755,55 +798,27 @@ def create_bilinear_upsample_picker_matrix(
     upsample_c_idx_adjusted = torch.clip(upsample_c_idx_adjusted, min=0, max=c - 1)
     upsample_r_idx_adjusted = torch.clip(upsample_r_idx_adjusted, min=0, max=r - 1)
 
-    inp_idx_to_weight_c = {}
-    inp_idx_to_weight_r = {}
-
-    # Compute and store idx heat map
-    # Key: int
-    #   idx in a given row
-    # Value: list
-    #   The portion that act[idx] contribute to the upsampled output
-    #   List length is the upsampled length
-    for j in range(c):
-        inp_idx = j
-
-        # Step 1: normalize to around the current idx
-        normalized_idx = upsample_c_idx_adjusted - inp_idx
-        # Step 2: take abs around current idx
-        abs_idx = torch.abs(normalized_idx)
-        # Step 3: calculate contribution to each upsampled index
-        inverted_idx = 1 - abs_idx
-        # Step 4: contribution must be between [0,1]
-        clipped_idx = torch.where(inverted_idx < 0, torch.zeros(inverted_idx.shape), inverted_idx).to_sparse()
-
-        inp_idx_to_weight_c[inp_idx] = clipped_idx
-
-    for i in range(r):
-        inp_idx = i
-
-        # Step 1: normalize to around the current idx
-        normalized_idx = upsample_r_idx_adjusted - inp_idx
-        # Step 2: take abs around current idx
-        abs_idx = torch.abs(normalized_idx)
-        # Step 3: calculate contribution to each upsampled index
-        inverted_idx = 1 - abs_idx
-        # Step 4: contribution must be between [0,1]
-        clipped_idx = torch.where(inverted_idx < 0, torch.zeros(inverted_idx.shape), inverted_idx).to_sparse()
-
-        inp_idx_to_weight_r[inp_idx] = clipped_idx
-
-    # Go through each cell in input activation and build up contribution depending on
-    # row and column.
-    baseline = torch.stack([inp_idx_to_weight_c[i % c].unsqueeze(0) for i in range(num_cols)], dim=0)
-    idx_elements = torch.stack([inp_idx_to_weight_r[i // c].unsqueeze(-1) for i in range(num_cols)], dim=0)
-    indices = torch.bmm(idx_elements, baseline.to_dense()).view(num_cols, num_rows).transpose(-2, -1)
+    # Contributions along each of the dims
+    up_c, orig_c, weights_c = get_bilinear_upsample_contributions(upsample_c_idx_adjusted, c)
+    up_r, orig_r, weights_r = get_bilinear_upsample_contributions(upsample_r_idx_adjusted, r)
+
+    # Contribution of input activation cell (orig_r, orig_c) to the upsampled cell (up_r, up_c) is the
+    # product of the contributions along the row and the column
+    rows = (up_r.unsqueeze(-1) * (c * scale_factor[0]) + up_c.unsqueeze(0)).reshape(-1)
+    cols = (orig_r.unsqueeze(-1) * c + orig_c.unsqueeze(0)).reshape(-1)
+    values = (weights_r.unsqueeze(-1) * weights_c.unsqueeze(0)).reshape(-1)
+
     if split_factor > 1:
         assert num_rows % split_factor == 0
         chunk = num_rows // split_factor
-        indices = indices[(split_idx * chunk) : ((split_idx + 1) * chunk)]
-    return indices.to_sparse()
+        mask = (rows >= split_idx * chunk) & (rows < (split_idx + 1) * chunk)
+        rows, cols, values = rows[mask] - split_idx * chunk, cols[mask], values[mask]
+        num_rows = chunk
+
+    return torch.sparse_coo_tensor(torch.stack([rows, cols]), values, (num_rows, num_cols)).coalesce()
 
 
+@sparse_picker_cache
 def create_conv2d_transpose_weight_dident(kH, kW, tile_align=False):
     rows = torch.arange(kH * kW)
     cols = torch.flip(rows, dims=[0])
@@ -815,15 +830,16 @@ def create_conv2d_transpose_weight_dident(kH, kW, tile_align=False):
         sparse_r = align_up_tile(sparse_r)
         sparse_c = align_up_tile(sparse_c)
 
-    return torch.sparse_coo_tensor([rows.tolist(), cols.tolist()], torch.ones(cols.shape[0]), (sparse_r, sparse_c))
+    return torch.sparse_coo_tensor(torch.stack([rows, cols]), torch.ones(cols.shape[0]), (sparse_r, sparse_c))
 
 
+@sparse_picker_cache
 def create_conv2d_transpose_input_act_dident(y, x, stride, tile_align=False):
     cols = torch.arange(start=1, end=y * x + 1).view(y, x)
 
     # Stride is used to dilate input activation
     if stride != 1:
-        gap_cols = torch.zeros((y * stride, x * stride))
+        gap_cols = torch.zeros((y * stride, x * stride), dtype=cols.dtype)
         gap_cols[::stride, ::stride] = cols
         cols = gap_cols
 
@@ -839,13 +855,14 @@ def create_conv2d_transpose_input_act_dident(y, x, stride, tile_align=False):
         sparse_r = align_up_tile(sparse_r)
         sparse_c = align_up_tile(sparse_c)
     return torch.sparse_coo_tensor(
-        [rows.tolist(), cols.tolist()],
+        torch.stack([rows, cols]),
         torch.ones(cols.shape[0]),
         (sparse_r, sparse_c),
         dtype=torch.float32,
     )
 
 
+@sparse_picker_cache
 def create_eye_sparse_picker_matrix(r, tile_align=False):
     eye = torch.arange(r)
     sparse_r = eye.shape[0]
@@ -853,9 +870,10 @@ def create_eye_sparse_picker_matrix(r, tile_align=False):
     if tile_align:
         sparse_r = align_up_tile(sparse_r)
         sparse_c = align_up_tile(sparse_c)
-    return torch.sparse_coo_tensor([eye.tolist(), eye.tolist()], torch.ones(eye.shape[0]), (sparse_r, sparse_c))
+    return torch.sparse_coo_tensor(torch.stack([eye, eye]), torch.ones(eye.shape[0]), (sparse_r, sparse_c))
 
 
+@sparse_picker_cache
 def create_all_around_padding_picker_matrix(shape, padding, channel_last=False, tile_align=False):
 
     assert len(padding) == 4
@@ -873,32 +891,21 @@ def create_all_around_padding_picker_matrix(shape, padding, channel_last=False,
         r = shape[-2]
         c = shape[-1]
 
+    # Each input cell (i, j) is picked into the cell (i + padding_top, j + padding_left) of the padded activation
+    padded_c = c + padding_left + padding_right
     c_index = torch.arange(r * c)
-    r_index = (torch.arange(r * c) + 1).tolist()
-    r_index_rows = [r_index[x : x + c] for x in range(0, len(r_index), c)]
-
-    for i, row in enumerate(r_index_rows):
-        r_index_rows[i] = [0] * padding_left + row + [0] * padding_right
-    r_index = [item for row in r_index_rows for item in row]
+    r_index = (
+        ((torch.arange(r) + padding_top) * padded_c).unsqueeze(-1) + (torch.arange(c) + padding_left).unsqueeze(0)
+    ).reshape(-1)
 
-    r_index_final = torch.Tensor(
-        [0] * (c + padding_left + padding_right) * padding_top
-        + r_index
-        + [0] * (c + padding_left + padding_right) * padding_bottom
-    )
-
-    r_index = torch.nonzero(r_index_final).flatten().tolist()
     num_cols = r * c
-    num_rows = (r + padding_top + padding_bottom) * (c + padding_left + padding_right)
+    num_rows = (r + padding_top + padding_bottom) * padded_c
     if tile_align:
         num_rows = align_up_tile(num_rows)
         num_cols = align_up_tile(num_cols)
 
     return torch.sparse_coo_tensor(
-        [
-            r_index,
-            c_index.tolist(),
-        ],
+        torch.stack([r_index, c_index]),
         torch.ones(r * c),
         (num_rows, num_cols),
     )
@@ -1432,53 +1439,34 @@ def pad_sparse_coo_tensor(sparse_tensor, new_shape):
     return result
 
 
+@sparse_picker_cache
 def create_pad_replicate_sparse_picker(r, c, left, right, top, bottom):
     new_shape = (r + top + bottom) * (c + left + right)
     orig_shape = r * c
 
-    rows = torch.arange(new_shape).tolist()
-    cols = []
-
-    # dim=-1 padding
-    last_dim_index = []
-    for _ in range(left):
-        last_dim_index.append(0)
-    last_dim_index.extend(torch.arange(c).tolist())
-    for _ in range(right):
-        last_dim_index.append(c - 1)
-
-    # dim=-2 padding
-    for _ in range(top):
-        cols.extend(last_dim_index)
-    [cols.extend((torch.tensor(last_dim_index) + offset * c).tolist()) for offset in range(r)]
-    for _ in range(bottom):
-        cols.extend((torch.tensor(last_dim_index) + (r - 1) * c).tolist())
-
-    spm = torch.sparse_coo_tensor((rows, cols), torch.ones(new_shape), (new_shape, orig_shape))
+    rows = torch.arange(new_shape)
+
+    # Padded cells pick the closest edge cell of the original activation
+    row_index = torch.clamp(torch.arange(r + top + bottom) - top, 0, r - 1)
+    col_index = torch.clamp(torch.arange(c + left + right) - left, 0, c - 1)
+    cols = (row_index.unsqueeze(-1) * c + col_index.unsqueeze(0)).reshape(-1)
+
+    spm = torch.sparse_coo_tensor(torch.stack([rows, cols]), torch.ones(new_shape), (new_shape, orig_shape))
     return spm
 
 
+@sparse_picker_cache
 def create_pad_reflect_sparse_picker(r, c, left, right, top, bottom):
     new_shape = (r + top + bottom) * (c + left + right)
     orig_shape = r * c
 
-    rows = torch.arange(new_shape).tolist()
-    cols = []
-
-    horizontal_indices = (
-        [left - cidx for cidx in range(left)] + torch.arange(c).tolist() + [c - cidx - 2 for cidx in range(right)]
-    )
-    vertical_indices = (
-        [top - ridx for ridx in range(top)] + torch.arange(r).tolist() + [r - ridx - 2 for ridx in range(bottom)]
-    )
-
-    for vertical_index in vertical_indices:
+    rows = torch.arange(new_shape)
 
-        vectical_offset = vertical_index * c
-        last_dim_index = [x + vectical_offset for x in horizontal_indices]
-        cols.extend(last_dim_index)
+    horizontal_indices = torch.cat([left - torch.arange(left), torch.arange(c), c - 2 - torch.arange(right)])
+    vertical_indices = torch.cat([top - torch.arange(top), torch.arange(r), r - 2 - torch.arange(bottom)])
+    cols = (vertical_indices.unsqueeze(-1) * c + horizontal_indices.unsqueeze(0)).reshape(-1)
 
-    spm = torch.sparse_coo_tensor((rows, cols), torch.ones(new_shape), (new_shape, orig_shape))
+    spm = torch.sparse_coo_tensor(torch.stack([rows, cols]), torch.ones(new_shape), (new_shape, orig_shape))
     return spm
 
 
@@ -11,12 +11,91 @@ import numpy as np
 import torch
 
 from forge.compiled_graph_state import CompiledModel
-from forge.tensor import Tensor
+from forge.forgeglobal import TILE_DIM, round_up_div
+from forge.tensor import Tensor, forge_dataformat_to_pytorch_dtype
 from forge.parameter import Parameter
 import forge.torch_optimizers
 from forge.torch_optimizers import AdamNoBiasCorrection
 
 
+def broadcast_scalar(ac, scalar, shape: List[int]):
+    """
+    Explicitly broadcasts a scalar optimizer input or constant of shape (1,) to the given shape.
+
+    Scalar optimizer state (learning rate, bias correction powers) is kept in (1,) tensors, shared by all elements of
+    the parameter, and broadcast only where it meets the full-shape tensors in the optimizer graph.
+    """
+    # TODO: scalar state used to be allocated with the full shape of the parameter because of the following issue
+    # https://github.com/tenstorrent/tt-metal/issues/16352
+    # The issue is still open, it is worked around by broadcasting explicitly here instead of relying on implicit
+    # broadcasting of the (1,) tensors in eltwise ops.
+    for dim in range(-1, -len(shape) - 1, -1):
+        if shape[dim] > 1:
+            scalar = ac.op("broadcast", (scalar,), (dim, shape[dim]))
+    return scalar
+
+
+def get_flat_rows(shape: List[int]) -> int:
+    """
+    Returns the number of rows of the tensor in the flat buffer of a multi-tensor group.
+
+    Tensors are flattened into rows of `TILE_DIM` elements (the last row is zero-padded), so that the flat buffers are
+    not padded to tiles on device.
+    """
+    return round_up_div(int(np.prod(shape)), TILE_DIM)
+
+
+def flatten_tensors(ac, tensors):
+    """
+    Flattens the tensors and concatenates them into a single [rows, TILE_DIM] buffer, see `get_flat_rows`.
+    """
+    flat_tensors = []
+    for tensor in tensors:
+        shape = tensor.shape.as_list()
+        volume = int(np.prod(shape))
+        rows = get_flat_rows(shape)
+        if volume % TILE_DIM != 0:
+            flat = ac.op_with_named_attrs("reshape", (tensor,), {"shape": [1, volume]})
+            padding = ac.tensor(
+                torch.zeros(1, rows * TILE_DIM - volume, dtype=forge_dataformat_to_pytorch_dtype(tensor.output_df))
+            )
+            tensor = ac.op_with_named_attrs("concatenate", (flat, padding), {"dim": -1})
+        if shape != [rows, TILE_DIM]:
+            tensor = ac.op_with_named_attrs("reshape", (tensor,), {"shape": [rows, TILE_DIM]})
+        flat_tensors.append(tensor)
+
+    if len(flat_tensors) == 1:
+        return flat_tensors[0]
+    return ac.op_with_named_attrs("concatenate", flat_tensors, {"dim": -2})
+
+
+def unflatten_tensor(ac, flat_tensor, shapes: List[List[int]]):
+    """
+    Slices the flat buffer created by `flatten_tensors` back to the tensors of the given shapes.
+    """
+    tensors = []
+    start = 0
+    for shape in shapes:
+        volume = int(np.prod(shape))
+        rows = get_flat_rows(shape)
+        tensor = ac.op(
+            "index",
+            (flat_tensor,),
+            (-2, start, start + rows, 1),
+            named_attrs={"dim": -2, "start": start, "stop": start + rows, "stride": 1},
+        )
+        if volume % TILE_DIM != 0:
+            tensor = ac.op_with_named_attrs("reshape", (tensor,), {"shape": [1, rows * TILE_DIM]})
+            tensor = ac.op(
+                "index", (tensor,), (-1, 0, volume, 1), named_attrs={"dim": -1, "start": 0, "stop": volume, "stride": 1}
+            )
+        if shape != [rows, TILE_DIM]:
+            tensor = ac.op_with_named_attrs("reshape", (tensor,), {"shape": shape})
+        tensors.append(tensor)
+        start += rows
+    return tensors
+
+
 class Optimizer:
     """
     Optimizer base class
@@ -29,12 +108,20 @@ class Optimizer:
     # The derived classes will populate this dictionary with the necessary optimizer parameters.
     parameter_to_opt_inputs: Dict[str, Dict[str, Tensor]] = {}
 
-    def __init__(self, parameters: Optional[List[Parameter]]):
+    def __init__(self, parameters: Optional[List[Parameter]], multi_tensor: bool = False):
         """
         Create baseline optimizer. If parameters are not passed at construction, they will be
         dynamically added during compilation.
+
+        In the multi-tensor mode, parameters of the same data format are updated together, by one set of ops over
+        their flattened tensors (see `generate_multi_tensor_op_trace`). Flattening and slicing back costs a few ops per
+        parameter, so it pays off for optimizers with longer updates than SGD.
         """
         self.dynamic_params = parameters is None
+        self.multi_tensor = multi_tensor
+        # Multi-tensor groups, by the name of their first parameter - names of the parameters of the group and their
+        # number of rows in the flat buffers
+        self.multi_tensor_groups: Dict[str, Dict[str, int]] = {}
 
     def get_param_dict(self) -> Dict:
         """
@@ -57,12 +144,60 @@ class Optimizer:
 
         return opt_params
 
+    def get_state_memory_bytes(self) -> Dict[str, int]:
+        """
+        Returns the size of the optimizer state (moments and scalar state, such as the learning rate) of each
+        optimized parameter, in bytes.
+
+        In the multi-tensor mode, flat state of a group is split between its parameters by their rows in the flat
+        buffers, and scalar state is counted for the first parameter of the group.
+        """
+        state_bytes: Dict[str, int] = {}
+        for parameter_name, params in self.parameter_to_opt_inputs.items():
+            group = self.multi_tensor_groups.get(parameter_name, {parameter_name: 1})
+            num_rows = sum(group.values())
+            for param in params.values():
+                num_bytes = param.value().numel() * param.value().element_size()
+                if param.value().numel() == 1:
+                    state_bytes[parameter_name] = state_bytes.get(parameter_name, 0) + num_bytes
+                    continue
+                for name, rows in group.items():
+                    state_bytes[name] = state_bytes.get(name, 0) + num_bytes * rows // num_rows
+        return state_bytes
+
     def generate_op_trace(self, parameter, gradient):
         """
         Define the graph of ops involved in the optimizer eval.
         """
         raise RuntimeError("Subclasses should implement this.")
 
+    def add_multi_tensor_group(self, parameters):
+        """
+        Registers the group of parameters updated together in the multi-tensor mode, and creates the optimizer state of
+        the group - state has the shape of the flat buffer of the group, and is registered under the name of its first
+        parameter (optimizer inputs of the group are created for the first parameter).
+        """
+        group = {parameter.name: get_flat_rows(parameter.shape.as_list()) for parameter in parameters}
+        flat_shape = [sum(group.values()), TILE_DIM]
+
+        group_name = parameters[0].name
+        self.multi_tensor_groups[group_name] = group
+        self.parameter_to_opt_inputs[group_name] = self.get_param_dict(
+            forge_dataformat_to_pytorch_dtype(parameters[0].output_df), flat_shape
+        )
+
+    def generate_multi_tensor_op_trace(self, ac, parameters, gradients):
+        """
+        Define the graph of ops updating a group of parameters of the same data format at once, in the multi-tensor
+        mode. Parameters and gradients of the group are flattened into a single buffer, updated by the ops of
+        `generate_op_trace` and sliced back. Suitable for optimizers with elementwise updates.
+
+        Returns the updated parameters.
+        """
+        self.add_multi_tensor_group(parameters)
+        updated_parameter = self.generate_op_trace(ac, flatten_tensors(ac, parameters), flatten_tensors(ac, gradients))
+        return unflatten_tensor(ac, updated_parameter, [parameter.shape.as_list() for parameter in parameters])
+
     def torch_parameter_update(
         self, *, parameter_name: str, parameter: torch.Tensor, gradient: torch.Tensor
     ) -> torch.Tensor:
@@ -91,6 +226,14 @@ class Optimizer:
         for module in self.linked_modules:
             module.step()
 
+    def zero_grad(self):
+        """
+        Zeroes the gradients accumulated on device by the linked modules (compiled with gradient accumulation).
+        """
+        assert self.linked_modules is not None, "Optimizer must be linked to a module before calling zero_grad"
+        for module in self.linked_modules:
+            module.zero_grad()
+
 
 class SGD(Optimizer):
     """
@@ -105,8 +248,8 @@ class SGD(Optimizer):
         optimizer_parameter_name -> Tensor dict.
     """
 
-    def __init__(self, learning_rate: float, parameters: Optional[List[Parameter]] = None):
-        super().__init__(parameters)
+    def __init__(self, learning_rate: float, parameters: Optional[List[Parameter]] = None, multi_tensor: bool = False):
+        super().__init__(parameters, multi_tensor)
         self.learning_rate: float = learning_rate
         self.parameter_to_opt_inputs: Dict[str, Dict[str, Tensor]] = {}
 
@@ -114,14 +257,15 @@ class SGD(Optimizer):
             self.set_parameters_to_optimize(parameters)
 
     def set_parameters_to_optimize(self, parameters: List[Parameter]):
-        # For each Parameter, we register its associated set of optimizer parameters
+        # For each Parameter, we register its associated set of optimizer parameters. In the multi-tensor mode, they
+        # are registered per group, when the optimizer graph is generated.
         for parameter in parameters:
-            if parameter.requires_grad:
+            if parameter.requires_grad and not self.multi_tensor:
                 self.parameter_to_opt_inputs[parameter.get_name()] = self.get_param_dict(parameter.pt_data_format)
 
-    def get_param_dict(self, dtype: torch.dtype) -> Dict:
+    def get_param_dict(self, dtype: torch.dtype, shape: Optional[Tuple[int]] = None) -> Dict:
         """
-        Return a dict of optimizer parameter names to tensor
+        Return a dict of optimizer parameter names to tensor. SGD has no state with the shape of the parameter.
         """
         # Forge needs a pytorch array for now
         # TODO(jchu): modify these two lines when we deprecate the old path
@@ -205,6 +349,8 @@ class Adam(Optimizer):
         weight decay (L2 penalty) (default: 0)
     bias_correction: (bool, optional)
         use bias correction
+    multi_tensor: (bool, optional)
+        update all parameters of the same data format by one set of ops (default: False)
     """
 
     def __init__(
@@ -217,8 +363,9 @@ class Adam(Optimizer):
         bias_correction: bool = True,
         parameters: Optional[List[Parameter]] = None,
         enable_adam_w: bool = False,
+        multi_tensor: bool = False,
     ):
-        super().__init__(parameters)
+        super().__init__(parameters, multi_tensor)
         # optimizer constants
         self.beta1 = beta1
         self.beta2 = beta2
@@ -236,14 +383,14 @@ class Adam(Optimizer):
             self.set_parameters_to_optimize(parameters)
 
     def get_cpu_param_dict(self, dtype: torch.dtype, shape: Tuple[int]) -> Dict:
-        # TODO: shapes are set to the shape of the parameter because of the following issue
-        # https://github.com/tenstorrent/tt-metal/issues/16352
+        # TODO: scalar state is kept in (1,) tensors and broadcast explicitly in the optimizer graph because of
+        # https://github.com/tenstorrent/tt-metal/issues/16352 - see `broadcast_scalar`
         if self.bias_correction:
             return {
                 "torch_mean": torch.full(shape, 0.0, dtype=dtype),
                 "torch_variance": torch.full(shape, 0.0, dtype=dtype),
-                "torch_beta1_pow": torch.full(shape, 1.0, dtype=dtype),
-                "torch_beta2_pow": torch.full(shape, 1.0, dtype=dtype),
+                "torch_beta1_pow": torch.full((1,), 1.0, dtype=dtype),
+                "torch_beta2_pow": torch.full((1,), 1.0, dtype=dtype),
             }
         else:
             return {
@@ -253,20 +400,21 @@ class Adam(Optimizer):
 
     def get_param_dict(self, dtype: torch.dtype, shape: Tuple[int]) -> Dict:
         """
-        Return a dict of optimizer parameter names to tensor
+        Return a dict of optimizer parameter names to tensor. Moments have the shape of the parameter, learning rate and
+        bias correction powers are scalars, broadcast in the optimizer graph.
         """
         torch_lr = torch.full((1,), self.learning_rate, dtype=dtype)
         if self.bias_correction:
             return {
-                "lr": Tensor.create_from_torch(torch.full(shape, self.learning_rate, dtype=dtype)),
+                "lr": Tensor.create_from_torch(torch_lr),
                 "mean": Tensor.create_from_torch(torch.full(shape, 0.0, dtype=dtype)),
                 "variance": Tensor.create_from_torch(torch.full(shape, 0.0, dtype=dtype)),
-                "beta1_pow": Tensor.create_from_torch(torch.full(shape, 1.0, dtype=dtype)),
-                "beta2_pow": Tensor.create_from_torch(torch.full(shape, 1.0, dtype=dtype)),
+                "beta1_pow": Tensor.create_from_torch(torch.full((1,), 1.0, dtype=dtype)),
+                "beta2_pow": Tensor.create_from_torch(torch.full((1,), 1.0, dtype=dtype)),
             }
         else:
             return {
-                "lr": Tensor.create_from_torch(torch.full(shape, self.learning_rate, dtype=dtype)),
+                "lr": Tensor.create_from_torch(torch_lr),
                 "mean": Tensor.create_from_torch(torch.full(shape, 0.0, dtype=dtype)),
                 "variance": Tensor.create_from_torch(torch.full(shape, 0.0, dtype=dtype)),
             }
@@ -281,12 +429,14 @@ class Adam(Optimizer):
         return "adam"
 
     def set_parameters_to_optimize(self, parameters: List[Parameter]):
-        # For each Parameter, we register its associated set of optimizer parameters
+        # For each Parameter, we register its associated set of optimizer parameters. In the multi-tensor mode, they
+        # are registered per group, when the optimizer graph is generated.
         for parameter in parameters:
             if parameter.requires_grad:
-                self.parameter_to_opt_inputs[parameter.get_name()] = self.get_param_dict(
-                    parameter.pt_data_format, parameter.shape.get_pytorch_shape()
-                )
+                if not self.multi_tensor:
+                    self.parameter_to_opt_inputs[parameter.get_name()] = self.get_param_dict(
+                        parameter.pt_data_format, parameter.shape.get_pytorch_shape()
+                    )
                 self.parameter_to_opt_torch_inputs[parameter.get_name()] = self.get_cpu_param_dict(
                     parameter.pt_data_format, parameter.shape.get_pytorch_shape()
                 )
@@ -317,7 +467,7 @@ class Adam(Optimizer):
 
         # {mean, variance} get updated in the loopback
         for parameter, opt_inputs in self.parameter_to_opt_inputs.items():
-            torch_lr = torch.full(parameter.shape.as_list(), self.learning_rate, dtype=opt_inputs["lr"].pt_data_format)
+            torch_lr = torch.full((1,), self.learning_rate, dtype=opt_inputs["lr"].pt_data_format)
             opt_inputs["lr"] = Tensor.create_from_torch(torch_lr)
 
     def generate_op_trace(self, ac, parameter, gradient):
@@ -333,7 +483,8 @@ class Adam(Optimizer):
             gradient = ac.op("add", (gradient, weight_decay_times_param))
 
         # self.mean = self.beta1 * self.mean + one_minus_beta1 * gradient
-        mean = ac.input("mean", parameter.shape, copy_consteval_operations=True)
+        # Flat state of a multi-tensor group doesn't have the layout of a single parameter
+        mean = ac.input("mean", parameter.shape, copy_consteval_operations=not self.multi_tensor)
         beta1 = ac.tensor(torch.full(parameter_shape, self.beta1))
         one_minus_beta1 = ac.tensor(torch.full(parameter_shape, 1 - self.beta1))
         mean_times_beta1 = ac.op("multiply", (mean, beta1))
@@ -341,7 +492,7 @@ class Adam(Optimizer):
         updated_mean = ac.op("add", (mean_times_beta1, gradient_times_one_minus_beta1))
 
         # self.variance = self.beta2 * self.variance + one_minus_beta2 * gradient**2
-        variance = ac.input("variance", parameter.shape, copy_consteval_operations=True)
+        variance = ac.input("variance", parameter.shape, copy_consteval_operations=not self.multi_tensor)
         beta2 = ac.tensor(torch.full(parameter_shape, self.beta2))
         one_minus_beta2 = ac.tensor(torch.full(parameter_shape, 1 - self.beta2))
         variance_times_beta2 = ac.op("multiply", (variance, beta2))
@@ -354,20 +505,25 @@ class Adam(Optimizer):
         from forge.op.eval.forge.sqrt import Sqrt
 
         if self.bias_correction:
+            # Bias corrections are computed on scalars, and broadcast to the shape of the parameter
+            one = ac.tensor(torch.full((1,), 1.0))
+
             # bias_correction1 = 1 - beta1 ** step
-            beta1_one = ac.tensor(torch.full(parameter_shape, 1.0))
-            beta1_pow = ac.input("beta1_pow", parameter.shape, disable_consteval=True)  # stores beta1 ** step
-            updated_beta1_pow = ac.op("multiply", (beta1_pow, beta1))
-            bias_correction1 = ac.op("subtract", (beta1_one, updated_beta1_pow))
-            reciprocal_bias_correction1 = ac.op(Reciprocal.create(), (bias_correction1,))
+            beta1_pow = ac.input("beta1_pow", (1,), disable_consteval=True)  # stores beta1 ** step
+            updated_beta1_pow = ac.op("multiply", (beta1_pow, ac.tensor(torch.full((1,), self.beta1))))
+            bias_correction1 = ac.op("subtract", (one, updated_beta1_pow))
+            reciprocal_bias_correction1 = broadcast_scalar(
+                ac, ac.op(Reciprocal.create(), (bias_correction1,)), parameter_shape
+            )
 
             # bias_correction2 = 1 - beta2 ** step
-            beta2_one = ac.tensor(torch.full(parameter_shape, 1.0))
-            beta2_pow = ac.input("beta2_pow", parameter.shape, disable_consteval=True)  # stores beta2 ** step
-            updated_beta2_pow = ac.op("multiply", (beta2_pow, beta2))
-            bias_correction2 = ac.op("subtract", (beta2_one, updated_beta2_pow))
+            beta2_pow = ac.input("beta2_pow", (1,), disable_consteval=True)  # stores beta2 ** step
+            updated_beta2_pow = ac.op("multiply", (beta2_pow, ac.tensor(torch.full((1,), self.beta2))))
+            bias_correction2 = ac.op("subtract", (one, updated_beta2_pow))
             sqrt_bias_correction2 = ac.op(Sqrt.create(), (bias_correction2,))
-            reciprocal_sqrt_bias_correction2 = ac.op(Reciprocal.create(), (sqrt_bias_correction2,))
+            reciprocal_sqrt_bias_correction2 = broadcast_scalar(
+                ac, ac.op(Reciprocal.create(), (sqrt_bias_correction2,)), parameter_shape
+            )
 
             # sqrt_of_variance / sqrt_bias_correction2
             sqrt_of_variance_biased = ac.op(Sqrt.create(), (updated_variance,))
@@ -401,7 +557,7 @@ class Adam(Optimizer):
                 mean_times_reciprocal_of_sqrt_of_variance_plus_epsilon
             )
 
-        lr = ac.input("lr", parameter.shape)
+        lr = broadcast_scalar(ac, ac.input("lr", (1,)), parameter_shape)
         parameter_delta = ac.op(
             "multiply", (mean_times_reciprocal_of_sqrt_of_variance_plus_epsilon_plus_weight_decay_times_param, lr)
         )
@@ -496,6 +652,7 @@ class AdamW(Adam):
         weight_decay: float = 0.01,
         bias_correction: bool = True,
         parameters: Optional[List[Parameter]] = None,
+        multi_tensor: bool = False,
     ):
         super().__init__(
             learning_rate,
@@ -506,6 +663,7 @@ class AdamW(Adam):
             bias_correction,
             parameters,
             enable_adam_w=True,
+            multi_tensor=multi_tensor,
         )
 
 
@@ -520,8 +678,9 @@ class LAMB(Optimizer):
         correction: bool = False,
         clip_value=(0.0, 10.0),
         parameters: Optional[List[Parameter]] = None,
+        multi_tensor: bool = False,
     ):
-        super().__init__(parameters)
+        super().__init__(parameters, multi_tensor)
 
         # LAMB Optimizer Constants
         assert learning_rate >= 0.0, f"Invalid learning rate value: {learning_rate}"
@@ -552,9 +711,10 @@ class LAMB(Optimizer):
         for parameter in parameters:
             if parameter.requires_grad:
                 # Forge
-                self.parameter_to_opt_inputs[parameter.get_name()] = self.get_param_dict(
-                    parameter.pt_data_format, parameter.shape.get_pytorch_shape()
-                )
+                if not self.multi_tensor:
+                    self.parameter_to_opt_inputs[parameter.get_name()] = self.get_param_dict(
+                        parameter.pt_data_format, parameter.shape.get_pytorch_shape()
+                    )
                 # PyTorch
                 self.parameter_to_opt_torch_inputs[parameter.get_name()] = self.get_cpu_param_dict(
                     parameter.pt_data_format, parameter.shape.get_pytorch_shape()
@@ -599,7 +759,8 @@ class LAMB(Optimizer):
         }
 
     def get_param_dict(self, dtype: torch.dtype, shape: Tuple[int]) -> Dict:
-
+        # TODO: learning rate is kept in a (1,) tensor and broadcast explicitly in the optimizer graph because of
+        # https://github.com/tenstorrent/tt-metal/issues/16352 - see `broadcast_scalar`
         torch_lr = torch.full((1,), self.learning_rate, dtype=dtype)
         return {
             "lr": Tensor.create_from_torch(torch_lr),
@@ -611,6 +772,23 @@ class LAMB(Optimizer):
         return "lamb"
 
     def generate_op_trace(self, ac, parameter, gradient):
+        r_t = self.generate_adam_ratio_op_trace(ac, parameter, gradient)
+        learning_rate = ac.input("lr", (1,))
+        return self.generate_trust_ratio_op_trace(ac, parameter, r_t, learning_rate)
+
+    def generate_multi_tensor_op_trace(self, ac, parameters, gradients):
+        # Adam ratio is elementwise and is computed for the whole group, the trust ratio is computed from the norms of
+        # every parameter
+        self.add_multi_tensor_group(parameters)
+        r_t = self.generate_adam_ratio_op_trace(ac, flatten_tensors(ac, parameters), flatten_tensors(ac, gradients))
+        r_ts = unflatten_tensor(ac, r_t, [parameter.shape.as_list() for parameter in parameters])
+        learning_rate = ac.input("lr", (1,))
+        return [
+            self.generate_trust_ratio_op_trace(ac, parameter, parameter_r_t, learning_rate)
+            for parameter, parameter_r_t in zip(parameters, r_ts)
+        ]
+
+    def generate_adam_ratio_op_trace(self, ac, parameter, gradient):
 
         # get parameter shape
         param_shape = parameter.shape.as_list()
@@ -656,18 +834,9 @@ class LAMB(Optimizer):
             variance_hat = None
         """
 
-        # L2 normaliztion of weights
-        phi_norm = ac.op("multiply", (parameter, parameter))
-        phi_norm_shape = phi_norm.shape.as_list()
-        if len(phi_norm_shape) > 1:
-            phi_norm = ac.op("reduce_sum", (phi_norm,), (-2,))
-        phi_norm = ac.op("reduce_sum", (phi_norm,), (-1,))
-
         # importing locally to avoid circular dependency from Dataformats
         from forge.op.eval.forge.sqrt import Sqrt
 
-        phi_norm = ac.op(Sqrt.create(), (phi_norm,))
-
         epsilon = ac.tensor(torch.zeros(param_shape) + self.eps)
         weight_decay = ac.tensor(torch.zeros(param_shape) + self.weight_decay)
 
@@ -682,6 +851,30 @@ class LAMB(Optimizer):
             decayed_param = ac.op("multiply", (parameter, weight_decay))
             r_t = ac.op("add", (r_t, decayed_param))
 
+        # Update mean and variance
+        ac.loopback(updated_mean, mean)
+        ac.loopback(updated_variance, variance)
+
+        return r_t
+
+    def generate_trust_ratio_op_trace(self, ac, parameter, r_t, learning_rate):
+
+        # get parameter shape
+        param_shape = parameter.shape.as_list()
+
+        # L2 normaliztion of weights
+        phi_norm = ac.op("multiply", (parameter, parameter))
+        phi_norm_shape = phi_norm.shape.as_list()
+        if len(phi_norm_shape) > 1:
+            phi_norm = ac.op("reduce_sum", (phi_norm,), (-2,))
+        phi_norm = ac.op("reduce_sum", (phi_norm,), (-1,))
+
+        # importing locally to avoid circular dependency from Dataformats
+        from forge.op.eval.forge.reciprocal import Reciprocal
+        from forge.op.eval.forge.sqrt import Sqrt
+
+        phi_norm = ac.op(Sqrt.create(), (phi_norm,))
+
         r_t_norm = ac.op("multiply", (r_t, r_t))
         r_t_norm_shape = r_t_norm.shape.as_list()
         if len(r_t_norm_shape) > 1:
@@ -727,15 +920,11 @@ class LAMB(Optimizer):
         trust_ratio = ac.op("add", (trust_ratio, phi_norm_eq))
 
         # w(t) = w(t - 1) - learning_rate * adam_ratio * trust_ratio
-        learning_rate = ac.tensor(torch.zeros(param_shape) + self.learning_rate)
+        learning_rate = broadcast_scalar(ac, learning_rate, param_shape)
         updated_parameter = ac.op("multiply", (trust_ratio, r_t))
         updated_parameter = ac.op("multiply", (updated_parameter, learning_rate))
         updated_parameter = ac.op("subtract", (parameter, updated_parameter))
 
-        # Update mean and variance
-        ac.loopback(updated_mean, mean)
-        ac.loopback(updated_variance, variance)
-
         return updated_parameter
 
     def torch_parameter_update(
@@ -881,6 +1070,8 @@ class LARS(Optimizer):
         }
 
     def get_param_dict(self, dtype: torch.dtype, shape: Tuple[int]) -> Dict:
+        # TODO: learning rate is kept in a (1,) tensor and broadcast explicitly in the optimizer graph because of
+        # https://github.com/tenstorrent/tt-metal/issues/16352 - see `broadcast_scalar`
         torch_lr = torch.full((1,), self.learning_rate, dtype=dtype)
         return {
             "lr": Tensor.create_from_torch(torch_lr),
@@ -994,7 +1185,7 @@ class LARS(Optimizer):
         momentum = ac.input("momentum", parameter.shape)
         momentum_ = ac.tensor(torch.zeros(param_shape) + self.momentum)
         current_momentum = ac.op("multiply", (momentum, momentum_))
-        learning_rate = ac.tensor(torch.zeros(param_shape) + self.learning_rate)
+        learning_rate = broadcast_scalar(ac, ac.input("lr", (1,)), param_shape)
         updated_momentum = ac.op(
             "add",
             (ac.op("multiply", (learning_rate, ac.op("multiply", (local_learning_rate, grad)))), current_momentum),
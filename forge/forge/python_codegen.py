@@ -1,6 +1,7 @@
 # SPDX-FileCopyrightText: © 2024 Tenstorrent AI ULC
 
 # SPDX-License-Identifier: Apache-2.0
+import io
 import os
 
 import torch
@@ -91,13 +92,22 @@ def pytorch_df_from_str(df: Union[str, torch.dtype], name: str, return_as_str: b
 
 
 class PythonWriter:
-    def __init__(self, module_name, module_directory="generated_modules", open_file=True):
+    def __init__(self, module_name, module_directory="generated_modules", open_file=True, in_memory=False):
         self.filename = module_name + ".py"
 
         self.module_directory = module_directory
-        os.makedirs(self.module_directory, exist_ok=True)
+        # In-memory writers keep the generated source (and serialized params) in memory instead of writing them to
+        # module_directory, the module is then created directly from the source, see `tvm_to_python.load_generated_module`
+        self.in_memory = in_memory
+        self.source = None
+        self.serialized_params = None
+        if not in_memory:
+            os.makedirs(self.module_directory, exist_ok=True)
         if open_file:
-            self.file = open(os.path.join(self.module_directory, self.filename), "w")
+            if in_memory:
+                self.file = io.StringIO()
+            else:
+                self.file = open(os.path.join(self.module_directory, self.filename), "w")
         self.indent = 0
         self.module_name = module_name
         self.class_name = module_name.title().replace("_", "")
@@ -110,8 +120,17 @@ class PythonWriter:
         self.wl("import pdb; pdb.set_trace()")
 
     def close_file(self):
+        if self.in_memory:
+            self.source = self.file.getvalue()
         self.file.close()
 
+    def write_serialized_params_load(self, param_file_name):
+        if self.in_memory:
+            # Set as a module global when the module is created
+            self.wl("serialized_params = SERIALIZED_PARAMS")
+        else:
+            self.wl(f'serialized_params = torch.load("{param_file_name}")')
+
     def import_module_path(self):
         return self.module_directory + f".{self.module_name}"
 
@@ -128,8 +147,9 @@ class ForgeWriter(PythonWriter):
         module_directory="generated_modules",
         contains_incompatible_np_floats=False,
         delete_inputs=True,
+        in_memory=False,
     ):
-        super().__init__(module_name, module_directory)
+        super().__init__(module_name, module_directory, in_memory=in_memory)
 
         self.framework = framework
         self.param_names = []
@@ -300,7 +320,7 @@ class ForgeWriter(PythonWriter):
                 self.indent += 1
                 self.wl(f"named_parameters = dict(model.state_dict().items())")
                 if param_file_name is not None:
-                    self.wl(f'serialized_params = torch.load("{param_file_name}")')
+                    self.write_serialized_params_load(param_file_name)
                     self.wl(f"named_parameters.update(serialized_params)")
                 self.wl("named_buffers = dict(model.named_buffers())")
                 self.wl("named_parameters.update(named_buffers)")
@@ -312,7 +332,7 @@ class ForgeWriter(PythonWriter):
                 self.indent += 1
                 self.wl(f"named_parameters = torch.load('{named_params_file_name}')")
                 if param_file_name is not None:
-                    self.wl(f'serialized_params = torch.load("{param_file_name}")')
+                    self.write_serialized_params_load(param_file_name)
                     self.wl(f"named_parameters.update(serialized_params)")
                 self.wl(f"named_buffers = torch.load('{named_buffers_file_name}')")
                 self.wl("named_parameters.update(named_buffers)")
@@ -497,7 +517,7 @@ class ForgeWriter(PythonWriter):
             self.indent -= 1
 
             if param_file_name is not None:
-                self.wl(f'serialized_params = torch.load("{param_file_name}")')
+                self.write_serialized_params_load(param_file_name)
                 self.wl(f"for name, torch_param in serialized_params.items():")
                 self.indent += 1
                 self.wl("tensor = torch_param.data")
@@ -560,7 +580,7 @@ class ForgeWriter(PythonWriter):
             self.indent -= 1
             self.wl("}")
 
-            self.wl(f'serialized_params = torch.load("{param_file_name}")')
+            self.write_serialized_params_load(param_file_name)
             self.wl(f"for name, torch_param in serialized_params.items():")
             self.indent += 1
             self.wl("tensor = torch_param.data")
@@ -688,7 +708,7 @@ class ForgeWriter(PythonWriter):
             self.indent -= 1
             self.indent -= 1
             if param_file_name is not None:
-                self.wl(f'serialized_params = torch.load("{param_file_name}")')
+                self.write_serialized_params_load(param_file_name)
                 self.wl(f"for name, torch_param in serialized_params.items():")
                 self.indent += 1
                 self.wl("tensor = torch_param.data")
@@ -776,7 +796,7 @@ class ForgeWriter(PythonWriter):
             self.indent -= 1
             self.indent -= 1
             if param_file_name is not None:
-                self.wl(f'serialized_params = torch.load("{param_file_name}")')
+                self.write_serialized_params_load(param_file_name)
                 self.wl(f"for key, val in serialized_params.items():")
                 self.indent += 1
                 self.wl(f"model_params[key] = jnp.array(val.data.numpy())")
@@ -817,7 +837,7 @@ class ForgeWriter(PythonWriter):
             self.indent -= 1
             self.wl("}")
 
-            self.wl(f'serialized_params = torch.load("{param_file_name}")')
+            self.write_serialized_params_load(param_file_name)
             self.wl(f"for name, torch_param in serialized_params.items():")
             self.indent += 1
             self.wl("tensor = torch_param.data")
@@ -1053,8 +1073,8 @@ class PyTorchWriter(PythonWriter):
         tf.bfloat16,
     ]
 
-    def __init__(self, module_name, source_framework):
-        super().__init__(module_name)
+    def __init__(self, module_name, source_framework, in_memory=False):
+        super().__init__(module_name, in_memory=in_memory)
 
         self.framework = source_framework
         self.param_names = []
@@ -1321,7 +1341,7 @@ class PyTorchWriter(PythonWriter):
             self.indent -= 1
             self.wl("named_buffers = dict(model.named_buffers())")
             if param_file_name is not None:
-                self.wl(f'serialized_params = torch.load("{param_file_name}")')
+                self.write_serialized_params_load(param_file_name)
                 self.wl("named_buffers.update(serialized_params)")
 
             self.wl("self.load_state_dict(named_buffers, strict=False)")
@@ -1358,7 +1378,7 @@ class PyTorchWriter(PythonWriter):
 
             if param_file_name is not None:
                 self.wl("named_parameters.update(named_buffers)")
-                self.wl(f'serialized_params = torch.load("{param_file_name}")')
+                self.write_serialized_params_load(param_file_name)
                 self.wl("named_parameters.update(serialized_params)")
 
             self.wl("self.load_state_dict(named_parameters, strict=False)")
@@ -1375,7 +1395,7 @@ class PyTorchWriter(PythonWriter):
             self.wl("named_parameters[name] = value\n")
             self.indent -= 1
             if param_file_name is not None:
-                self.wl(f'serialized_params = torch.load("{param_file_name}")')
+                self.write_serialized_params_load(param_file_name)
                 self.wl("serialized_params_cleaned = {}")
                 self.wl(f"for key, value in serialized_params.items():")
                 self.indent += 1
@@ -1423,7 +1443,7 @@ class PyTorchWriter(PythonWriter):
             self.indent -= 1
             self.wl("named_parameters = {}")
             if param_file_name is not None:
-                self.wl(f'serialized_params = torch.load("{param_file_name}")')
+                self.write_serialized_params_load(param_file_name)
                 self.wl(f"for key, val in serialized_params.items():")
                 self.indent += 1
                 self.wl(f"named_parameters[key] = val")
@@ -1445,7 +1465,7 @@ class PyTorchWriter(PythonWriter):
             self.indent += 1
             self.wl("named_parameters = {}")
             if param_file_name is not None:
-                self.wl(f'serialized_params = torch.load("{param_file_name}")')
+                self.write_serialized_params_load(param_file_name)
                 self.wl("serialized_params_cleaned = {}")
                 self.wl(f"for key, value in serialized_params.items():")
                 self.indent += 1
@@ -1460,7 +1480,7 @@ class PyTorchWriter(PythonWriter):
             self.indent += 1
             self.wl("named_parameters = {}")
             if param_file_name is not None:
-                self.wl(f'serialized_params = torch.load("{param_file_name}")')
+                self.write_serialized_params_load(param_file_name)
                 self.wl("serialized_params_cleaned = {}")
                 self.wl(f"for key, value in serialized_params.items():")
                 self.indent += 1
@@ -5,18 +5,16 @@
 from typing import Union, Tuple, List, Optional, Dict, TypeAlias
 from forge.tvm_utils import map_pt_dtype_to_pd, map_tf_dtype_to_pt, map_pd_dtype_to_pt
 
-import paddle
 import torch
-import tensorflow as tf
 import numpy as np
 from loguru import logger
 import copy
-import jax
-import jax.numpy as jnp
+import hashlib
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 import json
 
-import keras
-
 from .forgeglobal import TILE_DIM, align_up_tile, round_up_div
 from forge._C import DataFormat
 from forge._C.graph import OpType, RuntimeTensorTransform, RuntimeTensorTransformType, get_constant_input_value
@@ -24,9 +22,17 @@ from forge.utils import detach_tensors
 from .utils import align_up
 
 from forge.tvm_utils import map_tf_dtype_to_pt, map_pt_dtype_to_tf
+from forge.lazy_import import lazy_import, is_imported
 
 import forge
 
+# Frontend frameworks are imported on first use, see forge.lazy_import
+tf = lazy_import("tensorflow")
+paddle = lazy_import("paddle")
+jax = lazy_import("jax")
+jnp = lazy_import("jax.numpy")
+keras = lazy_import("keras")
+
 SomeTensor = Union[torch.Tensor, "Tensor", np.ndarray]
 
 
@@ -170,10 +176,10 @@ class Tensor(TensorBase):
     def to_pytorch(self) -> torch.Tensor:
         return to_pt_tensors(self.value())[0]
 
-    def to_tensorflow(self) -> tf.Tensor:
+    def to_tensorflow(self) -> "tf.Tensor":
         return to_tf_tensors(self.value())[0]
 
-    def to_jax(self) -> jnp.ndarray:
+    def to_jax(self) -> "jnp.ndarray":
         return to_jax_tensors(self.value())[0]
 
     def to_framework(self, framework: str) -> "Tensor":
@@ -404,10 +410,12 @@ class TensorFromTrace(Tensor):
         self.src_op = src_op
         self.requires_grad = False
         self._value = None
+        # Set if the value is evaluated lazily from the source op, see `set_lazy_value`
+        self._lazy_pt_dtype: Optional[torch.dtype] = None
         self._data_format = data_format
 
     def has_value(self) -> bool:
-        return self._value is not None
+        return self._value is not None or self._lazy_pt_dtype is not None
 
     def set_value(self, value: torch.Tensor):
         assert (
@@ -416,6 +424,12 @@ class TensorFromTrace(Tensor):
 
         self._value = value
 
+    def set_lazy_value(self, pt_dtype: torch.dtype):
+        """
+        Value of the tensor (of the given dtype) will be evaluated from the source op on the first access.
+        """
+        self._lazy_pt_dtype = pt_dtype
+
     @property
     def shape(self):
         return self.tensor_shape
@@ -425,6 +439,10 @@ class TensorFromTrace(Tensor):
         if self._value is not None:
             return self._value
 
+        if self._lazy_pt_dtype is not None:
+            evaluate_lazy_values([self])
+            return self._value
+
         raise RuntimeError("Trying to get Tensor value where there isn't one")
 
     def clone(self) -> "TensorFromTrace":
@@ -432,8 +450,10 @@ class TensorFromTrace(Tensor):
             self.src_op, self.tensor_shape.get_pytorch_shape(), self._data_format
         )
         t.requires_grad = self.requires_grad
-        if self._value:
+        if self._value is not None:
             t.set_value(self._value.clone())
+        elif self._lazy_pt_dtype is not None:
+            t.set_lazy_value(self._lazy_pt_dtype)
         return t
 
     @property
@@ -441,6 +461,9 @@ class TensorFromTrace(Tensor):
         if self._value is not None:
             return self._value.dtype
 
+        if self._lazy_pt_dtype is not None:
+            return self._lazy_pt_dtype
+
         raise RuntimeError("Trying to get Tensor value where there isn't one")
 
     @property
@@ -487,10 +510,84 @@ class TensorFromTrace(Tensor):
         return super().to_framework(framework)
 
 
-FrameworkTensor: TypeAlias = (
-    torch.Tensor | tf.Tensor | tf.Variable | paddle.Tensor | jax.Array | (keras.src.backend.Variable)
-)
-AnyTensor: TypeAlias = FrameworkTensor | Tensor
+def evaluate_lazy_values(tensors: List[Tensor]):
+    """
+    Evaluates values of lazily traced tensors, together with all lazy tensors they depend on, in a single pass in
+    topological order. Every evaluated tensor keeps its value, so subexpressions shared by multiple tensors are
+    evaluated only once, and values of the intermediates are part of the autograd graph of the values computed from
+    them (e.g. for `retain_grad` on golden intermediates).
+    """
+
+    def is_lazy(t) -> bool:
+        return isinstance(t, TensorFromTrace) and t._value is None and t._lazy_pt_dtype is not None
+
+    # Collect lazy tensors which the values depend on, in topological order
+    order: List[TensorFromTrace] = []
+    stack = [(t, False) for t in tensors if is_lazy(t)]
+    visited = set()
+    while stack:
+        t, operands_visited = stack.pop()
+        if operands_visited:
+            order.append(t)
+            continue
+        if t in visited:
+            continue
+        visited.add(t)
+        stack.append((t, True))
+        for operand in t.src_op.operands:
+            if is_lazy(operand) and operand not in visited:
+                stack.append((operand, False))
+
+    for t in order:
+        operand_values = [
+            operand.value() if isinstance(operand, TensorBase) else operand for operand in t.src_op.operands
+        ]
+        t._value = t.src_op.cpp_op_type.eval(operand_values)
+
+
+FrameworkTensor: TypeAlias = Union[
+    torch.Tensor, "tf.Tensor", "tf.Variable", "paddle.Tensor", "jax.Array", "keras.src.backend.Variable"
+]
+AnyTensor: TypeAlias = Union[FrameworkTensor, Tensor]
+
+
+def is_tf_tensor(t) -> bool:
+    return is_imported(tf) and isinstance(t, (tf.Tensor, tf.Variable))
+
+
+def is_keras_variable(t) -> bool:
+    return is_imported(keras) and isinstance(t, keras.src.backend.Variable)
+
+
+def is_paddle_tensor(t) -> bool:
+    return is_imported(paddle) and isinstance(t, paddle.Tensor)
+
+
+def is_jax_array(t) -> bool:
+    return is_imported(jax) and isinstance(t, jax.Array)
+
+
+def get_framework_tensor_types() -> Tuple[type, ...]:
+    """
+    Returns tensor types of the frameworks which have been imported, for isinstance checks against `FrameworkTensor`.
+    """
+    types = [torch.Tensor]
+    if is_imported(tf):
+        types += [tf.Tensor, tf.Variable]
+    if is_imported(paddle):
+        types.append(paddle.Tensor)
+    if is_imported(jax):
+        types.append(jax.Array)
+    if is_imported(keras):
+        types.append(keras.src.backend.Variable)
+    return tuple(types)
+
+
+def get_any_tensor_types() -> Tuple[type, ...]:
+    """
+    Returns types for isinstance checks against `AnyTensor`.
+    """
+    return get_framework_tensor_types() + (Tensor,)
 
 
 def cast_unsupported_torch_dtype(tensor: torch.Tensor):
@@ -634,7 +731,7 @@ def change_rank(tensor: torch.Tensor, rank: int):
 
 def to_tf_variables(
     tensors: Tuple[Union[torch.Tensor, Tensor], ...], convert_format: bool = False
-) -> Tuple[tf.Variable, ...]:
+) -> Tuple["tf.Variable", ...]:
     """
     Take a tuple of either pytorch, TF or forge tensors, and return TF Variables.
     """
@@ -680,7 +777,7 @@ def to_tf_variables(
 
 def to_tf_tensors(
     tensors: Union[
-        Tuple[Union[torch.Tensor, Tensor, tf.Tensor], ...], Dict[str, Union[torch.Tensor, Tensor, tf.Tensor]]
+        Tuple[Union[torch.Tensor, Tensor, "tf.Tensor"], ...], Dict[str, Union[torch.Tensor, Tensor, "tf.Tensor"]]
     ],
     convert_format: bool = False,
     force_float32: bool = False,
@@ -693,7 +790,7 @@ def to_tf_tensors(
     if not isinstance(tensors, (list, tuple)):
         tensors = (tensors,)
     for t in tensors:
-        if isinstance(t, (tf.Tensor, tf.Variable)):
+        if is_tf_tensor(t):
             assert (
                 not convert_format
             ), "Can't convert format of raw pytorch tensor - don't know what the target format is"
@@ -752,11 +849,11 @@ def to_pt_tensors(tensors: Union[AnyTensor, Tuple[AnyTensor, ...], List[AnyTenso
 
 
 def to_pt_tensor(t: AnyTensor) -> torch.Tensor:
-    if isinstance(t, keras.src.backend.Variable):
+    if is_keras_variable(t):
         t = tf.convert_to_tensor(t)
     if isinstance(t, torch.Tensor):
         return t
-    elif isinstance(t, (tf.Tensor, tf.Variable)):
+    elif is_tf_tensor(t):
         pt = torch.Tensor(t.numpy() if t.dtype != tf.bfloat16 else tf.cast(t, tf.float32).numpy()).type(
             map_tf_dtype_to_pt(t.dtype)
         )
@@ -767,19 +864,19 @@ def to_pt_tensor(t: AnyTensor) -> torch.Tensor:
     elif isinstance(t, Tensor):
         assert t.has_value(), "Expected Forge tensor to have a value"
         return t.value()
-    elif isinstance(t, paddle.Tensor):
+    elif is_paddle_tensor(t):
         pt = torch.Tensor(t.numpy()).type(map_pd_dtype_to_pt(t.dtype))
         pt.requires_grad = t.stop_gradient == False
         return pt
     elif isinstance(t, np.ndarray):
         return torch.from_numpy(t)
-    elif isinstance(t, jax.Array):
+    elif is_jax_array(t):
         return torch.from_numpy(np.array(t))
     else:
         raise RuntimeError(f"Unknown type of tensor: {type(t)}")
 
 
-def to_pd_tensors(tensors: Union[AnyTensor, Tuple[AnyTensor, ...], List[AnyTensor]]) -> Tuple[paddle.Tensor, ...]:
+def to_pd_tensors(tensors: Union[AnyTensor, Tuple[AnyTensor, ...], List[AnyTensor]]) -> Tuple["paddle.Tensor", ...]:
     paddle_tensors = []
 
     if not isinstance(tensors, (list, tuple)):
@@ -791,8 +888,8 @@ def to_pd_tensors(tensors: Union[AnyTensor, Tuple[AnyTensor, ...], List[AnyTenso
     return tuple(paddle_tensors)
 
 
-def to_pd_tensor(pt: torch.Tensor) -> paddle.Tensor:
-    if isinstance(pt, paddle.Tensor):
+def to_pd_tensor(pt: torch.Tensor) -> "paddle.Tensor":
+    if is_paddle_tensor(pt):
         return pt
     elif isinstance(pt, torch.Tensor):
         pd = paddle.to_tensor(pt.detach().numpy(), dtype=map_pt_dtype_to_pd(pt.dtype))
@@ -804,7 +901,7 @@ def to_pd_tensor(pt: torch.Tensor) -> paddle.Tensor:
 
 def to_jax_tensors(
     tensors: Union[
-        Tuple[Union[torch.Tensor, Tensor, tf.Tensor], ...], Dict[str, Union[torch.Tensor, Tensor, tf.Tensor]]
+        Tuple[Union[torch.Tensor, Tensor, "tf.Tensor"], ...], Dict[str, Union[torch.Tensor, Tensor, "tf.Tensor"]]
     ],
     convert_format: bool = False,
 ) -> Tuple[torch.Tensor, ...]:
@@ -822,7 +919,7 @@ def to_jax_tensors(
                 not convert_format
             ), "Can't convert format of raw pytorch tensor - don't know what the target format is"
             jax_tensors.append(jnp.asarray(t.detach().numpy()))
-        elif isinstance(t, (tf.Tensor, tf.Variable)):
+        elif is_tf_tensor(t):
             jax_tensor = jnp.asarray(t.numpy())
             jax_tensors.append(jax_tensor)
         elif isinstance(t, Tensor):
@@ -843,7 +940,7 @@ def to_jax_tensors(
 
         elif isinstance(t, np.ndarray):
             jax_tensors.append(jnp.asarray(t))
-        elif isinstance(t, jax.Array):
+        elif is_jax_array(t):
             jax_tensors.append(t)
         else:
             raise RuntimeError(f"Unknown type of tensor: {type(t)}")
@@ -862,7 +959,7 @@ def to_forge_tensors(tensors: Tuple[Union[torch.Tensor, Tensor], ...]) -> Tuple[
             forge_tensors.append(Tensor.create_from_torch(t))
         elif isinstance(t, Tensor):
             forge_tensors.append(t)
-        elif isinstance(t, (tf.Tensor, tf.Variable)):
+        elif is_tf_tensor(t):
             pt = torch.Tensor(t.numpy()).type(map_tf_dtype_to_pt(t.dtype))
             pt.requires_grad = (
                 t.trainable if isinstance(t, tf.Variable) else torch.is_complex(pt) or torch.is_floating_point(pt)
@@ -887,7 +984,7 @@ def remove_microbatch(tensors: Tuple[Union[torch.Tensor, Tensor], ...]) -> Tuple
     for input in tensors:
         if isinstance(input, torch.Tensor):
             out.append(Tensor.create_from_torch(torch.narrow(input.clone(), 0, 0, 1)))
-        elif isinstance(input, (tf.Variable, tf.Tensor)):
+        elif is_tf_tensor(input):
             torch_tensor = torch.Tensor(input.numpy()).type(map_tf_dtype_to_pt(input.dtype))
             out.append(Tensor.create_from_torch(torch.narrow(torch_tensor, 0, 0, 1)))
         elif isinstance(input, (list, tuple)):
@@ -928,7 +1025,61 @@ def get_constant_inputs(
     return values
 
 
-def consteval_tensor(consteval_trace, name: str, inputs: Dict[str, torch.Tensor]) -> torch.Tensor:
+def get_consteval_node_keys(consteval_graph) -> Dict[str, str]:
+    """
+    Returns structural key for each node of the consteval graph. Two nodes have the same key if they compute
+    the same ops (with the same input tms) on the same inputs, so the key identifies the value of the node
+    across consteval graphs of different inputs.
+    """
+    node_keys: Dict[str, str] = {}
+    for node_name in consteval_graph["topological_sorted_nodes"]:
+        node = consteval_graph["nodes"][node_name]
+        if node["opcode"] == "Input":
+            node_keys[node_name] = f"Input:{node_name}"
+        elif node["opcode"] in {"ForgeOp"}:
+            signature = json.dumps(
+                [node["op_type"], node.get("input_tms", None), [node_keys[operand] for operand in node["input_nodes"]]],
+                sort_keys=True,
+            )
+            node_keys[node_name] = hashlib.sha256(signature.encode("utf-8")).hexdigest()
+        elif node["opcode"] == "Output":
+            node_keys[node_name] = node_keys[node["input_nodes"][0]]
+    return node_keys
+
+
+class ConstEvalSharedTensors:
+    """
+    Intermediate consteval results which are shared between the consteval graphs of multiple inputs, so that
+    they are evaluated only once. Safe to use from multiple threads - in the worst case a shared node is
+    evaluated more than once.
+    """
+
+    def __init__(self, consteval_trace, input_names: List[str]):
+        self.node_keys: Dict[str, Dict[str, str]] = {}
+        key_counts: Dict[str, int] = {}
+        for input_name in input_names:
+            consteval_graph = consteval_trace.get(input_name, None)
+            if consteval_graph is None:
+                continue
+            node_keys = get_consteval_node_keys(consteval_graph)
+            self.node_keys[input_name] = node_keys
+            for node_name, key in node_keys.items():
+                if consteval_graph["nodes"][node_name]["opcode"] in {"ForgeOp"}:
+                    key_counts[key] = key_counts.get(key, 0) + 1
+
+        self.shared_keys = {key for key, count in key_counts.items() if count > 1}
+        self.tensors: Dict[str, torch.Tensor] = {}
+
+    def uses_shared_nodes(self, name: str) -> bool:
+        return any(key in self.shared_keys for key in self.node_keys.get(name, {}).values())
+
+
+def consteval_tensor(
+    consteval_trace,
+    name: str,
+    inputs: Dict[str, torch.Tensor],
+    shared_tensors: Optional[ConstEvalSharedTensors] = None,
+) -> torch.Tensor:
     import forge.op.eval.forge as eval_module
 
     consteval_graph = consteval_trace.get(name, None)
@@ -945,12 +1096,20 @@ def consteval_tensor(consteval_trace, name: str, inputs: Dict[str, torch.Tensor]
     output: Optional[torch.Tensor] = None
     tile_r, tile_c = (TILE_DIM, TILE_DIM)
 
+    node_keys = shared_tensors.node_keys[name] if shared_tensors is not None else {}
+
     for node_name in consteval_graph["topological_sorted_nodes"]:
         node = consteval_graph["nodes"][node_name]
         if node["opcode"] == "Input":
             input_value = inputs[node_name]
             node_to_tensor[node_name] = input_value
         elif node["opcode"] in {"ForgeOp"}:
+            node_key = node_keys.get(node_name, None)
+            is_shared = shared_tensors is not None and node_key in shared_tensors.shared_keys
+            if is_shared and node_key in shared_tensors.tensors:
+                node_to_tensor[node_name] = shared_tensors.tensors[node_key]
+                continue
+
             inputs_after_tms: List[torch.Tensor] = []
             for input_index, operand in enumerate(node["input_nodes"]):
                 operand_tensor = node_to_tensor[operand]
@@ -962,6 +1121,9 @@ def consteval_tensor(consteval_trace, name: str, inputs: Dict[str, torch.Tensor]
             output = eval_op(node["op_type"], inputs_after_tms)
             node_to_tensor[node_name] = output
 
+            if is_shared:
+                shared_tensors.tensors[node_key] = output
+
         elif node["opcode"] == "Output":
             output = node_to_tensor[node["input_nodes"][0]]
 
@@ -969,8 +1131,24 @@ def consteval_tensor(consteval_trace, name: str, inputs: Dict[str, torch.Tensor]
     return output
 
 
-def consteval_input(consteval_trace, name: str, inputs: Dict[str, torch.Tensor]) -> torch.Tensor:
-    const_eval_tensor = consteval_tensor(consteval_trace, name, inputs)
+def consteval_input(
+    consteval_trace,
+    name: str,
+    inputs: Dict[str, torch.Tensor],
+    shared_tensors: Optional[ConstEvalSharedTensors] = None,
+) -> torch.Tensor:
+    const_eval_tensor = consteval_tensor(consteval_trace, name, inputs, shared_tensors)
+
+    # Result which is contiguous and doesn't share memory with the inputs (framework weights) or with the results
+    # of other consteval graphs, can be used as is.
+    input_storages = {value.untyped_storage().data_ptr() for value in inputs.values()}
+    if (
+        const_eval_tensor.is_contiguous()
+        and const_eval_tensor.untyped_storage().data_ptr() not in input_storages
+        and (shared_tensors is None or not shared_tensors.uses_shared_nodes(name))
+    ):
+        return const_eval_tensor
+
     # This: "torch.empty(const_eval_tensor.shape).copy_(const_eval_tensor)" will create tensor with contiguous memory layout consistent with its current shape.
     # We are doing this because constant input tensors should have memory layout consistent with their shape.
     # Sometimes, the stride is inconsistent with shape because some consteval operations might change the shape but not the stride.
@@ -983,10 +1161,12 @@ def compare_tensors(t0, t1):
     return torch.equal(t0, t1)
 
 
-def const_eval_tensor(inputs, consteval_trace, input_name):
+def const_eval_tensor(inputs, consteval_trace, input_name, shared_tensors: Optional[ConstEvalSharedTensors] = None):
     contains_recorded_operations = consteval_trace[input_name]
     if contains_recorded_operations:
-        value = detach_tensors([consteval_input(consteval_trace, input_name, inputs)], fix_non_contiguous=True)[0]
+        value = detach_tensors(
+            [consteval_input(consteval_trace, input_name, inputs, shared_tensors)], fix_non_contiguous=True
+        )[0]
     else:
         value = inputs[input_name]
     # cast if necessary
@@ -996,6 +1176,51 @@ def const_eval_tensor(inputs, consteval_trace, input_name):
     return value
 
 
+def get_consteval_num_threads() -> int:
+    return int(os.environ.get("FORGE_CONSTEVAL_NUM_THREADS", min(8, os.cpu_count() or 1)))
+
+
+def get_consteval_cache_dir() -> Optional[str]:
+    """
+    Returns directory of the on-disk cache of post-consteval tensors, None if the cache is disabled.
+    """
+    return os.environ.get("FORGE_CONSTEVAL_CACHE_DIR", None)
+
+
+def get_tensor_hash(tensor: torch.Tensor) -> str:
+    tensor = tensor.detach().contiguous()
+    tensor_hash = hashlib.sha256(f"{tensor.dtype}_{list(tensor.shape)}".encode("utf-8"))
+    tensor_hash.update(tensor.view(-1).view(torch.uint8).numpy().tobytes())
+    return tensor_hash.hexdigest()
+
+
+def get_consteval_cache_key(consteval_trace, input_name: str, inputs: Dict[str, torch.Tensor]) -> str:
+    """
+    Returns key of the post-consteval tensor in the consteval cache - hash of the consteval trace and of its
+    source tensors.
+    """
+    cache_key = hashlib.sha256(json.dumps(consteval_trace[input_name], sort_keys=True).encode("utf-8"))
+    for name in sorted(inputs.keys()):
+        cache_key.update(f"{name}:{get_tensor_hash(inputs[name])}".encode("utf-8"))
+    return cache_key.hexdigest()
+
+
+def load_consteval_cache_entry(cache_dir: str, cache_key: str) -> Optional[torch.Tensor]:
+    cache_path = os.path.join(cache_dir, cache_key + ".pt")
+    if not os.path.exists(cache_path):
+        return None
+    return torch.load(cache_path)
+
+
+def store_consteval_cache_entry(cache_dir: str, cache_key: str, value: torch.Tensor):
+    os.makedirs(cache_dir, exist_ok=True)
+    cache_path = os.path.join(cache_dir, cache_key + ".pt")
+    # Write into a temporary file first, so that concurrent readers never see a partial entry
+    tmp_cache_path = f"{cache_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    torch.save(value, tmp_cache_path)
+    os.replace(tmp_cache_path, cache_path)
+
+
 def get_device_constant_and_parameters(
     device, *, constant_to_tensor=None, updated_parameter_values=None
 ) -> Dict[str, torch.Tensor]:
@@ -1022,11 +1247,19 @@ def get_post_const_eval_tensors(
     consteval_trace,
     ordered_input_names,
 ) -> Dict[str, torch.Tensor]:
-    post_const_eval_constants: Dict[str, torch.Tensor] = {}
+    """
+    Runs consteval of the given graph inputs.
 
+    Consteval graphs of different inputs are independent, so they are evaluated on a thread pool
+    (`FORGE_CONSTEVAL_NUM_THREADS`), while the intermediate results shared between them are evaluated only once.
+    If `FORGE_CONSTEVAL_CACHE_DIR` is set, results are cached on disk, keyed by the consteval trace and the
+    source tensors.
+    """
     constant_nodes = {node.name: node for node in graph.get_constant_nodes(recurse=True)}
+    shared_tensors = ConstEvalSharedTensors(consteval_trace, ordered_input_names)
+    cache_dir = get_consteval_cache_dir()
 
-    for input_name in ordered_input_names:
+    def post_const_eval_tensor(input_name):
         # Load input constant tensors for consteval
         inputs = get_constant_inputs(
             constant_nodes,
@@ -1035,13 +1268,34 @@ def get_post_const_eval_tensors(
             input_name,
         )
 
-        post_const_eval_constants[input_name] = const_eval_tensor(
+        cache_key = None
+        if cache_dir is not None and consteval_trace.get(input_name, None):
+            cache_key = get_consteval_cache_key(consteval_trace, input_name, inputs)
+            value = load_consteval_cache_entry(cache_dir, cache_key)
+            if value is not None:
+                return value
+
+        value = const_eval_tensor(
             inputs,
             consteval_trace,
             input_name,
+            shared_tensors,
         )
 
-    return post_const_eval_constants
+        if cache_key is not None:
+            store_consteval_cache_entry(cache_dir, cache_key, value)
+
+        return value
+
+    num_threads = min(get_consteval_num_threads(), len(shared_tensors.node_keys))
+    if num_threads <= 1:
+        return {input_name: post_const_eval_tensor(input_name) for input_name in ordered_input_names}
+
+    with ThreadPoolExecutor(max_workers=num_threads) as executor:
+        futures = {
+            input_name: executor.submit(post_const_eval_tensor, input_name) for input_name in ordered_input_names
+        }
+        return {input_name: future.result() for input_name, future in futures.items()}
 
 
 def do_runtime_transform(transform, tensor, q, tile_bcast_dims):
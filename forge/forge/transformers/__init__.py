@@ -2,3 +2,4 @@
 
 # SPDX-License-Identifier: Apache-2.0
 from .pipeline import NLPPipelineWrapper, pipeline
+from .generation import GenerationEngine, GenerationResult, SamplingConfig, sample_next_token
@@ -0,0 +1,427 @@
+# SPDX-FileCopyrightText: © 2025 Tenstorrent AI ULC
+
+# SPDX-License-Identifier: Apache-2.0
+"""
+Autoregressive generation of causal language models, with separately compiled prefill and decode programs.
+
+The prefill program runs the prompt (right padded to `max_prompt_length`) and returns the logits and the KV cache. The
+decode program runs one token per sequence against the cache, and returns the logits and the updated cache. Both
+programs work on a KV cache of a fixed length (`max_cache_length`) - the key/value of a new token are written into the
+cache at its position, instead of being appended - so the decode program is compiled once, and the cache outputs of
+each step are passed as the cache inputs of the next step without leaving the device:
+
+    engine = GenerationEngine(model, max_prompt_length=32, max_cache_length=128)
+    engine.compile()
+    result = engine.generate(input_ids, max_new_tokens=64, sampling=SamplingConfig(do_sample=True, top_p=0.9))
+    print(result.tokens, result.time_to_first_token, result.tokens_per_second)
+"""
+
+import time
+from dataclasses import dataclass, field
+from typing import Callable, List, Optional, Sequence, Tuple, Union
+
+import torch
+from loguru import logger
+
+import forge
+from forge.compiled_graph_state import CompiledModel
+from forge.lazy_import import lazy_import
+
+attn_mask_utils = lazy_import("transformers.modeling_attn_mask_utils")
+cache_utils = lazy_import("transformers.cache_utils")
+
+# Called with the tokens generated so far [batch, num_generated], returns the mask of finished sequences [batch]
+StoppingCriteria = Callable[[torch.Tensor], torch.Tensor]
+
+
+def flatten_kv_cache(past_key_values: Sequence[Tuple[torch.Tensor, torch.Tensor]]) -> List[torch.Tensor]:
+    """
+    Flattens the per-layer (key, value) pairs into [key_0, value_0, key_1, value_1, ...].
+    """
+    return [t for key_value in past_key_values for t in key_value]
+
+
+def unflatten_kv_cache(flat_cache: Sequence[torch.Tensor]) -> List[Tuple[torch.Tensor, torch.Tensor]]:
+    """
+    Groups [key_0, value_0, key_1, value_1, ...] into the per-layer (key, value) pairs.
+    """
+    assert len(flat_cache) % 2 == 0, "KV cache should hold a key and a value per layer"
+    return [(flat_cache[idx], flat_cache[idx + 1]) for idx in range(0, len(flat_cache), 2)]
+
+
+def _to_legacy_cache(past_key_values) -> Sequence[Tuple[torch.Tensor, torch.Tensor]]:
+    return past_key_values.to_legacy_cache() if hasattr(past_key_values, "to_legacy_cache") else past_key_values
+
+
+class PrefillWrapper(torch.nn.Module):
+    """
+    Prefill program of a causal LM.
+
+    forward(input_ids [B, P], attention_mask [B, P]) -> [logits [B, P, V], key_0, value_0, ...]
+
+    Prompts are right padded to P. The returned KV cache is padded along the sequence dimension up to
+    `max_cache_length` - key/value shape is [B, num_kv_heads, max_cache_length, head_dim].
+    """
+
+    def __init__(self, model: torch.nn.Module, max_cache_length: int):
+        super().__init__()
+        self.model = model
+        self.max_cache_length = max_cache_length
+
+    def forward(self, input_ids, attention_mask):
+        inputs_embeds = self.model.get_input_embeddings()(input_ids)
+
+        # Causal mask is computed explicitly, since the one computed inside the HF model isn't traced properly (see
+        # LlamaModelWrapper in test/mlir/llama/tests/test_llama_decode.py)
+        causal_attention_mask = attn_mask_utils._prepare_4d_causal_attention_mask(
+            attention_mask, input_ids.shape, inputs_embeds, 0
+        )
+        outputs = self.model(attention_mask=causal_attention_mask, inputs_embeds=inputs_embeds, use_cache=True)
+
+        padding = self.max_cache_length - input_ids.shape[-1]
+        cache = [
+            torch.nn.functional.pad(t, (0, 0, 0, padding))
+            for t in flatten_kv_cache(_to_legacy_cache(outputs.past_key_values))
+        ]
+        return [outputs.logits, *cache]
+
+
+class DecodeWrapper(torch.nn.Module):
+    """
+    Decode program of a causal LM, runs a single token per sequence.
+
+    forward(input_ids [B, 1], attention_mask [B, L + 1], position_ids [B, 1], cache_update_mask [B, 1, L, 1],
+            key_0, value_0, ...) -> [logits [B, 1, V], key_0, value_0, ...]
+
+    `attention_mask` selects the valid cache positions, followed by the new token. Key/value of the new token are
+    written into the cache at the position selected by `cache_update_mask` (one-hot along the sequence dimension), so
+    the returned cache has the same shape as the input cache, L = `max_cache_length`.
+    """
+
+    def __init__(self, model: torch.nn.Module):
+        super().__init__()
+        self.model = model
+
+    def forward(self, input_ids, attention_mask, position_ids, cache_update_mask, *cache):
+        inputs_embeds = self.model.get_input_embeddings()(input_ids)
+        past_key_values = cache_utils.DynamicCache.from_legacy_cache(unflatten_kv_cache(cache))
+
+        causal_attention_mask = attn_mask_utils._prepare_4d_causal_attention_mask(
+            attention_mask, input_ids.shape, inputs_embeds, cache[0].shape[-2]
+        )
+        outputs = self.model(
+            attention_mask=causal_attention_mask,
+            position_ids=position_ids,
+            past_key_values=past_key_values,
+            inputs_embeds=inputs_embeds,
+            use_cache=True,
+        )
+
+        # Model appends the new key/value to the cache, move them to their position instead
+        update_mask = cache_update_mask.to(cache[0].dtype)
+        updated_cache = [
+            past * (1 - update_mask) + present[:, :, -1:, :] * update_mask
+            for past, present in zip(cache, flatten_kv_cache(_to_legacy_cache(outputs.past_key_values)))
+        ]
+        return [outputs.logits, *updated_cache]
+
+
+@dataclass
+class SamplingConfig:
+    """
+    Selection of the next token - greedy (argmax) if `do_sample` is False, otherwise sampled from the distribution
+    restricted to the `top_k` most probable tokens and to the smallest set of tokens whose cumulative probability
+    exceeds `top_p` (0 and 1 disable the respective restriction).
+    """
+
+    do_sample: bool = False
+    temperature: float = 1.0
+    top_k: int = 0
+    top_p: float = 1.0
+    seed: Optional[int] = None
+
+
+def sample_next_token(
+    logits: torch.Tensor, config: SamplingConfig, generator: Optional[torch.Generator] = None
+) -> torch.Tensor:
+    """
+    Selects the next token of each sequence from the logits [batch, vocab_size], returns the token ids [batch].
+    """
+    if not config.do_sample:
+        return torch.argmax(logits, dim=-1)
+
+    assert config.temperature > 0, "Temperature has to be positive, use greedy selection for temperature 0"
+    logits = logits.float() / config.temperature
+
+    if config.top_k > 0:
+        kth_largest = torch.topk(logits, min(config.top_k, logits.shape[-1]), dim=-1).values[:, -1:]
+        logits = logits.masked_fill(logits < kth_largest, float("-inf"))
+
+    if config.top_p < 1.0:
+        sorted_logits, sorted_indices = torch.sort(logits, dim=-1, descending=True)
+        sorted_probs = torch.softmax(sorted_logits, dim=-1)
+        # Token is dropped if the tokens more probable than it already cover top_p, so the most probable one is kept
+        drop = (torch.cumsum(sorted_probs, dim=-1) - sorted_probs) > config.top_p
+        sorted_logits = sorted_logits.masked_fill(drop, float("-inf"))
+        logits = torch.empty_like(logits).scatter_(-1, sorted_indices, sorted_logits)
+
+    probs = torch.softmax(logits, dim=-1)
+    return torch.multinomial(probs, num_samples=1, generator=generator).squeeze(-1)
+
+
+@dataclass
+class GenerationResult:
+    # Generated tokens of each sequence, up to and including the token which stopped the sequence
+    tokens: List[List[int]]
+    # Seconds from the start of generation until the first token (prefill and sampling)
+    time_to_first_token: float
+    # Seconds spent in the decode steps
+    decode_time: float
+    # Number of tokens produced by the decode steps, over all sequences in the batch
+    num_decoded_tokens: int
+    num_decode_steps: int = 0
+    stopped: List[bool] = field(default_factory=list)
+
+    @property
+    def tokens_per_second(self) -> float:
+        """
+        Decode throughput - tokens produced by the decode steps per second, over all sequences in the batch.
+        """
+        return self.num_decoded_tokens / self.decode_time if self.decode_time > 0 else 0.0
+
+
+def compile_with_forge(module: torch.nn.Module, sample_inputs: List[torch.Tensor]) -> CompiledModel:
+    return forge.compile(module, sample_inputs=sample_inputs)
+
+
+class GenerationEngine:
+    """
+    Autoregressive generation with the KV cache resident between the decode steps.
+
+    Parameters
+    ----------
+    model: torch.nn.Module
+        HF causal LM, e.g. LlamaForCausalLM.
+    max_prompt_length: int
+        Length to which the prompts are padded, sequence length of the prefill program.
+    max_cache_length: int
+        Length of the KV cache - the prompt and all generated tokens, except for the last one, have to fit into it.
+    batch_size: int
+        Batch size of the compiled programs.
+    compile_fn: Callable
+        Called with the prefill/decode module and its sample inputs, returns the callable running it -
+        `forge.compile` by default. Any callable following the same input/output convention can be returned, e.g.
+        the module itself to run on CPU.
+    keep_cache_on_device: bool
+        Keep the KV cache outputs of compiled models on the device, and pass them to the next decode step as they are.
+        Otherwise the cache is read back to the host after every step.
+    """
+
+    def __init__(
+        self,
+        model: torch.nn.Module,
+        max_prompt_length: int,
+        max_cache_length: int,
+        batch_size: int = 1,
+        compile_fn: Callable[[torch.nn.Module, List[torch.Tensor]], Callable] = compile_with_forge,
+        keep_cache_on_device: bool = True,
+    ):
+        assert max_cache_length > max_prompt_length, "KV cache has to be longer than the prompt"
+
+        self.model = model
+        self.max_prompt_length = max_prompt_length
+        self.max_cache_length = max_cache_length
+        self.batch_size = batch_size
+        self.compile_fn = compile_fn
+        self.keep_cache_on_device = keep_cache_on_device
+
+        self.prefill_model: Optional[Callable] = None
+        self.decode_model: Optional[Callable] = None
+        self.num_cache_tensors = 0
+        self.cache_dtype = torch.float32
+
+    def compile(self):
+        """
+        Compiles the prefill and the decode programs.
+        """
+        self.model.eval()
+        prefill_module = PrefillWrapper(self.model, self.max_cache_length).eval()
+        decode_module = DecodeWrapper(self.model).eval()
+
+        prefill_inputs = [
+            torch.zeros((self.batch_size, self.max_prompt_length), dtype=torch.long),
+            torch.ones((self.batch_size, self.max_prompt_length), dtype=torch.long),
+        ]
+        # Shapes and dtypes of the decode cache inputs are those of the prefill cache outputs
+        with torch.no_grad():
+            cache = prefill_module(*prefill_inputs)[1:]
+        self.num_cache_tensors = len(cache)
+        self.cache_dtype = cache[0].dtype
+
+        decode_inputs = [
+            torch.zeros((self.batch_size, 1), dtype=torch.long),
+            torch.ones((self.batch_size, self.max_cache_length + 1), dtype=torch.long),
+            torch.zeros((self.batch_size, 1), dtype=torch.long),
+            torch.zeros((self.batch_size, 1, self.max_cache_length, 1), dtype=self.cache_dtype),
+            *cache,
+        ]
+
+        logger.info(f"Compiling prefill program, prompt length {self.max_prompt_length}")
+        self.prefill_model = self.compile_fn(prefill_module, prefill_inputs)
+        logger.info(f"Compiling decode program, cache length {self.max_cache_length}")
+        self.decode_model = self.compile_fn(decode_module, decode_inputs)
+
+    def _run(self, model: Callable, inputs: List[Union[torch.Tensor, object]]) -> List:
+        if self.keep_cache_on_device and isinstance(model, CompiledModel):
+            cache_outputs = range(1, 1 + self.num_cache_tensors)
+            return model.run_with_device_outputs(*inputs, device_outputs=cache_outputs)
+        return model(*inputs)
+
+    def _update_finished(
+        self,
+        finished: torch.Tensor,
+        generated: torch.Tensor,
+        eos_token_ids: Optional[torch.Tensor],
+        stopping_criteria: Sequence[StoppingCriteria],
+    ) -> torch.Tensor:
+        stopped = torch.zeros_like(finished)
+        if eos_token_ids is not None:
+            stopped |= torch.isin(generated[:, -1], eos_token_ids)
+        for criteria in stopping_criteria:
+            stopped |= criteria(generated).to(torch.bool)
+        return finished | stopped
+
+    @torch.no_grad()
+    def generate(
+        self,
+        input_ids: torch.Tensor,
+        attention_mask: Optional[torch.Tensor] = None,
+        max_new_tokens: Optional[int] = None,
+        sampling: Optional[SamplingConfig] = None,
+        eos_token_id: Optional[Union[int, List[int]]] = None,
+        stopping_criteria: Sequence[StoppingCriteria] = (),
+        pad_token_id: int = 0,
+    ) -> GenerationResult:
+        """
+        Generates tokens following the prompts.
+
+        Parameters
+        ----------
+        input_ids: torch.Tensor
+            Right padded prompts [batch_size, prompt_length], prompt_length <= max_prompt_length.
+        attention_mask: torch.Tensor, optional
+            Mask of the prompt tokens, all tokens are used by default.
+        max_new_tokens: int, optional
+            Maximum number of generated tokens per sequence, as many as fit into the KV cache by default.
+        sampling: SamplingConfig, optional
+            Selection of the next token, greedy by default.
+        eos_token_id: int or [int, ...], optional
+            Tokens stopping the sequence.
+        stopping_criteria: [StoppingCriteria, ...]
+            Additional criteria stopping the sequences, a sequence stops when any of them is met.
+        pad_token_id: int
+            Token fed to the sequences which have already stopped (and to the prompt padding).
+
+        Returns
+        -------
+        GenerationResult
+            Generated tokens, time to first token and decode throughput
+        """
+        assert self.prefill_model is not None, "Engine has to be compiled before generating, call `compile` first"
+
+        batch_size, prompt_length = input_ids.shape
+        assert batch_size == self.batch_size, f"Engine is compiled for batch size {self.batch_size}, got {batch_size}"
+        assert (
+            prompt_length <= self.max_prompt_length
+        ), f"Prompt length {prompt_length} exceeds max prompt length {self.max_prompt_length}"
+
+        if attention_mask is None:
+            attention_mask = torch.ones_like(input_ids)
+        prompt_lengths = attention_mask.sum(dim=-1)
+        assert torch.equal(
+            attention_mask.bool(), torch.arange(prompt_length).unsqueeze(0) < prompt_lengths.unsqueeze(1)
+        ), "Prompts have to be right padded"
+        assert bool((prompt_lengths > 0).all()), "Prompts can't be empty"
+
+        # The last generated token is not decoded, so it doesn't need a cache slot
+        cache_budget = self.max_cache_length - int(prompt_lengths.max()) + 1
+        if max_new_tokens is None:
+            max_new_tokens = cache_budget
+        assert 0 < max_new_tokens <= cache_budget, f"Up to {cache_budget} new tokens fit into the KV cache"
+
+        sampling = sampling if sampling is not None else SamplingConfig()
+        generator = None
+        if sampling.seed is not None:
+            generator = torch.Generator().manual_seed(sampling.seed)
+
+        eos_token_ids = None
+        if eos_token_id is not None:
+            eos_token_ids = torch.tensor(eos_token_id if isinstance(eos_token_id, list) else [eos_token_id])
+
+        padding = self.max_prompt_length - prompt_length
+        prefill_inputs = [
+            torch.nn.functional.pad(input_ids.long(), (0, padding), value=pad_token_id),
+            torch.nn.functional.pad(attention_mask.long(), (0, padding)),
+        ]
+
+        start = time.perf_counter()
+        logits, *cache = self._run(self.prefill_model, prefill_inputs)
+        next_tokens = sample_next_token(logits[torch.arange(batch_size), prompt_lengths - 1], sampling, generator)
+        time_to_first_token = time.perf_counter() - start
+
+        generated = next_tokens.unsqueeze(1)
+        finished = self._update_finished(
+            torch.zeros(batch_size, dtype=torch.bool), generated, eos_token_ids, stopping_criteria
+        )
+        # Number of generated tokens of each sequence, up to the one which stopped it
+        num_tokens = torch.ones(batch_size, dtype=torch.long)
+
+        # Cache position at which the key/value of the next fed token are written
+        positions = prompt_lengths.clone().long()
+        cache_range = torch.arange(self.max_cache_length)
+        num_decoded_tokens = 0
+        num_decode_steps = 0
+
+        decode_start = time.perf_counter()
+        while num_decode_steps < max_new_tokens - 1 and not bool(finished.all()):
+            decode_attention_mask = torch.cat(
+                [
+                    (cache_range.unsqueeze(0) < positions.unsqueeze(1)).long(),
+                    torch.ones((batch_size, 1), dtype=torch.long),
+                ],
+                dim=-1,
+            )
+            cache_update_mask = (cache_range.unsqueeze(0) == positions.unsqueeze(1)).to(self.cache_dtype)
+            decode_inputs = [
+                next_tokens.unsqueeze(1).long(),
+                decode_attention_mask,
+                positions.unsqueeze(1),
+                cache_update_mask.reshape(batch_size, 1, self.max_cache_length, 1),
+                *cache,
+            ]
+            logits, *cache = self._run(self.decode_model, decode_inputs)
+
+            next_tokens = sample_next_token(logits[:, -1], sampling, generator)
+            next_tokens = torch.where(finished, torch.full_like(next_tokens, pad_token_id), next_tokens)
+            num_decoded_tokens += int((~finished).sum())
+            num_tokens += (~finished).long()
+
+            generated = torch.cat([generated, next_tokens.unsqueeze(1)], dim=-1)
+            finished = self._update_finished(finished, generated, eos_token_ids, stopping_criteria)
+            positions += 1
+            num_decode_steps += 1
+        decode_time = time.perf_counter() - decode_start
+
+        logger.debug(
+            f"Generated {num_decoded_tokens + batch_size} tokens, time to first token {time_to_first_token * 1e3:.1f}ms, "
+            f"{num_decode_steps} decode steps in {decode_time * 1e3:.1f}ms"
+        )
+
+        return GenerationResult(
+            tokens=[generated[idx, : num_tokens[idx]].tolist() for idx in range(batch_size)],
+            time_to_first_token=time_to_first_token,
+            decode_time=decode_time,
+            num_decoded_tokens=num_decoded_tokens,
+            num_decode_steps=num_decode_steps,
+            stopped=finished.tolist(),
+        )
@@ -7,16 +7,19 @@ import forge
 from loguru import logger
 import torch
 from collections import OrderedDict
-import transformers
-from transformers.modeling_outputs import CausalLMOutputWithCrossAttentions, BaseModelOutputWithPastAndCrossAttentions
-from transformers.models.auto.tokenization_auto import AutoTokenizer
 from forge.forgeglobal import align_up_tile
+from forge.lazy_import import lazy_import
 from forge.tensor import remove_microbatch
 
+transformers = lazy_import("transformers")
+
 
 class NLPPipelineWrapper(torch.nn.Module):
     """
     Wrapper for transformers nlp pipeline. Provide to pipeline(...) call as model.
+
+    Deprecated for generation - every step re-runs the whole sequence padded to `max_length`. Use
+    `forge.transformers.GenerationEngine`, which runs separately compiled prefill and decode programs on a KV cache.
     """
 
     def __init__(
@@ -30,6 +33,9 @@ class NLPPipelineWrapper(torch.nn.Module):
         max_length=None,
     ):
         super().__init__()
+        logger.warning(
+            "NLPPipelineWrapper is deprecated for generation, use forge.transformers.GenerationEngine instead"
+        )
 
         # forge.config._get_global_compiler_config().verify_forge_codegen_vs_framework = False
         self.original_fwd = model.forward
@@ -76,7 +82,7 @@ class NLPPipelineWrapper(torch.nn.Module):
             logits = output_q.get()[0].value()
             logits = logits[:, : self.orig_len, :]
 
-        return CausalLMOutputWithCrossAttentions(logits=logits)
+        return transformers.modeling_outputs.CausalLMOutputWithCrossAttentions(logits=logits)
 
     # This compilation forward is only used for torchscript tracing.
     # It is a simple pass-through while grouping the inputs into a dictionary,
@@ -234,7 +240,7 @@ class NLPPipelineWrapper(torch.nn.Module):
         if pipeline.startswith("translation"):
             lookup_name = "translation"
         model = tasks[lookup_name]["pt"][0].from_pretrained(name)
-        tokenizer = AutoTokenizer.from_pretrained(name)
+        tokenizer = transformers.AutoTokenizer.from_pretrained(name)
 
         wrapper = NLPPipelineWrapper(
             model, tokenizer, name.replace("-", "_"), use_cache=use_cache, forward_fn=forward_fn, max_length=max_length
@@ -4,9 +4,11 @@
 from forge.tensor import to_tf_tensors, to_pt_tensor, to_pt_tensors, to_pd_tensors
 from forge.tvm_utils import flatten_inputs, flatten_structured_output
 from forge.forge_property_utils import ExecutionStage, record_execution
+from forge.compile_profiler import compile_phase
 import torch
 import paddle
 import flax
+import jax
 import jax.numpy as jnp
 import numpy as np
 import tvm
@@ -20,11 +22,11 @@ from tensorflow.python.framework.convert_to_constants import (
 from loguru import logger
 
 import copy
+import inspect
 import json
 
 from collections.abc import MutableMapping
 
-from json import JSONEncoder
 import os
 import subprocess
 from os.path import exists as file_exists
@@ -76,6 +78,59 @@ def retrieve_forge_cpudevice_json_graph(*args):
     retrieve_graph(cpu_json_graph, t)
 
 
+class LazyParamDict(MutableMapping):
+    """
+    Parameter dictionary of TVM graphs whose values are materialized on first access.
+
+    Values are either set directly or registered as zero-argument loaders (e.g. reading
+    a TVM NDArray or slicing a memory-mapped cache blob). A loader is invoked once, the first
+    time its key is read, and the resulting array replaces it.
+    """
+
+    def __init__(self, values=None):
+        # key -> (is_materialized, value or loader)
+        self._entries = {}
+        if values is not None:
+            for key, value in values.items():
+                self[key] = value
+
+    def set_lazy(self, key, loader):
+        self._entries[key] = (False, loader)
+
+    def loader(self, key):
+        """Returns a loader for the key without materializing its value."""
+        is_materialized, value = self._entries[key]
+        return (lambda: value) if is_materialized else value
+
+    def is_materialized(self, key):
+        return self._entries[key][0]
+
+    def __getitem__(self, key):
+        is_materialized, value = self._entries[key]
+        if not is_materialized:
+            value = value()
+            self._entries[key] = (True, value)
+        return value
+
+    def __setitem__(self, key, value):
+        self._entries[key] = (True, value)
+
+    def __delitem__(self, key):
+        del self._entries[key]
+
+    def __iter__(self):
+        return iter(self._entries)
+
+    def __len__(self):
+        return len(self._entries)
+
+
+def add_lazy_function_params(params, function_params, param_names):
+    """Registers TVM function parameters as lazy numpy loaders under their graph param names."""
+    for value, name in zip(function_params.values(), param_names):
+        params.set_lazy(name, lambda value=value: value.numpy())
+
+
 def load_tvm_graph(
     inputs,
     module,
@@ -114,16 +169,17 @@ def load_tvm_graph(
     if compiler_cfg.tvm_graph_store_path != "" and compiler_cfg.tvm_graph_load_path != "":
         logger.warning(f"TVM serialization logic will be skipped as both store and load paths are provided")
 
-    json_graphs, flattened_inputs = compile_tvm_graph(
-        inputs,
-        module,
-        compiler_cfg,
-        graph_name=graph_name,
-        input_names=input_names,
-        path=path,
-        verify_cfg=verify_cfg,
-        framework=framework,
-    )
+    with compile_phase("tvm.compile_graph"):
+        json_graphs, flattened_inputs = compile_tvm_graph(
+            inputs,
+            module,
+            compiler_cfg,
+            graph_name=graph_name,
+            input_names=input_names,
+            path=path,
+            verify_cfg=verify_cfg,
+            framework=framework,
+        )
 
     flattened_pytorch_inputs, weights = format_tvm_graph_weights(
         flattened_inputs, module, compiler_cfg, framework=framework
@@ -265,6 +321,7 @@ def save_nid_to_input_idx(traced_model_inputs, json_graph):
     json_graph["nid_to_input_idx"] = nid_to_input_idx
 
 
+@compile_phase("tvm.extract_graphs")
 def extract_graphs(partitioned_mod, forge_params, input_names, weight_names, param_name_lookup={}, graph_hash=""):
     mod = partitioned_mod["main"]
     main_graph = str(mod.astext())
@@ -320,32 +377,24 @@ def extract_graphs(partitioned_mod, forge_params, input_names, weight_names, par
         for func in functions_to_remove:
             del cpu_pre_json_graph["functions"][func]
 
-        cpu_pre_json_graph["params"] = {}
+        cpu_pre_json_graph["params"] = LazyParamDict()
         for function_name in forge_params.keys():
             if function_name == cpu_pre_function:
-                cpu_pre_json_graph["params"].update(
-                    {
-                        name: v.numpy()
-                        for (k, v), name in zip(
-                            forge_params[function_name].items(), cpu_pre_json_graph["param_names"][function_name]
-                        )
-                    }
+                add_lazy_function_params(
+                    cpu_pre_json_graph["params"],
+                    forge_params[function_name],
+                    cpu_pre_json_graph["param_names"][function_name],
                 )
     else:
         cpu_pre_json_graph = {"graph": ""}
 
     dev_json_graph["graph"] = dev_json_graph["functions"][device_function]
 
-    dev_json_graph["params"] = {}
+    dev_json_graph["params"] = LazyParamDict()
     for function_name in forge_params.keys():
         if function_name in dev_json_graph["param_names"]:
-            dev_json_graph["params"].update(
-                {
-                    name: v.numpy()
-                    for (k, v), name in zip(
-                        forge_params[function_name].items(), dev_json_graph["param_names"][function_name]
-                    )
-                }
+            add_lazy_function_params(
+                dev_json_graph["params"], forge_params[function_name], dev_json_graph["param_names"][function_name]
             )
 
     if cpu_post_function is not None:
@@ -361,16 +410,13 @@ def extract_graphs(partitioned_mod, forge_params, input_names, weight_names, par
         for func in functions_to_remove:
             del cpu_post_json_graph["functions"][func]
 
-        cpu_post_json_graph["params"] = {}
+        cpu_post_json_graph["params"] = LazyParamDict()
         for function_name in forge_params.keys():
             if function_name == cpu_post_function:
-                cpu_post_json_graph["params"].update(
-                    {
-                        name: v.numpy()
-                        for (k, v), name in zip(
-                            forge_params[function_name].items(), cpu_post_json_graph["param_names"][function_name]
-                        )
-                    }
+                add_lazy_function_params(
+                    cpu_post_json_graph["params"],
+                    forge_params[function_name],
+                    cpu_post_json_graph["param_names"][function_name],
                 )
     else:
         cpu_post_json_graph = {"graph": ""}
@@ -499,6 +545,13 @@ class ConvertEmulatedDtypes:
 def compile_pytorch_for_forge(torchmod, *inputs, graph_name, compiler_cfg, verify_cfg=None, input_names=[]):
     training_mode = torchmod.training
 
+    graph_hash = get_tvm_graph_hash("pytorch", torchmod, inputs, compiler_cfg, graph_name, input_names)
+    if is_tvm_cache_enabled():
+        cached_graphs = load_serialized_tvm_graph(compiler_cfg, graph_hash.hexdigest(), framework="pytorch")
+        if cached_graphs is not None:
+            flattened_inputs, _, _ = flatten_inputs(inputs)
+            return cached_graphs, flattened_inputs
+
     with ConvertEmulatedDtypes(torchmod, inputs):
         # Extract framework model outputs
         # ConvertEmulatedDtypes converts tochmod parameters to float32 if they are bfloat16
@@ -519,7 +572,8 @@ def compile_pytorch_for_forge(torchmod, *inputs, graph_name, compiler_cfg, verif
             torchmod = torch.jit.freeze(torchmod)
 
         # Trace framework model
-        traced_model = torch.jit.trace(torchmod, inputs, check_trace=False, strict=False)
+        with compile_phase("tvm.trace"):
+            traced_model = torch.jit.trace(torchmod, inputs, check_trace=False, strict=False)
         # Extract flatten inputs
         flattened_inputs, flattened_input_names, flattened_name_map, input_structure = extract_flatten_inputs(
             framework="pytorch",
@@ -529,15 +583,10 @@ def compile_pytorch_for_forge(torchmod, *inputs, graph_name, compiler_cfg, verif
         )
         # Generate TVM module
         convert_params = compiler_cfg.convert_framework_params_to_tvm
-        mod, params = tvm.relay.frontend.from_pytorch(traced_model, input_structure, do_convert_params=convert_params)
-
-    graph_hash = hashlib.sha256()
-    if is_tvm_cache_enabled():
-        graph_string = traced_model.graph.str().encode("utf-8")
-        graph_hash.update(graph_string)
-        cached_graphs = load_serialized_tvm_graph(compiler_cfg, graph_hash.hexdigest(), framework="pytorch")
-        if cached_graphs is not None:
-            return cached_graphs, flattened_inputs
+        with compile_phase("tvm.from_pytorch"):
+            mod, params = tvm.relay.frontend.from_pytorch(
+                traced_model, input_structure, do_convert_params=convert_params
+            )
 
     record_execution(ExecutionStage.FAILED_TVM_RELAY_IO_FLATTENING)
     logger.trace("From PyTorch")
@@ -615,7 +664,8 @@ def compile_paddle_for_forge(paddlemod, *inputs, graph_name, compiler_cfg, verif
     named_inputs = {name: inp.shape for name, inp in zip(input_names, paddle_inputs)}
 
     # Generate TVM module
-    mod, params = tvm.relay.frontend.from_paddle(traced_model, named_inputs)
+    with compile_phase("tvm.from_paddle"):
+        mod, params = tvm.relay.frontend.from_paddle(traced_model, named_inputs)
 
     record_execution(ExecutionStage.FAILED_TVM_RELAY_IO_FLATTENING)
 
@@ -678,13 +728,14 @@ def compile_tvm_for_forge(
 ):
     target = "llvm"
     verify_args = {"inputs": inputs, "framework_outputs": golden_outputs, "verify_cfg": verify_cfg}
-    mod, params = compile_for_forge(
-        mod,
-        target=target,
-        params=params,
-        graph_name=graph_name,
-        **verify_args,
-    )
+    with compile_phase("tvm.compile_passes"):
+        mod, params = compile_for_forge(
+            mod,
+            target=target,
+            params=params,
+            graph_name=graph_name,
+            **verify_args,
+        )
 
     if verify_cfg is not None and verify_cfg.verify_tvm_compile:
         compiler_cfg.convert_framework_params_to_tvm = True
@@ -698,10 +749,12 @@ def compile_tvm_for_forge(
             verify_tvm_compile(mod, params, inputs, target, golden_outputs, "compile_for_forge", verify_cfg=verify_cfg)
 
     # Reconstruct Ops + export forge graph
-    mod, forge_params = partition_for_forge(
-        mod, graph_name=graph_name, compiler_cfg=compiler_cfg, input_names=input_names
-    )
-    tvm.relay.build_module.build(mod, target=target, params=params)
+    with compile_phase("tvm.partition"):
+        mod, forge_params = partition_for_forge(
+            mod, graph_name=graph_name, compiler_cfg=compiler_cfg, input_names=input_names
+        )
+    with compile_phase("tvm.build"):
+        tvm.relay.build_module.build(mod, target=target, params=params)
     record_execution(ExecutionStage.FAILED_FORGE_MODULE_GENERATION)
 
     if return_params:
@@ -723,8 +776,10 @@ def clean_names(json_graph, forge_params, param_name_lookup={}):
     if len(json_graph["params"]) > 0:
 
         old_params = json_graph["params"]
-        json_graph["params"] = {}
-        for k, v in old_params.items():
+        if not isinstance(old_params, LazyParamDict):
+            old_params = LazyParamDict(old_params)
+        json_graph["params"] = LazyParamDict()
+        for k in old_params:
             if precursor in k:
                 num_digits = k.replace(precursor, "").find("_")
                 key = k.replace(precursor, "")[num_digits + 1 :] + k.replace(precursor, "")[:num_digits]
@@ -733,7 +788,8 @@ def clean_names(json_graph, forge_params, param_name_lookup={}):
                 old_name = param_name_lookup[name] if name in param_name_lookup else name
                 param_name_lookup[k] = old_name + f"_{num_digits}"
                 key = param_name_lookup[k]  # This is done to sync the node names with the param names
-            json_graph["params"][key] = v
+            # Move the loader rather than the value, so renaming doesn't materialize the parameter
+            json_graph["params"].set_lazy(key, old_params.loader(k))
 
     graph = json.loads(json_graph["graph"])
 
@@ -754,6 +810,12 @@ def clean_names(json_graph, forge_params, param_name_lookup={}):
 def compile_onnx_for_forge(onnx_mod, onnx_path, *inputs, graph_name, compiler_cfg, verify_cfg=None):
     import onnxruntime as ort
 
+    graph_hash = get_tvm_graph_hash("onnx", onnx_mod, inputs, compiler_cfg, graph_name)
+    if is_tvm_cache_enabled():
+        cached_graphs = load_serialized_tvm_graph(compiler_cfg, graph_hash.hexdigest(), framework="onnx")
+        if cached_graphs is not None:
+            return cached_graphs, inputs
+
     # Set default num threads to 2, hangs on some hosts otherwise https://github.com/microsoft/onnxruntime/issues/10166
     so = ort.SessionOptions()
     so.inter_op_num_threads = 2
@@ -791,15 +853,8 @@ def compile_onnx_for_forge(onnx_mod, onnx_path, *inputs, graph_name, compiler_cf
     del onnx_session
     del onnx_model
 
-    graph_hash = hashlib.sha256()
-    if is_tvm_cache_enabled():
-        graph_string = str(onnx_mod).encode("utf-8")
-        graph_hash.update(graph_string)
-        cached_graphs = load_serialized_tvm_graph(compiler_cfg, graph_hash.hexdigest(), framework="onnx")
-        if cached_graphs is not None:
-            return cached_graphs, inputs
-
-    mod, params = relay.frontend.from_onnx(onnx_mod, input_shape_dict, freeze_params=False)
+    with compile_phase("tvm.from_onnx"):
+        mod, params = relay.frontend.from_onnx(onnx_mod, input_shape_dict, freeze_params=False)
     mod = relay.transform.DynamicToStatic()(mod)
     record_execution(ExecutionStage.FAILED_TVM_RELAY_IR_TRANSFORMATION)
 
@@ -837,6 +892,12 @@ def compile_tflite_for_forge(module, path, *inputs, graph_name, compiler_cfg, ve
     assert path != None, "TFLite compile needs path to .tflite file on disk."
     tflite_model_buf = open(path, "rb").read()
 
+    graph_hash = get_tvm_graph_hash("tflite", tflite_model_buf, inputs, compiler_cfg, graph_name)
+    if is_tvm_cache_enabled():
+        cached_graphs = load_serialized_tvm_graph(compiler_cfg, graph_hash.hexdigest(), framework="tflite")
+        if cached_graphs is not None:
+            return cached_graphs, inputs
+
     input_details = module.get_input_details()
 
     framework_outputs = extract_framework_model_outputs(
@@ -865,18 +926,11 @@ def compile_tflite_for_forge(module, path, *inputs, graph_name, compiler_cfg, ve
         input_shape_dict[details["name"]] = list(details["shape"])
         input_dict[details["name"]] = inputs[i]
 
-    graph_hash = hashlib.sha256()
-    if is_tvm_cache_enabled():
-        graph_string = str(module).encode("utf-8")
-        graph_hash.update(graph_string)
-        cached_graphs = load_serialized_tvm_graph(compiler_cfg, graph_hash.hexdigest(), framework="tflite")
-        if cached_graphs is not None:
-            return cached_graphs, inputs
-
-    mod, params = relay.frontend.from_tflite(
-        tflite_model,
-        shape_dict=input_shape_dict,
-    )
+    with compile_phase("tvm.from_tflite"):
+        mod, params = relay.frontend.from_tflite(
+            tflite_model,
+            shape_dict=input_shape_dict,
+        )
     record_execution(ExecutionStage.FAILED_TVM_RELAY_IR_TRANSFORMATION)
 
     assert len(input_names) == len(inputs), "Number of input names must match number of inputs"
@@ -977,6 +1031,13 @@ def get_frozen_graph_for_large_jax_model(
 
 
 def compile_jax_for_forge(jaxmodel, *inputs, graph_name, compiler_cfg, verify_cfg=None):
+    graph_hash = get_tvm_graph_hash("jax", jaxmodel, inputs, compiler_cfg, graph_name)
+    if is_tvm_cache_enabled():
+        cached_graphs = load_serialized_tvm_graph(compiler_cfg, graph_hash.hexdigest(), framework="jax")
+        if cached_graphs is not None:
+            flattened_inputs, _, _ = flatten_inputs(inputs)
+            return cached_graphs, flattened_inputs
+
     # Extract framework model outputs
     framework_outputs = extract_framework_model_outputs(
         framework="jax",
@@ -1006,15 +1067,9 @@ def compile_jax_for_forge(jaxmodel, *inputs, graph_name, compiler_cfg, verify_cf
         inputs=inputs,
     )
 
-    graph_hash = hashlib.sha256()
-    if is_tvm_cache_enabled():
-        graph_hash.update(str(graph_def).encode("utf-8"))
-        cached_graphs = load_serialized_tvm_graph(compiler_cfg, graph_hash.hexdigest(), framework="jax")
-        if cached_graphs is not None:
-            return cached_graphs, flattened_inputs
-
     outputs = [output.name for output in tf_func.outputs]
-    mod, params = tvm.relay.frontend.from_tensorflow(graph_def, layout="NCHW", outputs=outputs)
+    with compile_phase("tvm.from_tensorflow"):
+        mod, params = tvm.relay.frontend.from_tensorflow(graph_def, layout="NCHW", outputs=outputs)
     mod = tvm.transform.Sequential([tvm.relay.transform.Inline()])(mod)
     record_execution(ExecutionStage.FAILED_TVM_RELAY_IR_TRANSFORMATION)
 
@@ -1080,6 +1135,13 @@ def compile_jax_for_forge(jaxmodel, *inputs, graph_name, compiler_cfg, verify_cf
 
 
 def compile_tf_for_forge(tfmod, *inputs, graph_name, compiler_cfg, verify_cfg=None):
+    graph_hash = get_tvm_graph_hash("tensorflow", tfmod, inputs, compiler_cfg, graph_name)
+    if is_tvm_cache_enabled():
+        cached_graphs = load_serialized_tvm_graph(compiler_cfg, graph_hash.hexdigest(), framework="tensorflow")
+        if cached_graphs is not None:
+            flattened_inputs, _, _ = flatten_inputs(inputs)
+            return cached_graphs, flattened_inputs
+
     # Extract framework model outputs
     framework_outputs = extract_framework_model_outputs(
         framework="tensorflow",
@@ -1113,17 +1175,11 @@ def compile_tf_for_forge(tfmod, *inputs, graph_name, compiler_cfg, verify_cfg=No
         inputs=inputs,
     )
 
-    graph_hash = hashlib.sha256()
-    if is_tvm_cache_enabled():
-        graph_hash.update(str(graph_def).encode("utf-8"))
-        cached_graphs = load_serialized_tvm_graph(compiler_cfg, graph_hash.hexdigest(), framework="tensorflow")
-        if cached_graphs is not None:
-            return cached_graphs, flattened_inputs
-
     flattened_outputs = flatten_structured_output([full_model.structured_outputs])
     # Generate TVM module
     outputs = [x.name for x in flattened_outputs]
-    mod, params = tvm.relay.frontend.from_tensorflow(graph_def, outputs=outputs)
+    with compile_phase("tvm.from_tensorflow"):
+        mod, params = tvm.relay.frontend.from_tensorflow(graph_def, outputs=outputs)
     mod = tvm.transform.Sequential([tvm.relay.transform.Inline()])(mod)
     record_execution(ExecutionStage.FAILED_TVM_RELAY_IR_TRANSFORMATION)
 
@@ -1194,14 +1250,14 @@ def compile_tf_graphdef_for_forge(
         if "input" in node.name and node.op == "Placeholder":
             input_names.append(node.name)
 
-    graph_hash = hashlib.sha256()
+    graph_hash = get_tvm_graph_hash("tf_graphdef", graph_def, inputs, compiler_cfg, graph_name, input_names)
     if is_tvm_cache_enabled():
-        graph_hash.update(str(graph_def).encode("utf-8"))
         cached_graphs = load_serialized_tvm_graph(compiler_cfg, graph_hash.hexdigest(), framework="tf_graphdef")
         if cached_graphs is not None:
             return cached_graphs
 
-    mod, params = tvm.relay.frontend.from_tensorflow(graph_def, layout="NCHW", outputs=output_list_)
+    with compile_phase("tvm.from_tensorflow"):
+        mod, params = tvm.relay.frontend.from_tensorflow(graph_def, layout="NCHW", outputs=output_list_)
     mod = tvm.transform.Sequential([tvm.relay.transform.Inline()])(mod)
     record_execution(ExecutionStage.FAILED_TVM_RELAY_IR_TRANSFORMATION)
 
@@ -1225,14 +1281,17 @@ def compile_tf_graphdef_for_forge(
         mod = tvm.IRModule.from_expr(tvm.relay.build_module.bind_params_by_name(mod["main"], propped_params))
 
     target = "llvm"
-    mod, params = compile_for_forge(mod, target=target, params=params, graph_name=graph_name)
+    with compile_phase("tvm.compile_passes"):
+        mod, params = compile_for_forge(mod, target=target, params=params, graph_name=graph_name)
 
     # Reconstruct Ops + export forge graph
-    partitioned_mod, forge_params = tvm.relay.op.contrib.forge.partition_for_forge(
-        mod, graph_name=graph_name, compiler_cfg=compiler_cfg, input_names=input_names
-    )
+    with compile_phase("tvm.partition"):
+        partitioned_mod, forge_params = tvm.relay.op.contrib.forge.partition_for_forge(
+            mod, graph_name=graph_name, compiler_cfg=compiler_cfg, input_names=input_names
+        )
 
-    tvm.relay.build_module.build(partitioned_mod, target=target, params=params)
+    with compile_phase("tvm.build"):
+        tvm.relay.build_module.build(partitioned_mod, target=target, params=params)
     record_execution(ExecutionStage.FAILED_FORGE_MODULE_GENERATION)
 
     json_graphs = extract_graphs(partitioned_mod, forge_params, input_names, [], graph_hash=graph_hash.hexdigest())
@@ -1353,6 +1412,259 @@ def is_tvm_cache_enabled():
     return bool(os.environ.get("FORGE_ENABLE_TVM_CACHE", 0))
 
 
+TVM_CACHE_DIR = "generated_modules/tvm_cache"
+
+# Size limit of the auto TVM cache in MB, least recently used entries are evicted above it
+TVM_CACHE_DEFAULT_SIZE_LIMIT_MB = 10 * 1024
+
+# Compiler config fields which influence the TVM generated graphs, and hence are part of the cache key
+TVM_CACHE_COMPILER_CONFIG_FIELDS = [
+    "enable_training",
+    "enable_tvm_cpu_fallback",
+    "cpu_fallback_ops",
+    "enable_tm_cpu_fallback",
+    "tm_cpu_fallback_max_depth",
+    "enable_tvm_dropout",
+    "enable_tvm_unsupported_ops",
+    "enable_tvm_constant_prop",
+    "convert_framework_params_to_tvm",
+    "enable_xla_jax_convert",
+    "enable_tvm_jax_freeze_large_model",
+    "framework_model_output_names",
+    "tvm_constnat_prop_mask",
+    "tvm_module_to_num_patterns",
+]
+
+
+def get_tensor_signature(tensors):
+    """
+    Returns nested structure of (shape, dtype) pairs describing the given (framework) tensors.
+    """
+    if isinstance(tensors, (list, tuple)):
+        return [get_tensor_signature(t) for t in tensors]
+    if isinstance(tensors, dict):
+        return {str(k): get_tensor_signature(v) for k, v in tensors.items()}
+    if tensors is None:
+        return None
+
+    return [[int(dim) if dim is not None else None for dim in tensors.shape], str(tensors.dtype)]
+
+
+def get_tensor_data_hash(tensors):
+    """
+    Returns hash of the values of the given (framework) tensors.
+    """
+    data_hash = hashlib.sha256()
+    for tensor in tensors:
+        data_hash.update(np.ascontiguousarray(np.asarray(tensor)).tobytes())
+
+    return data_hash.hexdigest()
+
+
+def get_module_signature(framework, module):
+    """
+    Returns cheap to compute description of the framework module: its type and the structure (names, shapes and
+    dtypes) of its weights. PyTorch weight values are not part of the signature, as they are bound to the generated
+    module after loading from the cache (the cache is bypassed when they are constant propagated into the graph).
+    ONNX, TensorFlow and JAX weights are frozen into the converted graph, so their values are hashed as well.
+    """
+    if framework in ["tflite", "tf_graphdef"]:
+        # Serialized model is already at hand, hash it as a whole
+        serialized = module if isinstance(module, bytes) else module.SerializeToString(deterministic=True)
+        return {"model": hashlib.sha256(serialized).hexdigest()}
+
+    signature = {"type": f"{type(module).__module__}.{type(module).__qualname__}"}
+
+    if framework == "pytorch":
+        # Model code isn't captured by the weights structure, so hash sources of all (sub)module classes
+        sources = hashlib.sha256()
+        for module_type in sorted(
+            {type(m) for m in module.modules()}, key=lambda t: f"{t.__module__}.{t.__qualname__}"
+        ):
+            try:
+                sources.update(inspect.getsource(module_type).encode("utf-8"))
+            except (OSError, TypeError):
+                sources.update(f"{module_type.__module__}.{module_type.__qualname__}".encode("utf-8"))
+        if isinstance(module, torch.jit.ScriptModule):
+            sources.update(str(module.inlined_graph).encode("utf-8"))
+        signature["sources"] = sources.hexdigest()
+        signature["training"] = module.training
+
+        weights = dict(module.state_dict(keep_vars=True))
+        weights.update(dict(module.named_buffers()))
+        signature["weights"] = {name: get_tensor_signature(value) for name, value in weights.items()}
+    elif framework == "onnx":
+        # Hash the graph topology and initializer metadata, without the (potentially huge) initializer data
+        graph = hashlib.sha256()
+        for node in module.graph.node:
+            graph.update(node.SerializeToString(deterministic=True))
+        for value_info in list(module.graph.input) + list(module.graph.output):
+            graph.update(value_info.SerializeToString(deterministic=True))
+        signature["graph"] = graph.hexdigest()
+        signature["opset"] = [[opset.domain, opset.version] for opset in module.opset_import]
+        signature["weights"] = {
+            weight.name: [list(weight.dims), weight.data_type] for weight in module.graph.initializer
+        }
+        weights_data = hashlib.sha256()
+        for weight in module.graph.initializer:
+            weights_data.update(weight.SerializeToString(deterministic=True))
+        signature["weights_data"] = weights_data.hexdigest()
+    elif framework == "tensorflow":
+        signature["weights"] = {weight.path: get_tensor_signature(weight) for weight in module.weights}
+        signature["weights_data"] = get_tensor_data_hash(weight.numpy() for weight in module.weights)
+    elif framework == "jax":
+        model_params = {}
+        if hasattr(module, "params"):
+            model_params = module.params
+        elif hasattr(module, "variables"):
+            model_params = module.variables
+        flattened_params = jax.tree_util.tree_flatten_with_path(model_params)[0]
+        signature["weights"] = [
+            [jax.tree_util.keystr(path), get_tensor_signature(value)] for path, value in flattened_params
+        ]
+        signature["weights_data"] = get_tensor_data_hash(value for _, value in flattened_params)
+    else:
+        raise RuntimeError(f"Unsupported framework for TVM cache: {framework}")
+
+    return signature
+
+
+def get_tvm_graph_hash(framework, module, inputs, compiler_cfg, graph_name, input_names=[]):
+    """
+    Computes TVM graph cache key from a cheap, stable fingerprint of the workload: module type and weights (see
+    `get_module_signature`), input shapes and dtypes, and compiler config fields affecting TVM compilation. As it
+    doesn't require any tracing, cache lookup can happen before the framework model is converted to Relay.
+
+    Parameters
+    ----------
+    framework: str
+        Framework of the module
+
+    module: Framework module (or serialized model for TFLite/GraphDef)
+        Module which is compiled
+
+    inputs: Tuple[Tensor, ...]
+        Input tensors
+
+    compiler_cfg: CompilerConfig
+        Compiler configurations
+
+    Returns
+    -------
+    hashlib.sha256
+        Graph hash
+    """
+    graph_hash = hashlib.sha256()
+    if not is_tvm_cache_enabled():
+        return graph_hash
+
+    fingerprint = {
+        "framework": framework,
+        "module": get_module_signature(framework, module),
+        "inputs": get_tensor_signature(inputs),
+        "input_names": list(input_names),
+        "graph_name": graph_name,
+        "compiler_cfg": {
+            field: getattr(compiler_cfg, field)
+            for field in TVM_CACHE_COMPILER_CONFIG_FIELDS
+            if hasattr(compiler_cfg, field)
+        },
+    }
+    # Sets are sorted for a stable key, other values which aren't JSON serializable are represented by their string
+    fingerprint_json = json.dumps(
+        fingerprint, sort_keys=True, default=lambda x: sorted(x) if isinstance(x, (set, frozenset)) else str(x)
+    )
+    graph_hash.update(fingerprint_json.encode("utf-8"))
+
+    return graph_hash
+
+
+def get_tvm_cache_size_limit():
+    """
+    Returns size limit of the auto TVM cache in bytes (FORGE_TVM_CACHE_SIZE_LIMIT_MB), 0 means no limit.
+    """
+    return int(os.environ.get("FORGE_TVM_CACHE_SIZE_LIMIT_MB", TVM_CACHE_DEFAULT_SIZE_LIMIT_MB)) * 1024 * 1024
+
+
+def get_tvm_cache_entries(cache_dir=TVM_CACHE_DIR):
+    """
+    Returns list of (graph_path, [entry files], size in bytes, last use time) for entries in the TVM cache,
+    ordered from the least to the most recently used.
+    """
+    if not os.path.isdir(cache_dir):
+        return []
+
+    entries = []
+    for file_name in os.listdir(cache_dir):
+        graph_path = os.path.join(cache_dir, file_name)
+        if (
+            file_name.endswith(TVM_GRAPH_CACHE_BLOB_SUFFIX)
+            or file_name.endswith(".tmp")
+            or not os.path.isfile(graph_path)
+        ):
+            continue
+
+        files = [graph_path]
+        if file_exists(get_tvm_graph_blob_path(graph_path)):
+            files.append(get_tvm_graph_blob_path(graph_path))
+        # Last use is tracked through the modification time of the graph file, which is touched on every cache hit
+        entries.append((graph_path, files, sum(os.path.getsize(f) for f in files), os.path.getmtime(graph_path)))
+
+    return sorted(entries, key=lambda entry: entry[3])
+
+
+def remove_tvm_cache_entry(graph_path):
+    for path in [graph_path, get_tvm_graph_blob_path(graph_path)]:
+        if file_exists(path):
+            os.remove(path)
+
+
+def evict_tvm_cache(size_limit=None, cache_dir=TVM_CACHE_DIR):
+    """
+    Evicts least recently used entries from the TVM cache until its size is within the limit.
+
+    Returns
+    -------
+    List[str]
+        Graph paths of evicted entries
+    """
+    size_limit = get_tvm_cache_size_limit() if size_limit is None else size_limit
+    if size_limit <= 0:
+        return []
+
+    entries = get_tvm_cache_entries(cache_dir)
+    cache_size = sum(entry[2] for entry in entries)
+
+    evicted = []
+    for graph_path, _, size, _ in entries:
+        if cache_size <= size_limit:
+            break
+        remove_tvm_cache_entry(graph_path)
+        cache_size -= size
+        evicted.append(graph_path)
+        logger.info(f"Evicted TVM cache entry {graph_path}")
+
+    return evicted
+
+
+def invalidate_tvm_cache(graph_hash=None, cache_dir=TVM_CACHE_DIR):
+    """
+    Removes entries from the TVM cache - all of them, or only the ones for the given graph hash.
+
+    Returns
+    -------
+    int
+        Number of removed entries
+    """
+    removed = 0
+    for graph_path, _, _, _ in get_tvm_cache_entries(cache_dir):
+        if graph_hash is None or os.path.basename(graph_path).endswith("_" + graph_hash):
+            remove_tvm_cache_entry(graph_path)
+            removed += 1
+
+    return removed
+
+
 def get_auto_path(graph_hash, compiler_cfg, is_load):
     """
     Returns auto cache path based on graph hash and tvm submodule git commit
@@ -1398,17 +1710,31 @@ def get_auto_path(graph_hash, compiler_cfg, is_load):
                     .decode("utf-8")
                     .strip()
                 )
-            auto_path = "generated_modules/tvm_cache/" + tvm_hash + "_" + graph_hash
+            auto_path = os.path.join(TVM_CACHE_DIR, tvm_hash + "_" + graph_hash)
     else:
         auto_path = compiler_cfg.tvm_graph_load_path if is_load else compiler_cfg.tvm_graph_store_path
 
     return auto_path
 
 
+# Version of the TVM graph cache format. Graphs (and parameter metadata) are stored as JSON,
+# while the parameter data is stored as raw bytes in a separate blob that is memory-mapped on load.
+TVM_GRAPH_CACHE_VERSION = 2
+TVM_GRAPH_CACHE_BLOB_SUFFIX = ".params.bin"
+TVM_GRAPH_CACHE_BLOB_ALIGNMENT = 64
+
+
+def get_tvm_graph_blob_path(graph_path):
+    return graph_path + TVM_GRAPH_CACHE_BLOB_SUFFIX
+
+
 def load_serialized_tvm_graph(compiler_cfg, graph_hash, framework):
     """
     Loads serialized TVM graph representation ported to Forge in form of python dictionary.
 
+    Parameters are not read from disk here; the parameter blob is memory-mapped and each
+    parameter is materialized on first access (see LazyParamDict).
+
     Parameters
     ----------
     compiler_cfg: CompilerConfig
@@ -1433,19 +1759,45 @@ def load_serialized_tvm_graph(compiler_cfg, graph_hash, framework):
         return None
 
     with open(load_path, "r") as file:
-        serialized_graph_str = json.load(file)
+        serialized_graph = json.load(file)
+
+    if serialized_graph.get("version") != TVM_GRAPH_CACHE_VERSION:
+        logger.warning(f"Serialized TVM graph at {load_path} has an unsupported format, ignoring it")
+        return None
+
+    blob_path = get_tvm_graph_blob_path(load_path)
+    has_params = any(len(json_graph["params"]) > 0 for json_graph in serialized_graph["graphs"])
+    if has_params and not file_exists(blob_path):
+        logger.warning(f"Parameter blob {blob_path} of serialized TVM graph is missing, ignoring cached graph")
+        return None
+
+    # Copy-on-write mapping, so that tensors created from the parameters are writable without touching the cache
+    blob = np.memmap(blob_path, dtype=np.uint8, mode="c") if has_params and os.path.getsize(blob_path) > 0 else None
+
+    def param_loader(meta):
+        def load():
+            begin, end = meta["data_offsets"]
+            data = blob[begin:end] if blob is not None else np.empty((0,), dtype=np.uint8)
+            return data.view(np.dtype(meta["dtype"])).reshape(meta["shape"])
+
+        return load
 
     json_graphs = []
-    for id, json_graph in serialized_graph_str.items():
+    for json_graph in serialized_graph["graphs"]:
         serialized_dict = {}
         serialized_dict["graph"] = json.dumps(json_graph["graph"])
         serialized_dict["hash"] = json.dumps(json_graph["hash"])
-        serialized_dict["params"] = json_graph["params"]
+        serialized_dict["params"] = LazyParamDict()
+        for name, meta in json_graph["params"].items():
+            serialized_dict["params"].set_lazy(name, param_loader(meta))
         serialized_dict["device"] = json_graph["device"]
         if "nid_to_input_idx" in json_graph.keys():
             serialized_dict["nid_to_input_idx"] = {int(k): v for k, v in json_graph["nid_to_input_idx"].items()}
         json_graphs.append(serialized_dict)
 
+    # Mark entry as recently used for LRU eviction
+    os.utime(load_path)
+
     logger.info(f"Successfully loaded serialized TVM graph from {load_path} path")
 
     return json_graphs
@@ -1453,8 +1805,10 @@ def load_serialized_tvm_graph(compiler_cfg, graph_hash, framework):
 
 def serialize_and_store_tvm_graph(json_graphs, compiler_cfg, framework):
     """
-    Serializes TVM graph representation ported to Forge in form of JSON and stores it
-    on the desired destination.
+    Serializes TVM graph representation ported to Forge and stores it on the desired destination.
+
+    Graph structure and parameter metadata (dtype, shape, byte offsets) are stored as JSON on the
+    store path, while parameter data is streamed into a single binary blob next to it.
 
     Parameters
     ----------
@@ -1468,12 +1822,6 @@ def serialize_and_store_tvm_graph(json_graphs, compiler_cfg, framework):
     -------
     """
 
-    class NumpyArrayEncoder(JSONEncoder):
-        def default(self, obj):
-            if isinstance(obj, np.ndarray):
-                return obj.tolist()
-            return JSONEncoder.default(self, obj)
-
     graph_hash = json_graphs[0]["hash"]
     store_path = get_auto_path(graph_hash, compiler_cfg, False)
     if (
@@ -1483,23 +1831,51 @@ def serialize_and_store_tvm_graph(json_graphs, compiler_cfg, framework):
     ):
         return
 
-    serilized_dict = {}
+    os.makedirs(os.path.dirname(store_path) or ".", exist_ok=True)
+
+    serialized_graphs = []
+    offset = 0
+    # Write to temporary files first, so that an interrupted store never leaves a truncated cache entry behind
+    blob_path = get_tvm_graph_blob_path(store_path)
+    with open(blob_path + ".tmp", "wb") as blob:
+        for json_graph in json_graphs:
+            params = json_graph["params"]
+            params_meta = {}
+            for name in params:
+                if isinstance(params, LazyParamDict) and not params.is_materialized(name):
+                    # Stream lazy parameters to disk without keeping them alive
+                    value = params.loader(name)()
+                else:
+                    value = params[name]
+                value = np.asarray(value, order="C")
+
+                padding = -offset % TVM_GRAPH_CACHE_BLOB_ALIGNMENT
+                blob.write(b"\0" * padding)
+                offset += padding
+                blob.write(value.tobytes())
+                params_meta[name] = {
+                    "dtype": value.dtype.str,
+                    "shape": list(value.shape),
+                    "data_offsets": [offset, offset + value.nbytes],
+                }
+                offset += value.nbytes
 
-    for id, json_graph in enumerate(json_graphs):
-        graph_dict = json.loads(json_graph["graph"])
-        params_dict = json_graph["params"]
-        serilized_dict[str(id)] = {}
-        serilized_dict[str(id)]["graph"] = graph_dict
-        serilized_dict[str(id)]["params"] = params_dict
-        serilized_dict[str(id)]["device"] = json_graph["device"]
-        serilized_dict[str(id)]["hash"] = json_graph["hash"]
-        if "nid_to_input_idx" in json_graph.keys():
-            serilized_dict[str(id)]["nid_to_input_idx"] = json_graph["nid_to_input_idx"]
+            serialized_graph = {}
+            serialized_graph["graph"] = json.loads(json_graph["graph"])
+            serialized_graph["params"] = params_meta
+            serialized_graph["device"] = json_graph["device"]
+            serialized_graph["hash"] = json_graph["hash"]
+            if "nid_to_input_idx" in json_graph.keys():
+                serialized_graph["nid_to_input_idx"] = json_graph["nid_to_input_idx"]
+            serialized_graphs.append(serialized_graph)
 
-    serilized_str = json.dumps(serilized_dict, cls=NumpyArrayEncoder, indent=2)
+    with open(store_path + ".tmp", "w") as file:
+        json.dump({"version": TVM_GRAPH_CACHE_VERSION, "graphs": serialized_graphs}, file)
 
-    os.makedirs(os.path.dirname(store_path), exist_ok=True)
-    with open(store_path, "w") as file:
-        file.write(serilized_str)
+    os.replace(blob_path + ".tmp", blob_path)
+    os.replace(store_path + ".tmp", store_path)
 
     logger.info(f"Successfully stored serilized TVM graph to {store_path} path")
+
+    if os.path.dirname(os.path.abspath(store_path)) == os.path.abspath(TVM_CACHE_DIR):
+        evict_tvm_cache()
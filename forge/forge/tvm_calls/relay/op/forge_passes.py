@@ -3,6 +3,12 @@
 # SPDX-License-Identifier: Apache-2.0
 import os
 import ast
+import json
+import time
+from collections import Counter
+from dataclasses import dataclass, field, asdict
+from typing import Dict, FrozenSet, Optional, Tuple
+
 import tvm
 
 from tvm.relay import transform
@@ -14,6 +20,7 @@ import math
 import numpy as np
 from tvm.relay.dataflow_pattern import *
 from loguru import logger
+from forge.compile_profiler import compile_phase
 from .utils import *
 from tvm.relay.op import _make
 
@@ -926,6 +933,9 @@ class LiftLinearSplit(DFPatternCallback):
 
 
 class LowerSplitToStridedSlice(DFPatternCallback):
+    # Pattern is anchored on the tuple get item, only split outputs are lowered
+    anchor_ops = ("split",)
+
     def __init__(self):
         super().__init__(rewrite_once=True, require_type=True)
         self.act = wildcard()
@@ -1081,6 +1091,8 @@ class LowerCopyToNOP(DFPatternCallback):
 
 
 class ArgmaxAndMaxReconstruct(DFPatternCallback):
+    anchor_ops = ("take",)
+
     def __init__(self, rewrite_once=True):
         super().__init__(rewrite_once=rewrite_once)
         self.input_tensor = wildcard()
@@ -5034,6 +5046,64 @@ class RemoveEmptyConcat(DFPatternCallback):
             return post
 
 
+# Disables skipping of pattern callbacks whose anchor ops are not present in the module, for debugging
+DISABLE_PATTERN_CALLBACK_SKIPPING = bool(int(os.environ.get("FORGE_DISABLE_PATTERN_CALLBACK_SKIPPING", "0")))
+
+
+@dataclass
+class PatternCallbackStats:
+    name: str
+    # Ops one of which has to be present in the module for the callback to match, None if not known
+    anchor_ops: Optional[Tuple[str, ...]] = None
+    num_runs: int = 0
+    # Number of times the callback was skipped, because none of its anchor ops were present in the module
+    num_skipped: int = 0
+    # Number of pattern matches, i.e. calls of the callback function
+    num_matches: int = 0
+    # Number of runs which changed the module
+    num_changes: int = 0
+    wall_time_ns: int = 0
+
+
+@dataclass
+class PatternCallbackReport:
+    """
+    Per-callback time and hit counts of `run_pattern_callbacks`, accumulated over all of the runs it was passed to.
+    """
+
+    callbacks: Dict[str, PatternCallbackStats] = field(default_factory=dict)
+    # Time spent on building op histograms of the module
+    histogram_time_ns: int = 0
+
+    def get_stats(self, callback_name: str, anchor_ops: Optional[FrozenSet[str]] = None) -> PatternCallbackStats:
+        if callback_name not in self.callbacks:
+            anchors = tuple(sorted(anchor_ops)) if anchor_ops is not None else None
+            self.callbacks[callback_name] = PatternCallbackStats(callback_name, anchors)
+        return self.callbacks[callback_name]
+
+    def to_dict(self) -> Dict:
+        return asdict(self)
+
+    def dump_json(self, path: str):
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with open(path, "w") as f:
+            json.dump(self.to_dict(), f, indent=2)
+
+    def summary(self) -> str:
+        total_time_ns = sum(stats.wall_time_ns for stats in self.callbacks.values())
+        num_skipped = sum(stats.num_skipped for stats in self.callbacks.values())
+        lines = [
+            f"Pattern callbacks: {total_time_ns / 1e6:.1f} ms, {num_skipped} skipped runs, "
+            f"op histograms {self.histogram_time_ns / 1e6:.1f} ms"
+        ]
+        for stats in sorted(self.callbacks.values(), key=lambda stats: stats.wall_time_ns, reverse=True):
+            lines.append(
+                f"  {stats.name}: {stats.wall_time_ns / 1e6:.1f} ms, runs {stats.num_runs}, "
+                f"skipped {stats.num_skipped}, matches {stats.num_matches}, changes {stats.num_changes}"
+            )
+        return "\n".join(lines)
+
+
 def _get_callback_name(callback):
     if isinstance(callback, DFPatternCallback):
         return type(callback).__name__
@@ -5043,9 +5113,76 @@ def _get_callback_name(callback):
         raise NotImplementedError(f"Type of callback ({(callback)}) not implemented")
 
 
-def _run_pattern_callback(relay_module, callback, callback_name):
+def _get_pattern_anchor_ops(pattern) -> Optional[FrozenSet[str]]:
+    """
+    Returns names of ops one of which has to be present in the module for the pattern to match - ops of the calls
+    the pattern can be rooted at. Returns None if the pattern is not rooted at a known op call (e.g. wildcard, tuple).
+    """
+    if isinstance(pattern, CallPattern):
+        if isinstance(pattern.op, ExprPattern) and isinstance(pattern.op.expr, tvm.ir.Op):
+            return frozenset([pattern.op.expr.name])
+        return None
+    if isinstance(pattern, AltPattern):
+        left = _get_pattern_anchor_ops(pattern.left)
+        right = _get_pattern_anchor_ops(pattern.right)
+        if left is None or right is None:
+            return None
+        return left | right
+    if isinstance(pattern, (AttrPattern, TypePattern, ShapePattern, DataTypePattern)):
+        return _get_pattern_anchor_ops(pattern.pattern)
+    return None
+
+
+def _get_callback_anchor_ops(callback) -> Optional[FrozenSet[str]]:
+    """
+    Returns anchor ops of the callback - either declared by the callback through `anchor_ops`, or derived from its
+    pattern. Returns None if the callback has to run regardless of the ops in the module.
+    """
+    if not isinstance(callback, DFPatternCallback):
+        return None
+    anchor_ops = getattr(callback, "anchor_ops", None)
+    if anchor_ops is not None:
+        return frozenset(anchor_ops)
+    return _get_pattern_anchor_ops(callback.pattern)
+
+
+def _get_op_histogram(func) -> Counter:
+    """
+    Returns number of calls of each op in the function.
+    """
+    histogram = Counter()
+
+    def visit(expr):
+        if isinstance(expr, tvm.relay.Call) and isinstance(expr.op, tvm.ir.Op):
+            histogram[expr.op.name] += 1
+
+    tvm.relay.analysis.post_order_visit(func, visit)
+    return histogram
+
+
+class _CountingPatternCallback:
+    """
+    Stands in for the callback in `rewrite`, counts the pattern matches.
+    """
+
+    def __init__(self, callback: DFPatternCallback):
+        self.pattern = callback.pattern
+        self.require_type = callback.require_type
+        self.rewrite_once = callback.rewrite_once
+        self.wrapped_callback = callback
+        self.num_matches = 0
+
+    def callback(self, pre, post, node_map):
+        self.num_matches += 1
+        return self.wrapped_callback.callback(pre, post, node_map)
+
+
+def _run_pattern_callback(relay_module, callback, callback_name, stats=None):
     if isinstance(callback, DFPatternCallback):
-        relay_module["main"] = rewrite(callback, relay_module["main"])
+        counting_callback = _CountingPatternCallback(callback)
+        relay_module["main"] = rewrite([counting_callback], relay_module["main"])
+        if stats is not None:
+            stats.num_matches += counting_callback.num_matches
     elif isinstance(callback, tvm.transform.Pass):
         relay_module = tvm.transform.Sequential([callback])(relay_module)
     else:
@@ -5058,31 +5195,80 @@ def _run_pattern_callback(relay_module, callback, callback_name):
 
 
 def run_pattern_callbacks(
-    relay_module, callbacks, params=None, inputs=None, target=None, framework_outputs=None, verify_cfg=None
+    relay_module,
+    callbacks,
+    params=None,
+    inputs=None,
+    target=None,
+    framework_outputs=None,
+    verify_cfg=None,
+    report: Optional[PatternCallbackReport] = None,
 ):
+    """
+    Runs the callbacks on the main function of the module, in order.
 
+    Pattern callbacks whose anchor ops (see `_get_callback_anchor_ops`) are not present in the module are skipped,
+    presence of ops is tracked through an op histogram of the main function, rebuilt only when a callback changes it.
+    Time and hit counts of the callbacks are recorded into the report - if not passed, the report is logged at the
+    debug level and written to FORGE_PATTERN_CALLBACK_REPORT path, if set.
+    """
     run_verify = verify_cfg and params and inputs and target and framework_outputs and verify_cfg.verify_each_forge_pass
     if verify_cfg and verify_cfg.verify_each_forge_pass and not run_verify:
         logger.warning(
             f"Cannot verify relay module after forge passes because one of (params, inputs, target, golden_outputs, veirfy_cfg) is None"
         )
 
+    owns_report = report is None
+    if owns_report:
+        report = PatternCallbackReport()
+
+    skip_callbacks = not DISABLE_PATTERN_CALLBACK_SKIPPING
+    op_histogram = None
     for callback in callbacks:
         callback_name = _get_callback_name(callback)
+        anchor_ops = _get_callback_anchor_ops(callback)
+        stats = report.get_stats(callback_name, anchor_ops)
+
+        if skip_callbacks and anchor_ops is not None:
+            if op_histogram is None:
+                start = time.perf_counter_ns()
+                op_histogram = _get_op_histogram(relay_module["main"])
+                report.histogram_time_ns += time.perf_counter_ns() - start
+            if not any(op_histogram[op] for op in anchor_ops):
+                stats.num_skipped += 1
+                continue
+
+        main = relay_module["main"]
+        start = time.perf_counter_ns()
         try:
-            relay_module = _run_pattern_callback(relay_module, callback, callback_name)
+            with compile_phase(callback_name, category="tvm_pattern_callback"):
+                relay_module = _run_pattern_callback(relay_module, callback, callback_name, stats)
         except Exception as ex:
             logger.error(f'Failed on "{callback_name}" TVM callback')
             raise ex
+        stats.wall_time_ns += time.perf_counter_ns() - start
+        stats.num_runs += 1
+
+        if not relay_module["main"].same_as(main):
+            stats.num_changes += 1
+            # Histogram is rebuilt lazily, once a callback with anchor ops runs on the changed module
+            op_histogram = None
+
         if run_verify:
             logger.trace(f"Verifying {callback_name}")
             verify_tvm_compile(relay_module, params, inputs, target, framework_outputs, callback_name, verify_cfg)
 
+    if owns_report:
+        logger.debug(report.summary())
+        report_path = os.environ.get("FORGE_PATTERN_CALLBACK_REPORT", "")
+        if report_path:
+            report.dump_json(report_path)
+
     return relay_module
 
 
 def run_forge_compile_passes(
-    relay_module, params=None, inputs=None, target=None, framework_outputs=None, verify_cfg=None
+    relay_module, params=None, inputs=None, target=None, framework_outputs=None, verify_cfg=None, report=None
 ):
     return run_pattern_callbacks(
         relay_module,
@@ -5189,4 +5375,5 @@ def run_forge_compile_passes(
         target=target,
         framework_outputs=framework_outputs,
         verify_cfg=verify_cfg,
+        report=report,
     )
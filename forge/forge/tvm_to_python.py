@@ -16,10 +16,13 @@ from forge.verify.config import _get_global_verify_config
 import forge
 from forge.tensor import to_pt_tensors
 from forge.tvm_utils import flatten_inputs
+from forge.compile_profiler import compile_phase
 
 import os
 import sys
+import types
 import importlib
+import linecache
 
 from forge.python_codegen import PyTorchWriter, ForgeWriter, PythonWriter, pytorch_df_from_str
 from forge.tvm_unique_op_generation import Operation, NodeType, extract_and_export_unique_ops_config
@@ -34,6 +37,14 @@ class ExitTest(Exception):
 
 
 def import_from_path(module_name, file_path):
+    # Generated files can be rewritten under the same name (e.g. by a previous run), so make sure that neither the
+    # previously imported module nor its cached bytecode (validated only by source mtime and size) are reused
+    sys.modules.pop(module_name, None)
+    importlib.invalidate_caches()
+    bytecode_path = importlib.util.cache_from_source(file_path)
+    if os.path.exists(bytecode_path):
+        os.remove(bytecode_path)
+
     spec = importlib.util.spec_from_file_location(module_name, file_path)
     assert spec is not None, f"Could not load module {module_name} from {file_path}"
     module = importlib.util.module_from_spec(spec)
@@ -42,6 +53,28 @@ def import_from_path(module_name, file_path):
     return module
 
 
+def load_generated_module(writer):
+    """
+    Loads the module generated by the writer.
+
+    Modules written to disk are imported from the file. In-memory modules are compiled from the source kept by the
+    writer into a fresh module object, without writing, byte-compiling and importing a file.
+    """
+    if not writer.in_memory:
+        return import_from_path(writer.module_name, os.path.join(writer.module_directory, writer.filename))
+
+    assert writer.source is not None, f"Source of the generated module {writer.module_name} is not finalized"
+    filename = f"<generated {writer.filename}>"
+    # Register the source, so that tracebacks and debuggers can show the generated code
+    linecache.cache[filename] = (len(writer.source), None, writer.source.splitlines(keepends=True), filename)
+
+    module = types.ModuleType(writer.module_name)
+    module.__file__ = filename
+    module.SERIALIZED_PARAMS = writer.serialized_params
+    exec(compile(writer.source, filename, "exec"), module.__dict__)
+    return module
+
+
 def populate_torch_all_to_args(graph, nid, compiler_cfg):
     curr_node, args = _populate_torch_init_args(graph, nid)
 
@@ -1955,16 +1988,6 @@ def get_framework(module):
 
 
 counter = 0
-generated_files = []
-
-
-def cleanup_temporary_files():
-    global generated_files
-    for filename in generated_files:
-        if os.path.exists(filename):
-            os.remove(filename)
-
-    generated_files = []
 
 
 def get_forge_outputs(forge_mods, devices, forge_inputs):
@@ -2061,7 +2084,6 @@ def generate_forge_module(
     compiler_cfg=None,
     graph_name=None,
     verify_cfg=None,
-    clean_later=False,
     input_names=[],
 ):
     global counter
@@ -2087,57 +2109,47 @@ def generate_forge_module(
         framework_outputs = framework_mod.cpu_eval_forward(*pytorch_inputs)
 
     if not reload:
+        # Generated modules get unique names, so that the ones written to disk don't overwrite each other
         module_name = graph_name if counter == 0 else f"{graph_name}_{counter}"
-        module_writers, flattened_inputs = compile_tvm_to_python(
-            framework_mod,
-            graph_name,
-            pytorch_inputs,
-            module_name=module_name,
-            compiler_cfg=compiler_cfg,
-            verify_cfg=verify_cfg,
-            input_names=input_names,
-        )
+        with compile_phase("tvm.codegen"):
+            module_writers, flattened_inputs = compile_tvm_to_python(
+                framework_mod,
+                graph_name,
+                pytorch_inputs,
+                module_name=module_name,
+                compiler_cfg=compiler_cfg,
+                verify_cfg=verify_cfg,
+                input_names=input_names,
+            )
     else:
         module_writers, flattened_inputs = load_writers_metadata(graph_name, inputs)
 
     counter += 1
-    sys.path.append(".")
 
     forge_mods = []
     devices = []
     for writer in module_writers:
         # Load the generated module
-        module_name = writer.module_name
-        file_path = os.path.join(writer.module_directory, writer.filename)
-        module = import_from_path(module_name, file_path)
+        with compile_phase("tvm.module_import"):
+            module = load_generated_module(writer)
 
-        TestClass = getattr(module, writer.class_name)
+            TestClass = getattr(module, writer.class_name)
 
-        devices.append(writer.dev)
-        if writer.dev == "CPUDevice":
-            forge_mod = forge.PyTorchModule(writer.module_name, TestClass())
-            forge_mod.module.process_framework_parameters(framework_mod.module)
-        else:
-            forge_mod = TestClass(writer.module_name)
+            devices.append(writer.dev)
+            if writer.dev == "CPUDevice":
+                forge_mod = forge.PyTorchModule(writer.module_name, TestClass())
+                forge_mod.module.process_framework_parameters(framework_mod.module)
+            else:
+                forge_mod = TestClass(writer.module_name)
 
-            forge_mod.process_framework_parameters(framework_mod.module)
+                forge_mod.process_framework_parameters(framework_mod.module)
 
-            assert not any(
-                [param.value() is None for param in forge_mod.get_parameters()]
-            ), f"Could not retrieve parameters from framework and tvm"
+                assert not any(
+                    [param.value() is None for param in forge_mod.get_parameters()]
+                ), f"Could not retrieve parameters from framework and tvm"
 
         forge_mods.append(forge_mod)
 
-        if not compiler_cfg.retain_tvm_python_files:
-            global generated_files
-            generated_files.append(writer.filename)
-            param_filename = os.path.join(writer.module_directory, writer.module_name + "_params.pt")
-            if os.path.exists(param_filename):
-                generated_files.append(os.path.abspath(param_filename))
-
-            if not clean_later:
-                cleanup_temporary_files()
-
     if devices[0] == "CPUDevice":
         forge_inputs = forge.tensor.to_pt_tensors(flattened_inputs)
     else:
@@ -2211,6 +2223,10 @@ def compile_tvm_to_python(
         match = span_lexer(node["attrs"]["span"])
         return match.group(0) if match is not None else None
 
+    # Generated modules are only written to disk when they need to be retained, or are read back from disk when
+    # extracting the unique ops configuration
+    in_memory = not (compiler_cfg.retain_tvm_python_files or compiler_cfg.extract_tvm_unique_ops_config)
+
     modules = []
     for graph_index, json_graph in enumerate(json_graphs):
         graph = json.loads(json_graph["graph"])
@@ -2678,9 +2694,10 @@ def compile_tvm_to_python(
                 framework,
                 contains_incompatible_np_floats=contains_incompatible_np_floats,
                 delete_inputs=delete_inputs,
+                in_memory=in_memory,
             )
         else:
-            writer = PyTorchWriter(current_module_name, source_framework=framework)
+            writer = PyTorchWriter(current_module_name, source_framework=framework, in_memory=in_memory)
 
         writer.write_header()
 
@@ -2765,7 +2782,10 @@ def compile_tvm_to_python(
         param_file_name = None
         if len(params_from_tvm):
             param_file_name = os.path.join(writer.module_directory, writer.module_name + "_params.pt")
-            torch.save(params_from_tvm, param_file_name)
+            if writer.in_memory:
+                writer.serialized_params = params_from_tvm
+            else:
+                torch.save(params_from_tvm, param_file_name)
 
         param_names.update(const_names)
         writer.write_param_parser(param_names, param_file_name)
@@ -2778,8 +2798,7 @@ def compile_tvm_to_python(
 
             # Running the inference to verify the generated forge module which helps
             # to avoid extracting unique ops configuration for not properly traced models
-            file_path = os.path.join(writer.module_directory, writer.filename)
-            module = import_from_path(writer.module_name, file_path)
+            module = load_generated_module(writer)
 
             TestClass = getattr(module, writer.class_name)
             forge_mod = TestClass(writer.module_name)
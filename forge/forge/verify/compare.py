@@ -3,35 +3,55 @@
 # SPDX-License-Identifier: Apache-2.0
 
 
+from dataclasses import dataclass
 from multiprocessing.pool import ThreadPool
 import math
 import os
 from typing import Union
 
 import torch
-import tensorflow as tf
 import numpy as np
 from loguru import logger
 from scipy.spatial import distance
 from typing import Union, Tuple, List, Optional
 
 from forge._C import verif
+from forge.lazy_import import lazy_import, is_imported
+
+tf = lazy_import("tensorflow")
 
 # Compares golden and calculated tensors. Using allclose for scalar values, rogerstanimoto for bool tensors, pcc otherwise
 def compare_with_golden(
-    golden: Union[torch.Tensor, tf.Tensor, tf.Variable],
+    golden: Union[torch.Tensor, "tf.Tensor", "tf.Variable"],
     calculated: torch.Tensor,
     pcc: float = 0.99,
     rtol: float = 1e-05,
     atol: float = 1e-08,
     dissimilarity_threshold: float = 1e-03,  # threshold picked empirically. We will update it as TTNN evolves
 ):
+    result, _ = compare_with_golden_detailed(golden, calculated, pcc, rtol, atol, dissimilarity_threshold)
+    return result
+
+
+# Same as `compare_with_golden`, but also returns the comparison of non-scalar (non-bool) tensors, which holds the
+# all_close result with the given tolerances and the observed differences
+def compare_with_golden_detailed(
+    golden: Union[torch.Tensor, "tf.Tensor", "tf.Variable"],
+    calculated: torch.Tensor,
+    pcc: float = 0.99,
+    rtol: float = 1e-05,
+    atol: float = 1e-08,
+    dissimilarity_threshold: float = 1e-03,
+) -> Tuple[bool, Optional["TensorComparison"]]:
+    comparison = None
     if golden.dtype == torch.bool:
         calculated_dissimilarity = calculate_dissimilarity(golden, calculated)
         result = compare_dissimilarity(calculated_dissimilarity, dissimilarity_threshold)
     elif golden.flatten().size() != (1,):  # PCC for single values doesn't work
-        calculated_pcc = calculate_pcc(golden, calculated)
-        result = compare_pcc(calculated_pcc, pcc)
+        comparison = compare_tensors(golden, calculated, rtol=rtol, atol=atol, early_exit=False)
+        if not comparison.special_values_match:
+            logger.error("Tensor mismatch. NaN/Inf values of golden and calculated tensors don't match")
+        result = compare_pcc(comparison.pcc, pcc)
     else:
         # For scalar values, we can't calculate PCC, but we can compare golden and calculated values using relative and absolute tolerances
         golden = golden.flatten()[0]
@@ -51,7 +71,7 @@ def compare_with_golden(
         logger.error("Calculated: (shape = {}", calculated.shape)
         logger.error(calculated)
 
-    return result
+    return result, comparison
 
 
 def calculate_dissimilarity(golden: torch.Tensor, calculated: torch.Tensor):
@@ -222,7 +242,7 @@ def compare_pcc(calculated_pcc: float, pcc: float = 0.99):
 # Deprecated: avoid using it, instead use compare_with_golden
 def compare_tensor_to_golden(
     name: str,
-    golden: Union[torch.Tensor, tf.Tensor, tf.Variable],
+    golden: Union[torch.Tensor, "tf.Tensor", "tf.Variable"],
     calculated: torch.Tensor,
     rtol=None,
     atol=None,
@@ -232,7 +252,7 @@ def compare_tensor_to_golden(
     verify_cfg=None,
 ):
     # Convert golden to pytorch tensor for comparisons
-    if isinstance(golden, (tf.Tensor, tf.Variable)):
+    if is_imported(tf) and isinstance(golden, (tf.Tensor, tf.Variable)):
         golden = torch.from_numpy(golden.numpy())
 
     if golden.dtype == torch.bool and calculated.dtype != torch.bool:
@@ -399,10 +419,194 @@ def compute_required_tolerances(golden, calculated):
     if golden.shape != calculated.shape:
         raise ValueError("Tensors must have the same shape")
 
-    required_atol = calculate_atol(golden, calculated)
-    required_rtol = calculate_rtol(golden, calculated)
+    comparison = compare_tensors(golden, calculated)
+
+    return comparison.max_abs_diff, comparison.max_rel_diff
+
+
+# Number of elements compared at once by `compare_tensors`, bounds the memory used for temporaries
+COMPARE_CHUNK_SIZE = int(os.environ.get("FORGE_VERIFY_CHUNK_SIZE", 1 << 20))
+
+
+@dataclass
+class TensorComparison:
+    # Pearson correlation coefficient over finite values, 0.0 if NaN/Inf values don't match
+    pcc: float = 1.0
+    # Maximum absolute and relative (w.r.t. calculated) difference over finite values, inf if NaN/Inf values don't match.
+    # When the tensors are compared with the native kernels and all_close passes, they are not computed (None)
+    max_abs_diff: Optional[float] = 0.0
+    max_rel_diff: Optional[float] = 0.0
+    # NaNs and Infs are at the same positions (and of the same sign) in both tensors
+    special_values_match: bool = True
+    # Result of all_close with the requested tolerances, None if tolerances weren't given
+    all_close: Optional[bool] = None
+    # Number of elements compared, smaller than the tensor size if the comparison terminated early
+    num_elements: int = 0
+    terminated_early: bool = False
+
+
+class _PccMoments:
+    """
+    Running mean, variance and covariance of two sequences, merged chunk by chunk (Chan et al. parallel algorithm),
+    which keeps the PCC numerically stable over large tensors.
+    """
+
+    def __init__(self):
+        self.n = 0
+        self.mean_a = 0.0
+        self.mean_b = 0.0
+        self.m2_a = 0.0
+        self.m2_b = 0.0
+        self.c_ab = 0.0
+
+    def update(self, a: torch.Tensor, b: torch.Tensor):
+        n = a.numel()
+        if n == 0:
+            return
+
+        mean_a = a.mean().item()
+        mean_b = b.mean().item()
+        centered_a = a - mean_a
+        centered_b = b - mean_b
+        m2_a = torch.dot(centered_a, centered_a).item()
+        m2_b = torch.dot(centered_b, centered_b).item()
+        c_ab = torch.dot(centered_a, centered_b).item()
+
+        total = self.n + n
+        delta_a = mean_a - self.mean_a
+        delta_b = mean_b - self.mean_b
+        scale = self.n * n / total
+        self.mean_a += delta_a * n / total
+        self.mean_b += delta_b * n / total
+        self.m2_a += m2_a + delta_a * delta_a * scale
+        self.m2_b += m2_b + delta_b * delta_b * scale
+        self.c_ab += c_ab + delta_a * delta_b * scale
+        self.n = total
+
+    def pcc(self, all_close: bool) -> float:
+        if self.n == 0:
+            # Only NaN/Inf values, all of them matching
+            return 1.0
+        if self.m2_a == 0 or self.m2_b == 0:
+            # PCC is undefined for constant tensors, they are either equal or not
+            return 1.0 if all_close else 0.0
+        return max(-1.0, min(1.0, self.c_ab / math.sqrt(self.m2_a * self.m2_b)))
+
+
+def compare_tensors(
+    golden: torch.Tensor,
+    calculated: torch.Tensor,
+    rtol: Optional[float] = None,
+    atol: Optional[float] = None,
+    early_exit: bool = True,
+    chunk_size: int = COMPARE_CHUNK_SIZE,
+) -> TensorComparison:
+    """
+    Compares two tensors, computing PCC, maximum absolute and relative difference, NaN/Inf agreement and (if tolerances
+    are given) all_close.
+
+    Floating point tensors of the same type without NaN/Inf values are compared with the native kernels (see
+    `can_use_custom_kernel`); differences are then computed only if all_close fails or isn't requested.
+
+    Other tensors are compared in a single pass over fixed size chunks, so the memory overhead is a few chunk sized
+    temporaries, regardless of the tensor size. The comparison stops as soon as the result is known to be a failure:
+    on the first NaN/Inf mismatch, and, if `early_exit` is set and tolerances are given, on the first element outside
+    of the tolerances. Statistics of an early terminated comparison cover only the elements compared so far.
+
+    Parameters
+    ----------
+    golden: torch.Tensor
+        Expected tensor
 
-    return required_atol, required_rtol
+    calculated: torch.Tensor
+        Calculated tensor, same number of elements as golden
+
+    rtol, atol: Optional[float]
+        Tolerances for the all_close check, which is skipped if neither is given
+
+    early_exit: bool
+        Stop on the first all_close failure
+
+    chunk_size: int
+        Number of elements compared at once
+
+    Returns
+    -------
+    TensorComparison
+    """
+    if golden.numel() != calculated.numel():
+        raise ValueError(f"Tensors must have the same number of elements: {golden.shape} vs {calculated.shape}")
+
+    check_all_close = rtol is not None or atol is not None
+    rtol = 0.0 if rtol is None else rtol
+    atol = 0.0 if atol is None else atol
+
+    if golden.shape == calculated.shape and can_use_custom_kernel(golden, calculated):
+        result = TensorComparison(
+            pcc=calculate_pcc(golden, calculated),
+            max_abs_diff=None,
+            max_rel_diff=None,
+            num_elements=golden.numel(),
+        )
+        if check_all_close:
+            result.all_close = verif.all_close(golden, calculated, rtol=rtol, atol=atol)
+        if not result.all_close:
+            result.max_abs_diff = calculate_atol(golden, calculated)
+            result.max_rel_diff = calculate_rtol(golden, calculated)
+        return result
+
+    golden = golden.detach().reshape(-1)
+    calculated = calculated.detach().reshape(-1)
+
+    result = TensorComparison(all_close=True if check_all_close else None)
+    moments = _PccMoments()
+    # all_close with the default tolerances, decides PCC of constant tensors
+    default_all_close = True
+
+    for start in range(0, golden.numel(), chunk_size):
+        a = golden[start : start + chunk_size].to(torch.float64)
+        b = calculated[start : start + chunk_size].to(torch.float64)
+        result.num_elements += a.numel()
+
+        finite_a = torch.isfinite(a)
+        finite_b = torch.isfinite(b)
+        if not (finite_a.all() and finite_b.all()):
+            # Non-finite values have to be the same in both tensors (NaN == NaN, inf == inf with the same sign)
+            if not torch.equal(finite_a, finite_b) or not torch.equal(
+                torch.nan_to_num(a[~finite_a], nan=0.0), torch.nan_to_num(b[~finite_b], nan=0.0)
+            ):
+                result.special_values_match = False
+                result.all_close = False if check_all_close else None
+                result.pcc = 0.0
+                result.max_abs_diff = math.inf
+                result.max_rel_diff = math.inf
+                result.terminated_early = result.num_elements < golden.numel()
+                return result
+            a = a[finite_a]
+            b = b[finite_b]
+
+        if a.numel() == 0:
+            continue
+
+        abs_diff = torch.abs(a - b)
+        abs_b = torch.abs(b)
+        result.max_abs_diff = max(result.max_abs_diff, abs_diff.max().item())
+        # Zero calculated values don't contribute to the relative difference (same as `calculate_rtol`)
+        rel_diff = torch.where(abs_b == 0, 0.0, abs_diff / abs_b)
+        result.max_rel_diff = max(result.max_rel_diff, rel_diff.max().item())
+        default_all_close = default_all_close and bool(torch.all(abs_diff <= 1e-08 + 1e-05 * abs_b))
+
+        moments.update(a, b)
+
+        if check_all_close and not torch.all(abs_diff <= atol + rtol * abs_b):
+            result.all_close = False
+            if early_exit:
+                result.terminated_early = result.num_elements < golden.numel()
+                result.pcc = moments.pcc(default_all_close)
+                return result
+
+    result.pcc = moments.pcc(default_all_close)
+    return result
 
 
 def determine_consistency_limits(
@@ -447,12 +651,11 @@ def determine_consistency_limits(
             atol = calculate_atol(fw_out, co_out)
             atol_values.append(atol)
         else:
-            pcc = calculate_pcc(fw_out, co_out)
-            pcc_values.append(pcc)
-            atol = calculate_atol(fw_out, co_out)
-            atol_values.append(atol)
-            rtol = calculate_rtol(fw_out, co_out)
-            rtol_values.append(rtol)
+            # PCC, ATOL and RTOL in a single pass over the tensors
+            comparison = compare_tensors(fw_out, co_out)
+            pcc_values.append(comparison.pcc)
+            atol_values.append(comparison.max_abs_diff)
+            rtol_values.append(comparison.max_rel_diff)
 
     min_pcc = min(pcc_values) if pcc_values else None
     max_atol = max(atol_values) if atol_values else None
@@ -7,9 +7,7 @@ from enum import Enum
 import os
 
 
-import paddle
 import torch
-import tensorflow as tf
 import forge
 
 from forge._C import DataFormat
@@ -270,9 +268,9 @@ class VerifyConfig:
     # --- Supported Types --- #
     @property
     def supported_tensor_types(self) -> Tuple:
-        from forge.tensor import AnyTensor  # Local import to avoid circular dependency
+        from forge.tensor import get_any_tensor_types  # Local import to avoid circular dependency
 
-        return (AnyTensor,)
+        return get_any_tensor_types()
 
     @property
     def compiled_model_types(self) -> Tuple:
@@ -282,6 +280,6 @@ class VerifyConfig:
 
     @property
     def framework_model_types(self) -> Tuple:
-        from forge.module import AnyModule  # Local import to avoid circular dependency
+        from forge.module import get_any_module_types  # Local import to avoid circular dependency
 
-        return (AnyModule,)
+        return get_any_module_types()
@@ -4,7 +4,7 @@
 from abc import ABC, abstractmethod
 
 import torch
-from forge.verify.compare import compare_with_golden, compute_required_tolerances
+from forge.verify.compare import compare_with_golden, compare_with_golden_detailed, compute_required_tolerances
 from forge._C import verif
 
 
@@ -76,21 +76,25 @@ class FullValueChecker(ValueChecker):
         )
 
     def check(self, fw_out, co_out):
-        if not compare_with_golden(fw_out, co_out, self.pcc, self.rtol, self.atol, self.dissimilarity_threshold):
+        result, comparison = compare_with_golden_detailed(
+            fw_out, co_out, self.pcc, self.rtol, self.atol, self.dissimilarity_threshold
+        )
+        if not result:
             raise ValueError(
                 f"Data mismatch -> FullChecker (compare_with_golden): framework_model={fw_out}, compiled_model={co_out}"
             )
 
+        # Scalars are already compared with all_close, and tensors' all_close comes with the PCC comparison
         all_close_check = True
-        if fw_out.dtype not in [
+        if comparison is not None and fw_out.dtype not in [
             torch.int32,
             torch.int64,
             torch.bool,
         ]:  # allclose doesn't make sense for integer/bool types
-            all_close_check = verif.all_close(fw_out, co_out, rtol=self.rtol, atol=self.atol)
+            all_close_check = comparison.all_close
 
         if not all_close_check:
-            atol, rtol = compute_required_tolerances(fw_out, co_out)
+            atol, rtol = comparison.max_abs_diff, comparison.max_rel_diff
             raise ValueError(
                 f"Data mismatch -> FullChecker (all_close):\n"
                 f"- Tensor mismatch. Required rtol={self.rtol}, atol={self.atol}\n"
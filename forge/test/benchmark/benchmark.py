@@ -76,6 +76,13 @@ def read_args():
         help="Data format, format of the input data. If the model gives opportunity to change data format.",
     )
     parser.add_argument("-lp", "--loop_count", type=int, default=1, help="Number of times to run the benchmark.")
+    parser.add_argument(
+        "-wc",
+        "--warmup_count",
+        type=int,
+        default=1,
+        help="Number of warmup runs of the model, before the measured ones.",
+    )
     parser.add_argument(
         "-isz",
         "--input_size",
@@ -117,6 +124,7 @@ def read_args():
     parsed_args["config"] = args.config
     parsed_args["training"] = args.training
     parsed_args["loop_count"] = args.loop_count
+    parsed_args["warmup_count"] = args.warmup_count
 
     if not args.batch_size:
         print("\nBatch size is not specified. We set on size 1. \n\n")
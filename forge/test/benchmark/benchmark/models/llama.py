@@ -4,10 +4,6 @@
 
 # Built-in modules
 import pytest
-import time
-import socket
-import json
-from datetime import datetime
 
 # Third-party modules
 import torch
@@ -19,6 +15,14 @@ from forge._C.runtime.experimental import configure_devices, DeviceSettings
 from test.mlir.llama.utils.utils import load_model
 from forge.verify.compare import compare_with_golden
 from forge.config import CompilerConfig, MLIRConfig
+from test.benchmark.engine import (
+    BenchmarkConfig,
+    create_measurement,
+    get_measurement,
+    print_benchmark_result,
+    run_model_benchmark,
+    save_benchmark_result,
+)
 
 
 # Common constants
@@ -46,6 +50,7 @@ def test_llama_prefill(
     batch_size,
     model_path,
     loop_count,
+    warmup_count=1,
 ):
 
     if training:
@@ -72,109 +77,55 @@ def test_llama_prefill(
 
     # This is the part of the model needed for prefill; model without the last Linear layer (lm_head)
     model_decoder = model.get_decoder()
-    compiled_decoder = forge.compile(model_decoder, sample_inputs=input_ids, compiler_cfg=compiler_config)
 
-    # Enable program cache on all devices
-    settings = DeviceSettings()
-    settings.enable_program_cache = True
-    configure_devices(device_settings=settings)
+    def compile_fn():
+        compiled_decoder = forge.compile(model_decoder, sample_inputs=input_ids, compiler_cfg=compiler_config)
 
-    # Prefill Phase - Process the initial prompt on device
-    # This what we actually want to benchmark, and measure the time taken.
-    transformer_outputs = compiled_decoder(input_ids)
-    start = time.time()
-    for _ in range(loop_count):
-        transformer_outputs = compiled_decoder(input_ids)
-    end = time.time()
+        # Enable program cache on all devices
+        settings = DeviceSettings()
+        settings.enable_program_cache = True
+        configure_devices(device_settings=settings)
 
-    # Get hidden states for all tokens from the last "transformer layer".
-    hidden_states_compiled = transformer_outputs[0]
-    hidden_states_compiled = hidden_states_compiled.to("cpu")
+        return compiled_decoder
 
-    # Get hidden states for all tokens from the last "transformer layer" calculated on CPU.
-    hidden_states_framework = prefil_on_cpu(model, input_ids)
+    def check_fn(sample, outputs):
+        # Get hidden states for all tokens from the last "transformer layer" calculated on CPU.
+        hidden_states_framework = prefil_on_cpu(model, input_ids)
 
-    # Compare result of prefilling on device with the result of prefilling on CPU.
-    # Calculate the pcc for only the last vector in the hidden states tensor.
-    assert compare_with_golden(hidden_states_framework[:, -1, :], hidden_states_compiled[:, -1, :])
+        # Compare result of prefilling on device with the result of prefilling on CPU.
+        # Calculate the pcc for only the last vector in the hidden states tensor.
+        assert compare_with_golden(hidden_states_framework[:, -1, :], outputs[0][:, -1, :])
 
-    date = datetime.now().strftime("%d-%m-%Y")
-    machine_name = socket.gethostname()
     input_size = len(input_ids[0])
-    total_time = end - start
-    total_tokens = input_size * loop_count
-
-    tokens_per_sec = total_tokens / total_time
     model_name = "Llama Prefill"
-    model_type = "Text Generation, Random Text Data"
-    dataset_name = "Llama, Random Data"
-    num_layers = -1  # Number of layers in the model is not relevant here.
-    batch_size = 1  # Batch size is always 1 for text generation.
-
-    input_sequence_length = len(input_ids[0])
-    output_sequence_length = -1  # We are not generating any output here.
-    # This will be changed when we add the decoding part of the model.
-
-    print("====================================================================")
-    print("| Llama Benchmark Results:                                         |")
-    print("--------------------------------------------------------------------")
-    print(f"| Model: {model_name}")
-    print(f"| Model type: {model_type}")
-    print(f"| Dataset name: {dataset_name}")
-    print(f"| Date: {date}")
-    print(f"| Machine name: {machine_name}")
-    print(f"| Total execution time: : {total_time}")
-    print(f"| Total tokens: {total_tokens}")
-    print(f"| Token per second: {tokens_per_sec}")
-    print(f"| Input size: {input_size}")
-    print("====================================================================")
-
-    result = {
-        "model": model_name,
-        "model_type": model_type,
-        "run_type": f"{'_'.join(model_name.split())}_{input_size}_{loop_count}",
-        "config": {"model_size": "small"},
-        "num_layers": num_layers,
-        "batch_size": batch_size,
-        "precision": "f32",  # This is we call dataformat, it should be generic, too, but for this test we don't experiment with it
-        # "math_fidelity": math_fidelity, @TODO - For now, we are skipping these parameters, because we are not supporting them
-        "dataset_name": dataset_name,
-        "profile_name": "",
-        "input_sequence_length": input_sequence_length,
-        "output_sequence_length": output_sequence_length,
-        # This parameter can't have a generic value, so we are leaving it empty.
-        "perf_analysis": False,
-        "training": training,
-        "measurements": [
-            {
-                "iteration": 1,  # This is the number of iterations, we are running only one iteration.
-                "step_name": model_name,
-                "step_warm_up_num_iterations": 0,
-                "measurement_name": "total_tokens",
-                "value": total_tokens,
-                "target": -1,  # This value is negative, because we don't have a target value.
-                "device_power": -1.0,  # This value is negative, because we don't have a device power value.
-                "device_temperature": -1.0,  # This value is negative, because we don't have a device temperature value.
-            },
-            {
-                "iteration": 1,  # This is the number of iterations, we are running only one iteration.
-                "step_name": model_name,
-                "step_warm_up_num_iterations": 0,
-                "measurement_name": "total_time",
-                "value": total_time,
-                "target": -1,  # This value is negative, because we don't have a target value.
-                "device_power": -1.0,  # This value is negative, because we don't have a device power value.
-                "device_temperature": -1.0,  # This value is negative, because we don't have a device temperature value.
-            },
-        ],
-        "device_info": {
-            "device_name": "",
-            "galaxy": False,
-            "arch": "",
-            "chips": 1,
-        },
-        "device_ip": None,
-    }
+
+    # Prefill Phase - Process the initial prompt on device
+    # This what we actually want to benchmark, and measure the time taken.
+    config = BenchmarkConfig(
+        model_name=model_name,
+        model_type="Text Generation, Random Text Data",
+        batch_size=1,  # Batch size is always 1 for text generation.
+        loop_count=loop_count,
+        warmup_count=warmup_count,
+        dataset_name="Llama, Random Data",
+        precision="f32",  # This is we call dataformat, it should be generic, too, but for this test we don't experiment with it
+        num_layers=-1,  # Number of layers in the model is not relevant here.
+        training=training,
+        input_sequence_length=input_size,
+        # We are not generating any output here, this will be changed when we add the decoding part of the model.
+        output_sequence_length=-1,
+        run_type_suffix=f"{input_size}_{loop_count}",
+    )
+    result = run_model_benchmark(config, [[input_ids]], compile_fn, check_fn=check_fn)
+
+    # Every sample of the prefill is the whole prompt
+    total_tokens = input_size * loop_count
+    total_time = get_measurement(result, "total_time")
+    result["measurements"].append(create_measurement(config, "total_tokens", total_tokens))
+    result["measurements"].append(
+        create_measurement(config, "tokens_per_sec", total_tokens / total_time if total_time > 0 else 0.0)
+    )
+    print_benchmark_result(result)
 
     return result
 
@@ -187,12 +138,14 @@ def llama_prefill_benchmark(config: dict):
     output_file = config["output"]
     loop_count = config["loop_count"]
 
-    result = test_llama_prefill(training=training, batch_size=batch_size, model_path=model_path, loop_count=loop_count)
+    result = test_llama_prefill(
+        training=training,
+        batch_size=batch_size,
+        model_path=model_path,
+        loop_count=loop_count,
+        warmup_count=config.get("warmup_count", 1),
+    )
 
     if not output_file:
         output_file = f"forge-benchmark-e2e-llama_prefill_{result['run_type']}.json"
-    result["output"] = output_file
-
-    # Save the results to a file
-    with open(result["output"], "w") as f:
-        json.dump(result, f)
+    save_benchmark_result(result, output_file)
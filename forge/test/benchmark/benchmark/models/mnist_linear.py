@@ -4,10 +4,6 @@
 
 # Built-in modules
 import pytest
-import time
-import socket
-import json
-from datetime import datetime
 
 # Third-party modules
 import torch
@@ -19,6 +15,7 @@ from forge.verify.value_checkers import AutomaticValueChecker
 from forge._C.runtime.experimental import configure_devices, DeviceSettings
 from forge.verify.verify import verify
 from forge.config import CompilerConfig, MLIRConfig
+from test.benchmark.engine import BenchmarkConfig, run_model_benchmark, print_benchmark_result, save_benchmark_result
 
 
 # Common constants
@@ -91,6 +88,7 @@ def test_mnist_linear(
     input_size,
     hidden_size,
     loop_count,
+    warmup_count=1,
     # arch,
     # dataformat,
     # math_fidelity,
@@ -106,99 +104,38 @@ def test_mnist_linear(
 
     compiler_cfg = CompilerConfig()
     compiler_cfg.mlir_config = MLIRConfig().set_enable_optimizer(True)
-    compiled_model = forge.compile(framework_model, sample_inputs=inputs, compiler_cfg=compiler_cfg)
-
-    # Enable program cache on all devices
-    # TODO: enable the program cache - when the optimizer is enabled, running with program cache is not working.
-    # settings = DeviceSettings()
-    # settings.enable_program_cache = True
-    # configure_devices(device_settings=settings)
-
-    # Run for the first time to warm up the model, it will be done by verify function.
-    # This is required to get accurate performance numbers.
-    verify(inputs, framework_model, compiled_model)
-    start = time.time()
-    for _ in range(loop_count):
-        co_out = compiled_model(*inputs)
-    end = time.time()
-
-    co_out = [co.to("cpu") for co in co_out]
-    AutomaticValueChecker().check(fw_out=fw_out, co_out=co_out[0])
-
-    date = datetime.now().strftime("%d-%m-%Y")
-    machine_name = socket.gethostname()
-    total_time = end - start
-    total_samples = batch_size * loop_count
-
-    samples_per_sec = total_samples / total_time
-    model_name = "MNIST Linear"
-    model_type = "Classification, Random Input Data"
+
+    def compile_fn():
+        compiled_model = forge.compile(framework_model, sample_inputs=inputs, compiler_cfg=compiler_cfg)
+
+        # Enable program cache on all devices
+        # TODO: enable the program cache - when the optimizer is enabled, running with program cache is not working.
+        # settings = DeviceSettings()
+        # settings.enable_program_cache = True
+        # configure_devices(device_settings=settings)
+
+        verify(inputs, framework_model, compiled_model)
+        return compiled_model
+
+    def check_fn(sample, outputs):
+        AutomaticValueChecker().check(fw_out=fw_out, co_out=outputs[0])
+
     num_layers = 2  # Number of layers in the model, in this case 2 Linear hidden layers
-    dataset_name = "MNIST, Random Data"
-
-    print("====================================================================")
-    print("| MNIST Benchmark Results:                                         |")
-    print("--------------------------------------------------------------------")
-    print(f"| Model: {model_name}")
-    print(f"| Model type: {model_type}")
-    print(f"| Dataset name: {dataset_name}")
-    print(f"| Date: {date}")
-    print(f"| Machine name: {machine_name}")
-    print(f"| Total execution time: {total_time}")
-    print(f"| Total samples: {total_samples}")
-    print(f"| Sample per second: {samples_per_sec}")
-    print(f"| Batch size: {batch_size}")
-    print(f"| Input size: {input_size}")
-    print(f"| Hidden size: {hidden_size}")
-    print(f"| Number of layers: {num_layers}")
-    print("====================================================================")
-
-    result = {
-        "model": model_name,
-        "model_type": model_type,
-        "run_type": f"{model_name}_{batch_size}_{input_size}_{hidden_size}",
-        "config": {"model_size": "small"},
-        "num_layers": num_layers,
-        "batch_size": batch_size,
-        "precision": "f32",  # This is we call dataformat, it should be generic, too, but for this test we don't experiment with it
-        # "math_fidelity": math_fidelity, @TODO - For now, we are skipping these parameters, because we are not supporting them
-        "dataset_name": dataset_name,
-        "profile_name": "",
-        "input_sequence_length": -1,  # When this value is negative, it means it is not applicable
-        "output_sequence_length": -1,  # When this value is negative, it means it is not applicable
-        "image_dimension": f"{MNIST_INPUT_FEATURE_SIZE}",
-        "perf_analysis": False,
-        "training": training,
-        "measurements": [
-            {
-                "iteration": 1,  # This is the number of iterations, we are running only one iteration.
-                "step_name": model_name,
-                "step_warm_up_num_iterations": 0,
-                "measurement_name": "total_samples",
-                "value": total_samples,
-                "target": -1,  # This value is negative, because we don't have a target value.
-                "device_power": -1.0,  # This value is negative, because we don't have a device power value.
-                "device_temperature": -1.0,  # This value is negative, because we don't have a device temperature value.
-            },
-            {
-                "iteration": 1,  # This is the number of iterations, we are running only one iteration.
-                "step_name": model_name,
-                "step_warm_up_num_iterations": 0,
-                "measurement_name": "total_time",
-                "value": total_time,
-                "target": -1,  # This value is negative, because we don't have a target value.
-                "device_power": -1.0,  # This value is negative, because we don't have a device power value.
-                "device_temperature": -1.0,  # This value is negative, because we don't have a device temperature value.
-            },
-        ],
-        "device_info": {
-            "device_name": "",
-            "galaxy": False,
-            "arch": "",
-            "chips": 1,
-        },
-        "device_ip": None,
-    }
+    config = BenchmarkConfig(
+        model_name="MNIST Linear",
+        model_type="Classification, Random Input Data",
+        batch_size=batch_size,
+        loop_count=loop_count,
+        warmup_count=warmup_count,
+        dataset_name="MNIST, Random Data",
+        precision="f32",  # This is we call dataformat, it should be generic, too, but for this test we don't experiment with it
+        num_layers=num_layers,
+        training=training,
+        image_dimension=f"{MNIST_INPUT_FEATURE_SIZE}",
+        run_type_suffix=f"{batch_size}_{input_size}_{hidden_size}",
+    )
+    result = run_model_benchmark(config, [inputs], compile_fn, check_fn=check_fn)
+    print_benchmark_result(result)
 
     return result
 
@@ -219,12 +156,9 @@ def mnist_linear_benchmark(config: dict):
         input_size=input_size,
         hidden_size=hidden_size,
         loop_count=loop_count,
+        warmup_count=config.get("warmup_count", 1),
     )
 
     if not output_file:
         output_file = f"forge-benchmark-e2e-mnist_{batch_size}_{input_size}_{hidden_size}.json"
-    result["output"] = output_file
-
-    # Save the results to a file
-    with open(result["output"], "w") as f:
-        json.dump(result, f)
+    save_benchmark_result(result, output_file)
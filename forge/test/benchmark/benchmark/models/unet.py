@@ -3,11 +3,6 @@
 # SPDX-License-Identifier: Apache-2.0
 
 import pytest
-import time
-import socket
-import json
-from datetime import datetime
-from tqdm import tqdm
 
 import torch
 import torch.nn as nn
@@ -23,6 +18,7 @@ from forge.forge_property_utils import (
     Task,
 )
 from test.utils import download_model
+from test.benchmark.engine import BenchmarkConfig, run_model_benchmark, print_benchmark_result, save_benchmark_result
 
 BATCH_SIZE = [
     1,
@@ -59,6 +55,7 @@ def test_unet(
     loop_count,
     data_format,
     variant,
+    warmup_count=1,
 ):
     if training:
         pytest.skip("Training is not supported")
@@ -93,102 +90,42 @@ def test_unet(
         framework_model = framework_model.to(torch.float32)
         compiler_config.default_df_override = DataFormat.Float32
 
-    # Forge compile framework model
-    compiled_model = forge.compile(
-        framework_model, sample_inputs=input_sample, module_name=module_name, compiler_cfg=compiler_config
-    )
+    def compile_fn():
+        # Forge compile framework model
+        compiled_model = forge.compile(
+            framework_model, sample_inputs=input_sample, module_name=module_name, compiler_cfg=compiler_config
+        )
+
+        # Enable program cache on all devices
+        settings = DeviceSettings()
+        settings.enable_program_cache = True
+        configure_devices(device_settings=settings)
+
+        verify(input_sample, framework_model, compiled_model)
+
+        return compiled_model
+
+    def check_fn(sample, outputs):
+        fw_out = framework_model(*sample)
+        AutomaticValueChecker().check(fw_out=fw_out[0], co_out=outputs[0])
 
-    # Enable program cache on all devices
-    settings = DeviceSettings()
-    settings.enable_program_cache = True
-    configure_devices(device_settings=settings)
-
-    # Run for the first time to warm up the model, it will be done by verify function.
-    # This is required to get accurate performance numbers.
-    verify(input_sample, framework_model, compiled_model)
-    start = time.time()
-    for _ in tqdm(range(loop_count)):
-        co_out = compiled_model(*input_sample)
-    end = time.time()
-
-    fw_out = framework_model(*input_sample)
-    co_out = [co.to("cpu") for co in co_out]
-    AutomaticValueChecker().check(fw_out=fw_out[0], co_out=co_out[0])
-
-    date = datetime.now().strftime("%d-%m-%Y")
-    machine_name = socket.gethostname()
-    total_time = end - start
-    total_samples = batch_size * loop_count
-
-    samples_per_sec = total_samples / total_time
-
-    model_name = module_name
-    model_type = Task.CV_IMAGE_SEG
-    dataset_name = "Random data"
     num_layers = -1  # Not applicable for UNet
 
-    print("====================================================================")
-    print("| UNet Benchmark Results:                                          |")
-    print("--------------------------------------------------------------------")
-    print(f"| Model: {model_name}")
-    print(f"| Model type: {model_type}")
-    print(f"| Dataset name: {dataset_name}")
-    print(f"| Date: {date}")
-    print(f"| Machine name: {machine_name}")
-    print(f"| Total execution time: {total_time}")
-    print(f"| Total samples: {total_samples}")
-    print(f"| Sample per second: {samples_per_sec}")
-    print(f"| Batch size: {batch_size}")
-    print(f"| Data format: {data_format}")
-    print(f"| Input size: {input_size}")
-    print(f"| Channel size: {channel_size}")
-    print("====================================================================")
-
-    result = {
-        "model": model_name,
-        "model_type": model_type,
-        "run_type": f"{'_'.join(model_name.split())}_{batch_size}_{'_'.join([str(dim) for dim in input_size])}_{num_layers}_{loop_count}",
-        "config": {"model_size": "small"},
-        "num_layers": num_layers,
-        "batch_size": batch_size,
-        "precision": data_format,
-        "dataset_name": dataset_name,
-        "profile_name": "",
-        "input_sequence_length": -1,  # When this value is negative, it means it is not applicable
-        "output_sequence_length": -1,  # When this value is negative, it means it is not applicable
-        "image_dimension": f"{channel_size}x{input_size[0]}x{input_size[1]}",
-        "perf_analysis": False,
-        "training": training,
-        "measurements": [
-            {
-                "iteration": 1,  # This is the number of iterations, we are running only one iteration.
-                "step_name": model_name,
-                "step_warm_up_num_iterations": 0,
-                "measurement_name": "total_samples",
-                "value": total_samples,
-                "target": -1,  # This value is negative, because we don't have a target value.
-                "device_power": -1.0,  # This value is negative, because we don't have a device power value.
-                "device_temperature": -1.0,  # This value is negative, because we don't have a device temperature value.
-            },
-            {
-                "iteration": 1,  # This is the number of iterations, we are running only one iteration.
-                "step_name": model_name,
-                "step_warm_up_num_iterations": 0,
-                "measurement_name": "total_time",
-                "value": total_time,
-                "target": -1,  # This value is negative, because we don't have a target value.
-                "device_power": -1.0,  # This value is negative, because we don't have a device power value.
-                "device_temperature": -1.0,  # This value is negative, because we don't have a device temperature value.
-            },
-        ],
-        "device_info": {
-            "device_name": "",
-            "galaxy": False,
-            "arch": "",
-            "chips": 1,
-        },
-        "device_ip": None,
-    }
+    config = BenchmarkConfig(
+        model_name=module_name,
+        model_type=Task.CV_IMAGE_SEG,
+        batch_size=batch_size,
+        loop_count=loop_count,
+        warmup_count=warmup_count,
+        dataset_name="Random data",
+        precision=data_format,
+        num_layers=num_layers,
+        training=training,
+        image_dimension=f"{channel_size}x{input_size[0]}x{input_size[1]}",
+        run_type_suffix=f"{batch_size}_{'_'.join([str(dim) for dim in input_size])}_{num_layers}_{loop_count}",
+    )
+    result = run_model_benchmark(config, [input_sample], compile_fn, check_fn=check_fn)
+    print_benchmark_result(result)
 
     return result
 
@@ -216,12 +153,9 @@ def unet_benchmark(config: dict):
         loop_count=loop_count,
         data_format=data_format,
         variant=variant,
+        warmup_count=config.get("warmup_count", 1),
     )
 
     if not output_file:
         output_file = f"forge-benchmark-e2e-unet_{variant}_{result['run_type']}.json"
-    result["output"] = output_file
-
-    # Save the results to a file
-    with open(result["output"], "w") as f:
-        json.dump(result, f)
+    save_benchmark_result(result, output_file)
@@ -4,14 +4,9 @@
 
 # Built-in modules
 import pytest
-import time
-import socket
-import json
-from datetime import datetime
 
 # Third-party modules
 import torch
-from tqdm import tqdm
 from transformers import ViTForImageClassification
 
 # Forge modules
@@ -22,6 +17,7 @@ from forge._C.runtime.experimental import configure_devices, DeviceSettings
 from test.utils import download_model
 from forge.config import CompilerConfig, MLIRConfig
 from test.benchmark.utils import load_benchmark_dataset, evaluate_classification
+from test.benchmark.engine import BenchmarkConfig, run_model_benchmark, print_benchmark_result, save_benchmark_result
 from forge._C import DataFormat
 
 
@@ -68,7 +64,9 @@ VARIANTS = [
 @pytest.mark.parametrize("variant", VARIANTS, ids=[f"variant={item}" for item in VARIANTS])
 @pytest.mark.parametrize("task", TASK, ids=[f"task={item}" for item in TASK])
 @pytest.mark.parametrize("data_format", DATA_FORMAT, ids=[f"data_format={item}" for item in DATA_FORMAT])
-def test_vit_base(training, batch_size, input_size, channel_size, loop_count, variant, task, data_format):
+def test_vit_base(
+    training, batch_size, input_size, channel_size, loop_count, variant, task, data_format, warmup_count=1
+):
     """
     Test the ViT base benchmark function.
     It is used for benchmarking purposes.
@@ -114,137 +112,54 @@ def test_vit_base(training, batch_size, input_size, channel_size, loop_count, va
         # Convert model to bfloat16
         compiler_config.default_df_override = DataFormat.Float16_b
 
-    # Forge compile framework model
-    compiled_model = forge.compile(
-        framework_model, sample_inputs=inputs[0], module_name=module_name, compiler_cfg=compiler_config
-    )
-
-    # Enable program cache on all devices
-    settings = DeviceSettings()
-    settings.enable_program_cache = True
-    configure_devices(device_settings=settings)
-
-    verify(
-        [
-            inputs[0],
-        ],
-        framework_model,
-        compiled_model,
-    )
+    def compile_fn():
+        # Forge compile framework model
+        compiled_model = forge.compile(
+            framework_model, sample_inputs=inputs[0], module_name=module_name, compiler_cfg=compiler_config
+        )
 
-    if task == "classification":
-        predictions = []
-        start = time.time()
-        for i in tqdm(range(loop_count)):
-            co_out = compiled_model(inputs[i])[0]
-            predictions.append(co_out)
-        end = time.time()
-        predictions = torch.cat(predictions)
-        labels = torch.cat(labels)
-        evaluation_score = evaluate_classification(predictions, labels)
-    elif task == "na":
-        start = time.time()
-        for i in tqdm(range(loop_count)):
-            co_out = compiled_model(inputs[0])[0]
-        end = time.time()
-        evaluation_score = 0.0
-    else:
-        raise ValueError(f"Unsupported task: {task}.")
+        # Enable program cache on all devices
+        settings = DeviceSettings()
+        settings.enable_program_cache = True
+        configure_devices(device_settings=settings)
 
-    fw_out = framework_model(inputs[-1])[0]
-    co_out = co_out.to("cpu")
-    AutomaticValueChecker().check(fw_out=fw_out, co_out=co_out)
+        verify([inputs[0]], framework_model, compiled_model)
+        return compiled_model
 
-    date = datetime.now().strftime("%d-%m-%Y")
-    machine_name = socket.gethostname()
-    total_time = end - start
-    total_samples = batch_size * loop_count
+    def check_fn(sample, outputs):
+        fw_out = framework_model(*sample)[0]
+        AutomaticValueChecker().check(fw_out=fw_out, co_out=outputs[0])
 
-    samples_per_sec = total_samples / total_time
     model_name = "ViT Base"
-    model_type = "Classification"
     if task == "classification":
-        model_type += ", ImageNet-1K"
+        model_type = "Classification, ImageNet-1K"
         dataset_name = "ImageNet-1K"
-    elif task == "na":
-        model_type += ", Random Input Data"
+        # Labels of the measured iterations, in the order of the inputs
+        labels = torch.cat(labels[:loop_count])
+        evaluate_fn = lambda outputs: evaluate_classification(torch.cat([out[0] for out in outputs]), labels)
+    else:
+        model_type = "Classification, Random Input Data"
         dataset_name = model_name + ", Random Data"
+        evaluate_fn = None
     num_layers = 1  # Number of layers in the model, in this case number of convolutional layers
 
-    print("====================================================================")
-    print("| ViT Benchmark Results:                                           |")
-    print("--------------------------------------------------------------------")
-    print(f"| Model: {model_name}")
-    print(f"| Model type: {model_type}")
-    print(f"| Dataset name: {dataset_name}")
-    print(f"| Date: {date}")
-    print(f"| Machine name: {machine_name}")
-    print(f"| Total execution time: {total_time}")
-    print(f"| Total samples: {total_samples}")
-    print(f"| Sample per second: {samples_per_sec}")
-    print(f"| Evaluation score: {evaluation_score}")
-    print(f"| Batch size: {batch_size}")
-    print(f"| Data format: {data_format}")
-    print(f"| Input size: {input_size}")
-    print(f"| Channel size: {channel_size}")
-    print("====================================================================")
-
-    result = {
-        "model": model_name,
-        "model_type": model_type,
-        "run_type": f"{'_'.join(model_name.split())}_{batch_size}_{'_'.join([str(dim) for dim in input_size])}_{num_layers}_{loop_count}",
-        "config": {"model_size": "small"},
-        "num_layers": num_layers,
-        "batch_size": batch_size,
-        "precision": data_format,
-        # "math_fidelity": math_fidelity, @TODO - For now, we are skipping these parameters, because we are not supporting them
-        "dataset_name": dataset_name,
-        "profile_name": "",
-        "input_sequence_length": -1,  # When this value is negative, it means it is not applicable
-        "output_sequence_length": -1,  # When this value is negative, it means it is not applicable
-        "image_dimension": f"{channel_size}x{input_size[0]}x{input_size[1]}",
-        "perf_analysis": False,
-        "training": training,
-        "measurements": [
-            {
-                "iteration": 1,  # This is the number of iterations, we are running only one iteration.
-                "step_name": model_name,
-                "step_warm_up_num_iterations": 0,
-                "measurement_name": "total_samples",
-                "value": total_samples,
-                "target": -1,  # This value is negative, because we don't have a target value.
-                "device_power": -1.0,  # This value is negative, because we don't have a device power value.
-                "device_temperature": -1.0,  # This value is negative, because we don't have a device temperature value.
-            },
-            {
-                "iteration": 1,  # This is the number of iterations, we are running only one iteration.
-                "step_name": model_name,
-                "step_warm_up_num_iterations": 0,
-                "measurement_name": "total_time",
-                "value": total_time,
-                "target": -1,  # This value is negative, because we don't have a target value.
-                "device_power": -1.0,  # This value is negative, because we don't have a device power value.
-                "device_temperature": -1.0,  # This value is negative, because we don't have a device temperature value.
-            },
-            {
-                "iteration": 1,  # This is the number of iterations, we are running only one iteration.
-                "step_name": model_name,
-                "step_warm_up_num_iterations": 0,
-                "measurement_name": "evaluation_score",
-                "value": evaluation_score,
-                "target": -1,
-                "device_power": -1.0,  # This value is negative, because we don't have a device power value.
-                "device_temperature": -1.0,  # This value is negative, because we don't have a device temperature value.
-            },
-        ],
-        "device_info": {
-            "device_name": "",
-            "galaxy": False,
-            "arch": "",
-            "chips": 1,
-        },
-        "device_ip": None,
-    }
+    config = BenchmarkConfig(
+        model_name=model_name,
+        model_type=model_type,
+        batch_size=batch_size,
+        loop_count=loop_count,
+        warmup_count=warmup_count,
+        dataset_name=dataset_name,
+        precision=data_format,
+        num_layers=num_layers,
+        training=training,
+        image_dimension=f"{channel_size}x{input_size[0]}x{input_size[1]}",
+        run_type_suffix=f"{batch_size}_{'_'.join([str(dim) for dim in input_size])}_{num_layers}_{loop_count}",
+    )
+    result = run_model_benchmark(
+        config, [[item] for item in inputs], compile_fn, evaluate_fn=evaluate_fn, check_fn=check_fn
+    )
+    print_benchmark_result(result)
 
     return result
 
@@ -274,12 +189,9 @@ def vit_base_benchmark(config: dict):
         variant=variant,
         task=task,
         data_format=data_format,
+        warmup_count=config.get("warmup_count", 1),
     )
 
     if not output_file:
         output_file = f"forge-benchmark-e2e-vit_base_{result['run_type']}.json"
-    result["output"] = output_file
-
-    # Save the results to a file
-    with open(result["output"], "w") as f:
-        json.dump(result, f)
+    save_benchmark_result(result, output_file)
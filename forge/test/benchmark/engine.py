@@ -0,0 +1,270 @@
+# SPDX-FileCopyrightText: © 2025 Tenstorrent AI ULC
+
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Shared benchmark engine.
+
+Runs the compile, warmup and measured iterations of a benchmarked model, and produces the result in the schema
+used by all of the benchmarks. Compile time, device run latency and host side input/output conversion times are
+measured separately, with per-iteration latencies taken through `time.perf_counter_ns`.
+
+Model benchmarks only provide the framework model, inputs and a compile function, e.g.:
+
+    config = BenchmarkConfig(model_name="MNIST Linear", model_type="Classification", batch_size=32, loop_count=32)
+    result = run_model_benchmark(config, inputs, compile_fn=lambda: forge.compile(framework_model, inputs[0]))
+    print_benchmark_result(result)
+    save_benchmark_result(result, "forge-benchmark-e2e-mnist.json")
+"""
+
+# Built-in modules
+import json
+import socket
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+# Third-party modules
+import numpy as np
+import torch
+
+# Percentiles of the per-iteration latency reported in the results
+LATENCY_PERCENTILES = [50, 90, 99]
+
+
+@dataclass
+class BenchmarkConfig:
+    # Human readable name of the model, e.g. "Resnet 50 HF"
+    model_name: str
+    # Model type, including the dataset, e.g. "Classification, ImageNet-1K"
+    model_type: str
+    batch_size: int = 1
+    # Number of measured iterations
+    loop_count: int = 1
+    # Number of iterations run before the measured ones, not included in the results
+    warmup_count: int = 1
+    dataset_name: str = ""
+    precision: str = "f32"
+    num_layers: int = 1
+    training: bool = False
+    # Image dimension, or any other description of the input size, e.g. "3x224x224"
+    image_dimension: str = ""
+    # Sequence lengths of the language models, negative when not applicable
+    input_sequence_length: int = -1
+    output_sequence_length: int = -1
+    # Suffix of the run type, describes the configuration of the run, e.g. "8_224_224_50_32"
+    run_type_suffix: str = ""
+    model_config: Dict[str, Any] = field(default_factory=lambda: {"model_size": "small"})
+    # Target of the evaluation score, negative if there is no target
+    evaluation_score_target: float = -1
+
+
+@dataclass
+class BenchmarkTimings:
+    compile_time_ns: int = 0
+    # Per-iteration times of the measured iterations
+    input_conversion_ns: List[int] = field(default_factory=list)
+    run_ns: List[int] = field(default_factory=list)
+    output_conversion_ns: List[int] = field(default_factory=list)
+    # Wall time of the measured loop
+    total_time_ns: int = 0
+
+    def latency_percentiles(self) -> Dict[int, float]:
+        """
+        Returns percentiles of the run latency in milliseconds.
+        """
+        if not self.run_ns:
+            return {percentile: 0.0 for percentile in LATENCY_PERCENTILES}
+        latencies = np.array(self.run_ns, dtype=np.float64) / 1e6
+        return {percentile: float(np.percentile(latencies, percentile)) for percentile in LATENCY_PERCENTILES}
+
+
+def default_input_conversion(inputs: Sequence[torch.Tensor]) -> List[torch.Tensor]:
+    return [item.contiguous() for item in inputs]
+
+
+def default_output_conversion(outputs: Sequence[torch.Tensor]) -> List[torch.Tensor]:
+    return [item.to("cpu") for item in outputs]
+
+
+def run_model_benchmark(
+    config: BenchmarkConfig,
+    inputs: Sequence[Sequence[torch.Tensor]],
+    compile_fn: Callable[[], Callable],
+    input_conversion: Callable = default_input_conversion,
+    output_conversion: Callable = default_output_conversion,
+    evaluate_fn: Optional[Callable[[List[List[torch.Tensor]]], float]] = None,
+    check_fn: Optional[Callable[[List[torch.Tensor], List[torch.Tensor]], None]] = None,
+) -> Dict:
+    """
+    Compiles the model and runs warmup and measured iterations, returns the benchmark result.
+
+    Parameters:
+    ----------
+    config: BenchmarkConfig
+        Configuration of the benchmark run.
+    inputs: Sequence[Sequence[torch.Tensor]]
+        Inputs of the model, one list of tensors per iteration. Inputs are cycled if there are less of them than
+        iterations.
+    compile_fn: Callable
+        Returns the compiled model, compile time is measured around it.
+    input_conversion: Callable
+        Host side conversion of the iteration inputs, before they are passed to the compiled model.
+    output_conversion: Callable
+        Host side conversion of the compiled model outputs, e.g. transfer to cpu.
+    evaluate_fn: Callable, optional
+        Computes the evaluation score from the outputs of all measured iterations.
+    check_fn: Callable, optional
+        Checks the outputs of the last measured iteration against its inputs, raises on mismatch.
+
+    Returns:
+    -------
+    result: dict
+        Benchmark result, see `create_benchmark_result`.
+    """
+    assert len(inputs) > 0, "At least one input sample is required"
+
+    start = time.perf_counter_ns()
+    compiled_model = compile_fn()
+    timings = BenchmarkTimings(compile_time_ns=time.perf_counter_ns() - start)
+
+    def run_iteration(iteration: int, record: bool):
+        sample = inputs[iteration % len(inputs)]
+
+        start = time.perf_counter_ns()
+        converted_inputs = input_conversion(sample)
+        converted = time.perf_counter_ns()
+        outputs = compiled_model(*converted_inputs)
+        finished = time.perf_counter_ns()
+        outputs = output_conversion(outputs)
+        end = time.perf_counter_ns()
+
+        if record:
+            timings.input_conversion_ns.append(converted - start)
+            timings.run_ns.append(finished - converted)
+            timings.output_conversion_ns.append(end - finished)
+        return sample, outputs
+
+    for iteration in range(config.warmup_count):
+        run_iteration(iteration, record=False)
+
+    all_outputs = []
+    sample, outputs = None, None
+    start = time.perf_counter_ns()
+    for iteration in range(config.loop_count):
+        sample, outputs = run_iteration(iteration, record=True)
+        if evaluate_fn is not None:
+            all_outputs.append(outputs)
+    timings.total_time_ns = time.perf_counter_ns() - start
+
+    evaluation_score = evaluate_fn(all_outputs) if evaluate_fn is not None else 0.0
+    if check_fn is not None and outputs is not None:
+        check_fn(sample, outputs)
+
+    return create_benchmark_result(config, timings, evaluation_score)
+
+
+def create_measurement(config: BenchmarkConfig, name: str, value: float, target: float = -1) -> Dict:
+    return {
+        "iteration": 1,  # This is the number of iterations, we are running only one iteration.
+        "step_name": config.model_name,
+        "step_warm_up_num_iterations": config.warmup_count,
+        "measurement_name": name,
+        "value": value,
+        "target": target,  # When this value is negative, there is no target value.
+        "device_power": -1.0,  # This value is negative, because we don't have a device power value.
+        "device_temperature": -1.0,  # This value is negative, because we don't have a device temperature value.
+    }
+
+
+def create_benchmark_result(config: BenchmarkConfig, timings: BenchmarkTimings, evaluation_score: float = 0.0) -> Dict:
+    """
+    Creates the benchmark result, the same schema is emitted for all of the models.
+
+    Times are given in seconds for totals, and in milliseconds for per-iteration values.
+    """
+    total_samples = config.batch_size * config.loop_count
+    total_time = timings.total_time_ns / 1e9
+    run_time = sum(timings.run_ns) / 1e9
+
+    measurements = [
+        create_measurement(config, "total_samples", total_samples),
+        create_measurement(config, "total_time", total_time),
+        create_measurement(config, "compile_time", timings.compile_time_ns / 1e9),
+        create_measurement(config, "samples_per_sec", total_samples / total_time if total_time > 0 else 0.0),
+        create_measurement(config, "device_samples_per_sec", total_samples / run_time if run_time > 0 else 0.0),
+    ]
+    for percentile, latency in timings.latency_percentiles().items():
+        measurements.append(create_measurement(config, f"latency_p{percentile}_ms", latency))
+    measurements += [
+        create_measurement(
+            config, "input_conversion_time_ms", float(np.mean(timings.input_conversion_ns or [0])) / 1e6
+        ),
+        create_measurement(
+            config, "output_conversion_time_ms", float(np.mean(timings.output_conversion_ns or [0])) / 1e6
+        ),
+        create_measurement(config, "evaluation_score", evaluation_score, config.evaluation_score_target),
+    ]
+
+    run_type = "_".join(config.model_name.split())
+    if config.run_type_suffix:
+        run_type += f"_{config.run_type_suffix}"
+
+    return {
+        "model": config.model_name,
+        "model_type": config.model_type,
+        "run_type": run_type,
+        "config": config.model_config,
+        "num_layers": config.num_layers,
+        "batch_size": config.batch_size,
+        "precision": config.precision,
+        "dataset_name": config.dataset_name,
+        "profile_name": "",
+        "input_sequence_length": config.input_sequence_length,
+        "output_sequence_length": config.output_sequence_length,
+        "image_dimension": config.image_dimension,
+        "perf_analysis": False,
+        "training": config.training,
+        "measurements": measurements,
+        "device_info": {
+            "device_name": "",
+            "galaxy": False,
+            "arch": "",
+            "chips": 1,
+        },
+        "device_ip": None,
+        "date": datetime.now().strftime("%d-%m-%Y"),
+        "machine_name": socket.gethostname(),
+    }
+
+
+def get_measurement(result: Dict, name: str) -> Optional[float]:
+    for measurement in result["measurements"]:
+        if measurement["measurement_name"] == name:
+            return measurement["value"]
+    return None
+
+
+def print_benchmark_result(result: Dict):
+    print("====================================================================")
+    print(f"| {result['model']} Benchmark Results:")
+    print("--------------------------------------------------------------------")
+    print(f"| Model: {result['model']}")
+    print(f"| Model type: {result['model_type']}")
+    print(f"| Dataset name: {result['dataset_name']}")
+    print(f"| Date: {result['date']}")
+    print(f"| Machine name: {result['machine_name']}")
+    print(f"| Batch size: {result['batch_size']}")
+    print(f"| Data format: {result['precision']}")
+    if result["image_dimension"]:
+        print(f"| Input size: {result['image_dimension']}")
+    for measurement in result["measurements"]:
+        print(f"| {measurement['measurement_name']}: {measurement['value']}")
+    print("====================================================================")
+
+
+def save_benchmark_result(result: Dict, output_file: str):
+    result["output"] = output_file
+    with open(output_file, "w") as f:
+        json.dump(result, f)
@@ -0,0 +1,66 @@
+# SPDX-FileCopyrightText: © 2025 Tenstorrent AI ULC
+
+# SPDX-License-Identifier: Apache-2.0
+
+import json
+
+import pytest
+import torch
+from torch import nn
+
+from test.benchmark.engine import BenchmarkConfig, get_measurement, run_model_benchmark, save_benchmark_result
+
+
+class StubCompiledModel:
+    """
+    Stands in for `CompiledModel`, runs the framework model on cpu and counts the calls.
+    """
+
+    def __init__(self, framework_model):
+        self.framework_model = framework_model
+        self.num_calls = 0
+
+    def __call__(self, *inputs):
+        self.num_calls += 1
+        return [self.framework_model(*inputs)]
+
+
+@pytest.mark.push
+def test_benchmark_engine(tmp_path):
+    framework_model = nn.Linear(32, 10)
+    inputs = [[torch.rand(4, 32)] for _ in range(3)]
+    compiled_model = StubCompiledModel(framework_model)
+
+    checked = []
+
+    def check_fn(sample, outputs):
+        assert torch.allclose(framework_model(*sample), outputs[0])
+        checked.append(sample)
+
+    config = BenchmarkConfig(
+        model_name="Stub Linear", model_type="Random Input Data", batch_size=4, loop_count=5, warmup_count=2
+    )
+    result = run_model_benchmark(
+        config,
+        inputs,
+        compile_fn=lambda: compiled_model,
+        evaluate_fn=lambda outputs: float(len(outputs)),
+        check_fn=check_fn,
+    )
+
+    # Warmup iterations are run, but not measured
+    assert compiled_model.num_calls == 7
+    assert len(checked) == 1 and checked[0] is inputs[(config.loop_count - 1) % len(inputs)]
+
+    assert result["run_type"] == "Stub_Linear"
+    assert get_measurement(result, "total_samples") == 20
+    assert get_measurement(result, "evaluation_score") == 5.0
+    assert get_measurement(result, "compile_time") >= 0
+    assert get_measurement(result, "samples_per_sec") > 0
+    assert 0 < get_measurement(result, "latency_p50_ms") <= get_measurement(result, "latency_p99_ms")
+    assert all(measurement["step_warm_up_num_iterations"] == 2 for measurement in result["measurements"])
+
+    output_file = str(tmp_path / "result.json")
+    save_benchmark_result(result, output_file)
+    with open(output_file) as f:
+        assert json.load(f)["measurements"] == result["measurements"]
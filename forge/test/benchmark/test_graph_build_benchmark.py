@@ -0,0 +1,111 @@
+# SPDX-FileCopyrightText: © 2025 Tenstorrent AI ULC
+
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Scaling benchmark of the initial graph construction (`generate_graph`) over synthetic graphs of 1k-100k ops.
+"""
+
+import time
+
+import pytest
+import torch
+
+import forge
+import forge.op
+from forge import ForgeModule, Tensor
+from forge._C import DataFormat
+from forge._C.graph import Graph, OpType, create_data_edge, create_op_node, create_output
+from forge.compile import CompileContext, generate_graph
+from forge.config import CompilerConfig
+from forge.graph_builder import GraphBuilder
+from forge.verify import DeprecatedVerifyConfig
+
+GRAPH_SIZES = [1000, 10000, 100000]
+
+
+class SyntheticChain(ForgeModule):
+    """
+    Chain of eltwise ops, every other op consumes the module input and a shared parameter.
+    """
+
+    def __init__(self, name, num_ops):
+        super().__init__(name)
+        self.num_ops = num_ops
+        self.weight = forge.Parameter(1, 32, requires_grad=False, name="weight")
+
+    def forward(self, x):
+        out = x
+        for i in range(self.num_ops):
+            if i % 2 == 0:
+                out = forge.op.Add(f"add_{i}", out, self.weight)
+            else:
+                out = forge.op.Multiply(f"multiply_{i}", out, x)
+        return out
+
+
+def time_generate_graph(num_ops: int):
+    module = SyntheticChain(f"synthetic_chain_{num_ops}", num_ops)
+    compiler_cfg = CompilerConfig(enable_shape_only_tracing=True)
+    context = CompileContext(
+        modules=[module],
+        graph_name=module.get_name(),
+        compiler_cfg=compiler_cfg,
+        verify_cfg=DeprecatedVerifyConfig.disabled(),
+        microbatch_size=1,
+        microbatch_count=1,
+        inputs=[Tensor.create_from_torch(torch.rand(1, 32))],
+    )
+
+    start = time.perf_counter()
+    graph, *_ = generate_graph(context, [module])
+    return graph, time.perf_counter() - start
+
+
+@pytest.mark.push
+def test_generate_graph_scaling():
+    # Only the graph structure is asserted, timings are logged - construction time per op should stay constant
+    for num_ops in GRAPH_SIZES:
+        graph, build_time = time_generate_graph(num_ops)
+        # Ops, module input, parameter and output
+        assert graph.num_nodes() == num_ops + 3
+        assert graph.num_edges() == 2 * num_ops + 1
+
+        print(f"generate_graph {num_ops} ops: {build_time:.3f}s, {1e6 * build_time / num_ops:.2f}us/op")
+
+
+@pytest.mark.push
+def test_bulk_graph_builder():
+    num_ops = GRAPH_SIZES[1]
+    shape = [1, 32]
+    data_format = DataFormat.Float32
+    op_type = OpType("nop")
+
+    # Node per pybind call
+    start = time.perf_counter()
+    graph = Graph("per_call")
+    node = create_output(graph, "output", shape, data_format, False, 0)
+    for i in range(num_ops):
+        op = create_op_node(graph, f"nop_{i}", op_type, shape, data_format, 0, {})
+        create_data_edge(graph, op, 0, node, 0, [])
+        node = op
+    per_call_time = time.perf_counter() - start
+
+    # Bulk builder
+    start = time.perf_counter()
+    bulk_graph = Graph("bulk")
+    builder = GraphBuilder(bulk_graph)
+    node = builder.add_output("output", shape, data_format, False, 0)
+    for i in range(num_ops):
+        op = builder.add_op_node(f"nop_{i}", op_type, shape, data_format, 0, {})
+        builder.add_data_edge(op, 0, node, 0, [])
+        node = op
+    builder.flush()
+    bulk_time = time.perf_counter() - start
+
+    print(f"{num_ops} ops - per call: {per_call_time:.3f}s, bulk: {bulk_time:.3f}s")
+
+    assert sorted(bulk_graph.nodes()) == sorted(graph.nodes())
+    assert bulk_graph.num_edges() == graph.num_edges()
+    for handle in range(num_ops + 1):
+        assert bulk_graph.get_node_name(builder.get_node_id(handle)) == builder.get_node_name(handle)
@@ -0,0 +1,59 @@
+# SPDX-FileCopyrightText: © 2025 Tenstorrent AI ULC
+
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Microbenchmark of the update_cache golden in a decode step - one token per sequence, written to the KV cache of every
+layer, with every sequence at its own position.
+"""
+
+import time
+
+import pytest
+import torch
+
+from forge.op.eval.forge.kv_cache import UpdateCache
+
+NUM_LAYERS = 16
+NUM_HEADS = 8
+MAX_SEQ_LEN = 512
+HEAD_DIM = 64
+NUM_STEPS = 8
+
+
+def update_cache_per_row(cache, input, update_index):
+    # Previous implementation of the golden, kept as the baseline of the benchmark
+    for b in range(input.shape[0]):
+        idx = update_index[b].item()
+        cache[b, :, idx : idx + 1, :] = input[b]
+    return cache
+
+
+def time_decode_steps(update_fn, caches, tokens, positions):
+    start = time.perf_counter_ns()
+    for step in range(NUM_STEPS):
+        for cache in caches:
+            update_fn(cache, tokens, positions + step)
+    return (time.perf_counter_ns() - start) / NUM_STEPS
+
+
+@pytest.mark.parametrize("batch_size", [1, 32, 128])
+@pytest.mark.push
+def test_update_cache_decode_step(batch_size):
+    op = UpdateCache.create(batch_offset=0)
+    tokens = torch.randn(batch_size, NUM_HEADS, 1, HEAD_DIM)
+    positions = torch.randint(0, MAX_SEQ_LEN - NUM_STEPS, (batch_size,), dtype=torch.int32)
+
+    caches = [torch.zeros(batch_size, NUM_HEADS, MAX_SEQ_LEN, HEAD_DIM) for _ in range(NUM_LAYERS)]
+    per_row_caches = [cache.clone() for cache in caches]
+
+    batched_ns = time_decode_steps(lambda *tensors: op.eval(list(tensors)), caches, tokens, positions)
+    per_row_ns = time_decode_steps(update_cache_per_row, per_row_caches, tokens, positions)
+
+    print(
+        f"update_cache batch {batch_size}, {NUM_LAYERS} layers - per row: {per_row_ns / 1e3:.1f}us/step, "
+        f"batched: {batched_ns / 1e3:.1f}us/step"
+    )
+
+    for cache, per_row_cache in zip(caches, per_row_caches):
+        assert torch.equal(cache, per_row_cache)
@@ -0,0 +1,179 @@
+# SPDX-FileCopyrightText: © 2025 Tenstorrent AI ULC
+
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Benchmark of the optimizer step in the multi-tensor mode (parameters of the same data format updated by one set of ops
+over their flattened tensors) against the per-parameter mode - node count of the optimizer graph and the step time.
+"""
+
+import time
+
+import pytest
+import torch
+from torch import nn
+
+import forge
+from forge._C import DataFormat
+from forge.forgeglobal import TILE_DIM
+from forge.optimizers import flatten_tensors, get_flat_rows, unflatten_tensor
+from forge.verify.compare import compare_with_golden
+from test.mlir.utils import copy_params
+
+NUM_LAYERS = 16
+HIDDEN_SIZE = 256
+BATCH_SIZE = 32
+NUM_STEPS = 10
+
+
+class MLP(nn.Module):
+    def __init__(self):
+        super().__init__()
+        self.layers = nn.ModuleList([nn.Linear(HIDDEN_SIZE, HIDDEN_SIZE) for _ in range(NUM_LAYERS)])
+
+    def forward(self, x):
+        for layer in self.layers:
+            x = torch.relu(layer(x))
+        return x
+
+
+def train(model, optimizer, inputs):
+    tt_model = forge.compile(model, sample_inputs=[inputs[0]], optimizer=optimizer, training=True)
+    num_nodes = tt_model.opt_compiled_graph_state.graph.num_nodes()
+
+    loss_fn = nn.MSELoss()
+    step_ns = 0
+    for x in inputs:
+        loss_fn(tt_model(x)[0], torch.zeros_like(x)).backward()
+        tt_model.backward()
+
+        start = time.perf_counter_ns()
+        optimizer.step()
+        step_ns += time.perf_counter_ns() - start
+
+    tt_model.update_host_weights()
+    return num_nodes, step_ns / len(inputs)
+
+
+# Flattening and slicing back costs a few ops per parameter, the multi-tensor graph is smaller only for optimizers with
+# longer updates than SGD
+@pytest.mark.parametrize(
+    "optimizer, fewer_nodes",
+    [
+        (lambda multi_tensor: forge.optimizers.SGD(learning_rate=0.01, multi_tensor=multi_tensor), False),
+        (lambda multi_tensor: forge.optimizers.Adam(learning_rate=0.01, multi_tensor=multi_tensor), True),
+        (lambda multi_tensor: forge.optimizers.LAMB(learning_rate=0.01, multi_tensor=multi_tensor), True),
+    ],
+    ids=["sgd", "adam", "lamb"],
+)
+@pytest.mark.push
+def test_multi_tensor_optimizer(optimizer, fewer_nodes):
+    torch.manual_seed(0)
+    inputs = [torch.rand(BATCH_SIZE, HIDDEN_SIZE) for _ in range(NUM_STEPS)]
+
+    model = MLP()
+    multi_tensor_model = MLP()
+    copy_params(model, multi_tensor_model)
+
+    num_nodes, step_ns = train(model, optimizer(False), inputs)
+    multi_tensor_num_nodes, multi_tensor_step_ns = train(multi_tensor_model, optimizer(True), inputs)
+
+    print(
+        f"{2 * NUM_LAYERS} parameters - per-parameter: {num_nodes} nodes, {step_ns / 1e3:.1f}us/step, "
+        f"multi-tensor: {multi_tensor_num_nodes} nodes, {multi_tensor_step_ns / 1e3:.1f}us/step"
+    )
+
+    if fewer_nodes:
+        assert multi_tensor_num_nodes < num_nodes
+
+    for param, multi_tensor_param in zip(model.parameters(), multi_tensor_model.parameters()):
+        assert compare_with_golden(multi_tensor_param, param, pcc=0.99)
+
+
+class TracedShape(list):
+    def as_list(self):
+        return list(self)
+
+
+class TracedTensor:
+    """
+    Stands in for the node of the optimizer graph, holds the value computed by `TorchAutogradContext`.
+    """
+
+    def __init__(self, value, name=None):
+        self.value = value
+        self.name = name
+        self.output_df = DataFormat.Float32
+
+    @property
+    def shape(self):
+        return TracedShape(self.value.shape)
+
+
+class TorchAutogradContext:
+    """
+    Stands in for the autograd context - evaluates the ops used by `flatten_tensors` and `unflatten_tensor` on CPU.
+    """
+
+    def tensor(self, value):
+        return TracedTensor(value)
+
+    def op_with_named_attrs(self, op_type, operands, named_attrs):
+        values = [operand.value for operand in operands]
+        if op_type == "reshape":
+            return TracedTensor(values[0].reshape(named_attrs["shape"]))
+        assert op_type == "concatenate"
+        return TracedTensor(torch.cat(values, dim=named_attrs["dim"]))
+
+    def op(self, op_type, operands, attrs, named_attrs):
+        assert op_type == "index" and named_attrs["stride"] == 1
+        start, stop = named_attrs["start"], named_attrs["stop"]
+        return TracedTensor(operands[0].value.narrow(named_attrs["dim"], start, stop - start))
+
+
+# Tile-aligned, smaller than a row, and not a multiple of a row
+SHAPES = [[TILE_DIM, TILE_DIM], [10], [3, 11]]
+
+
+@pytest.mark.push
+def test_flatten_tensors():
+    ac = TorchAutogradContext()
+    tensors = [torch.rand(shape) for shape in SHAPES]
+
+    flat = flatten_tensors(ac, [TracedTensor(tensor) for tensor in tensors])
+    assert flat.value.shape == (sum(get_flat_rows(shape) for shape in SHAPES), TILE_DIM)
+    assert [get_flat_rows(shape) for shape in SHAPES] == [TILE_DIM, 1, 2]
+
+    # Last row of the tensors which aren't a multiple of a row is zero-padded
+    assert torch.equal(flat.value[TILE_DIM, 10:], torch.zeros(TILE_DIM - 10))
+    assert torch.equal(flat.value[TILE_DIM + 2, 33 - TILE_DIM :], torch.zeros(2 * TILE_DIM - 33))
+
+    for tensor, unflattened in zip(tensors, unflatten_tensor(ac, flat, SHAPES)):
+        assert torch.equal(unflattened.value, tensor)
+
+
+@pytest.mark.push
+def test_multi_tensor_state_memory():
+    parameters = [TracedTensor(torch.rand(shape), name=f"param_{idx}") for idx, shape in enumerate(SHAPES)]
+
+    per_parameter = forge.optimizers.Adam(learning_rate=0.01)
+    for parameter in parameters:
+        per_parameter.parameter_to_opt_inputs[parameter.name] = per_parameter.get_param_dict(
+            torch.float32, parameter.value.shape
+        )
+
+    multi_tensor = forge.optimizers.Adam(learning_rate=0.01, multi_tensor=True)
+    multi_tensor.add_multi_tensor_group(parameters)
+
+    # Moments of the flat buffers are split by the rows of the parameters, scalar state (lr, beta1_pow, beta2_pow) is
+    # counted once, for the first parameter of the group
+    moments_bytes = [2 * get_flat_rows(shape) * TILE_DIM * 4 for shape in SHAPES]
+    scalar_bytes = 3 * 4
+    assert multi_tensor.get_state_memory_bytes() == {
+        "param_0": moments_bytes[0] + scalar_bytes,
+        "param_1": moments_bytes[1],
+        "param_2": moments_bytes[2],
+    }
+
+    # Tile-aligned parameter has the same state in both modes
+    assert multi_tensor.get_state_memory_bytes()["param_0"] == per_parameter.get_state_memory_bytes()["param_0"]
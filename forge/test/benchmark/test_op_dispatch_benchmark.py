@@ -0,0 +1,51 @@
+# SPDX-FileCopyrightText: © 2025 Tenstorrent AI ULC
+
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Microbenchmark of the per-node overhead of calling python op implementations from C++ (`OpType::shape`).
+"""
+
+import time
+
+import pytest
+
+from forge._C.graph import OpType
+from forge.op.eval.forge import clear_op_dispatch_cache
+
+NUM_NODES = 10000
+INPUT_SHAPE = [1, 64, 128]
+
+
+def create_op_types():
+    # Ops implemented in python - module style (tm, reduce) and class style (exp), with a few distinct attributes
+    op_types = []
+    for i in range(NUM_NODES):
+        if i % 3 == 0:
+            op_types.append(OpType("select", [-1, i % 4, 32, 128]))
+        elif i % 3 == 1:
+            op_types.append(OpType("reduce_sum", [-(i % 2) - 1, True]))
+        else:
+            op_types.append(OpType("exp"))
+    return op_types
+
+
+def time_shapes(op_types):
+    start = time.perf_counter_ns()
+    shapes = [op_type.shape([INPUT_SHAPE]) for op_type in op_types]
+    return shapes, (time.perf_counter_ns() - start) / len(op_types)
+
+
+@pytest.mark.push
+def test_op_dispatch_overhead():
+    op_types = create_op_types()
+
+    clear_op_dispatch_cache()
+    cold_shapes, cold_ns = time_shapes(op_types)
+    warm_shapes, warm_ns = time_shapes(op_types)
+
+    print(f"{NUM_NODES} nodes - shape dispatch cold: {cold_ns:.0f}ns/node, warm: {warm_ns:.0f}ns/node")
+
+    assert [shape.as_list() for shape, _ in warm_shapes] == [shape.as_list() for shape, _ in cold_shapes]
+    assert cold_shapes[0][0].as_list() == [1, 64, 32]
+    assert cold_shapes[1][0].as_list() == [1, 1, 128]
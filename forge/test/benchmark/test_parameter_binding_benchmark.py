@@ -0,0 +1,97 @@
+# SPDX-FileCopyrightText: © 2025 Tenstorrent AI ULC
+
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Benchmark of the per-step binding of the backward gradient outputs to the module parameters, for a synthetic number of
+parameters - substring matching of every parameter against every output vs. the binding table computed at compile time.
+"""
+
+import time
+
+import pytest
+
+from forge.compiled_graph_state import (
+    get_gradient_parameter_name,
+    get_optimizer_parameter_key,
+    get_parameter_gradient_outputs,
+)
+
+NUM_STEPS = 5
+
+
+def create_names(num_parameters):
+    # Parameter names which are substrings of each other, e.g. `layers.1.weight` and `layers.11.weight`
+    parameter_names = [f"layers.{idx}.weight" for idx in range(num_parameters)] + ["l1.weight", "ll1.weight"]
+    output_names = [f"grad_acc_{name}_grad_accumulator" for name in reversed(parameter_names)]
+    return parameter_names, output_names
+
+
+def bind_by_substring(parameter_names, output_names):
+    # Previous implementation of the binding, kept as the baseline of the benchmark
+    bindings = []
+    for name in parameter_names:
+        for idx, output_name in enumerate(output_names):
+            if name in output_name:
+                bindings.append((name, idx))
+    return bindings
+
+
+def bind_by_table(parameter_names, table):
+    parameters = {name: name for name in parameter_names}
+    return [(parameters[name], idx) for name, idx in table]
+
+
+def time_steps(bind_fn):
+    start = time.perf_counter_ns()
+    for _ in range(NUM_STEPS):
+        bindings = bind_fn()
+    return bindings, (time.perf_counter_ns() - start) / NUM_STEPS
+
+
+@pytest.mark.parametrize("num_parameters", [100, 1000])
+@pytest.mark.push
+def test_gradient_binding(num_parameters):
+    parameter_names, output_names = create_names(num_parameters)
+
+    # Computed once at compile time, see `CompiledGraphState.gradient_parameter_names`
+    table = [(get_gradient_parameter_name(output_name), idx) for idx, output_name in enumerate(output_names)]
+
+    substring_bindings, substring_ns = time_steps(lambda: bind_by_substring(parameter_names, output_names))
+    table_bindings, table_ns = time_steps(lambda: bind_by_table(parameter_names, table))
+
+    print(
+        f"{len(parameter_names)} parameters - substring matching: {substring_ns / 1e3:.1f}us/step, "
+        f"binding table: {table_ns / 1e3:.1f}us/step"
+    )
+
+    # Every parameter is bound to exactly its own gradient
+    assert sorted(table_bindings) == sorted(
+        (name, len(parameter_names) - 1 - idx) for idx, name in enumerate(parameter_names)
+    )
+    # Substring matching also binds `l1.weight` to the gradient of `ll1.weight`
+    assert len(substring_bindings) > len(table_bindings)
+
+
+@pytest.mark.push
+def test_optimizer_parameter_key():
+    assert get_optimizer_parameter_key("input_opt_l1.weight_0.lr") == ("l1.weight", "lr")
+    assert get_optimizer_parameter_key("input_opt_layers.1_2.bias_10.beta1_pow") == ("layers.1_2.bias", "beta1_pow")
+    assert get_optimizer_parameter_key("l1.weight") is None
+
+
+@pytest.mark.push
+def test_parameter_gradient_outputs():
+    output_names = ["grad_acc_l1.weight_grad_accumulator", "loss_grad", "grad_acc_const_0_grad_accumulator"]
+    gradient_parameter_names = {
+        output_name: get_gradient_parameter_name(output_name)
+        for output_name in output_names
+        if get_gradient_parameter_name(output_name) is not None
+    }
+
+    assert get_parameter_gradient_outputs(output_names, gradient_parameter_names) == [
+        ("l1.weight", 0),
+        ("const_0", 2),
+    ]
+    # Gradients of parameters which are not in the framework module are skipped
+    assert get_parameter_gradient_outputs(output_names, gradient_parameter_names, {"l1.weight"}) == [("l1.weight", 0)]
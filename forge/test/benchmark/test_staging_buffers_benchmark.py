@@ -0,0 +1,58 @@
+# SPDX-FileCopyrightText: © 2025 Tenstorrent AI ULC
+
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Benchmark of the per-call host overhead of the compiled model - default calls, calls with the persistent staging
+buffers and calls with preallocated `out=` tensors.
+"""
+
+import time
+
+import pytest
+import torch
+from torch import nn
+
+import forge
+
+NUM_CALLS = 100
+SHAPE = (1, 1024, 1024)
+
+
+class Add(nn.Module):
+    def forward(self, x1, x2):
+        return torch.add(x1, x2)
+
+
+def time_calls(call_fn, inputs):
+    # Warmup, allocates the persistent buffers
+    call_fn(*inputs)
+
+    start = time.perf_counter_ns()
+    for _ in range(NUM_CALLS):
+        outputs = call_fn(*inputs)
+    return outputs, (time.perf_counter_ns() - start) / NUM_CALLS
+
+
+@pytest.mark.push
+def test_staging_buffers():
+    inputs = [torch.rand(SHAPE), torch.rand(SHAPE)]
+    compiled_model = forge.compile(Add(), sample_inputs=inputs)
+
+    default_outputs, default_ns = time_calls(compiled_model, inputs)
+
+    out = [torch.empty_like(default_outputs[0])]
+    out_outputs, out_ns = time_calls(lambda *tensors: compiled_model(*tensors, out=out), inputs)
+
+    compiled_model.enable_persistent_buffers()
+    persistent_outputs, persistent_ns = time_calls(compiled_model, inputs)
+    compiled_model.enable_persistent_buffers(False)
+
+    print(
+        f"Per call {SHAPE}: default {default_ns / 1e3:.1f}us, out= {out_ns / 1e3:.1f}us, "
+        f"persistent buffers {persistent_ns / 1e3:.1f}us"
+    )
+
+    assert out_outputs[0] is out[0]
+    assert torch.equal(out_outputs[0], default_outputs[0])
+    assert torch.equal(persistent_outputs[0], default_outputs[0])
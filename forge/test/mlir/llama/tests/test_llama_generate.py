@@ -0,0 +1,130 @@
+# SPDX-FileCopyrightText: © 2025 Tenstorrent AI ULC
+
+# SPDX-License-Identifier: Apache-2.0
+import pytest
+
+import torch
+from torch import nn
+from transformers import LlamaConfig, LlamaForCausalLM
+
+import forge
+from forge._C.runtime import Tensor as CTensor
+from forge.transformers import GenerationEngine, SamplingConfig
+from forge.verify.compare import compare_with_golden
+
+MAX_PROMPT_LENGTH = 8
+MAX_CACHE_LENGTH = 24
+
+
+def tiny_llama():
+    torch.manual_seed(0)
+    config = LlamaConfig(
+        vocab_size=128,
+        hidden_size=64,
+        intermediate_size=128,
+        num_hidden_layers=2,
+        num_attention_heads=4,
+        num_key_value_heads=2,
+        max_position_embeddings=64,
+    )
+    return LlamaForCausalLM(config).eval()
+
+
+class MockRuntime:
+    """
+    Stands in for the compiled model - runs the module on CPU, and records the inputs and outputs of every run.
+    """
+
+    def __init__(self, module, sample_inputs):
+        self.module = module
+        self.runs = []
+
+    def __call__(self, *inputs):
+        outputs = self.module(*inputs)
+        self.runs.append((inputs, outputs))
+        return outputs
+
+
+@pytest.mark.push
+def test_generate_greedy():
+    model = tiny_llama()
+    engine = GenerationEngine(model, MAX_PROMPT_LENGTH, MAX_CACHE_LENGTH, batch_size=2, compile_fn=MockRuntime)
+    engine.compile()
+
+    input_ids = torch.randint(1, 128, (2, 6))
+    attention_mask = torch.ones_like(input_ids)
+    attention_mask[1, 4:] = 0
+    result = engine.generate(input_ids, attention_mask, max_new_tokens=10)
+
+    # Tokens match generation without the fixed size KV cache
+    for idx, prompt_length in enumerate([6, 4]):
+        expected = model.generate(
+            input_ids[idx : idx + 1, :prompt_length], max_new_tokens=10, do_sample=False, pad_token_id=0
+        )
+        assert result.tokens[idx] == expected[0, prompt_length:].tolist()
+
+    # Prefill and decode are compiled once, cache outputs of every decode step are the next step's cache inputs
+    assert len(engine.prefill_model.runs) == 1
+    decode_runs = engine.decode_model.runs
+    assert len(decode_runs) == result.num_decode_steps == 9
+    for (_, previous_outputs), (inputs, _) in zip(decode_runs, decode_runs[1:]):
+        assert all(cache_input is cache_output for cache_input, cache_output in zip(inputs[4:], previous_outputs[1:]))
+
+    assert result.time_to_first_token > 0
+    assert result.num_decoded_tokens == 18
+    assert result.tokens_per_second > 0
+
+
+@pytest.mark.push
+def test_generate_sampling_and_stopping():
+    model = tiny_llama()
+    engine = GenerationEngine(model, MAX_PROMPT_LENGTH, MAX_CACHE_LENGTH, compile_fn=MockRuntime)
+    engine.compile()
+    input_ids = torch.randint(1, 128, (1, 5))
+
+    greedy = engine.generate(input_ids, max_new_tokens=8)
+    # Top-1 and a tiny nucleus both reduce sampling to greedy selection
+    top_k = engine.generate(input_ids, max_new_tokens=8, sampling=SamplingConfig(do_sample=True, top_k=1, seed=0))
+    top_p = engine.generate(input_ids, max_new_tokens=8, sampling=SamplingConfig(do_sample=True, top_p=1e-6, seed=0))
+    assert top_k.tokens == greedy.tokens
+    assert top_p.tokens == greedy.tokens
+
+    # Sampling is reproducible with a seed
+    sampling = SamplingConfig(do_sample=True, top_k=20, seed=0)
+    sampled = engine.generate(input_ids, max_new_tokens=8, sampling=sampling)
+    assert sampled.tokens == engine.generate(input_ids, max_new_tokens=8, sampling=sampling).tokens
+
+    # Generation stops at the EOS token, and at the stopping criteria
+    eos = engine.generate(input_ids, max_new_tokens=8, eos_token_id=greedy.tokens[0][2])
+    assert eos.tokens[0] == greedy.tokens[0][: greedy.tokens[0].index(greedy.tokens[0][2]) + 1]
+    assert eos.stopped == [True]
+
+    stop_after_four = engine.generate(
+        input_ids, max_new_tokens=8, stopping_criteria=[lambda generated: torch.tensor([generated.shape[-1] >= 4])]
+    )
+    assert stop_after_four.tokens[0] == greedy.tokens[0][:4]
+    assert stop_after_four.num_decode_steps == 3
+
+
+@pytest.mark.push
+def test_run_with_device_outputs():
+    class CacheUpdate(nn.Module):
+        def forward(self, cache, x):
+            new_cache = cache + x
+            return torch.relu(new_cache) * 2.0, new_cache
+
+    framework_model = CacheUpdate()
+    cache = torch.rand(1, 32, 32)
+    compiled_model = forge.compile(framework_model, sample_inputs=[cache, torch.rand(1, 32, 32)])
+
+    # The cache stays on device between the runs, and is passed back as the first input ahead of the host input
+    device_cache = cache
+    for _ in range(3):
+        x = torch.rand(1, 32, 32)
+        out, device_cache = compiled_model.run_with_device_outputs(device_cache, x, device_outputs=[1])
+        fw_out, cache = framework_model(cache, x)
+
+        assert isinstance(device_cache, CTensor)
+        assert compare_with_golden(golden=fw_out, calculated=out)
+
+    assert compare_with_golden(golden=cache, calculated=device_cache.to_torch())
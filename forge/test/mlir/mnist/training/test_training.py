@@ -18,6 +18,7 @@ from forge.config import CompileDepth
 from ..utils import *
 from test.mlir.utils import *
 from forge.config import CompilerConfig
+from forge.mixed_precision import DynamicLossScaler, MixedPrecisionTrainer
 from forge._C import DataFormat
 
 
@@ -194,6 +195,130 @@ def test_mnist_training_with_grad_accumulation():
     print(f"Test (total) loss: {test_loss}")
 
 
+@pytest.mark.push
+def test_mnist_training_mixed_precision():
+    # Config
+    num_epochs = 2
+    batch_size = 1024
+    learning_rate = 0.001
+
+    # Limit number of batches to run - quicker test
+    limit_num_batches = 10
+
+    # Load dataset
+    test_loader, train_loader = load_dataset(batch_size)
+
+    # Model trained in bfloat16 with fp32 master weights, and its fp32 golden trained on CPU
+    framework_model = MNISTLinear(bias=False)
+    golden_model = MNISTLinear(bias=False)
+    copy_params(framework_model, golden_model)
+
+    loss_fn = torch.nn.CrossEntropyLoss()
+    golden_optimizer = torch.optim.SGD(golden_model.parameters(), lr=learning_rate)
+
+    trainer = MixedPrecisionTrainer(framework_model, lambda params: torch.optim.SGD(params, lr=learning_rate))
+    trainer.compile(sample_inputs=[torch.rand(batch_size, 784)])
+
+    logger.info("Starting training loop... (logger will be disabled)")
+    logger.disable("")
+    for epoch_idx in range(num_epochs):
+        total_loss = 0
+        for batch_idx, (data, target) in enumerate(train_loader):
+            target = nn.functional.one_hot(target, num_classes=10).float()
+
+            # Forward and backward pass on device in bfloat16, loss on CPU in fp32
+            loss = loss_fn(trainer(data)[0], target)
+            total_loss += loss.item()
+            trainer.backward(loss)
+            assert trainer.step()
+
+            # Golden on CPU
+            golden_optimizer.zero_grad()
+            golden_loss = loss_fn(golden_model(data), target)
+            golden_loss.backward()
+            golden_optimizer.step()
+
+            assert torch.allclose(loss, golden_loss, rtol=1e-1)  # 10% tolerance
+
+            if batch_idx >= limit_num_batches:
+                break
+
+        print(f"epoch: {epoch_idx} loss: {total_loss} loss scale: {trainer.loss_scale}")
+
+    assert trainer.loss_scaler.num_skipped_steps == 0
+    for param, master, golden_param in zip(
+        framework_model.parameters(), trainer.master_parameters, golden_model.parameters()
+    ):
+        assert param.dtype == torch.bfloat16 and master.dtype == torch.float32
+        assert torch.equal(param, master.to(torch.bfloat16))
+        assert compare_with_golden(master, golden_param, pcc=0.99)
+
+
+class CpuTrainingRuntime:
+    """
+    Stands in for the compiled model - runs the forward and backward pass of the module on CPU.
+    """
+
+    def __init__(self, module, sample_inputs, **kwargs):
+        self.module = module
+        self.compiler_cfg = kwargs["compiler_cfg"]
+
+    def __call__(self, *inputs):
+        return [self.module(*inputs)]
+
+    def backward(self):
+        # Gradients are already in the `.grad` of the module parameters
+        pass
+
+    def accumulates_gradients(self):
+        return False
+
+
+@pytest.mark.push
+def test_mixed_precision_loss_scaling():
+    torch.manual_seed(0)
+    framework_model = MNISTLinear(bias=False)
+    loss_scaler = DynamicLossScaler(init_scale=2.0**4, growth_interval=2)
+    trainer = MixedPrecisionTrainer(
+        framework_model, lambda params: torch.optim.SGD(params, lr=0.1), loss_scaler=loss_scaler
+    )
+    compiler_cfg = CompilerConfig()
+    tt_model = trainer.compile(
+        sample_inputs=[torch.rand(4, 784)], compile_fn=CpuTrainingRuntime, compiler_cfg=compiler_cfg
+    )
+    assert tt_model.compiler_cfg.default_df_override == DataFormat.Float16_b
+    # The passed compiler config is left as it is
+    assert compiler_cfg.default_df_override is None
+
+    # Optimizer runs on the host over the master parameters, a device optimizer is rejected
+    with pytest.raises(AssertionError):
+        trainer.compile(
+            sample_inputs=[torch.rand(4, 784)],
+            compile_fn=CpuTrainingRuntime,
+            optimizer=forge.optimizers.SGD(learning_rate=0.1),
+        )
+
+    loss_fn = torch.nn.CrossEntropyLoss()
+    data, target = torch.rand(4, 784), torch.randint(0, 10, (4,))
+
+    # Two steps without an overflow raise the scale
+    for _ in range(2):
+        masters = [master.detach().clone() for master in trainer.master_parameters]
+        trainer.backward(loss_fn(trainer(data)[0], target))
+        assert trainer.step()
+        assert not all(torch.equal(master, previous) for master, previous in zip(trainer.master_parameters, masters))
+    assert trainer.loss_scale == 2.0**5
+
+    # Overflowing gradients skip the step and lower the scale
+    masters = [master.detach().clone() for master in trainer.master_parameters]
+    trainer.backward(loss_fn(trainer(data)[0], target))
+    trainer.parameters[0].grad[0, 0] = float("inf")
+    assert not trainer.step()
+    assert all(torch.equal(master, previous) for master, previous in zip(trainer.master_parameters, masters))
+    assert all(param.grad is None for param in framework_model.parameters())
+    assert loss_scaler.state_dict() == {"scale": 2.0**4, "growth_tracker": 0, "num_steps": 3, "num_skipped_steps": 1}
+
+
 @pytest.mark.parametrize("freeze_layer", [None, 0, 2, 4])
 @pytest.mark.push
 def test_forge_vs_torch_gradients(freeze_layer):
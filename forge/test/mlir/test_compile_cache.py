@@ -0,0 +1,83 @@
+# SPDX-FileCopyrightText: © 2025 Tenstorrent AI ULC
+
+# SPDX-License-Identifier: Apache-2.0
+
+from pathlib import Path
+
+import pytest
+import torch
+from torch import nn
+
+import forge
+from forge.compile_cache import get_compile_cache, get_compile_cache_stats
+from forge.config import CompilerConfig
+from forge.verify.verify import verify
+
+
+@pytest.mark.push
+def test_compile_cache(tmp_path, monkeypatch):
+    class Linear(nn.Module):
+        def __init__(self):
+            super().__init__()
+            self.l1 = nn.Linear(64, 32, bias=True)
+
+        def forward(self, a):
+            return self.l1(a)
+
+    monkeypatch.setenv("FORGE_ENABLE_COMPILE_CACHE", "1")
+    monkeypatch.setenv("FORGE_COMPILE_CACHE_DIR", str(tmp_path / "compile_cache"))
+
+    # Wrap the MLIR stage, so we can check whether compile stages were executed
+    mlir_compiler_calls = []
+    run_mlir_compiler = forge._C.run_mlir_compiler
+
+    def counting_run_mlir_compiler(*args, **kwargs):
+        mlir_compiler_calls.append(args)
+        return run_mlir_compiler(*args, **kwargs)
+
+    monkeypatch.setattr(forge._C, "run_mlir_compiler", counting_run_mlir_compiler)
+
+    inputs = [torch.rand(1, 64)]
+    framework_model = Linear()
+
+    compiled_model = forge.compile(framework_model, sample_inputs=inputs)
+    verify(inputs, framework_model, compiled_model)
+    stats = get_compile_cache_stats()
+    assert (stats.hits, stats.misses, stats.stores) == (0, 1, 1)
+    assert len(mlir_compiler_calls) == 1
+
+    # Second compile is served from the cache, without running any of the compile stages
+    compiled_model = forge.compile(framework_model, sample_inputs=inputs)
+    verify(inputs, framework_model, compiled_model)
+    assert (stats.hits, stats.misses, stats.stores) == (1, 1, 1)
+    assert len(mlir_compiler_calls) == 1
+
+    # Weights are not part of the cache key, cached model should pick up updated weights
+    with torch.no_grad():
+        framework_model.l1.weight.mul_(2.0)
+    compiled_model = forge.compile(framework_model, sample_inputs=inputs)
+    verify(inputs, framework_model, compiled_model)
+    assert stats.hits == 2
+
+    assert get_compile_cache().invalidate() == 1
+    compiled_model = forge.compile(framework_model, sample_inputs=inputs)
+    assert (stats.misses, stats.stores) == (2, 2)
+    assert len(mlir_compiler_calls) == 2
+
+
+@pytest.mark.push
+def test_compile_cache_key(tmp_path, monkeypatch):
+    monkeypatch.setenv("FORGE_COMPILE_CACHE_DIR", str(tmp_path / "compile_cache"))
+
+    module = forge.PyTorchModule("linear", nn.Linear(64, 32))
+    inputs = [torch.rand(1, 64)]
+
+    # Config values which aren't JSON serializable are keyed by their string
+    compiler_cfg = CompilerConfig()
+    compiler_cfg.tvm_module_to_num_patterns = {"linear": Path("patterns")}
+    key = get_compile_cache().get_key(module, inputs, compiler_cfg, training=False)
+    assert key is not None
+    assert key == get_compile_cache().get_key(module, inputs, compiler_cfg, training=False)
+
+    compiler_cfg.tvm_module_to_num_patterns = {"linear": Path("other_patterns")}
+    assert key != get_compile_cache().get_key(module, inputs, compiler_cfg, training=False)
@@ -0,0 +1,88 @@
+# SPDX-FileCopyrightText: © 2025 Tenstorrent AI ULC
+
+# SPDX-License-Identifier: Apache-2.0
+
+import json
+
+import pytest
+import torch
+from torch import nn
+
+import forge
+from forge.config import CompilerConfig
+from forge.verify.verify import verify
+
+
+@pytest.mark.push
+def test_compile_profiler(tmp_path):
+    class Linear(nn.Module):
+        def __init__(self):
+            super().__init__()
+            self.l1 = nn.Linear(64, 32, bias=True)
+
+        def forward(self, a):
+            return torch.relu(self.l1(a))
+
+    inputs = [torch.rand(1, 64)]
+    framework_model = Linear()
+
+    profile_path = tmp_path / "compile_profile.json"
+    trace_path = tmp_path / "compile_trace.json"
+    compiler_cfg = CompilerConfig(compile_profile_path=str(profile_path), compile_trace_path=str(trace_path))
+    compiled_model = forge.compile(framework_model, sample_inputs=inputs, compiler_cfg=compiler_cfg)
+    verify(inputs, framework_model, compiled_model)
+
+    profile = compiled_model.compile_profile
+    assert profile is not None
+
+    # Every compile stage is recorded, along with the graph size after the stage
+    stage_names = [phase.name for phase in profile.get_phases("compile_stage")]
+    assert stage_names[0] == "init_compile" and "run_mlir_compiler" in stage_names
+    for phase in profile.get_phases("compile_stage"):
+        assert phase.wall_time_ns > 0
+        if phase.name != "init_compile":
+            assert phase.num_nodes > 0 and phase.num_edges > 0
+
+    # TVM phases are nested under the initial graph generation
+    tvm_phase_names = {phase.name for phase in profile.get_phases("tvm")}
+    assert {"tvm.trace", "tvm.from_pytorch", "tvm.partition", "tvm.codegen", "tvm.module_import"} <= tvm_phase_names
+    assert all(phase.depth > 0 for phase in profile.get_phases("tvm"))
+    assert len(profile.get_total_time_by_name("tvm_pattern_callback")) > 0
+
+    with open(profile_path) as f:
+        assert json.load(f)["graph_name"] == profile.graph_name
+    with open(trace_path) as f:
+        assert len(json.load(f)["traceEvents"]) == len(profile.phases)
+
+
+@pytest.mark.push
+def test_pattern_callback_report(tmp_path, monkeypatch):
+    class Linear(nn.Module):
+        def __init__(self):
+            super().__init__()
+            self.l1 = nn.Linear(64, 32, bias=True)
+
+        def forward(self, a):
+            return torch.relu(self.l1(a))
+
+    report_path = tmp_path / "pattern_callback_report.json"
+    monkeypatch.setenv("FORGE_PATTERN_CALLBACK_REPORT", str(report_path))
+
+    inputs = [torch.rand(1, 64)]
+    framework_model = Linear()
+    compiled_model = forge.compile(framework_model, sample_inputs=inputs)
+    verify(inputs, framework_model, compiled_model)
+
+    with open(report_path) as f:
+        callbacks = json.load(f)["callbacks"]
+
+    # Callbacks anchored on ops which are not in the module are skipped
+    einsum = callbacks["DecomposeEinsum"]
+    assert einsum["anchor_ops"] == ["einsum"]
+    assert einsum["num_skipped"] == 1 and einsum["num_runs"] == 0 and einsum["wall_time_ns"] == 0
+
+    # Dense weight is transposed
+    dense = callbacks["DenseWeightTranspose"]
+    assert dense["num_runs"] == 1 and dense["num_matches"] > 0 and dense["num_changes"] == 1
+
+    assert all(stats["num_runs"] + stats["num_skipped"] == 1 for stats in callbacks.values())
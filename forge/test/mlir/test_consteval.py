@@ -0,0 +1,48 @@
+# SPDX-FileCopyrightText: © 2025 Tenstorrent AI ULC
+
+# SPDX-License-Identifier: Apache-2.0
+
+import pytest
+import torch
+from torch import nn
+
+import forge
+from forge.verify.verify import verify
+
+
+@pytest.mark.push
+@pytest.mark.parametrize("num_threads", [1, 4])
+def test_consteval_threads_and_cache(tmp_path, monkeypatch, num_threads):
+    class SharedWeights(nn.Module):
+        def __init__(self):
+            super().__init__()
+            self.l1 = nn.Linear(64, 64, bias=False)
+            self.l2 = nn.Linear(64, 64, bias=True)
+
+        def forward(self, a):
+            # Transposed l1 weight is consumed twice
+            return self.l2(self.l1(a)) + torch.matmul(a, self.l1.weight.T)
+
+    cache_dir = tmp_path / "consteval_cache"
+    monkeypatch.setenv("FORGE_CONSTEVAL_NUM_THREADS", str(num_threads))
+    monkeypatch.setenv("FORGE_CONSTEVAL_CACHE_DIR", str(cache_dir))
+
+    inputs = [torch.rand(1, 64)]
+    framework_model = SharedWeights()
+
+    compiled_model = forge.compile(framework_model, sample_inputs=inputs)
+    verify(inputs, framework_model, compiled_model)
+    num_cache_entries = len(list(cache_dir.iterdir()))
+    assert num_cache_entries > 0
+
+    # Recompile with unchanged weights is served from the consteval cache
+    compiled_model = forge.compile(framework_model, sample_inputs=inputs)
+    verify(inputs, framework_model, compiled_model)
+    assert len(list(cache_dir.iterdir())) == num_cache_entries
+
+    # Updated weights miss the cache
+    with torch.no_grad():
+        framework_model.l1.weight.mul_(2.0)
+    compiled_model = forge.compile(framework_model, sample_inputs=inputs)
+    verify(inputs, framework_model, compiled_model)
+    assert len(list(cache_dir.iterdir())) > num_cache_entries
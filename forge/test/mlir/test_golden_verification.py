@@ -126,3 +126,72 @@ def test_matmuls(shapes, train, verify_stage):
         training=train,
         verify_cfg=verify_cfg,
     )
+
+
+def select_golden_reference(x, dim, begin, length, stride):
+    # Slice by slice implementation of the select golden, the vectorized one is checked against it
+    zero_shape = list(x.shape)
+    zero_shape[dim] = 1
+    zero_slice = torch.zeros(zero_shape, dtype=x.dtype).squeeze(dim)
+    result = []
+    for offset in range(0, x.shape[dim] - begin, stride):
+        for i in range(begin, begin + length):
+            if offset + i < x.shape[dim] or stride == x.shape[dim]:
+                result.append(x.select(dim, offset + i))
+            else:
+                result.append(zero_slice)
+    return torch.stack(result, dim=dim)
+
+
+def gather_golden_reference(x, dim, begin, length, stride, orig_size):
+    # Slice by slice implementation of the gather golden, the vectorized one is checked against it
+    zero_shape = list(x.shape)
+    if dim > 0:
+        dim -= 4
+    while len(zero_shape) <= abs(dim):
+        zero_shape = [1] + zero_shape
+        x = x.unsqueeze(0)
+    zero_shape[dim] = 1
+    zero_slice = torch.zeros(zero_shape, dtype=x.dtype).squeeze(dim)
+    result = []
+    offset = 0
+    for i in range(0, orig_size):
+        if i >= begin and (i - begin) % stride < length:
+            result.append(x.select(dim, offset))
+            offset += 1
+        else:
+            result.append(zero_slice)
+    return torch.stack(result, dim=dim)
+
+
+@pytest.mark.parametrize("dtype", [torch.float32, torch.bfloat16, torch.int32])
+@pytest.mark.parametrize("dim", [-1, -2, 1])
+@pytest.mark.parametrize(
+    "begin, length, stride",
+    [
+        (0, 1, 1),
+        (0, 2, 4),
+        (1, 3, 4),
+        (2, 3, 5),
+        (3, 4, 6),
+        (0, 12, 12),
+    ],
+)
+@pytest.mark.push
+def test_select_gather_golden(dtype, dim, begin, length, stride):
+    from forge.op.eval.forge import tm
+
+    x = (torch.randn(2, 12, 12) * 10).to(dtype)
+    size = x.shape[dim]
+
+    selected = tm.eval("select", [dim, begin, length, stride], [x])
+    expected = select_golden_reference(x, dim, begin, length, stride)
+    assert selected.dtype == expected.dtype
+    assert torch.equal(selected, expected)
+    assert tuple(selected.shape) == tm.shape("select", [dim, begin, length, stride], [list(x.shape)])[0]
+
+    # Gather is the inverse of select
+    gather_dim = dim if dim < 0 else dim - len(x.shape)
+    gathered = tm.eval("gather", [gather_dim, begin, length, stride, size], [selected])
+    assert torch.equal(gathered, gather_golden_reference(selected, gather_dim, begin, length, stride, size))
+    assert tuple(gathered.shape) == tuple(x.shape)
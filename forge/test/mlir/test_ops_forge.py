@@ -103,3 +103,46 @@ def test_fill_cache(shapes_and_types):
         model,
         compiled,
     )
+
+
+def update_cache_reference(cache, input, update_index, batch_offset):
+    # Row by row implementation of the update_cache golden, the batched one is checked against it
+    for b in range(input.shape[0]):
+        idx = update_index[b].item()
+        cache[b + batch_offset, :, idx : idx + 1, :] = input[b]
+    return cache
+
+
+@pytest.mark.parametrize("dtype", [torch.float32, torch.bfloat16])
+@pytest.mark.push
+def test_update_cache_golden_properties(dtype):
+    from forge.op.eval.forge.kv_cache import FillCache, UpdateCache
+
+    generator = torch.Generator().manual_seed(0)
+    for _ in range(50):
+        B_in, H, S_cache, D = (int(x) for x in torch.randint(1, 9, (4,), generator=generator))
+        batch_offset = int(torch.randint(0, 4, (1,), generator=generator))
+        cache = torch.randn(B_in + batch_offset, H, S_cache, D, generator=generator).to(dtype)
+        input = torch.randn(B_in, H, 1, D, generator=generator).to(dtype)
+        # Ragged decode, every sequence is at its own position
+        update_index = torch.randint(0, S_cache, (B_in,), dtype=torch.int32, generator=generator)
+
+        expected = update_cache_reference(cache.clone(), input, update_index, batch_offset)
+        result = UpdateCache.create(batch_offset=batch_offset).eval([cache.clone(), input, update_index])
+        assert torch.equal(result, expected)
+
+        # Rows outside of [batch_offset, batch_offset + B_in) and positions other than the updated ones are untouched
+        untouched = torch.ones_like(cache, dtype=torch.bool)
+        untouched[torch.arange(B_in) + batch_offset, :, update_index.long(), :] = False
+        assert torch.equal(result[untouched], cache[untouched])
+
+        S_in = int(torch.randint(1, S_cache + 1, (1,), generator=generator))
+        prefill = torch.randn(B_in, H, S_in, D, generator=generator).to(dtype)
+        expected = cache.clone()
+        for b in range(B_in):
+            expected[b + batch_offset, :, 0:S_in, :] = prefill[b]
+        result = FillCache.create(update_idx=0, batch_offset=batch_offset).eval([cache.clone(), prefill])
+        assert torch.equal(result, expected)
+
+    with pytest.raises(AssertionError):
+        UpdateCache.create().eval([torch.zeros(2, 1, 4, 1), torch.zeros(2, 1, 1, 1), torch.tensor([0, 4])])
@@ -172,3 +172,36 @@ def test_adam(shape, betas, weight_decay):
         golden_model=golden_model,
         golden_optimizer=golden_optimizer,
     )
+
+
+@pytest.mark.parametrize(
+    "optimizer, num_moments",
+    [
+        (forge.optimizers.SGD(learning_rate=0.1), 0),
+        (forge.optimizers.Adam(learning_rate=0.1), 2),
+        (forge.optimizers.Adam(learning_rate=0.1, bias_correction=False), 2),
+        (forge.optimizers.AdamW(learning_rate=0.1), 2),
+        (forge.optimizers.LAMB(learning_rate=0.1), 2),
+        (forge.optimizers.LARS(learning_rate=0.1), 1),
+    ],
+)
+@pytest.mark.push
+def test_optimizer_state_memory(optimizer, num_moments):
+    parameters = [
+        forge.Parameter(torch.rand(64, 32), name="l1.weight"),
+        forge.Parameter(torch.rand(32), name="l1.bias"),
+        forge.Parameter(torch.rand(32, 32), requires_grad=False, name="l2.weight"),
+    ]
+    optimizer.set_parameters_to_optimize(parameters)
+
+    # Only the moments have the shape of the parameter, the rest of the state (learning rate, bias correction powers)
+    # are scalars
+    for name, params in optimizer.parameter_to_opt_inputs.items():
+        scalar_params = [opt_param for opt_param in params.values() if opt_param.value().numel() == 1]
+        assert len(params) - len(scalar_params) == num_moments
+
+    num_scalars = {name: len(params) - num_moments for name, params in optimizer.parameter_to_opt_inputs.items()}
+    assert optimizer.get_state_memory_bytes() == {
+        "l1.weight": (num_moments * 64 * 32 + num_scalars["l1.weight"]) * 4,
+        "l1.bias": (num_moments * 32 + num_scalars["l1.bias"]) * 4,
+    }
@@ -0,0 +1,59 @@
+# SPDX-FileCopyrightText: © 2025 Tenstorrent AI ULC
+
+# SPDX-License-Identifier: Apache-2.0
+
+import pytest
+import torch
+from torch import nn
+
+import forge
+from forge.config import CompilerConfig
+from forge.forgeglobal import start_tracing, stop_tracing
+from forge.tensor import evaluate_lazy_values
+from forge.verify.verify import verify
+
+
+@pytest.mark.push
+def test_shape_only_tracing():
+    class MLP(nn.Module):
+        def __init__(self):
+            super().__init__()
+            self.l1 = nn.Linear(64, 128, bias=True)
+            self.l2 = nn.Linear(128, 32, bias=True)
+
+        def forward(self, a):
+            return torch.softmax(self.l2(torch.relu(self.l1(a))), dim=-1)
+
+    inputs = [torch.rand(1, 64)]
+    framework_model = MLP()
+
+    compiler_cfg = CompilerConfig(enable_shape_only_tracing=True)
+    compiled_model = forge.compile(framework_model, sample_inputs=inputs, compiler_cfg=compiler_cfg)
+
+    verify(inputs, framework_model, compiled_model)
+
+
+@pytest.mark.push
+def test_lazy_values_shared_subexpressions():
+    weight = forge.Parameter(torch.rand(1, 32, requires_grad=True), requires_grad=True, name="weight")
+
+    start_tracing(shape_only=True)
+    shared = forge.op.Relu("relu", weight)
+    out0 = forge.op.Exp("exp", shared)
+    out1 = forge.op.Add("add", shared, shared)
+    stop_tracing()
+
+    assert shared._value is None and out0._value is None and out1._value is None
+
+    # Evaluating one output keeps the values of its operands, which the other output reuses
+    evaluate_lazy_values([out0])
+    shared_value = shared._value
+    assert shared_value is not None and out1._value is None
+    evaluate_lazy_values([out1, shared])
+    assert shared._value is shared_value
+
+    # Intermediate values are part of the outputs' autograd graph
+    shared_value.retain_grad()
+    (out0.value().sum() + out1.value().sum()).backward()
+    assert shared_value.grad is not None
+    assert weight.value().grad is not None
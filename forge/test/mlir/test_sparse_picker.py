@@ -0,0 +1,60 @@
+# SPDX-FileCopyrightText: © 2025 Tenstorrent AI ULC
+
+# SPDX-License-Identifier: Apache-2.0
+
+import pytest
+import torch
+
+
+@pytest.mark.push
+@pytest.mark.parametrize("align_corners", [False, True])
+@pytest.mark.parametrize("channel_last", [False, True])
+def test_sparse_picker_cache(align_corners, channel_last):
+    from forge.op.eval.sparse_utils import create_bilinear_upsample_picker_matrix
+
+    scale_factor = (2, 2)
+    act = torch.rand(1, 3, 6, 5)
+
+    create_bilinear_upsample_picker_matrix.cache_clear()
+    shape = act.permute(0, 2, 3, 1).shape if channel_last else act.shape
+    picker = create_bilinear_upsample_picker_matrix(
+        scale_factor, list(shape), align_corners=align_corners, channel_last=channel_last
+    )
+
+    # Picker applied to the flattened activation gives bilinear upsampled activation
+    golden = torch.nn.functional.interpolate(
+        act, scale_factor=scale_factor, mode="bilinear", align_corners=align_corners
+    )
+    upsampled = torch.sparse.mm(picker, act.reshape(3, -1).transpose(0, 1)).transpose(0, 1).reshape(golden.shape)
+    assert torch.allclose(upsampled, golden, atol=1e-5)
+
+    # Second request with the same shape and attributes is served from the cache, as a copy
+    picker.values().zero_()
+    cached_picker = create_bilinear_upsample_picker_matrix(
+        scale_factor, tuple(shape), align_corners=align_corners, channel_last=channel_last
+    )
+    assert create_bilinear_upsample_picker_matrix.cache_info().hits == 1
+    assert torch.allclose(torch.sparse.mm(cached_picker, act.reshape(3, -1).transpose(0, 1)).sum(), golden.sum())
+
+
+@pytest.mark.push
+def test_sparse_picker_cache_key():
+    from forge.op.eval.sparse_utils import sparse_picker_cache
+
+    calls = []
+
+    @sparse_picker_cache
+    def build_picker(fill_value, shape):
+        calls.append((fill_value, shape))
+        return torch.full(tuple(shape), fill_value)
+
+    # Lists and tuples of the same values share the entry, values of different types don't
+    assert build_picker(2, [1, 2]).dtype == torch.int64
+    assert build_picker(2, (1, 2)).dtype == torch.int64
+    assert build_picker(2.0, [1, 2]).dtype == torch.float32
+    assert len(calls) == 2
+
+    # Arguments which can't be cached are passed to the builder unchanged
+    shape = [1, torch.tensor(2)]
+    build_picker(2, shape)
+    assert calls[-1][1] is shape
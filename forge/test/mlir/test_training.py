@@ -11,6 +11,8 @@ import forge.config
 from forge.verify.verify import verify
 
 from forge.config import CompilerConfig
+from forge.verify.compare import compare_with_golden
+from test.mlir.utils import copy_params
 
 
 class MatmulParam(nn.Module):
@@ -72,3 +74,59 @@ def test_compile_optimizers(optimizer):
 
     optimizer = optimizer(learning_rate=0.1)
     tt_model = forge.compile(model, sample_inputs=[torch.rand(shape)], optimizer=optimizer)
+
+
+@pytest.mark.push
+@pytest.mark.parametrize("optimizer_on_device", [False, True])
+def test_gradient_accumulation(optimizer_on_device):
+    torch.manual_seed(0)
+    num_steps = 3
+    num_micro_batches = 4
+    learning_rate = 0.1
+    shape = (1, 1024)
+
+    model = MatmulParam()
+    golden_model = MatmulParam()
+    copy_params(model, golden_model)
+
+    loss_fn = torch.nn.MSELoss()
+    golden_optimizer = torch.optim.SGD(golden_model.parameters(), lr=learning_rate)
+    if optimizer_on_device:
+        optimizer = forge.optimizers.SGD(learning_rate=learning_rate)
+    else:
+        optimizer = torch.optim.SGD(model.parameters(), lr=learning_rate)
+
+    tt_model = forge.compile(
+        model,
+        sample_inputs=[torch.rand(shape)],
+        optimizer=optimizer,
+        training=True,
+        compiler_cfg=CompilerConfig(enable_gradient_accumulation=True),
+    )
+
+    for step in range(num_steps):
+        tt_model.zero_grad()
+        golden_optimizer.zero_grad()
+
+        # Gradients of the micro-batches are summed on device, and read back (or consumed by the optimizer) once
+        for _ in range(num_micro_batches):
+            inputs = torch.rand(shape)
+            target = torch.zeros(shape)
+
+            tt_out = tt_model(inputs)[0]
+            loss_fn(tt_out, target).backward()
+            tt_model.backward()
+
+            loss_fn(golden_model(inputs), target).backward()
+
+        if optimizer_on_device:
+            optimizer.step()
+            tt_model.update_host_weights()
+        else:
+            optimizer.zero_grad()
+            tt_model.update_host_gradients()
+            assert compare_with_golden(golden_model.p.grad, model.p.grad, pcc=0.99), f"Gradient mismatch at step {step}"
+            optimizer.step()
+
+        golden_optimizer.step()
+        assert compare_with_golden(golden_model.p, model.p, pcc=0.99), f"Weight mismatch at step {step}"
@@ -0,0 +1,94 @@
+# SPDX-FileCopyrightText: © 2025 Tenstorrent AI ULC
+
+# SPDX-License-Identifier: Apache-2.0
+
+import numpy as np
+import onnx
+import onnx.helper
+import onnx.numpy_helper
+import pytest
+import torch
+from torch import nn
+
+import forge
+from forge.config import CompilerConfig
+from forge.tvm_calls.forge_compile import (
+    evict_tvm_cache,
+    get_tvm_cache_entries,
+    get_tvm_graph_hash,
+    invalidate_tvm_cache,
+)
+from forge.verify.verify import verify
+
+
+@pytest.mark.push
+def test_tvm_graph_cache(tmp_path, monkeypatch):
+    class LinearWithConstant(nn.Module):
+        def __init__(self):
+            super().__init__()
+            self.l1 = nn.Linear(64, 32, bias=True)
+            self.const = torch.rand(1, 32)
+
+        def forward(self, a):
+            return self.l1(a) * self.const
+
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("FORGE_ENABLE_TVM_CACHE", "1")
+
+    inputs = [torch.rand(1, 64)]
+    framework_model = LinearWithConstant()
+
+    # First compile populates the cache, second one is served from it
+    compiled_model = forge.compile(framework_model, sample_inputs=inputs)
+    verify(inputs, framework_model, compiled_model)
+
+    cache_dir = tmp_path / "generated_modules" / "tvm_cache"
+    graph_files = [f for f in cache_dir.iterdir() if not f.name.endswith(".params.bin")]
+    assert len(graph_files) == 1
+    assert (cache_dir / (graph_files[0].name + ".params.bin")).exists()
+
+    compiled_model = forge.compile(framework_model, sample_inputs=inputs)
+    verify(inputs, framework_model, compiled_model)
+
+    # Cache key depends on input shapes, so a different batch size creates a new entry
+    batched_inputs = [torch.rand(2, 64)]
+    compiled_model = forge.compile(framework_model, sample_inputs=batched_inputs)
+    verify(batched_inputs, framework_model, compiled_model)
+    assert len(get_tvm_cache_entries()) == 2
+
+    assert len(evict_tvm_cache(size_limit=1)) == 2
+    assert len(get_tvm_cache_entries()) == 0
+
+    compiled_model = forge.compile(framework_model, sample_inputs=inputs)
+    assert invalidate_tvm_cache() == 1
+    assert len(get_tvm_cache_entries()) == 0
+
+
+@pytest.mark.push
+def test_tvm_graph_hash_weights(monkeypatch):
+    def make_onnx_model(weight):
+        node = onnx.helper.make_node("MatMul", ["a", "w"], ["out"])
+        graph = onnx.helper.make_graph(
+            [node],
+            "matmul",
+            [onnx.helper.make_tensor_value_info("a", onnx.TensorProto.FLOAT, [1, 4])],
+            [onnx.helper.make_tensor_value_info("out", onnx.TensorProto.FLOAT, [1, 4])],
+            initializer=[onnx.numpy_helper.from_array(weight, name="w")],
+        )
+        return onnx.helper.make_model(graph)
+
+    monkeypatch.setenv("FORGE_ENABLE_TVM_CACHE", "1")
+
+    # Config values which aren't JSON serializable must not break the key
+    compiler_cfg = CompilerConfig()
+    compiler_cfg.tvm_module_to_num_patterns = {"matmul": object()}
+
+    inputs = [np.random.rand(1, 4).astype(np.float32)]
+    weight = np.random.rand(4, 4).astype(np.float32)
+
+    def graph_hash(onnx_mod):
+        return get_tvm_graph_hash("onnx", onnx_mod, inputs, compiler_cfg, "matmul").hexdigest()
+
+    # ONNX weights are frozen into the generated graph, so changing their values changes the key
+    assert graph_hash(make_onnx_model(weight)) == graph_hash(make_onnx_model(weight.copy()))
+    assert graph_hash(make_onnx_model(weight)) != graph_hash(make_onnx_model(weight + 1))
@@ -0,0 +1,53 @@
+# SPDX-FileCopyrightText: © 2025 Tenstorrent AI ULC
+
+# SPDX-License-Identifier: Apache-2.0
+
+import pytest
+import torch
+from torch import nn
+
+import forge
+from forge.config import CompilerConfig
+from forge.verify.verify import verify
+
+
+@pytest.mark.push
+@pytest.mark.parametrize("retain_tvm_python_files", [False, True])
+def test_in_memory_codegen(tmp_path, monkeypatch, retain_tvm_python_files):
+    class Linear(nn.Module):
+        def __init__(self):
+            super().__init__()
+            self.l1 = nn.Linear(64, 32, bias=True)
+
+        def forward(self, a):
+            return torch.relu(self.l1(a))
+
+    # Generated modules are written relative to the working directory
+    monkeypatch.chdir(tmp_path)
+
+    inputs = [torch.rand(1, 64)]
+    framework_model = Linear()
+
+    compiler_cfg = CompilerConfig(retain_tvm_python_files=retain_tvm_python_files)
+    compiled_model = forge.compile(
+        framework_model, sample_inputs=inputs, module_name="in_memory_codegen", compiler_cfg=compiler_cfg
+    )
+    verify(inputs, framework_model, compiled_model)
+
+    # Python modules are generated and loaded in memory, unless they are retained
+    generated_modules = list((tmp_path / "generated_modules").glob("in_memory_codegen*.py"))
+    assert len(generated_modules) == (1 if retain_tvm_python_files else 0)
+
+    # Recompiling a different model under the same name doesn't reuse the previously generated module
+    class LinearTanh(Linear):
+        def forward(self, a):
+            return torch.tanh(self.l1(a))
+
+    framework_model = LinearTanh()
+    compiled_model = forge.compile(
+        framework_model, sample_inputs=inputs, module_name="in_memory_codegen", compiler_cfg=compiler_cfg
+    )
+    verify(inputs, framework_model, compiled_model)
+
+    generated_modules = list((tmp_path / "generated_modules").glob("in_memory_codegen*.py"))
+    assert len(generated_modules) == (2 if retain_tvm_python_files else 0)
@@ -0,0 +1,84 @@
+# SPDX-FileCopyrightText: © 2025 Tenstorrent AI ULC
+
+# SPDX-License-Identifier: Apache-2.0
+
+import json
+import threading
+import time
+
+import pytest
+import torch
+
+
+class StubBatchedModel:
+    """
+    Model compiled for a fixed batch size, with a fixed device latency per batch.
+    """
+
+    def __init__(self, batch_size, latency):
+        self.batch_size = batch_size
+        self.latency = latency
+        self.num_runs = 0
+
+    def __call__(self, x, y):
+        assert x.shape[0] == self.batch_size and y.shape[0] == self.batch_size, "Batch should be padded"
+        time.sleep(self.latency)
+        self.num_runs += 1
+        return [x * 2 + y, x.sum(dim=-1, keepdim=True)]
+
+
+@pytest.mark.push
+def test_batching_server():
+    import urllib.request
+    from concurrent.futures import ThreadPoolExecutor
+
+    from forge.batching import BatchingHTTPServer, BatchScheduler
+
+    batch_size = 8
+    num_requests = 64
+    model = StubBatchedModel(batch_size, latency=0.01)
+    requests = [(torch.rand(1, 4), torch.rand(1, 4)) for _ in range(num_requests)]
+
+    with BatchScheduler(model, max_batch_size=batch_size, max_latency_ms=20) as scheduler:
+        # Requests from concurrent callers are coalesced
+        with ThreadPoolExecutor(max_workers=num_requests) as executor:
+            outputs = list(executor.map(lambda inputs: scheduler.submit(*inputs).result(), requests))
+        for (x, y), (out, out_sum) in zip(requests, outputs):
+            assert torch.allclose(out, x * 2 + y)
+            assert torch.allclose(out_sum, x.sum(dim=-1, keepdim=True))
+        assert model.num_runs < num_requests
+
+        # Partial batch is padded, and served once the deadline passes
+        (out, _) = scheduler.submit(*requests[0]).result(timeout=5)
+        assert torch.allclose(out, requests[0][0] * 2 + requests[0][1])
+
+        with pytest.raises(ValueError):
+            scheduler.submit(torch.rand(1, 5), torch.rand(1, 5))
+
+        # HTTP front end
+        server = BatchingHTTPServer(scheduler, ("localhost", 0))
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        url = f"http://localhost:{server.server_address[1]}"
+
+        def infer(inputs):
+            body = json.dumps({"inputs": [t.squeeze(0).tolist() for t in inputs]}).encode()
+            request = urllib.request.Request(f"{url}/infer", data=body, headers={"Content-Type": "application/json"})
+            with urllib.request.urlopen(request) as response:
+                return json.loads(response.read())["outputs"]
+
+        with ThreadPoolExecutor(max_workers=16) as executor:
+            http_outputs = list(executor.map(infer, requests[:16]))
+        for (x, y), (out, _) in zip(requests, http_outputs):
+            assert torch.allclose(torch.tensor(out), (x * 2 + y).squeeze(0))
+
+        with urllib.request.urlopen(f"{url}/metrics") as response:
+            metrics = json.loads(response.read())
+        server.shutdown()
+        server.server_close()
+
+    print(f"Batching metrics: {metrics}")
+    assert metrics["requests"] == num_requests + 1 + 16
+    assert metrics["batches"] == model.num_runs
+    assert 0 < metrics["batch_fill_ratio"] <= 1
+    assert metrics["queue_depth"] == 0
+    assert 0 < metrics["latency_p50_ms"] <= metrics["latency_p99_ms"]
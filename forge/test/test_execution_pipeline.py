@@ -0,0 +1,98 @@
+# SPDX-FileCopyrightText: © 2025 Tenstorrent AI ULC
+
+# SPDX-License-Identifier: Apache-2.0
+
+import threading
+import time
+
+import pytest
+import torch
+import torch.nn as nn
+
+import forge
+
+
+@pytest.mark.push
+def test_submit():
+    class Add(nn.Module):
+        def __init__(self):
+            super().__init__()
+
+        def forward(self, x1, x2):
+            return torch.add(x1, x2)
+
+    model = Add()
+    shape = (1, 1024, 32)
+    compiled_model = forge.compile(model, sample_inputs=[torch.rand(shape), torch.rand(shape)])
+
+    requests = [[torch.rand(shape), torch.rand(shape)] for _ in range(8)]
+    compiled_model.start_pipeline(max_in_flight=2)
+    futures = [compiled_model.submit(*inputs) for inputs in requests]
+    outputs = [future.result() for future in futures]
+    compiled_model.shutdown_pipeline()
+
+    for inputs, output in zip(requests, outputs):
+        assert torch.allclose(output[0], model(*inputs), rtol=1e-1)
+        assert torch.equal(output[0], compiled_model(*inputs)[0])
+
+
+class MockRuntime:
+    """
+    Runtime with fixed host and device latencies, each of the stages holds only its own resource.
+    """
+
+    def __init__(self, staging_latency, device_latency, readback_latency):
+        self.staging_latency = staging_latency
+        self.device_latency = device_latency
+        self.readback_latency = readback_latency
+        self.device_lock = threading.Lock()
+        self.executed = []
+
+    def stage_inputs(self, request_id):
+        time.sleep(self.staging_latency)
+        return request_id
+
+    def execute(self, request_id):
+        with self.device_lock:
+            time.sleep(self.device_latency)
+            self.executed.append(request_id)
+        return request_id
+
+    def read_outputs(self, request_id):
+        time.sleep(self.readback_latency)
+        if request_id < 0:
+            raise ValueError(f"Invalid request {request_id}")
+        return request_id
+
+
+@pytest.mark.push
+def test_execution_pipeline_throughput():
+    from forge.execution_pipeline import ExecutionPipeline
+
+    num_requests = 20
+    runtime = MockRuntime(staging_latency=0.01, device_latency=0.01, readback_latency=0.01)
+
+    start = time.perf_counter()
+    sync_results = [runtime.read_outputs(runtime.execute(runtime.stage_inputs(i))) for i in range(num_requests)]
+    sync_time = time.perf_counter() - start
+
+    runtime.executed = []
+    with ExecutionPipeline(runtime.stage_inputs, runtime.execute, runtime.read_outputs, max_in_flight=4) as pipeline:
+        start = time.perf_counter()
+        futures = [pipeline.submit(i) for i in range(num_requests)]
+        pipelined_results = [future.result() for future in futures]
+        pipelined_time = time.perf_counter() - start
+
+        # Errors are reported through the future of the failed request only
+        failed = pipeline.submit(-1)
+        succeeded = pipeline.submit(num_requests)
+        with pytest.raises(ValueError):
+            failed.result()
+        assert succeeded.result() == num_requests
+
+    print(f"{num_requests} requests - synchronous: {sync_time:.3f}s, pipelined: {pipelined_time:.3f}s")
+
+    assert pipelined_results == sync_results
+    assert runtime.executed[:num_requests] == list(range(num_requests))
+    # Three equally long stages overlap, allow for thread scheduling noise
+    assert pipelined_time < 0.6 * sync_time
@@ -0,0 +1,41 @@
+# SPDX-FileCopyrightText: © 2025 Tenstorrent AI ULC
+
+# SPDX-License-Identifier: Apache-2.0
+
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+
+# Frontend frameworks which shouldn't be imported by `import forge`
+LAZY_FRAMEWORKS = ["tensorflow", "jax", "paddle", "keras", "onnx", "flax", "transformers"]
+
+# Upper bound of the `import forge` time, in seconds
+IMPORT_TIME_LIMIT = float(os.environ.get("FORGE_IMPORT_TIME_LIMIT", "5.0"))
+
+
+@pytest.mark.push
+def test_import_time():
+    # Run in a fresh interpreter, frameworks are already imported in this one (e.g. by this test module)
+    script = (
+        "import json, sys, time\n"
+        "start = time.perf_counter()\n"
+        "import forge\n"
+        "import_time = time.perf_counter() - start\n"
+        f"frameworks = {LAZY_FRAMEWORKS}\n"
+        "loaded = [name for name in frameworks if name in sys.modules]\n"
+        "print(json.dumps({'import_time': import_time, 'loaded': loaded}))\n"
+    )
+    # Import time of a warm (cached .pyc) import is measured, first run warms up the cache
+    for _ in range(2):
+        output = subprocess.run([sys.executable, "-c", script], check=True, capture_output=True, text=True).stdout
+    result = json.loads(output.strip().splitlines()[-1])
+
+    print(f"import forge: {result['import_time']:.3f}s")
+    assert not result["loaded"], f"Frameworks imported by `import forge`: {result['loaded']}"
+    assert (
+        result["import_time"] < IMPORT_TIME_LIMIT
+    ), f"`import forge` took {result['import_time']:.3f}s, limit is {IMPORT_TIME_LIMIT}s"
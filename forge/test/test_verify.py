@@ -7,7 +7,13 @@ import torch
 
 import numpy as np
 
-from forge.verify.compare import calculate_pcc, calculate_or_estimate_pcc, calculate_atol
+from forge.verify.compare import (
+    calculate_pcc,
+    calculate_or_estimate_pcc,
+    calculate_atol,
+    calculate_rtol,
+    compare_tensors,
+)
 import pytest
 
 import forge._C.verif as verif
@@ -119,3 +125,58 @@ def test_atol_calculation():
     # Check non-equal booleans scenario.
     actual = torch.tensor([True, False, False])
     assert calculate_atol(expected, actual) == 1
+
+
+@pytest.mark.push
+def test_compare_tensors():
+    fw_out = torch.rand(4, 3000)
+    co_out = fw_out + 0.01 * torch.rand(4, 3000)
+
+    # Float tensors without NaN/Inf are compared with the native kernels
+    comparison = compare_tensors(fw_out, co_out)
+    golden_pcc = np.min(np.corrcoef(fw_out.numpy().flatten(), co_out.numpy().flatten()))
+
+    assert comparison.special_values_match
+    assert comparison.num_elements == fw_out.numel()
+    assert np.isclose(comparison.pcc, golden_pcc)
+    assert np.isclose(comparison.max_abs_diff, calculate_atol(fw_out, co_out))
+    assert np.isclose(comparison.max_rel_diff, calculate_rtol(fw_out, co_out), rtol=1e-4)
+
+    # Differences are computed only when all_close fails
+    comparison = compare_tensors(fw_out, co_out, rtol=0.1, atol=0.1)
+    assert comparison.all_close is True
+    assert comparison.max_abs_diff is None and comparison.max_rel_diff is None
+
+    comparison = compare_tensors(fw_out, co_out, atol=1e-8)
+    assert comparison.all_close is False
+    assert np.isclose(comparison.max_abs_diff, calculate_atol(fw_out, co_out))
+
+    # Tensors with (matching) NaN/Inf values are compared in a single pass over chunks
+    fw_out[-1, -1] = torch.nan
+    co_out[-1, -1] = torch.nan
+    comparison = compare_tensors(fw_out, co_out, chunk_size=1000)
+    golden_pcc = np.min(np.corrcoef(fw_out.numpy().flatten()[:-1], co_out.numpy().flatten()[:-1]))
+
+    assert comparison.special_values_match
+    assert comparison.num_elements == fw_out.numel()
+    assert np.isclose(comparison.pcc, golden_pcc)
+    assert np.isclose(comparison.max_abs_diff, calculate_atol(fw_out, co_out))
+
+    # all_close failure terminates the comparison in the first chunk
+    comparison = compare_tensors(fw_out, co_out, atol=1e-8, chunk_size=1000)
+    assert comparison.all_close is False
+    assert comparison.terminated_early
+    assert comparison.num_elements == 1000
+
+    # Matching NaNs/Infs are skipped, mismatching ones are a hard failure
+    fw_out = torch.tensor([1.0, torch.nan, 3.0, torch.inf, 5.0, 6.0])
+    co_out = torch.tensor([1.1, torch.nan, 2.9, torch.inf, 5.0, 6.1])
+    comparison = compare_tensors(fw_out, co_out)
+    assert comparison.special_values_match
+    assert comparison.pcc > 0.99
+
+    co_out[3] = -torch.inf
+    comparison = compare_tensors(fw_out, co_out)
+    assert not comparison.special_values_match
+    assert comparison.pcc == 0.0
+    assert isinf(comparison.max_abs_diff)